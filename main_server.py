@@ -1,16 +1,59 @@
 # main_server.py
 import sys
 import os
+import argparse
 
 # 프로젝트 루트 경로를 sys.path에 추가 (src 패키지 인식용)
 sys.path.append(os.path.abspath(os.path.dirname(__file__)))
 
-from src.server.infra.server_core import TetrisServer
+from src.common.config import HOST, PORT, SIMULATION_MODE, SIM_WORKERS, REPLAY_DIR
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="TCP Socket Tetris Server")
+    parser.add_argument('--backend', choices=['selectors', 'asyncio'], default='selectors',
+                        help="이벤트 루프 백엔드 (기본: selectors)")
+    parser.add_argument('--loop', choices=['asyncio', 'uvloop'], default='asyncio',
+                        help="asyncio 백엔드에서 사용할 루프 구현")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="워커 프로세스 수 (2 이상이면 SO_REUSEPORT 멀티 워커 모드, selectors 전용)")
+    parser.add_argument('--sim', choices=['off', 'shadow', 'authoritative'], default=SIMULATION_MODE,
+                        help="서버 게임 시뮬레이션 (shadow: 클라이언트 보고 검증만, authoritative: 서버가 판정)")
+    parser.add_argument('--sim-workers', type=int, default=SIM_WORKERS,
+                        help="시뮬레이션 워커 프로세스 수 (0: 서버 루프 안에서 실행, selectors 단일 워커 전용)")
+    parser.add_argument('--replay-dir', default=REPLAY_DIR,
+                        help="경기 리플레이 저장 디렉터리 (빈 값이면 기록 안 함)")
+    parser.add_argument('--host', default=HOST)
+    parser.add_argument('--port', type=int, default=PORT)
+    return parser.parse_args()
 
 def main():
+    args = parse_args()
+    from src.server.game.game_session import GameSession
+    GameSession.simulation_mode = args.sim
+    from src.server.infra.replay_writer import replay_writer
+    replay_writer.configure(args.replay_dir)
+    if args.sim_workers > 0 and (args.backend != 'selectors' or args.workers > 1):
+        print("[Main] Simulation workers are supported only with the single-worker selectors backend.")
+        return
     try:
+        if args.sim != 'off' and args.sim_workers > 0:
+            from src.server.infra.sim_pool import sim_pool
+            sim_pool.start(args.sim_workers)
+            print(f"[Main] Simulation pool: {args.sim_workers} workers")
         # 서버 인스턴스 생성 및 시작
-        server = TetrisServer()
+        if args.workers > 1:
+            if args.backend != 'selectors':
+                print("[Main] Multi-worker mode supports only the selectors backend.")
+                return
+            from src.server.infra.prefork import run_prefork
+            run_prefork(args.workers, args.host, args.port)
+            return
+        if args.backend == 'asyncio':
+            from src.server.infra.async_server import AsyncTetrisServer
+            server = AsyncTetrisServer(args.host, args.port, loop_impl=args.loop)
+        else:
+            from src.server.infra.server_core import TetrisServer
+            server = TetrisServer(args.host, args.port)
         server.start()
     except KeyboardInterrupt:
         print("\n[Main] Server stopped by user.")
@@ -18,4 +61,4 @@ def main():
         print(f"\n[Main] Server Error: {e}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
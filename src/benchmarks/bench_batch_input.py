@@ -0,0 +1,117 @@
+# src/benchmarks/bench_batch_input.py
+"""
+GameState 입력 처리 벤치마크: 입력마다 호출 vs process_batch (초당 입력 수)
+
+같은 봇 입력 기록(키 코드, 서버 틱)을 새 GameState에 다시 적용하는 비용 비교
+- per-call (Action)      : 클라이언트처럼 Action 객체로 process_input 호출
+- per-call (keycode+poll): 서버 시뮬레이션/리플레이처럼 키 코드 -> Action(keycode) 변환 후 호출,
+                           매 입력 뒤 game_over / score / item_count 변화를 확인
+- batch                  : process_batch(keys) 한 번 (변화는 이벤트 목록으로)
+"틱 포함" 항목은 입력마다 기록된 서버 틱까지 advance_to 후 적용 (중력 / 방해 줄 포함)
+
+실행: python -m src.benchmarks.bench_batch_input [--games N] [--inputs N] [--repeat N]
+"""
+import sys
+import os
+import gc
+import time
+import random
+import argparse
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.common.constants import Action
+from src.core.game_state import GameState
+from src.tests.test_simulation import bot_action
+
+def record_game(seed, max_inputs):
+    """봇 한 판의 입력 기록 -> (키 코드 bytes, 입력별 틱)"""
+    rng = random.Random(seed)
+    game = GameState(seed)
+    keys, ticks = bytearray(), []
+    while not game.game_over and len(keys) < max_inputs:
+        game.advance_to(game.tick + rng.randrange(3))
+        action = bot_action(game, rng)
+        game.process_input(action)
+        keys.append(action.value)
+        ticks.append(game.tick)
+    return bytes(keys), ticks
+
+def per_call_action(seed, keys, ticks):
+    game = GameState(seed)
+    actions = [Action(k) for k in keys]  # 클라이언트는 입력 장치에서 Action을 바로 받음 (변환은 측정 밖)
+    t0 = time.perf_counter_ns()
+    process = game.process_input
+    if ticks is None:
+        for action in actions:
+            process(action)
+    else:
+        advance = game.advance_to
+        for action, tick in zip(actions, ticks):
+            advance(tick)
+            process(action)
+    return time.perf_counter_ns() - t0
+
+def per_call_keycode(seed, keys, ticks):
+    game = GameState(seed)
+    t0 = time.perf_counter_ns()
+    changes = 0
+    last = (0, 0)
+    for i, key in enumerate(keys):
+        if ticks is not None:
+            game.advance_to(ticks[i])
+        game.process_input(Action(key))
+        # 호출자가 매번 하던 상태 확인
+        state = (game.score, game.item_count)
+        if state != last or game.game_over:
+            changes += 1
+            last = state
+    return time.perf_counter_ns() - t0
+
+def batch(seed, keys, ticks):
+    game = GameState(seed)
+    t0 = time.perf_counter_ns()
+    game.process_batch(keys, ticks)
+    return time.perf_counter_ns() - t0
+
+def measure(paths, games, with_ticks, repeat):
+    """
+    경로마다 모든 게임을 한 번씩 다시 적용 -> 경로별 가장 빠른 회차 (ns)
+    머신 속도가 흔들리므로 경로를 번갈아 repeat번 측정
+    """
+    best = {}
+    for _ in range(repeat):
+        for name, fn in paths:
+            gc.collect()
+            gc.disable()
+            try:
+                elapsed = sum(fn(seed, keys, ticks if with_ticks else None) for seed, keys, ticks in games)
+            finally:
+                gc.enable()
+            best[name] = min(best.get(name, elapsed), elapsed)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="GameState per-call vs batched input benchmark")
+    parser.add_argument('--games', type=int, default=100)
+    parser.add_argument('--inputs', type=int, default=2000, help="max inputs per recorded game")
+    parser.add_argument('--repeat', type=int, default=9)
+    args = parser.parse_args()
+
+    games = [(seed,) + record_game(seed, args.inputs) for seed in range(args.games)]
+    total = sum(len(keys) for _, keys, _ in games)
+    print(f"{args.games} recorded games, {total} inputs")
+
+    paths = [("per-call (Action)", per_call_action),
+             ("per-call (keycode+poll)", per_call_keycode),
+             ("batch", batch)]
+    for with_ticks in (False, True):
+        print(f"\n[{'with server ticks' if with_ticks else 'inputs only'}]")
+        best = measure(paths, games, with_ticks, args.repeat)
+        base = best[paths[0][0]]
+        for name, elapsed in best.items():
+            print(f"{name:<24}: {total / (elapsed / 1e9):12,.0f} inputs/s "
+                  f"({elapsed / total:7.0f} ns/input, x{base / elapsed:.2f})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# src/benchmarks/bench_board.py
+"""
+보드 엔진 벤치마크 (리스트 Board vs 비트보드 BitBoard)
+
+시나리오
+- collision : 반쯤 찬 보드에서 무작위 위치의 is_valid_position 질의
+- drop      : 하드 드롭 (drop_distance) + 고정 + 줄 삭제 반복
+              (Board는 한 칸씩 검사, BitBoard는 열 높이로 한 번에 계산)
+- garbage   : 방해 줄 추가 + 줄 삭제 반복
+
+실행: python -m src.benchmarks.bench_board [--ops N] [--repeat R]
+"""
+import sys
+import os
+import time
+import random
+import argparse
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.core.board import Board
+from src.core.bitboard import BitBoard
+from src.core.tetromino import Tetromino
+
+def make_pieces(n, seed=1):
+    rng = random.Random(seed)
+    pieces = []
+    for _ in range(n):
+        p = Tetromino(rng.choice(Tetromino.TYPES))
+        p.rotation = rng.randrange(p.max_rotation)
+        p.x = rng.randint(-1, 8)
+        p.y = rng.randint(0, 18)
+        pieces.append(p)
+    return pieces
+
+def fill_half(board, seed=2):
+    """아래쪽 절반을 무작위로 채움 (한 줄에 구멍 하나 이상)"""
+    rng = random.Random(seed)
+    random.seed(seed)
+    board.add_garbage_lines(board.HEIGHT // 2)
+    for _ in range(30):
+        p = Tetromino(rng.choice(Tetromino.TYPES))
+        p.x = rng.randint(0, 6)
+        while board.is_valid_position(p, adj_y=1):
+            p.y += 1
+        if board.is_valid_position(p):
+            board.place_tetromino(p)
+
+def run_collision(board_cls, pieces):
+    board = board_cls()
+    fill_half(board)
+    valid = board.is_valid_position
+    hits = 0
+    for p in pieces:
+        if valid(p):
+            hits += 1
+    return hits
+
+def run_drop(board_cls, pieces):
+    board = board_cls()
+    lines = 0
+    for src in pieces:
+        p = Tetromino(src.type)
+        p.x = src.x if 0 <= src.x <= 6 else 3
+        if not board.is_valid_position(p):
+            board = board_cls()
+            continue
+        p.y += board.drop_distance(p)
+        board.place_tetromino(p)
+        lines += board.clear_lines()
+    return lines
+
+def run_garbage(board_cls, pieces):
+    board = board_cls()
+    random.seed(3)
+    total = 0
+    for i in range(len(pieces) // 8):
+        board.add_garbage_lines(1 + i % 3)
+        total += board.clear_lines()
+    return total
+
+def measure(func, board_cls, pieces, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = func(board_cls, pieces)
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+def main():
+    parser = argparse.ArgumentParser(description="Board engine benchmark")
+    parser.add_argument('--ops', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    pieces = make_pieces(args.ops)
+    scenarios = [('collision', run_collision), ('drop', run_drop), ('garbage', run_garbage)]
+    engines = [('Board (list)', Board), ('BitBoard', BitBoard)]
+
+    print(f"ops={args.ops} repeat={args.repeat}")
+    for name, func in scenarios:
+        print(f"\n[{name}]")
+        base = None
+        results = set()
+        for label, cls in engines:
+            result, elapsed = measure(func, cls, pieces, args.repeat)
+            results.add(result)
+            base = base or elapsed
+            print(f"  {label:<14} {elapsed * 1000:9.1f} ms  (x{base / elapsed:.2f})")
+        assert len(results) == 1, f"engines disagree: {results}"
+
+if __name__ == "__main__":
+    main()
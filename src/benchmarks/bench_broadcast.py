@@ -0,0 +1,119 @@
+# src/benchmarks/bench_broadcast.py
+"""
+방 브로드캐스트 송신 syscall 벤치마크
+
+4인 게임에서 한 플레이어의 REQ_MOVE 묶음(한 번의 recv에 담긴 키 입력들)을 중계할 때
+- per-packet : 변경 전 방식 재현 (패킷마다 수신자별로 직렬화 + send 1회)
+- coalesced  : 패킷은 한 번만 직렬화, 루프 1회 동안 쌓인 프레임을 피어당 sendmsg 1회로 전송
+
+실행: python -m src.benchmarks.bench_broadcast [--batch K] [--rounds R]
+"""
+import sys
+import os
+import time
+import socket
+import argparse
+import io
+import contextlib
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.common.protocol import Packet
+from src.common.constants import CMD_REQ_MOVE, Action
+from src.server.infra.client_peer import ClientPeer
+from src.server.infra.router import router
+from src.server.game.room_manager import room_manager
+import src.server.handlers.game  # noqa: F401  라우터에 핸들러 등록 (import만 함)
+
+PLAYERS = 4
+
+class CountingSocket:
+    """send/sendmsg 호출 수를 세는 소켓 래퍼"""
+    def __init__(self, sock, use_sendmsg):
+        self.sock = sock
+        self.calls = 0
+        if use_sendmsg:
+            self.sendmsg = self._sendmsg
+
+    def send(self, data):
+        self.calls += 1
+        return self.sock.send(data)
+
+    def _sendmsg(self, buffers):
+        self.calls += 1
+        return self.sock.sendmsg(buffers)
+
+def setup_room(use_sendmsg):
+    room = room_manager.create_room("bench")
+    peers, remotes = [], []
+    for i in range(PLAYERS):
+        a, b = socket.socketpair()
+        a.setblocking(False)
+        b.setblocking(False)
+        peer = ClientPeer(CountingSocket(a, use_sendmsg), ('127.0.0.1', i))
+        peer.nickname = f"P{i}"
+        peer.is_authenticated = True
+        room.enter_user(peer)
+        peers.append(peer)
+        remotes.append(b)
+    for i in range(1, PLAYERS):
+        room.ready_states[i] = True
+    with contextlib.redirect_stdout(io.StringIO()):
+        room.start_game()
+    return room, peers, remotes
+
+def drain(remotes):
+    for r in remotes:
+        try:
+            while r.recv(1 << 16):
+                pass
+        except BlockingIOError:
+            pass
+
+def run(mode, batch, rounds):
+    room, peers, remotes = setup_room(use_sendmsg=(mode == 'coalesced'))
+    drain(remotes)
+    for p in peers:
+        p.flush()
+        p.conn.calls = 0
+
+    sender = peers[0]
+    moves = [Packet(CMD_REQ_MOVE, bytes([Action.MOVE_LEFT.value if i % 2 else Action.MOVE_RIGHT.value]))
+             for i in range(batch)]
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        for pkt in moves:
+            router.handle(sender, pkt)
+            if mode == 'per-packet':
+                for p in peers:
+                    p.flush()
+        if mode == 'coalesced':
+            # 서버 루프 1회가 끝날 때의 flush
+            for p in peers:
+                p.flush()
+        drain(remotes)
+    elapsed = time.perf_counter() - t0
+
+    relayed = batch * rounds
+    calls = sum(p.conn.calls for p in peers)
+    room_manager.remove_room(room.room_id)
+    for p, r in zip(peers, remotes):
+        p.conn.sock.close()
+        r.close()
+    return calls / relayed, elapsed / relayed * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description="broadcast syscall benchmark")
+    parser.add_argument('--batch', type=int, nargs='+', default=[1, 4, 16])
+    parser.add_argument('--rounds', type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{PLAYERS} players, moves relayed to {PLAYERS - 1} peers")
+    print(f"{'batch':>5} {'mode':<11} {'syscalls/move':>14} {'us/move':>9}")
+    for batch in args.batch:
+        for mode in ('per-packet', 'coalesced'):
+            calls, us = run(mode, batch, args.rounds)
+            print(f"{batch:>5} {mode:<11} {calls:>14.2f} {us:>9.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,334 @@
+# src/benchmarks/bench_core.py
+"""
+게임 엔진(src/core) 마이크로 벤치마크 모음 + 기준값(JSON) 저장/비교
+
+항목 (결과는 모두 ns/op, 여러 번 돌려 가장 빠른 값)
+- board.*        : BitBoard 기본 연산 (충돌 검사, 고정, 줄 삭제, 방해 줄 추가, 무게추 drill_position 한 칸)
+- input.<Action> : GameState.process_input 한 번 (Action별)
+- game.ghost     : get_ghost_piece 한 번
+- game.full      : 시드 고정 게임 한 판 (입력 + 틱 진행 + 방해 줄, 게임오버까지)
+
+기준값은 저장소의 src/benchmarks/baselines/core.json에 두고, 엔진을 바꾼 뒤 --compare로
+기준보다 --threshold 이상 느려진 항목을 표시 (있으면 종료 코드 1)
+머신 속도가 측정할 때마다 흔들리므로 엔진과 무관한 calibration 항목을 같이 돌리고,
+비교는 항목마다 바로 뒤에 잰 calibration 대비 비율(반복의 중앙값)로 함 (기준값은 파이썬 버전에 묶이므로 버전이 바뀌면 --save로 새로 만들 것)
+
+실행: python -m src.benchmarks.bench_core [--compare | --save] [--filter board.] [--threshold 0.25]
+"""
+import sys
+import os
+import gc
+import json
+import time
+import random
+import argparse
+import statistics
+import platform
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.common.constants import Action
+from src.core.bitboard import BitBoard
+from src.core.game_state import GameState
+from src.core.rng import GarbageHoles
+from src.core.tetromino import Tetromino
+from src.benchmarks.bench_board import make_pieces, fill_half
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baselines', 'core.json')
+
+# --- 항목별 준비 함수: ops를 받아 (측정할 함수, 실제 op 수) 반환 (준비 시간은 측정하지 않음) ---
+def half_filled_cells():
+    board = BitBoard()
+    fill_half(board)
+    return [c for row in board.grid for c in row]
+
+def bench_is_valid_position(ops):
+    board = BitBoard()
+    fill_half(board)
+    pieces = make_pieces(ops)
+    valid = board.is_valid_position
+
+    def run():
+        for p in pieces:
+            valid(p)
+    return run, ops
+
+def bench_place_tetromino(ops):
+    rng = random.Random(1)
+    probe = BitBoard()
+    pairs = []
+    board = None
+    for i in range(ops):
+        if i % 8 == 0:
+            board = BitBoard()
+        p = Tetromino(rng.choice(Tetromino.TYPES))
+        p.x = rng.randint(0, 6)
+        p.y += probe.drop_distance(p)
+        pairs.append((board, p))
+
+    def run():
+        for board, p in pairs:
+            board.place_tetromino(p)
+    return run, ops
+
+def bench_clear_lines(ops):
+    # 아래 두 줄은 꽉 참, 그 위 두 줄은 구멍 하나 (2줄 삭제 + 위쪽 줄 내리기)
+    width, height = BitBoard.WIDTH, BitBoard.HEIGHT
+    cells = [0] * (width * (height - 4)) + ([1] * (width - 1) + [0]) * 2 + [2] * (width * 2)
+    boards = []
+    for _ in range(ops):
+        board = BitBoard()
+        board.load_cells(cells)
+        boards.append(board)
+
+    def run():
+        for board in boards:
+            board.clear_lines()
+    return run, ops
+
+def bench_add_garbage_lines(ops):
+    boards = [BitBoard(GarbageHoles(i)) for i in range(ops // 4)]
+
+    def run():
+        for board in boards:
+            board.add_garbage_lines(2)
+            board.add_garbage_lines(2)
+            board.add_garbage_lines(2)
+            board.add_garbage_lines(2)
+    return run, len(boards) * 4
+
+def bench_drill_position(ops):
+    # 반쯤 찬 보드를 무게추가 바닥까지 한 칸씩 뚫고 내려감 (GameState._move_down의 무게추 경로)
+    cells = half_filled_cells()
+    rng = random.Random(4)
+    jobs = []
+    steps = 0
+    while steps < ops:
+        board = BitBoard()
+        board.load_cells(cells)
+        piece = Tetromino(rng.choice(Tetromino.TYPES))
+        piece.x = rng.randint(0, 6)
+        piece.make_heavy()
+        jobs.append((board, piece))
+        steps += board.floor_distance(piece)
+
+    def run():
+        for board, piece in jobs:
+            while board.is_in_bounds(piece, adj_y=1):
+                board.drill_position(piece, adj_y=1)
+                piece.y += 1
+    return run, steps
+
+def make_input_bench(action):
+    def bench(ops):
+        games = [GameState(i) for i in range(ops)]
+        if action == Action.USE_ITEM:
+            for game in games:
+                game.item_count = 1
+        for i, game in enumerate(games):
+            # 좌우 이동이 벽에 막히지 않도록 시작 열을 조금씩 다르게
+            game.current_piece.x = 2 + i % 4
+
+        def run():
+            for game in games:
+                game.process_input(action)
+        return run, ops
+    return bench
+
+def bench_ghost_piece(ops):
+    game = GameState(7)
+    game.board.load_cells(half_filled_cells())
+    game.board.holes = GarbageHoles(7)
+
+    def run():
+        ghost = game.get_ghost_piece
+        for _ in range(ops):
+            ghost()
+    return run, ops
+
+ACTIONS = [Action.MOVE_LEFT, Action.MOVE_RIGHT, Action.ROTATE, Action.DOWN, Action.DROP]
+
+def play_full_game(seed, max_pieces=500):
+    """시드 고정 한 판: 블록마다 무작위 회전/이동 후 드롭, 입력 사이 틱 진행, 주기적으로 방해 줄"""
+    rng = random.Random(seed)
+    game = GameState(seed)
+    pieces = 0
+    while not game.game_over and pieces < max_pieces:
+        for _ in range(rng.randrange(4)):
+            game.process_input(Action.ROTATE)
+        move = Action.MOVE_LEFT if rng.random() < 0.5 else Action.MOVE_RIGHT
+        for _ in range(rng.randrange(5)):
+            game.process_input(move)
+            game.advance_to(game.tick + 2)
+        if rng.random() < 0.3:
+            game.process_input(Action.DOWN)
+        game.process_input(Action.DROP)
+        pieces += 1
+        game.advance_to(game.tick + 5)
+        if pieces % 20 == 0:
+            game.queue_garbage(1 + pieces // 20 % 3, game.tick + 60)
+        game.attacks.clear()
+    return pieces
+
+def bench_full_game(ops):
+    seeds = list(range(ops))
+
+    def run():
+        for seed in seeds:
+            play_full_game(seed)
+    return run, ops
+
+def bench_calibration(ops):
+    """엔진과 무관한 고정 파이썬 작업 (머신 속도 기준: 비교는 이 값에 대한 비율로 함)"""
+    items = [[i, i * 2] for i in range(64)]
+
+    def run():
+        total = 0
+        for i in range(ops):
+            pair = items[i & 63]
+            total += (pair[0] << 1) ^ pair[1]
+            pair[0] = total & 0xFF
+    return run, ops
+
+# (이름, 준비 함수, 측정 1회의 op 수) - 작은 묶음을 여러 번 돌려 최솟값을 쓰는 편이 큰 묶음보다 덜 흔들림
+CALIBRATION = 'calibration'
+CALIBRATION_CASE = (CALIBRATION, bench_calibration, 100_000)
+CASES = [
+    CALIBRATION_CASE,
+    ('board.is_valid_position', bench_is_valid_position, 20_000),
+    ('board.place_tetromino', bench_place_tetromino, 5_000),
+    ('board.clear_lines', bench_clear_lines, 2_000),
+    ('board.add_garbage_lines', bench_add_garbage_lines, 4_000),
+    ('board.drill_position', bench_drill_position, 10_000),
+]
+CASES += [(f'input.{a.name}', make_input_bench(a), 1_000 if a == Action.DROP else 2_000)
+          for a in ACTIONS + [Action.USE_ITEM]]
+CASES += [
+    ('game.ghost', bench_ghost_piece, 20_000),
+    ('game.full', bench_full_game, 10),
+]
+
+def measure_once(setup, ops):
+    """준비 -> 측정 1회 (GC는 측정 중에만 끔) -> ns/op"""
+    run, count = setup(ops)
+    gc.collect()
+    gc.disable()
+    try:
+        t0 = time.perf_counter_ns()
+        run()
+        elapsed = time.perf_counter_ns() - t0
+    finally:
+        gc.enable()
+    return elapsed / count
+
+def run_cases(cases, repeat, scale):
+    """
+    모든 항목을 한 바퀴씩 돌리는 것을 repeat번 반복 -> (항목별 최솟값 ns/op, 항목별 calibration 대비 비율의 중앙값)
+    한 항목을 몰아서 반복하면 그동안 머신이 느려졌을 때 그 항목만 나빠지므로 번갈아 측정하고,
+    비율은 항목 바로 뒤에 잰 calibration으로 나눠 그 순간의 머신 속도를 뺌
+    """
+    best, ratios = {}, {name: [] for name, _, _ in cases}
+    cal_setup, cal_ops = CALIBRATION_CASE[1], max(1, int(CALIBRATION_CASE[2] * scale))
+    for _ in range(repeat):
+        for name, setup, ops in cases:
+            per_op = measure_once(setup, max(1, int(ops * scale)))
+            cal = per_op if name == CALIBRATION else measure_once(cal_setup, cal_ops)
+            best[name] = min(best.get(name, per_op), per_op)
+            ratios[name].append(per_op / cal)
+    return {name: best[name] for name, _, _ in cases}, {name: statistics.median(r) for name, r in ratios.items()}
+
+def environment():
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'system': platform.system(),
+    }
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+def save_baseline(path, results, relative):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    data = {
+        'environment': environment(),
+        'created': time.strftime('%Y-%m-%d'),
+        'results': {name: round(ns, 1) for name, ns in results.items()},
+        'relative': {name: round(r, 5) for name, r in relative.items()},
+    }
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+        f.write('\n')
+
+def compare(results, relative, baseline, threshold):
+    """
+    항목별 (이름, ns, 기준 ns, 변화율, 표시) / 기준보다 threshold 이상 느리면 'REGRESSION'
+    변화율은 calibration 대비 비율끼리 비교 (머신 전체가 느려지거나 빨라진 만큼은 빼고 비교)
+    """
+    rows = []
+    base = baseline['results'] if baseline else {}
+    base_relative = baseline.get('relative', {}) if baseline else {}
+    for name, ns in results.items():
+        ref, ref_relative = base.get(name), base_relative.get(name)
+        if ref is None or ref_relative is None:
+            rows.append((name, ns, ref, None, 'new'))
+            continue
+        if name == CALIBRATION:
+            rows.append((name, ns, ref, ns / ref - 1.0, '(machine speed)'))
+            continue
+        change = relative[name] / ref_relative - 1.0
+        flag = 'REGRESSION' if change > threshold else ('faster' if change < -threshold else '')
+        rows.append((name, ns, ref, change, flag))
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description="Core engine micro-benchmarks with stored baselines")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--save', action='store_true', help="store results as the new baseline")
+    mode.add_argument('--compare', action='store_true', help="exit 1 if any case regressed beyond --threshold")
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--threshold', type=float, default=0.25, help="allowed slowdown (0.25 = 25%%)")
+    parser.add_argument('--repeat', type=int, default=15)
+    parser.add_argument('--scale', type=float, default=1.0, help="multiply op counts (smaller = quicker, noisier)")
+    parser.add_argument('--filter', default='', help="only cases whose name contains this")
+    args = parser.parse_args()
+
+    baseline = None if args.save else load_baseline(args.baseline)
+    if baseline and baseline.get('environment') != environment():
+        print(f"warning: baseline was recorded on {baseline.get('environment')}, this is {environment()}")
+
+    cases = [case for case in CASES if case[0] == CALIBRATION or args.filter in case[0]]
+    results, relative = run_cases(cases, args.repeat, args.scale)
+
+    print(f"{'case':<26} {'ns/op':>12} {'ops/s':>12} {'baseline':>12} {'change':>8}")
+    regressions = 0
+    for name, ns, ref, change, flag in compare(results, relative, baseline, args.threshold):
+        ref_text = f"{ref:12.1f}" if ref is not None else f"{'-':>12}"
+        change_text = f"{change * 100:+7.1f}%" if change is not None else f"{'':>8}"
+        print(f"{name:<26} {ns:12.1f} {1e9 / ns:12.0f} {ref_text} {change_text} {flag}")
+        regressions += flag == 'REGRESSION'
+
+    if args.save:
+        # 일부 항목만 돌렸으면 나머지 기준값은 유지 (비율은 그대로, ns는 기존 calibration 기준으로 환산)
+        old = load_baseline(args.baseline)
+        if old and args.filter and 'relative' in old:
+            merged, merged_relative = dict(old['results']), dict(old['relative'])
+            merged_relative.update({name: r for name, r in relative.items() if name != CALIBRATION})
+            merged.update({name: r * merged[CALIBRATION] for name, r in relative.items() if name != CALIBRATION})
+        else:
+            merged, merged_relative = results, relative
+        save_baseline(args.baseline, merged, merged_relative)
+        print(f"baseline saved: {args.baseline}")
+    elif args.compare:
+        if baseline is None:
+            print(f"no baseline at {args.baseline} (run with --save first)")
+            return 1
+        print(f"{regressions} regression(s) beyond {args.threshold * 100:.0f}%")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+# src/benchmarks/bench_messages.py
+"""
+패킷 본문 인코딩/디코딩 벤치마크: 스키마(src/common/messages.py) vs 기존 코드의 struct 호출
+
+기존 코드는 호출할 때마다 형식 문자열을 넘기고(struct 모듈 캐시 조회) 선택 필드를 슬라이스 + 길이 검사로 따로 읽었음
+스키마는 import 시점에 만든 Struct의 bound method를 바로 부름
+- pack   : 필드 값 -> 본문
+- unpack : 본문 -> 튜플 (길이 검사 포함)
+- decode : 본문 -> 메시지 객체 (__slots__)
+결과는 ns/op (여러 번 돌려 가장 빠른 값)
+
+실행: python -m src.benchmarks.bench_messages [--number 200000] [--repeat 5]
+"""
+import sys
+import os
+import struct
+import timeit
+import argparse
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.common.messages import ReqMove, NotiMove, NotiGarbage, ResSpectate, NotiEnterRoom
+
+# --- 기존 코드 (이 스키마 이전의 핸들러/씬) ---
+def legacy_relay_move(slot, body):
+    """서버 handle_move: REQ_MOVE 본문 -> NOTI_MOVE 본문"""
+    if len(body) < 1: return None
+    return struct.pack('>B B', slot, body[0]) + body[1:5]
+
+def legacy_unpack_noti_move(body):
+    """GameScene.on_peer_move"""
+    slot, keycode = struct.unpack('>B B', body[:2])
+    stamp = None
+    if len(body) >= 6:
+        stamp = struct.unpack('>I', body[2:6])[0]
+    return slot, keycode, stamp
+
+def legacy_unpack_garbage(body):
+    """GameScene.on_garbage"""
+    attacker, target, lines = struct.unpack('>B B B', body[:3])
+    apply_tick = None
+    if len(body) >= 7:
+        apply_tick = struct.unpack('>I', body[3:7])[0]
+    return attacker, target, lines, apply_tick
+
+def schema_relay_move(slot, body):
+    keycode, stamp = ReqMove.unpack(body)
+    return NotiMove.pack(slot, keycode, stamp)
+
+def cases():
+    """(메시지, 항목, 기존 함수, 스키마 함수)"""
+    move = ReqMove.pack(3, 1234)
+    noti_move = NotiMove.pack(1, 3, 1234)
+    garbage = NotiGarbage.pack(0, 2, 4, 1300)
+    spectate = ResSpectate.pack(0, 7, 123456, 0b1011)
+    enter = NotiEnterRoom.pack(2, 'player2')
+    return [
+        ('REQ_MOVE', 'relay', lambda: legacy_relay_move(1, move), lambda: schema_relay_move(1, move)),
+        ('NOTI_MOVE', 'pack', lambda: struct.pack('>B B I', 1, 3, 1234), lambda: NotiMove.pack(1, 3, 1234)),
+        ('NOTI_MOVE', 'unpack', lambda: legacy_unpack_noti_move(noti_move), lambda: NotiMove.unpack(noti_move)),
+        ('NOTI_MOVE', 'decode', lambda: legacy_unpack_noti_move(noti_move), lambda: NotiMove.decode(noti_move)),
+        ('NOTI_GARBAGE', 'pack', lambda: struct.pack('>B B B I', 0, 2, 4, 1300), lambda: NotiGarbage.pack(0, 2, 4, 1300)),
+        ('NOTI_GARBAGE', 'unpack', lambda: legacy_unpack_garbage(garbage), lambda: NotiGarbage.unpack(garbage)),
+        ('RES_SPECTATE', 'pack', lambda: struct.pack('>B H I B', 0, 7, 123456, 0b1011), lambda: ResSpectate.pack(0, 7, 123456, 0b1011)),
+        ('RES_SPECTATE', 'unpack', lambda: struct.unpack('>B H I B', spectate[:8]), lambda: ResSpectate.unpack(spectate)),
+        ('NOTI_ENTER_ROOM', 'pack', lambda: struct.pack('>B', 2) + 'player2'.encode('utf-8'), lambda: NotiEnterRoom.pack(2, 'player2')),
+        ('NOTI_ENTER_ROOM', 'unpack', lambda: (enter[0], enter[1:].decode('utf-8')), lambda: NotiEnterRoom.unpack(enter)),
+    ]
+
+def measure(func, number, repeat):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e9
+
+def main():
+    parser = argparse.ArgumentParser(description="packet schema codec benchmark")
+    parser.add_argument('--number', type=int, default=200000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'message':<16} {'op':<7} {'legacy ns':>10} {'schema ns':>10} {'speedup':>8}")
+    for name, op, legacy, schema in cases():
+        a = measure(legacy, args.number, args.repeat)
+        b = measure(schema, args.number, args.repeat)
+        print(f"{name:<16} {op:<7} {a:>10.1f} {b:>10.1f} {a / b:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
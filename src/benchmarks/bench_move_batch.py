@@ -0,0 +1,142 @@
+# src/benchmarks/bench_move_batch.py
+"""
+입력 묶음(CMD_REQ_MOVE_BATCH) 패킷/syscall 벤치마크
+
+4인 게임에서 한 플레이어가 블록마다 키를 연달아 누르는 입력 흐름(초당 --pps 블록, 블록당 2~7개 입력,
+입력 간격 --gap ms)을 클라이언트 루프(10ms마다 키 하나, GameScene과 같음)로 보내고 실제 라우터/핸들러로 중계
+- per-key: 입력마다 CMD_REQ_MOVE -> 서버가 상대마다 CMD_NOTI_MOVE
+- batch  : 한 틱(1/TICK_RATE초)에 한 번 CMD_REQ_MOVE_BATCH -> 서버가 상대마다 CMD_NOTI_MOVE_BATCH 하나
+클라이언트 송신 프레임/bytes, 서버 중계 프레임/send syscall/bytes, 입력당 서버 처리 시간(핸들러 + flush)을 비교
+(서버는 클라이언트 프레임마다 루프 1회 -> 프레임마다 피어당 sendmsg 1회)
+
+실행: python -m src.benchmarks.bench_move_batch [--gap 5 10 20 40] [--pps 2.5] [--seconds 60]
+"""
+import sys
+import os
+import time
+import struct
+import random
+import argparse
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.common.protocol import Packet
+from src.common.constants import CMD_REQ_MOVE, CMD_REQ_MOVE_BATCH, Action
+from src.common.config import TICK_RATE
+from src.common.move_batch import encode_moves
+from src.server.infra.router import router
+from src.server.game.room_manager import room_manager
+from src.benchmarks.bench_broadcast import setup_room, PLAYERS
+
+LOOP_MS = 10  # GameScene.update 주기 (time.sleep(0.01))
+KEYS = [Action.MOVE_LEFT.value, Action.ROTATE.value, Action.MOVE_RIGHT.value, Action.DOWN.value, Action.DROP.value]
+
+def make_trace(seconds, pps, gap_ms, seed):
+    """키를 누른 시각(ms) 목록: 블록마다 2~7개 입력을 약 gap_ms 간격으로"""
+    rng = random.Random(seed)
+    times = []
+    t = 0.0
+    while t < seconds * 1000:
+        for i in range(rng.randint(2, 7)):
+            times.append(t + i * gap_ms * rng.uniform(0.8, 1.2))
+        t += 1000 / pps
+    return times
+
+def client_frames(times, mode):
+    """클라이언트 루프마다 키 하나를 읽어 보낸 패킷 목록 (batch: GameScene._flush_moves와 같은 규칙)"""
+    interval = 1000 / TICK_RATE
+    frames = []
+    pending = []
+    pending_frame = 0
+    i = 0
+    now = 0
+    while i < len(times) or pending:
+        frame = int(now // interval)
+        if i < len(times) and times[i] <= now:
+            keycode = KEYS[i % len(KEYS)]
+            i += 1
+            if mode == 'per-key':
+                frames.append(Packet(CMD_REQ_MOVE, struct.pack('>B I', keycode, frame)))
+            else:
+                if not pending:
+                    pending_frame = frame
+                pending.append((keycode, frame))
+        if pending and frame != pending_frame:
+            frames.extend(Packet(CMD_REQ_MOVE_BATCH, body) for body in encode_moves(pending))
+            pending.clear()
+        now += LOOP_MS
+    return frames
+
+def drain(remotes):
+    """상대 소켓에 도착한 bytes 수"""
+    total = 0
+    for r in remotes:
+        try:
+            while True:
+                data = r.recv(1 << 16)
+                if not data:
+                    break
+                total += len(data)
+        except BlockingIOError:
+            pass
+    return total
+
+def run(frames, inputs):
+    room, peers, remotes = setup_room(use_sendmsg=True)
+    room.game_session.tick_timer.cancel()
+    for p in peers:
+        p.flush()
+    drain(remotes)
+    for p in peers:
+        p.conn.calls = 0
+
+    sender = peers[0]
+    bytes_down = 0
+    elapsed = 0
+    for pkt in frames:
+        t0 = time.perf_counter_ns()
+        router.handle(sender, pkt)
+        # 서버 루프 1회가 끝날 때의 flush
+        for p in peers:
+            p.flush()
+        elapsed += time.perf_counter_ns() - t0
+        bytes_down += drain(remotes)
+
+    result = {
+        'frames_up': len(frames),
+        'bytes_up': sum(len(pkt.to_bytes()) for pkt in frames),
+        'relays': len(frames) * (PLAYERS - 1),
+        'syscalls': sum(p.conn.calls for p in peers),
+        'bytes_down': bytes_down,
+        'us_per_input': elapsed / inputs / 1000,
+    }
+    room_manager.remove_room(room.room_id)
+    for p, r in zip(peers, remotes):
+        p.conn.sock.close()
+        r.close()
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="batched move frame benchmark")
+    parser.add_argument('--gap', type=float, nargs='+', default=[5, 10, 20, 40], help="ms between keys of one piece")
+    parser.add_argument('--pps', type=float, default=2.5, help="pieces per second")
+    parser.add_argument('--seconds', type=int, default=60)
+    args = parser.parse_args()
+
+    print(f"{PLAYERS} players, one sender, {args.pps} pieces/s x 2-7 keys, flush every {1000 / TICK_RATE:.1f} ms")
+    print(f"{'gap':>5} {'mode':<8} {'keys/s':>7} {'frames up':>10} {'bytes up':>9} {'relays':>7} "
+          f"{'send calls':>11} {'bytes down':>11} {'us/input':>9}")
+    for gap in args.gap:
+        times = make_trace(args.seconds, args.pps, gap, seed=int(gap))
+        results = {}
+        for mode in ('per-key', 'batch'):
+            r = results[mode] = run(client_frames(times, mode), len(times))
+            print(f"{gap:>5.0f} {mode:<8} {len(times) / args.seconds:>7.1f} {r['frames_up']:>10} {r['bytes_up']:>9} "
+                  f"{r['relays']:>7} {r['syscalls']:>11} {r['bytes_down']:>11} {r['us_per_input']:>9.2f}")
+        a, b = results['per-key'], results['batch']
+        print(f"{'':>5} {'ratio':<8} {'':>7} {a['frames_up'] / b['frames_up']:>9.2f}x {a['bytes_up'] / b['bytes_up']:>8.2f}x "
+              f"{a['relays'] / b['relays']:>6.2f}x {a['syscalls'] / b['syscalls']:>10.2f}x "
+              f"{a['bytes_down'] / b['bytes_down']:>10.2f}x {a['us_per_input'] / b['us_per_input']:>8.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# src/benchmarks/bench_packetizer.py
+"""
+Packetizer 처리량 벤치마크 (기존 bytes 버퍼 구현 vs 압축 버퍼 + memoryview 구현)
+
+시나리오
+- coalesced : recv 한 번에 작은 CMD_REQ_MOVE 프레임 수십 개가 뭉쳐서 도착
+- bulk      : 64KB 단위로 대량 수신 (기존 구현의 재슬라이싱 비용이 제곱으로 커지는 구간)
+- fragmented: 프레임이 7바이트 단위로 잘게 쪼개져서 도착
+
+실행: python -m src.benchmarks.bench_packetizer [--frames N] [--repeat R]
+"""
+import sys
+import os
+import time
+import argparse
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.common.protocol import Packet
+from src.common.packet_handler import Packetizer
+from src.common.config import HEADER_SIZE, BUFFER_SIZE
+from src.common.constants import CMD_REQ_MOVE, CMD_REQ_CREATE_ROOM
+
+class LegacyPacketizer:
+    """비교용: 변경 전 Packetizer (bytes 재연결 + 매 프레임 재슬라이싱)"""
+    def __init__(self):
+        self.buffer = b''
+
+    def put_data(self, data):
+        if data:
+            self.buffer += data
+
+    def get_packets(self):
+        while True:
+            if len(self.buffer) < HEADER_SIZE:
+                break
+            payload_len = Packet.parse_header(self.buffer[:HEADER_SIZE])
+            total_packet_len = HEADER_SIZE + payload_len
+            if len(self.buffer) < total_packet_len:
+                break
+            raw_payload = self.buffer[HEADER_SIZE : total_packet_len]
+            self.buffer = self.buffer[total_packet_len:]
+            yield Packet(raw_payload[0], raw_payload[1:])
+
+def make_stream(frames):
+    """MOVE 프레임 위주 + 가끔 긴 프레임이 섞인 스트림 생성"""
+    out = bytearray()
+    for i in range(frames):
+        if i % 50 == 49:
+            out += Packet(CMD_REQ_CREATE_ROOM, b'R' * 40).to_bytes()
+        else:
+            out += Packet(CMD_REQ_MOVE, bytes([1 + i % 5])).to_bytes()
+    return bytes(out)
+
+def chunked(stream, size):
+    return [stream[i:i + size] for i in range(0, len(stream), size)]
+
+def run_legacy(chunks):
+    p = LegacyPacketizer()
+    count = 0
+    for chunk in chunks:
+        p.put_data(chunk)
+        for _ in p.get_packets():
+            count += 1
+    return count
+
+def run_frames(chunks):
+    p = Packetizer()
+    count = 0
+    for chunk in chunks:
+        p.put_data(chunk)
+        for _ in p.get_frames():
+            count += 1
+    return count
+
+def run_packets(chunks):
+    p = Packetizer()
+    count = 0
+    for chunk in chunks:
+        p.put_data(chunk)
+        for _ in p.get_packets():
+            count += 1
+    return count
+
+def measure(func, chunks, repeat):
+    best = float('inf')
+    count = 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        count = func(chunks)
+        best = min(best, time.perf_counter() - t0)
+    return count, best
+
+def main():
+    parser = argparse.ArgumentParser(description="Packetizer throughput benchmark")
+    parser.add_argument('--frames', type=int, default=200000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    stream = make_stream(args.frames)
+    scenarios = {
+        'coalesced': chunked(stream, BUFFER_SIZE),
+        'bulk': chunked(stream, 65536),
+        'fragmented': chunked(stream, 7),
+    }
+    impls = [
+        ('legacy bytes', run_legacy),
+        ('frames (server path)', run_frames),
+        ('packets (client copy)', run_packets),
+    ]
+
+    print(f"frames={args.frames} stream={len(stream)}B repeat={args.repeat}")
+    for name, chunks in scenarios.items():
+        print(f"\n[{name}] chunks={len(chunks)}")
+        base = None
+        for label, func in impls:
+            count, elapsed = measure(func, chunks, args.repeat)
+            assert count == args.frames, (label, count)
+            rate = count / elapsed
+            base = base or rate
+            print(f"  {label:<22} {rate / 1e6:7.3f} M frames/s  (x{rate / base:.2f})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# src/benchmarks/bench_replay.py
+"""
+리플레이 기록 비용 벤치마크 (src/server/infra/replay_writer.py)
+
+- recorder.move     : MatchRecorder에 입력 레코드 1개를 추가하는 비용 (청크 인계 포함)
+- handle_move       : GameSession.handle_move (중계된 입력 1개 처리) 리플레이 끔 / 켬 비교
+- writer            : writer 스레드가 파일에 쓴 양, 입력당 파일 크기, 밀려서 버린 청크 수
+
+실행: python -m src.benchmarks.bench_replay [--moves N]
+"""
+import sys
+import os
+import time
+import argparse
+import tempfile
+import logging
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.common.replay import ReplayReader
+from src.server.infra.replay_writer import ReplayWriter, replay_writer
+from src.tests.helpers import StubRoom, start_session
+
+def bench_recorder(directory, moves):
+    writer = ReplayWriter()
+    writer.configure(directory)
+    rec = writer.open_match(1, 1, [(i, f"P{i}") for i in range(4)], 'off', 30)
+    move = rec.move
+    t0 = time.perf_counter_ns()
+    for i in range(moves):
+        move(i & 3, 1 + i % 5, i >> 3, i >> 3)
+    elapsed = time.perf_counter_ns() - t0
+    rec.close()
+    writer.flush(timeout=30)
+    writer.stop()
+    return elapsed / moves, writer.get_stats(), rec.path
+
+def bench_session(moves):
+    _, session = start_session(room=StubRoom(players=4, room_id=1, keep_packets=False))
+    handle = session.handle_move
+    t0 = time.perf_counter_ns()
+    for i in range(moves):
+        if i % 8 == 0:
+            session.tick += 1
+        handle(i & 3, 1 + i % 5, session.tick)
+    elapsed = time.perf_counter_ns() - t0
+    session.finish_game(0)
+    return elapsed / moves, session.recorder
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorder overhead benchmark")
+    parser.add_argument('--moves', type=int, default=500_000)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ns, stats, path = bench_recorder(tmp, args.moves)
+        reader = ReplayReader(path)
+        size = os.path.getsize(path)
+        print(f"recorder.move          : {ns:8.0f} ns/move")
+        print(f"  file {size / 1024:.1f} KiB for {reader.record_count} records "
+              f"({size / reader.record_count:.1f} B/record, {len(reader.index)} index entries)")
+        print(f"  writer {stats}")
+
+        replay_writer.configure(None)
+        off, _ = bench_session(args.moves)
+        replay_writer.configure(tmp)
+        on, recorder = bench_session(args.moves)
+        replay_writer.flush(timeout=30)
+        replay_writer.configure(None)
+        print(f"handle_move (replay off): {off:8.0f} ns/move")
+        print(f"handle_move (replay on) : {on:8.0f} ns/move  (+{on - off:.0f} ns)")
+        print(f"  recorded {recorder.records} records, failed={recorder.failed}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+# src/benchmarks/bench_server_backends.py
+"""
+서버 백엔드 비교 벤치마크 (selectors 루프 vs asyncio)
+
+각 백엔드를 별도 프로세스로 띄운 뒤 측정
+- connections/sec : 접속 -> 로그인 -> RES_LOGIN 수신 -> 종료 반복
+- relay latency   : 게임 중 방장의 REQ_MOVE가 상대에게 NOTI_MOVE로 도착하기까지 왕복 시간 (p50/p99)
+
+실행: python -m src.benchmarks.bench_server_backends [--backends selectors asyncio] [--conns N] [--moves M]
+"""
+import sys
+import os
+import time
+import socket
+import struct
+import argparse
+import subprocess
+import threading
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.append(ROOT)
+
+from src.common.protocol import Packet
+from src.common.packet_handler import Packetizer
+from src.common.constants import *
+
+class BenchClient:
+    """측정용 블로킹 클라이언트 (수신 스레드 없이 필요한 패킷을 직접 기다림)"""
+    def __init__(self, port, timeout=5.0):
+        self.sock = socket.create_connection(('127.0.0.1', port), timeout=timeout)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.packetizer = Packetizer()
+        self.backlog = []
+
+    def send(self, cmd, body=b''):
+        self.sock.sendall(Packet(cmd, body).to_bytes())
+
+    def wait_for(self, cmd):
+        while True:
+            for i, pkt in enumerate(self.backlog):
+                if pkt.cmd == cmd:
+                    return self.backlog.pop(i)
+            if not self.packetizer.recv_into(self.sock):
+                raise ConnectionError("server closed connection")
+            self.backlog.extend(self.packetizer.get_packets())
+
+    def close(self):
+        self.sock.close()
+
+def start_server(backend, port, extra_args=()):
+    """벤치마크용 서버 실행 (리플레이 기록 끔: 저장소의 replays/에 파일을 남기지 않음)"""
+    proc = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, 'main_server.py'), '--backend', backend, '--port', str(port),
+         '--replay-dir=', *extra_args],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, cwd=ROOT)
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.2).close()
+            return proc
+        except OSError:
+            time.sleep(0.05)
+    proc.kill()
+    raise RuntimeError(f"{backend} server did not start")
+
+def bench_connections(port, total, threads):
+    def worker(n):
+        for _ in range(n):
+            c = BenchClient(port)
+            c.send(CMD_REQ_LOGIN, b'bench')
+            c.wait_for(CMD_RES_LOGIN)
+            c.close()
+
+    per_thread = total // threads
+    ts = [threading.Thread(target=worker, args=(per_thread,)) for _ in range(threads)]
+    t0 = time.perf_counter()
+    for t in ts: t.start()
+    for t in ts: t.join()
+    return per_thread * threads / (time.perf_counter() - t0)
+
+def bench_relay(port, moves):
+    host, guest = BenchClient(port), BenchClient(port)
+    for c, name in ((host, b'host'), (guest, b'guest')):
+        c.send(CMD_REQ_LOGIN, name)
+        c.wait_for(CMD_RES_LOGIN)
+
+    host.send(CMD_REQ_CREATE_ROOM, b'bench')
+    _, room_id = struct.unpack('>B H', host.wait_for(CMD_RES_CREATE_ROOM).body)
+    guest.send(CMD_REQ_JOIN_ROOM, struct.pack('>H', room_id))
+    guest.wait_for(CMD_RES_JOIN_ROOM)
+    guest.send(CMD_REQ_TOGGLE_READY)
+    host.wait_for(CMD_NOTI_READY_STATE)
+    host.send(CMD_REQ_TOGGLE_READY)
+    host.wait_for(CMD_NOTI_GAME_START)
+    guest.wait_for(CMD_NOTI_GAME_START)
+
+    samples = []
+    move = bytes([Action.MOVE_LEFT.value])
+    for _ in range(moves):
+        t0 = time.perf_counter()
+        host.send(CMD_REQ_MOVE, move)
+        guest.wait_for(CMD_NOTI_MOVE)
+        samples.append(time.perf_counter() - t0)
+
+    host.close()
+    guest.close()
+    samples.sort()
+    pick = lambda q: samples[min(len(samples) - 1, int(len(samples) * q))] * 1e6
+    return pick(0.50), pick(0.99)
+
+def main():
+    parser = argparse.ArgumentParser(description="selectors vs asyncio server backend benchmark")
+    parser.add_argument('--backends', nargs='+', default=['selectors', 'asyncio'])
+    parser.add_argument('--port', type=int, default=5600)
+    parser.add_argument('--conns', type=int, default=1000)
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--moves', type=int, default=5000)
+    args = parser.parse_args()
+
+    print(f"{'backend':<10} {'conn/s':>10} {'p50 us':>10} {'p99 us':>10}")
+    for i, backend in enumerate(args.backends):
+        port = args.port + i
+        proc = start_server(backend, port)
+        try:
+            rate = bench_connections(port, args.conns, args.threads)
+            p50, p99 = bench_relay(port, args.moves)
+        finally:
+            proc.terminate()
+            proc.wait()
+        print(f"{backend:<10} {rate:>10.0f} {p50:>10.1f} {p99:>10.1f}")
+
+if __name__ == "__main__":
+    main()
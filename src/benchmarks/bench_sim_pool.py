@@ -0,0 +1,113 @@
+# src/benchmarks/bench_sim_pool.py
+"""
+시뮬레이션 워커 풀 확장성 벤치마크 (sim_pool)
+
+4인 방 N개의 입력 스트림(초당 --ips 입력/플레이어)을 서버 루프처럼 틱 단위로 제출하고
+워커 수를 바꿔 가며 처리량을 측정
+- inline : 워커 없이 I/O 프로세스에서 실행 (SIM_WORKERS=0)
+- wN     : N개 워커 프로세스 (방 번호로 고정 배정)
+
+출력: 초당 처리 입력 수, 1워커 대비 배속/효율, I/O 프로세스가 쓴 CPU 비율
+(I/O 프로세스 CPU가 낮을수록 소켓 처리에 쓸 여유가 많음)
+
+실행: python -m src.benchmarks.bench_sim_pool [--rooms N] [--seconds S] [--workers 1 2 4]
+"""
+import sys
+import os
+import time
+import random
+import argparse
+from multiprocessing.connection import wait
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.common.config import TICK_RATE, TICK_SYNC_INTERVAL, SIM_MAX_LAG_TICKS, GARBAGE_DELAY_TICKS
+from src.server.infra.sim_pool import SimPool
+
+PLAYERS = 4
+ACTIONS = [1, 1, 1, 2, 2, 2, 3, 3, 4, 5]  # 좌/우 이동, 회전이 많고 드롭은 가끔
+
+def make_streams(rooms, ticks, ips, seed=1):
+    """방마다 틱별 명령 목록 (서버가 GameSession에서 만드는 명령과 같은 형태)"""
+    rng = random.Random(seed)
+    chance = ips / TICK_RATE
+    streams = []
+    for _ in range(rooms):
+        per_tick = []
+        for tick in range(1, ticks + 1):
+            cmds = []
+            for slot in range(PLAYERS):
+                if rng.random() < chance:
+                    cmds.append(('move', slot, rng.choice(ACTIONS), tick))
+            if tick % 90 == 0:
+                cmds.append(('garbage', rng.randrange(PLAYERS), 1, tick + GARBAGE_DELAY_TICKS))
+            if tick % TICK_SYNC_INTERVAL == 0 and tick > SIM_MAX_LAG_TICKS:
+                cmds.append(('catch_up', tick - SIM_MAX_LAG_TICKS))
+            per_tick.append(cmds)
+        streams.append(per_tick)
+    return streams
+
+def run(workers, streams, ticks):
+    """(입력 수, 걸린 시간, I/O 프로세스 CPU 시간) 반환"""
+    pool = SimPool()
+    pool.start(workers)
+    events = [0]
+    def on_events(evs):
+        events[0] += len(evs)
+
+    handles = [pool.create(room_id, room_id, range(PLAYERS), 'authoritative', on_events)
+               for room_id in range(1, len(streams) + 1)]
+    inputs = 0
+    cpu0 = time.process_time()
+    t0 = time.perf_counter()
+    for t in range(ticks):
+        # 서버 루프 1회 = 틱 하나 동안 들어온 명령 제출 -> flush -> 도착한 응답 처리
+        for handle, stream in zip(handles, streams):
+            for cmd in stream[t]:
+                handle.submit(cmd)
+                inputs += cmd[0] == 'move'
+        if pool.enabled:
+            pool.flush()
+            for conn in wait(pool.connections, timeout=0):
+                pool.on_readable(conn)
+    for handle in handles:
+        handle.close()
+    if pool.enabled:
+        pool.flush()
+        while pool.pending():
+            for conn in wait(pool.connections):
+                pool.on_readable(conn)
+    elapsed = time.perf_counter() - t0
+    cpu = time.process_time() - cpu0
+    stats = pool.get_stats()
+    pool.stop()
+    return inputs, elapsed, cpu, stats
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulation worker pool scaling benchmark")
+    parser.add_argument('--rooms', type=int, default=64, help="방 수 (방당 4명)")
+    parser.add_argument('--seconds', type=int, default=20, help="게임 시간 (초, 서버 틱 기준)")
+    parser.add_argument('--ips', type=float, default=6.0, help="플레이어 1명의 초당 입력 수")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    args = parser.parse_args()
+
+    ticks = args.seconds * TICK_RATE
+    streams = make_streams(args.rooms, ticks, args.ips)
+    print(f"rooms={args.rooms} seconds={args.seconds} ips={args.ips} cpus={os.cpu_count()}")
+    print(f"  {'mode':<8}{'inputs/s':>12}{'speedup':>9}{'efficiency':>12}{'io cpu':>9}{'max backlog':>13}")
+
+    base = None
+    for workers in [0] + args.workers:
+        inputs, elapsed, cpu, stats = run(workers, streams, ticks)
+        rate = inputs / elapsed
+        label = 'inline' if workers == 0 else f"w{workers}"
+        if workers == 0:
+            print(f"  {label:<8}{rate:>12,.0f}{'':>9}{'':>12}{cpu / elapsed:>8.0%}{'-':>13}")
+            continue
+        base = base or rate
+        speedup = rate / base
+        print(f"  {label:<8}{rate:>12,.0f}{speedup:>8.2f}x{speedup / workers:>11.0%}"
+              f"{cpu / elapsed:>8.0%}{stats['max_backlog']:>13}")
+
+if __name__ == "__main__":
+    main()
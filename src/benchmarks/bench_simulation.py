@@ -0,0 +1,89 @@
+# src/benchmarks/bench_simulation.py
+"""
+서버 게임 시뮬레이션 벤치마크 (GameSession.simulation_mode)
+
+4인 방 N개를 서버 틱(TICK_RATE) 단위로 진행하면서 플레이어마다 초당 --ips 회의
+[KeyCode][Tick] 입력을 넣고, 모드별 처리 시간을 측정
+- off           : 중계만 (시뮬레이션 없음, 기준선)
+- shadow        : 슬롯별 GameState 진행 + 클라이언트 보고와 대조
+- authoritative : 슬롯별 GameState 진행 + 공격/게임오버를 서버가 판정
+
+출력: 코어 1개 기준 초당 처리 입력 수, 실시간 대비 배속,
+      그리고 지정한 입력 빈도에서 코어 1개가 감당할 수 있는 방 수(추정)
+
+실행: python -m src.benchmarks.bench_simulation [--rooms N] [--seconds S] [--ips K]
+"""
+import sys
+import os
+import time
+import random
+import logging
+import argparse
+import io
+import contextlib
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.common.constants import Action
+from src.common.config import TICK_RATE
+from src.server.game.game_session import GameSession
+from src.tests.helpers import StubRoom, start_session
+
+PLAYERS = 4
+# 실제 플레이와 비슷한 입력 분포 (블록 하나에 좌우 이동/회전 몇 번 + 드롭 1번)
+ACTIONS = ([Action.MOVE_LEFT] * 3 + [Action.MOVE_RIGHT] * 3 + [Action.ROTATE] * 2 +
+           [Action.DOWN] * 1 + [Action.DROP] * 1)
+
+def run(mode, rooms, seconds, ips, seed=1):
+    """(입력 수, 진행 틱 수, 걸린 시간, 끝난 게임 수) 반환"""
+    GameSession.simulation_mode = mode
+    rng = random.Random(seed)
+    random.seed(seed)  # 게임 시드도 매번 같게
+    chance = ips / TICK_RATE
+    with contextlib.redirect_stdout(io.StringIO()):
+        room_list = [StubRoom(PLAYERS, room_id=i, keep_packets=False) for i in range(rooms)]
+        sessions = [start_session(room=room)[1] for room in room_list]
+
+        inputs = 0
+        games = 0
+        ticks = seconds * TICK_RATE
+        t0 = time.perf_counter()
+        for _ in range(ticks):
+            for i, session in enumerate(sessions):
+                session.on_tick()
+                tick = session.tick
+                for slot in range(PLAYERS):
+                    if rng.random() < chance:
+                        session.handle_move(slot, rng.choice(ACTIONS).value, tick)
+                        inputs += 1
+                if room_list[i].ended or len(session.alive_slots) <= 1:
+                    # 한 판이 끝나면 같은 방에서 새 게임 시작
+                    games += 1
+                    sessions[i] = start_session(room=room_list[i])[1]
+        elapsed = time.perf_counter() - t0
+    return inputs, ticks, elapsed, games
+
+def main():
+    parser = argparse.ArgumentParser(description="Server-side game simulation benchmark")
+    parser.add_argument('--rooms', type=int, default=50, help="동시 진행 방 수 (방당 4명)")
+    parser.add_argument('--seconds', type=int, default=20, help="게임 시간 (초, 서버 틱 기준)")
+    parser.add_argument('--ips', type=float, default=6.0, help="플레이어 1명의 초당 입력 수")
+    parser.add_argument('--modes', nargs='+', default=['off', 'shadow', 'authoritative'],
+                        choices=['off', 'shadow', 'authoritative'])
+    args = parser.parse_args()
+
+    # 파일 로그(공격/사망)는 측정에서 제외
+    logging.disable(logging.WARNING)
+
+    print(f"rooms={args.rooms} players={args.rooms * PLAYERS} seconds={args.seconds} "
+          f"tick_rate={TICK_RATE} ips={args.ips}")
+    print(f"  {'mode':<14}{'inputs':>9}{'inputs/s/core':>16}{'x realtime':>12}{'rooms/core':>12}{'games':>7}")
+    for mode in args.modes:
+        inputs, ticks, elapsed, games = run(mode, args.rooms, args.seconds, args.ips)
+        realtime = (ticks / TICK_RATE) / elapsed
+        # 실시간 배속 = 코어 1개가 같은 부하의 방을 몇 배까지 돌릴 수 있는지
+        print(f"  {mode:<14}{inputs:>9}{inputs / elapsed:>16,.0f}{realtime:>11.1f}x"
+              f"{args.rooms * realtime:>12,.0f}{games:>7}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# src/benchmarks/bench_snapshot.py
+"""
+보드 스냅샷 코덱 벤치마크 (src/core/snapshot.py)
+
+무작위 입력으로 게임을 진행하면서 재동기화 주기(SNAPSHOT_INTERVAL_TICKS)마다 스냅샷을 만들고
+재동기화 1회당 바이트 수를 비교 (기준: 칸당 1바이트 보드 200B)
+- grid 1B/cell : Board.grid를 그대로 보낼 때 (200B, 블록/점수 정보 없음)
+- raw          : pack_state (헤더 + 4비트 패킹 보드 + 방해 줄 목록)
+- snapshot     : compress (보드 RLE, 짧을 때만)
+- delta        : 직전 스냅샷 대비 XOR 델타
+- mixed        : 실제 전송 형태 (SNAPSHOT_KEYFRAME_EVERY번마다 전체, 나머지 델타)
+인코딩/디코딩 시간도 함께 출력
+
+실행: python -m src.benchmarks.bench_snapshot [--games N] [--ticks T] [--ips K]
+"""
+import sys
+import os
+import time
+import random
+import argparse
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.common.constants import Action
+from src.common.config import TICK_RATE, SNAPSHOT_INTERVAL_TICKS, SNAPSHOT_KEYFRAME_EVERY
+from src.core.game_state import GameState
+from src.core.snapshot import (pack_state, restore_state, compress, decompress,
+                               encode_delta, decode_delta, CELLS)
+
+ACTIONS = [Action.MOVE_LEFT] * 3 + [Action.MOVE_RIGHT] * 3 + [Action.ROTATE] * 2 + [Action.DOWN, Action.DROP]
+
+def collect(games, ticks, ips, seed=1):
+    """게임 진행 중 재동기화 시점마다 raw 스냅샷 목록 (게임별)"""
+    rng = random.Random(seed)
+    chance = ips / TICK_RATE
+    streams = []
+    for g in range(games):
+        game = GameState(seed + g)
+        raws = []
+        for tick in range(1, ticks + 1):
+            game.advance_to(tick)
+            if rng.random() < chance:
+                game.process_input(rng.choice(ACTIONS))
+            if tick % 120 == 0:
+                game.queue_garbage(rng.randint(1, 2), tick + 60)
+            game.attacks.clear()
+            if game.game_over:
+                game = GameState(rng.getrandbits(32))
+            if tick % SNAPSHOT_INTERVAL_TICKS == 0:
+                raws.append(pack_state(game))
+        streams.append(raws)
+    return streams
+
+def main():
+    parser = argparse.ArgumentParser(description="Board snapshot codec benchmark")
+    parser.add_argument('--games', type=int, default=20)
+    parser.add_argument('--ticks', type=int, default=TICK_RATE * 120, help="게임당 진행 틱 (기본 2분)")
+    parser.add_argument('--ips', type=float, default=6.0, help="초당 입력 수")
+    args = parser.parse_args()
+
+    streams = collect(args.games, args.ticks, args.ips)
+    sizes = {'grid 1B/cell': [], 'raw': [], 'snapshot': [], 'delta': [], 'mixed': []}
+    enc_ns = dec_ns = count = 0
+    for raws in streams:
+        base = None
+        for i, raw in enumerate(raws):
+            t0 = time.perf_counter_ns()
+            full = compress(raw)
+            delta = encode_delta(raw, base) if base is not None else None
+            t1 = time.perf_counter_ns()
+            restore_state(GameState(0), decompress(full))
+            if delta is not None:
+                decode_delta(delta, base)
+            t2 = time.perf_counter_ns()
+            enc_ns += t1 - t0
+            dec_ns += t2 - t1
+            count += 1
+
+            sizes['grid 1B/cell'].append(CELLS)
+            sizes['raw'].append(len(raw))
+            sizes['snapshot'].append(len(full))
+            if delta is not None:
+                sizes['delta'].append(len(delta))
+            keyframe = delta is None or i % SNAPSHOT_KEYFRAME_EVERY == 0
+            sizes['mixed'].append(len(full) if keyframe else len(delta))
+            base = raw
+
+    print(f"games={args.games} ticks={args.ticks} ips={args.ips} "
+          f"resync every {SNAPSHOT_INTERVAL_TICKS} ticks, keyframe every {SNAPSHOT_KEYFRAME_EVERY}")
+    print(f"  {'format':<14}{'avg B':>8}{'max B':>8}{'vs 200B grid':>14}")
+    for name, values in sizes.items():
+        avg = sum(values) / len(values)
+        print(f"  {name:<14}{avg:>8.1f}{max(values):>8}{avg / CELLS:>13.0%}")
+    print(f"\n  encode (snapshot + delta): {enc_ns / count / 1000:.1f} us/resync")
+    print(f"  decode (restore + delta) : {dec_ns / count / 1000:.1f} us/resync")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# src/benchmarks/bench_spectators.py
+"""
+관전자 수에 따른 플레이어 중계 지연 벤치마크
+
+서버(selectors, --sim authoritative)를 별도 프로세스로 띄우고 4인 게임을 시작한 뒤
+관전자 N명을 붙인 상태에서 방장의 REQ_MOVE가 다른 플레이어에게 NOTI_MOVE로 도착하기까지의
+왕복 시간(p50/p99)을 측정 (관전자 0명과 비교)
+관전자는 별도 프로세스에서 접속해 소켓을 계속 읽어서 비움 (받은 바이트도 집계)
+
+실행: python -m src.benchmarks.bench_spectators [--spectators 0 100 500] [--moves M]
+"""
+import sys
+import os
+import time
+import struct
+import argparse
+import multiprocessing
+import selectors
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.common.constants import *
+from src.benchmarks.bench_server_backends import BenchClient, start_server
+
+PLAYERS = 4
+
+def login(port, name):
+    c = BenchClient(port)
+    c.send(CMD_REQ_LOGIN, name.encode())
+    c.wait_for(CMD_RES_LOGIN)
+    return c
+
+def start_game(port):
+    players = [login(port, f"p{i}") for i in range(PLAYERS)]
+    host = players[0]
+    host.send(CMD_REQ_CREATE_ROOM, b'bench')
+    _, room_id = struct.unpack('>B H', host.wait_for(CMD_RES_CREATE_ROOM).body)
+    for guest in players[1:]:
+        guest.send(CMD_REQ_JOIN_ROOM, struct.pack('>H', room_id))
+        guest.wait_for(CMD_RES_JOIN_ROOM)
+        guest.send(CMD_REQ_TOGGLE_READY)
+        host.wait_for(CMD_NOTI_READY_STATE)
+    host.send(CMD_REQ_TOGGLE_READY)
+    for p in players:
+        p.wait_for(CMD_NOTI_GAME_START)
+    return room_id, players
+
+def spectator_process(port, room_id, count, conn):
+    """관전자 count명을 접속시키고 stop 신호까지 소켓을 계속 읽어 비움 (측정 프로세스와 GIL 분리)"""
+    sel = selectors.DefaultSelector()
+    clients = []
+    for i in range(count):
+        c = login(port, f"s{i}")
+        c.send(CMD_REQ_SPECTATE, struct.pack('>H', room_id))
+        result = c.wait_for(CMD_RES_SPECTATE).body[0]
+        if result != 0:
+            raise RuntimeError(f"spectate failed: {result}")
+        c.sock.setblocking(False)
+        sel.register(c.sock, selectors.EVENT_READ)
+        clients.append(c)
+    conn.send('ready')
+
+    received = 0
+    while not conn.poll():
+        for key, _ in sel.select(timeout=0.05):
+            try:
+                received += len(key.fileobj.recv(1 << 16))
+            except BlockingIOError:
+                pass
+    conn.send(received)
+    for c in clients:
+        c.close()
+
+def run(port, spectators, moves):
+    room_id, players = start_game(port)
+    parent, child = multiprocessing.Pipe()
+    proc = multiprocessing.Process(target=spectator_process, args=(port, room_id, spectators, child))
+    proc.start()
+    parent.recv()
+
+    host, guest = players[0], players[1]
+    time.sleep(0.5)  # 관전 프레임 스트림이 돌기 시작한 뒤 측정
+    samples = []
+    actions = [Action.MOVE_LEFT.value, Action.MOVE_RIGHT.value]
+    start = time.perf_counter()
+    for i in range(moves):
+        t0 = time.perf_counter()
+        host.send(CMD_REQ_MOVE, bytes([actions[i % 2]]))
+        guest.wait_for(CMD_NOTI_MOVE)
+        samples.append(time.perf_counter() - t0)
+        guest.backlog.clear()
+        time.sleep(0.002)  # 실제 입력 간격에 가깝게 (관전 프레임 전송과 겹치도록)
+    elapsed = time.perf_counter() - start
+    parent.send('stop')
+    received = parent.recv()
+    proc.join()
+
+    for c in players:
+        c.close()
+    samples.sort()
+    pick = lambda q: samples[min(len(samples) - 1, int(len(samples) * q))] * 1e6
+    return pick(0.50), pick(0.99), received / elapsed / 1024
+
+def main():
+    parser = argparse.ArgumentParser(description="Spectator fan-out vs player relay latency benchmark")
+    parser.add_argument('--spectators', type=int, nargs='+', default=[0, 100, 500])
+    parser.add_argument('--moves', type=int, default=2000)
+    parser.add_argument('--port', type=int, default=5700)
+    args = parser.parse_args()
+
+    print(f"{PLAYERS} players, server --sim authoritative")
+    print(f"{'spectators':>10} {'p50 us':>9} {'p99 us':>9} {'spectator KiB/s':>16}")
+    for i, n in enumerate(args.spectators):
+        port = args.port + i
+        proc = start_server('selectors', port, ('--sim', 'authoritative'))
+        try:
+            p50, p99, rate = run(port, n, args.moves)
+        finally:
+            proc.terminate()
+            proc.wait()
+        print(f"{n:>10} {p50:>9.1f} {p99:>9.1f} {rate:>16.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# src/benchmarks/bench_state_copy.py
+"""
+GameState 상태 저장/복원 벤치마크 (롤백 / 재동기화용)
+
+게임 도중 상태(쌓인 보드, 방해 줄 대기열 포함)를 여러 개 만들어 두고 방식별 1회 비용과
+한 프레임 예산(--fps) 안에 할 수 있는 횟수를 비교
+- snapshot / restore       : GameState.snapshot() / restore() (같은 객체로 되감기, 블록 순서는 같은 청크)
+- restore (other object)   : 다른 GameState에 복원 (블록 순서 생성기를 seek로 다시 만듦)
+- pack_state / restore_state: 전송용 스냅샷 코덱 (src/core/snapshot.py)
+- deepcopy                 : copy.deepcopy(GameState)
+
+실행: python -m src.benchmarks.bench_state_copy [--states N] [--rounds N] [--fps 60]
+"""
+import sys
+import os
+import copy
+import time
+import random
+import argparse
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.core.game_state import GameState
+from src.core.snapshot import pack_state, restore_state
+from src.tests.test_simulation import bot_action
+
+def make_states(count):
+    """봇이 진행 중인 게임들 (틱 진행 + 방해 줄)"""
+    states = []
+    for seed in range(count):
+        rng = random.Random(seed)
+        game = GameState(seed)
+        for i in range(rng.randrange(20, 120)):
+            game.advance_to(game.tick + rng.randrange(3))
+            game.process_input(bot_action(game, rng))
+            if i % 25 == 0:
+                game.queue_garbage(1 + i % 3, game.tick + 40)
+            if game.game_over:
+                break
+        states.append(game)
+    return states
+
+def timed(fn, items, rounds):
+    """items 각각에 fn을 rounds번 -> 가장 빠른 회차의 1회 평균 ns"""
+    best = None
+    for _ in range(rounds):
+        t0 = time.perf_counter_ns()
+        for item in items:
+            fn(item)
+        elapsed = time.perf_counter_ns() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best / len(items)
+
+def main():
+    parser = argparse.ArgumentParser(description="GameState snapshot/restore benchmark")
+    parser.add_argument('--states', type=int, default=200)
+    parser.add_argument('--rounds', type=int, default=50)
+    parser.add_argument('--fps', type=int, default=60, help="frame budget = 1 / fps")
+    args = parser.parse_args()
+
+    games = make_states(args.states)
+    snaps = [(game, game.snapshot()) for game in games]
+    raws = [(game, pack_state(game)) for game in games]
+    others = [(GameState(game.seed), state) for game, state in snaps]
+
+    cases = [
+        ("snapshot", lambda game: game.snapshot(), games),
+        ("restore", lambda pair: pair[0].restore(pair[1]), snaps),
+        ("snapshot + restore", lambda pair: pair[0].restore(pair[0].snapshot()), snaps),
+        ("restore (other object)", lambda pair: pair[0].restore(pair[1]), others),
+        ("pack_state", pack_state, games),
+        ("restore_state", lambda pair: restore_state(pair[0], pair[1]), raws),
+        ("deepcopy", copy.deepcopy, games),
+    ]
+    budget = 1e9 / args.fps
+    print(f"{len(games)} mid-game states, frame budget {budget / 1e6:.1f} ms ({args.fps} fps)")
+    for name, fn, items in cases:
+        ns = timed(fn, items, args.rounds if name != "deepcopy" else max(1, args.rounds // 10))
+        print(f"{name:<24}: {ns / 1000:8.2f} us/op  {budget / ns:10,.0f} per frame")
+
+    # 복원 후 상태가 그대로인지 (벤치마크가 잘못된 것을 재지 않도록)
+    for game, state in snaps:
+        game.restore(state)
+        assert game.snapshot() == state
+
+if __name__ == "__main__":
+    main()
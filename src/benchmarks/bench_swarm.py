@@ -0,0 +1,494 @@
+# src/benchmarks/bench_swarm.py
+"""
+봇 스웜 부하 생성기 (대회/이벤트 전 서버 호스트 크기 산정용)
+
+asyncio 프로세스 여러 개에서 봇 수천 개를 띄워 실제 클라이언트와 같은 흐름으로 서버를 두드림
+  접속 -> 로그인 -> 방 생성/입장 -> 레디 -> 게임 (설정한 APM으로 입력, 줄을 지우면 공격, 게임오버 보고)
+  -> 결과 후 다시 레디 (--duration 동안 반복) -> 방 퇴장 -> 종료
+봇은 NOTI_GAME_START의 시드로 자기 보드(GameState)를 직접 진행하므로 입력/공격/게임오버가 실제 게임과 같은 모양
+한 방의 봇은 모두 같은 프로세스에 있어서, 보낸 REQ_MOVE가 같은 방 다른 봇에게 NOTI_MOVE로 도착하는 왕복 시간을 측정
+
+보고: 접속 속도와 접속+로그인 지연, 중계 왕복 p50/p90/p99, 입력/공격 수, 서버 CPU 사용률, 오류 종류별 수
+서버 CPU는 --spawn으로 띄운 서버 또는 --server-pid의 프로세스(자식 워커 포함)를 /proc에서 읽음 (Linux)
+
+실행: python -m src.benchmarks.bench_swarm --spawn selectors --bots 1000 --procs 4 --apm 120 --duration 30
+      python -m src.benchmarks.bench_swarm --host 10.0.0.5 --port 5000 --bots 4000 --procs 8 --server-pid 1234
+"""
+import sys
+import os
+import time
+import random
+import socket
+import struct
+import asyncio
+import argparse
+import multiprocessing
+from collections import Counter, deque
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import src.common.constants as constants
+from src.common.constants import *
+from src.common.config import PORT, MAX_ROOM_SLOTS
+from src.common.errors import ProtocolError
+from src.common.protocol import Packet
+from src.common.packet_handler import Packetizer
+from src.core.game_state import GameState
+from src.benchmarks.bench_server_backends import start_server
+
+CMD_NAMES = {value: name for name, value in vars(constants).items() if name.startswith('CMD_')}
+ACTION_NAMES = {'LEFT': Action.MOVE_LEFT, 'RIGHT': Action.MOVE_RIGHT, 'ROTATE': Action.ROTATE,
+                'DOWN': Action.DOWN, 'DROP': Action.DROP, 'ITEM': Action.USE_ITEM}
+RANDOM_ACTIONS = [Action.MOVE_LEFT, Action.MOVE_RIGHT, Action.ROTATE, Action.DOWN, Action.DROP]
+
+class SwarmStats:
+    """프로세스별 측정값 (끝나면 dict로 부모 프로세스에 보내 합침)"""
+    FIELDS = ('connected', 'moves', 'attacks', 'gameovers', 'games_started', 'games_finished', 'bytes_in',
+              'cpu_seconds')
+
+    def __init__(self):
+        self.connect_ms = []
+        self.rtt_ms = []
+        self.errors = Counter()
+        for name in self.FIELDS:
+            setattr(self, name, 0)
+
+    def to_dict(self):
+        out = {name: getattr(self, name) for name in self.FIELDS}
+        out.update(connect_ms=self.connect_ms, rtt_ms=self.rtt_ms, errors=dict(self.errors))
+        return out
+
+    @classmethod
+    def merge(cls, dicts):
+        total = cls()
+        for d in dicts:
+            for name in cls.FIELDS:
+                setattr(total, name, getattr(total, name) + d[name])
+            total.connect_ms.extend(d['connect_ms'])
+            total.rtt_ms.extend(d['rtt_ms'])
+            total.errors.update(d['errors'])
+        return total
+
+def plan_piece(game, rng):
+    """
+    현재 블록을 가장 깊이 착지시키는 회전/열을 골라 입력 목록으로 반환 (줄을 자주 지워 공격이 나오도록)
+    가끔은 무작위 열을 골라 사람처럼 실수함
+    """
+    piece = game.current_piece
+    probe = piece.clone()
+    best = (-1, 0, piece.x)
+    for rotation in range(4):
+        for x in range(-2, game.board.WIDTH):
+            probe.x = x
+            probe.y = piece.y
+            if game.board.is_valid_position(probe):
+                y = probe.y + game.board.drop_distance(probe)
+                if y > best[0] or (y == best[0] and rng.random() < 0.3):
+                    best = (y, rotation, x)
+        probe.rotate()
+    _, rotation, x = best
+    if rng.random() < 0.1:
+        x = rng.randrange(game.board.WIDTH - 2)
+    steps = [Action.ROTATE] * rotation
+    # 회전 후 x 위치는 그대로라고 가정 (벽에 막히면 봇이 다음 블록에서 다시 계획)
+    step = Action.MOVE_LEFT if x < piece.x else Action.MOVE_RIGHT
+    steps.extend([step] * abs(x - piece.x))
+    steps.append(Action.DROP)
+    return steps
+
+class Bot:
+    """스웜 클라이언트 1개 (asyncio 스트림, 수신 태스크가 패킷을 처리하고 기다리는 응답을 깨움)"""
+    def __init__(self, name, stats, options, rng):
+        self.name = name
+        self.stats = stats
+        self.options = options
+        self.rng = rng
+        self.reader = self.writer = None
+        self.packetizer = Packetizer()
+        self.waiters = {}          # cmd -> Future (응답 하나씩)
+        self.group = None
+        self.slot = -1
+        self.game = None
+        self.finished = None       # 이번 판 NOTI_RESULT Future
+        self.plan = deque()
+        self.script_pos = 0
+        self.reported_gameover = False
+        self.leaving = False
+        self.closed = False
+
+    # --- 연결 / 송수신 ---
+    async def connect(self, host, port, timeout):
+        t0 = time.perf_counter()
+        self.reader, self.writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+        sock = self.writer.get_extra_info('socket')
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.reader_task = asyncio.get_running_loop().create_task(self._read_loop())
+        await self.request(CMD_REQ_LOGIN, self.name.encode(), CMD_RES_LOGIN, timeout)
+        self.stats.connect_ms.append((time.perf_counter() - t0) * 1000)
+        self.stats.connected += 1
+
+    def send(self, cmd, body=b''):
+        if not self.closed:
+            self.writer.write(Packet(cmd, body).to_bytes())
+
+    def expect(self, cmd):
+        """cmd 패킷을 기다리는 Future (요청을 보내기 전에 등록해야 응답을 놓치지 않음)"""
+        future = asyncio.get_running_loop().create_future()
+        self.waiters[cmd] = future
+        return future
+
+    async def wait(self, future, cmd, timeout):
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            self.waiters.pop(cmd, None)
+            self.stats.errors[f"timeout {CMD_NAMES.get(cmd, hex(cmd))}"] += 1
+            raise
+
+    async def request(self, cmd, body, reply_cmd, timeout):
+        future = self.expect(reply_cmd)
+        self.send(cmd, body)
+        return await self.wait(future, reply_cmd, timeout)
+
+    async def _read_loop(self):
+        try:
+            while True:
+                data = await self.reader.read(65536)
+                if not data:
+                    break
+                self.stats.bytes_in += len(data)
+                self.packetizer.put_data(data)
+                for packet in self.packetizer.get_packets():
+                    self.on_packet(packet)
+        except ProtocolError:
+            self.stats.errors['protocol error'] += 1
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self.closed = True
+            if not self.leaving:
+                self.stats.errors['disconnected by server'] += 1
+            for future in self.waiters.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("connection closed"))
+            self.waiters.clear()
+
+    def close(self):
+        self.leaving = True
+        if self.writer is not None and not self.closed:
+            self.writer.close()
+
+    # --- 게임 ---
+    def on_packet(self, packet):
+        cmd = packet.cmd
+        if cmd == CMD_NOTI_MOVE:
+            if self.group:
+                self.group.on_relay(self, packet.body[0])
+        elif cmd == CMD_NOTI_TICK:
+            if self.game:
+                self.game.advance_to(struct.unpack('>I', packet.body)[0])
+                self._report()
+        elif cmd == CMD_NOTI_GARBAGE:
+            _, target, lines, apply_tick = struct.unpack('>B B B I', packet.body)
+            if self.game and target == self.slot:
+                self.game.queue_garbage(lines, apply_tick)
+        elif cmd == CMD_NOTI_GAME_START:
+            self.game = GameState(struct.unpack('>I', packet.body)[0])
+            self.finished = asyncio.get_running_loop().create_future()
+            self.plan.clear()
+            self.reported_gameover = False
+            if self.slot == 0:
+                self.stats.games_started += 1
+        elif cmd == CMD_NOTI_RESULT:
+            if self.finished and not self.finished.done():
+                self.finished.set_result(packet.body)
+
+        waiter = self.waiters.pop(cmd, None)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(packet)
+
+    def _report(self):
+        """콤보가 끝난 공격 / 게임오버를 서버에 보고 (실제 클라이언트와 같은 패킷)"""
+        game = self.game
+        for tick, lines in game.attacks:
+            self.send(CMD_REQ_ATTACK, struct.pack('>B I', lines, tick))
+            self.stats.attacks += 1
+        game.attacks.clear()
+        if game.game_over and not self.reported_gameover:
+            self.reported_gameover = True
+            self.send(CMD_REQ_GAMEOVER, struct.pack('>I I', game.score, game.tick))
+            self.stats.gameovers += 1
+
+    def next_action(self):
+        options = self.options
+        if options.script:
+            action = options.script[self.script_pos % len(options.script)]
+            self.script_pos += 1
+            return action
+        if options.inputs == 'random':
+            return self.rng.choice(RANDOM_ACTIONS)
+        if not self.plan:
+            self.plan.extend(plan_piece(self.game, self.rng))
+        return self.plan.popleft()
+
+    async def play(self, deadline):
+        """NOTI_RESULT 또는 deadline까지 APM에 맞춰 입력 전송"""
+        interval = 60.0 / self.options.apm
+        while not self.finished.done() and time.monotonic() < deadline and not self.closed:
+            await asyncio.sleep(interval * self.rng.uniform(0.5, 1.5))
+            game = self.game
+            if game.game_over or self.finished.done():
+                continue
+            action = self.next_action()
+            game.process_input(action)
+            self.send(CMD_REQ_MOVE, struct.pack('>B I', action.value, game.tick))
+            self.group.on_sent(self.slot)
+            self.stats.moves += 1
+            self._report()
+
+class RoomGroup:
+    """
+    한 방을 쓰는 봇 묶음 (첫 봇이 방장)
+    중계 왕복 측정: 보낸 시각을 슬롯별 FIFO에 넣고, 그 슬롯의 입력을 받는 봇 중 하나(observer)가 꺼냄
+    (TCP + 서버 중계가 순서를 지키므로 FIFO 순서 = 도착 순서)
+    """
+    def __init__(self, bots, stats, options):
+        self.bots = bots
+        self.stats = stats
+        self.options = options
+        self.sent = {}       # slot -> deque(보낸 시각)
+        self.observers = {}  # 보낸 슬롯 -> 측정하는 봇
+        for bot in bots:
+            bot.group = self
+
+    def on_sent(self, slot):
+        self.sent[slot].append(time.perf_counter())
+
+    def on_relay(self, bot, sender_slot):
+        if self.observers.get(sender_slot) is bot:
+            pending = self.sent.get(sender_slot)
+            if pending:
+                self.stats.rtt_ms.append((time.perf_counter() - pending.popleft()) * 1000)
+
+    async def form(self, timeout):
+        host = self.bots[0]
+        packet = await host.request(CMD_REQ_CREATE_ROOM, f"swarm-{host.name}".encode(), CMD_RES_CREATE_ROOM, timeout)
+        result, room_id = struct.unpack('>B H', packet.body)
+        if result != 0:
+            raise ConnectionError(f"create room failed: {result}")
+        host.slot = 0
+        joined = [host]
+        for guest in self.bots[1:]:
+            packet = await guest.request(CMD_REQ_JOIN_ROOM, struct.pack('>H', room_id), CMD_RES_JOIN_ROOM, timeout)
+            result, slot = struct.unpack('>B B', packet.body[:2])
+            if result != 0:
+                self.stats.errors[f"join result {result}"] += 1
+                guest.close()
+                continue
+            guest.slot = slot
+            joined.append(guest)
+        self.bots = joined
+        for bot in joined:
+            others = [b for b in joined if b is not bot]
+            if others:
+                self.observers[bot.slot] = min(others, key=lambda b: b.slot)
+
+    async def play_round(self, deadline, timeout):
+        bots = self.bots
+        host = bots[0]
+        for guest in bots[1:]:
+            await guest.request(CMD_REQ_TOGGLE_READY, b'', CMD_NOTI_READY_STATE, timeout)
+        starts = [bot.expect(CMD_NOTI_GAME_START) for bot in bots]
+        host.send(CMD_REQ_TOGGLE_READY)
+        await asyncio.gather(*(bot.wait(f, CMD_NOTI_GAME_START, timeout) for bot, f in zip(bots, starts)))
+        self.sent = {bot.slot: deque() for bot in bots}
+
+        await asyncio.gather(*(bot.play(deadline) for bot in bots))
+        if time.monotonic() >= deadline:
+            return False
+        # 한 명이 먼저 결과를 받았으면 나머지도 곧 받음
+        await asyncio.wait_for(asyncio.gather(*(bot.finished for bot in bots)), timeout)
+        self.stats.games_finished += 1
+        return True
+
+    async def run(self, deadline, timeout):
+        try:
+            await self.form(timeout)
+            if len(self.bots) < 2:
+                return
+            while time.monotonic() < deadline:
+                if not await self.play_round(deadline, timeout):
+                    break
+        except (asyncio.TimeoutError, ConnectionError) as e:
+            if isinstance(e, ConnectionError):
+                self.stats.errors['connection error'] += 1
+        finally:
+            for bot in self.bots:
+                if not bot.closed and bot.slot != -1:
+                    bot.send(CMD_REQ_LEAVE_ROOM)
+                bot.close()
+
+async def run_swarm(index, count, options, conn):
+    """프로세스 하나의 스웜: 접속(속도 제한) -> 부모에게 준비 알림 -> 'go' 후 방 단위로 게임"""
+    loop = asyncio.get_running_loop()
+    stats = SwarmStats()
+    rng = random.Random(options.seed * 1000 + index)
+    bots = [Bot(f"bot{index}_{i}", stats, options, random.Random(rng.random())) for i in range(count)]
+
+    rate = options.connect_rate / options.procs
+    t0 = time.monotonic()
+
+    async def connect(i, bot):
+        await asyncio.sleep(max(0.0, t0 + i / rate - time.monotonic()))
+        try:
+            await bot.connect(options.host, options.port, options.timeout)
+            return bot
+        except (OSError, asyncio.TimeoutError, ConnectionError) as e:
+            stats.errors[f"connect {type(e).__name__}"] += 1
+            bot.close()
+            return None
+
+    connected = [b for b in await asyncio.gather(*(connect(i, b) for i, b in enumerate(bots))) if b]
+    connect_seconds = time.monotonic() - t0
+    conn.send(('ready', len(connected), connect_seconds))
+    await loop.run_in_executor(None, conn.recv)  # 'go'
+
+    cpu0 = time.process_time()
+    deadline = time.monotonic() + options.duration
+    size = options.room_size
+    groups = [RoomGroup(connected[i:i + size], stats, options) for i in range(0, len(connected), size)]
+    await asyncio.gather(*(g.run(deadline, options.timeout) for g in groups))
+    stats.cpu_seconds = time.process_time() - cpu0
+    await asyncio.sleep(0.1)  # 닫힌 연결의 수신 태스크 정리
+    conn.send(('done', stats.to_dict()))
+
+def swarm_process(index, count, options, conn):
+    raise_fd_limit()
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    asyncio.run(run_swarm(index, count, options, conn))
+
+def raise_fd_limit():
+    """봇 수천 개 = 소켓 수천 개: 열린 파일 수 제한을 가능한 만큼 올림 (POSIX)"""
+    try:
+        import resource
+    except ImportError:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+def process_cpu_seconds(pid):
+    """pid와 모든 자식 프로세스(멀티 워커 서버)의 누적 CPU 시간 (/proc 없으면 None)"""
+    tck = os.sysconf('SC_CLK_TCK')
+    total = 0.0
+    stack = [pid]
+    try:
+        while stack:
+            p = stack.pop()
+            with open(f'/proc/{p}/stat') as f:
+                fields = f.read().rsplit(')', 1)[1].split()
+            total += (int(fields[11]) + int(fields[12])) / tck  # utime, stime
+            for task in os.listdir(f'/proc/{p}/task'):
+                with open(f'/proc/{p}/task/{task}/children') as f:
+                    stack.extend(int(c) for c in f.read().split())
+    except (OSError, ValueError):
+        return None if total == 0.0 else total
+    return total
+
+def percentile(samples, q):
+    if not samples:
+        return float('nan')
+    return samples[min(len(samples) - 1, int(len(samples) * q))]
+
+def parse_script(text):
+    try:
+        return [ACTION_NAMES[name.strip().upper()] for name in text.split(',') if name.strip()]
+    except KeyError as e:
+        raise argparse.ArgumentTypeError(f"unknown action {e} (use {', '.join(ACTION_NAMES)})")
+
+def main():
+    parser = argparse.ArgumentParser(description="asyncio bot swarm load generator")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=PORT)
+    parser.add_argument('--spawn', choices=['selectors', 'asyncio'], help="start a local server with this backend")
+    parser.add_argument('--server-args', default='', help="extra main_server.py arguments for --spawn")
+    parser.add_argument('--server-pid', type=int, help="pid of an already running server (CPU usage)")
+    parser.add_argument('--bots', type=int, default=200)
+    parser.add_argument('--procs', type=int, default=2, help="asyncio load generator processes")
+    parser.add_argument('--room-size', type=int, default=MAX_ROOM_SLOTS)
+    parser.add_argument('--apm', type=float, default=120, help="inputs per minute per bot")
+    parser.add_argument('--inputs', choices=['bot', 'random'], default='bot')
+    parser.add_argument('--script', type=parse_script, help="fixed input loop, e.g. LEFT,ROTATE,DROP")
+    parser.add_argument('--duration', type=float, default=30, help="play time in seconds")
+    parser.add_argument('--connect-rate', type=float, default=500, help="total new connections per second")
+    parser.add_argument('--timeout', type=float, default=10)
+    parser.add_argument('--seed', type=int, default=1)
+    options = parser.parse_args()
+    options.room_size = max(2, min(options.room_size, MAX_ROOM_SLOTS))
+    raise_fd_limit()
+
+    server = None
+    pid = options.server_pid
+    if options.spawn:
+        server = start_server(options.spawn, options.port, options.server_args.split())
+        pid = server.pid
+    try:
+        # 방 하나가 한 프로세스 안에 있도록 방 크기 단위로 나눔
+        rooms = max(1, options.bots // options.room_size)
+        per_proc = [(rooms // options.procs + (i < rooms % options.procs)) * options.room_size
+                    for i in range(options.procs)]
+        pipes, procs = [], []
+        for i, count in enumerate(per_proc):
+            if count == 0:
+                continue
+            parent, child = multiprocessing.Pipe()
+            proc = multiprocessing.Process(target=swarm_process, args=(i, count, options, child), daemon=True)
+            proc.start()
+            pipes.append(parent)
+            procs.append(proc)
+
+        ready = [p.recv() for p in pipes]
+        connected = sum(r[1] for r in ready)
+        connect_seconds = max(r[2] for r in ready)
+        cpu0, wall0 = (process_cpu_seconds(pid) if pid else None), time.perf_counter()
+        for p in pipes:
+            p.send('go')
+        results = [p.recv()[1] for p in pipes]
+        cpu1, wall = (process_cpu_seconds(pid) if pid else None), time.perf_counter() - wall0
+        for proc in procs:
+            proc.join()
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+    stats = SwarmStats.merge(results)
+    rtt = sorted(stats.rtt_ms)
+    connect_ms = sorted(stats.connect_ms)
+    print(f"bots {sum(per_proc)} in {len(procs)} procs, room size {options.room_size}, "
+          f"{options.apm:.0f} APM, inputs {'script' if options.script else options.inputs}")
+    print(f"connect   : {connected} ok in {connect_seconds:.2f}s ({connected / max(connect_seconds, 1e-9):.0f}/s), "
+          f"connect+login p50 {percentile(connect_ms, 0.5):.1f}ms p99 {percentile(connect_ms, 0.99):.1f}ms")
+    print(f"play      : {wall:.1f}s, games {stats.games_started} started / {stats.games_finished} finished, "
+          f"moves {stats.moves} ({stats.moves / wall:.0f}/s), attacks {stats.attacks}, gameovers {stats.gameovers}, "
+          f"recv {stats.bytes_in / wall / 1024:.0f} KiB/s")
+    print(f"relay rtt : p50 {percentile(rtt, 0.5):.2f}ms p90 {percentile(rtt, 0.9):.2f}ms "
+          f"p99 {percentile(rtt, 0.99):.2f}ms max {rtt[-1] if rtt else float('nan'):.2f}ms ({len(rtt)} samples)")
+    if cpu0 is not None and cpu1 is not None:
+        print(f"server cpu: {(cpu1 - cpu0) / wall * 100:.0f}% of one core (pid {pid}, incl. workers)")
+    else:
+        print("server cpu: n/a (use --spawn or --server-pid on Linux)")
+    # 부하 생성기가 CPU를 다 쓰면 측정한 왕복 시간에 봇 쪽 대기가 섞임 (프로세스를 늘리거나 호스트를 나눌 것)
+    gen_cpu = stats.cpu_seconds / wall / len(procs) * 100
+    warning = "  <- generator saturated, latency includes bot-side queueing" if gen_cpu > 80 else ""
+    print(f"bot cpu   : {gen_cpu:.0f}% of one core per process{warning}")
+    errors = ', '.join(f"{k} {v}" for k, v in stats.errors.most_common()) or 'none'
+    print(f"errors    : {errors}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+# src/client/core/rollback.py
+import time
+from collections import deque
+from src.common.constants import Action
+from src.common.config import GARBAGE_DELAY_TICKS, ROLLBACK_WINDOW_TICKS, ROLLBACK_BUDGET_MS
+from src.core.snapshot import restore_state
+
+class RollbackBoard:
+    """
+    상대 보드 하나의 로컬 복제본 (롤백 방식)
+
+    상대 입력은 서버 틱(CMD_NOTI_MOVE의 [Tick])이 붙어 오지만, 중계가 늦으면 이 보드가 이미
+    그 틱을 지나 중력이 더 작용한 뒤에 도착함 -> 도착 시점에 적용하면 블록이 다른 자리에 고정되어 어긋남
+    그래서 틱이 넘어갈 때마다 GameState.snapshot()을 짧게 보관해 두고, 늦은 입력이 오면
+    그 틱 이전 스냅샷으로 되돌린 뒤 이후 기록을 다시 적용해 현재 틱까지 재시뮬레이션함
+    (ROLLBACK_WINDOW_TICKS보다 늦은 입력은 예전처럼 도착 시점에 적용하고, 서버 스냅샷 재동기화에 맡김)
+
+    log: 받은 입력/공격 기록 (서버 스냅샷 / 로컬 스냅샷 이후분을 다시 적용할 때 사용)
+      ('move', 적용 후 입력 수, 틱, 키 코드) / ('garbage', 등록 후 공격 수, 줄 수, 적용 틱)
+    """
+    LOG_LIMIT = 1024  # 스냅샷을 받지 못하는 동안(서버 시뮬레이션 off) 기록이 무한히 쌓이지 않도록
+
+    def __init__(self, game, window=ROLLBACK_WINDOW_TICKS, budget_ms=ROLLBACK_BUDGET_MS):
+        self.game = game
+        self.window = window
+        self.budget_ns = budget_ms * 1_000_000
+        self.log = deque(maxlen=self.LOG_LIMIT)
+        self.history = deque()   # (틱, 스냅샷) 틱 오름차순
+        self.stats = {'rollbacks': 0, 'too_late': 0, 'depth_total': 0, 'depth_max': 0,
+                      'resim_ns': 0, 'resim_max_ns': 0, 'over_budget': 0}
+
+    def advance(self, tick):
+        """tick까지 진행 (넘어가기 전 상태를 스냅샷으로 보관)"""
+        game = self.game
+        if tick <= game.tick:
+            return
+        if not game.game_over:
+            history = self.history
+            history.append((game.tick, game.snapshot()))
+            while len(history) > 1 and history[0][0] < tick - self.window:
+                history.popleft()
+        game.advance_to(tick)
+        # 상대 보드의 공격은 그 클라이언트가 직접 보냄 (여기서는 버림)
+        game.attacks.clear()
+
+    def move(self, keycode, tick):
+        """상대 입력 (tick: 상대가 입력한 서버 틱, 이미 지났으면 롤백)"""
+        action = Action(keycode)
+        game = self.game
+        if tick >= game.tick:
+            self.advance(tick)
+            game.process_input(action)
+            self.log.append(('move', game.inputs, tick, keycode))
+            return
+        self.log.append(('move', game.inputs + 1, tick, keycode))
+        if not self._rollback(tick):
+            game.process_input(action)
+
+    def moves(self, moves):
+        """상대 입력 묶음 [(키 코드, 틱), ...] (틱 오름차순, 늦은 입력이 있어도 롤백은 한 번)"""
+        game = self.game
+        if not moves or moves[0][1] >= game.tick:
+            for keycode, tick in moves:
+                self.move(keycode, tick)
+            return
+        inputs = game.inputs
+        for i, (keycode, tick) in enumerate(moves, 1):
+            self.log.append(('move', inputs + i, tick, keycode))
+        if not self._rollback(moves[0][1]):
+            for keycode, tick in moves:
+                self.advance(tick)
+                game.process_input(Action(keycode))
+
+    def garbage(self, lines, apply_tick):
+        """상대가 받은 공격 (도착 틱이 이미 지났으면 그 전으로 롤백해서 제때 받은 것처럼)"""
+        game = self.game
+        arrive_tick = apply_tick - GARBAGE_DELAY_TICKS + 1
+        if arrive_tick <= game.tick:
+            self.log.append(('garbage', game.garbage_seq + 1, lines, apply_tick))
+            if self._rollback(arrive_tick - 1):
+                return
+            game.queue_garbage(lines, apply_tick)
+            return
+        game.queue_garbage(lines, apply_tick)
+        self.log.append(('garbage', game.garbage_seq, lines, apply_tick))
+
+    def resync(self, raw, now):
+        """서버 스냅샷으로 덮어쓴 뒤 그 이후 기록을 다시 적용 (로컬 스냅샷은 버림)"""
+        game = self.game
+        restore_state(game, raw)
+        self.history.clear()
+        pending = self._pending()
+        self.log.clear()
+        self.log.extend(pending)
+        self._replay(pending)
+        self.advance(now)
+
+    def _rollback(self, tick):
+        """tick 시점 이하의 가장 최근 스냅샷으로 되돌려 현재 틱까지 재시뮬레이션 (스냅샷이 없으면 False)"""
+        history = self.history
+        game = self.game
+        now = game.tick
+        if not history or history[0][0] > tick:
+            self.stats['too_late'] += 1
+            return False
+
+        t0 = time.perf_counter_ns()
+        # tick 이후 스냅샷은 늦은 입력이 빠진 상태라 버림 (재시뮬레이션하면서 다시 쌓임)
+        while history[-1][0] > tick:
+            history.pop()
+        snap_tick, state = history.pop()
+        game.restore(state)
+        self._replay(self._pending())
+        self.advance(now)
+        elapsed = time.perf_counter_ns() - t0
+
+        stats = self.stats
+        depth = now - snap_tick
+        stats['rollbacks'] += 1
+        stats['depth_total'] += depth
+        stats['depth_max'] = max(stats['depth_max'], depth)
+        stats['resim_ns'] += elapsed
+        stats['resim_max_ns'] = max(stats['resim_max_ns'], elapsed)
+        if elapsed > self.budget_ns:
+            stats['over_budget'] += 1
+        return True
+
+    def _pending(self):
+        """현재 상태 이후의 기록 (입력 수 / 공격 수로 구분)"""
+        inputs, garbage_seq = self.game.inputs, self.game.garbage_seq
+        return [e for e in self.log if e[1] > (inputs if e[0] == 'move' else garbage_seq)]
+
+    def _replay(self, pending):
+        """
+        기록을 다시 적용 (받은 순서대로 다시 적용하므로 입력 수 / 공격 수는 기록과 같게 나옴)
+        방해 줄은 적용 틱으로 처리 시점이 정해지므로 먼저 모두 등록하고, 입력은 각자의 틱에 적용
+        """
+        game = self.game
+        for kind, _, lines, apply_tick in pending:
+            if kind == 'garbage':
+                game.queue_garbage(lines, apply_tick)
+        for kind, _, tick, keycode in pending:
+            if kind == 'move':
+                self.advance(tick)
+                game.process_input(Action(keycode))
+
+    def summary(self):
+        """롤백 통계 한 줄 (로그용)"""
+        s = self.stats
+        count = s['rollbacks']
+        avg_depth = s['depth_total'] / count if count else 0
+        avg_us = s['resim_ns'] / count / 1000 if count else 0
+        return (f"rollbacks={count} depth avg={avg_depth:.1f} max={s['depth_max']} ticks, "
+                f"resim avg={avg_us:.0f}us max={s['resim_max_ns'] / 1000:.0f}us, "
+                f"over_budget={s['over_budget']} too_late={s['too_late']}")
@@ -6,6 +6,7 @@ from src.client.scenes.login_scene import LoginScene
 from src.client.scenes.lobby_scene import LobbyScene
 from src.client.scenes.room_scene import RoomScene
 from src.client.scenes.game_scene import GameScene
+from src.client.scenes.spectate_scene import SpectateScene
 from src.client.core.session_context import SessionContext  
 
 class SceneManager:
@@ -22,7 +23,8 @@ class SceneManager:
             "LOGIN": LoginScene(self),
             "LOBBY": LobbyScene(self),
             "ROOM": RoomScene(self),
-            "GAME": GameScene(self)
+            "GAME": GameScene(self),
+            "SPECTATE": SpectateScene(self)
         }
         self.current_scene = self.scenes["LOGIN"]
         self.current_scene.on_enter()
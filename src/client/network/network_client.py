@@ -3,9 +3,8 @@ import socket
 import threading
 import queue
 from src.common.config import HOST, PORT, BUFFER_SIZE
-from src.common.protocol import Packet
 from src.common.packet_handler import Packetizer
-from src.common.constants import CMD_REQ_LOGIN
+from src.common.messages import ReqLogin
 
 class NetworkClient:
     def __init__(self):
@@ -44,8 +43,7 @@ class NetworkClient:
 
     def login(self, nickname):
         """로그인 패킷 전송 편의 함수"""
-        pkt = Packet(CMD_REQ_LOGIN, nickname)
-        self.send_packet(pkt)
+        self.send_packet(ReqLogin.packet(nickname))
 
     def get_packet(self):
         """큐에서 패킷 꺼내기 (메인 루프에서 호출)"""
@@ -64,12 +62,10 @@ class NetworkClient:
         """백그라운드에서 계속 데이터 수신"""
         while self.is_running and self.sock:
             try:
-                data = self.sock.recv(BUFFER_SIZE)
-                if not data:
+                # 조립기 버퍼로 직접 수신하고 패킷 완성되면 큐에 넣음
+                if not self.packetizer.recv_into(self.sock, BUFFER_SIZE):
                     break
                 
-                # 조립기에 넣고 패킷 완성되면 큐에 넣음
-                self.packetizer.put_data(data)
                 for packet in self.packetizer.get_packets():
                     self.packet_queue.put(packet)
                     
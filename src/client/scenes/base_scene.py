@@ -1,5 +1,7 @@
 # src/client/scenes/base_scene.py
 from src.client.network.router import route
+from src.common.errors import ProtocolError
+from src.common.utils import setup_file_logger
 
 class BaseScene:
     def __init__(self, manager):
@@ -35,10 +37,15 @@ class BaseScene:
     def handle_packet(self, packet):
         """
         패킷의 CMD를 보고 등록된 핸들러 메서드를 자동 실행
+        핸들러에서 난 ProtocolError(스키마에 맞지 않는 본문 등)는 잘못된 패킷으로 보고 로그만 남기고 버림
         """
         handler = self._handlers.get(packet.cmd)
         if handler:
-            handler(packet)
+            try:
+                handler(packet)
+            except ProtocolError as e:
+                setup_file_logger(type(self).__name__).warning(
+                    f"Malformed packet dropped (CMD={hex(packet.cmd)}): {e}")
         else:
             # 핸들러가 없으면 무시하거나 로그 출력
             pass
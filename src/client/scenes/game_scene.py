@@ -1,26 +1,33 @@
 # src/client/scenes/game_scene.py
-import struct
 import time
-import random
 from src.client.scenes.base_scene import BaseScene
 from src.common.protocol import Packet
 from src.common.constants import *
+from src.common.config import GARBAGE_DELAY_TICKS, TICK_RATE, MOVE_BATCHING
+from src.common.messages import (ReqMove, NotiMove, NotiMoveBatch, ReqAttack, ReqGameover, NotiTick,
+                                 NotiGarbage, NotiSnapshot, NotiSnapshotDelta, NotiResult)
+from src.common.move_batch import encode_moves, decode_entries
 from src.core.game_state import GameState
+from src.core.snapshot import decompress, decode_delta
+from src.common.errors import ProtocolError
 from src.client.network.router import route
+from src.client.core.rollback import RollbackBoard
 from src.common.utils import setup_file_logger
 
 class GameScene(BaseScene):
     def __init__(self, manager):
         super().__init__(manager)
         self.games = {}
-        self.last_tick = 0
+        self.server_tick = 0             # 마지막으로 처리한 서버 틱 (CMD_NOTI_TICK)
         self.sent_gameover = False
         self.game_finished = False
         self.result_msg = ""
         self.my_final_score = 0
-        self.accumulated_lines = 0       # 내가 보내려고 모으고 있는 공격 줄 수
-        self.last_clear_time = 0         # 마지막으로 라인을 지운 시간 (콤보 타이머용)
-        self.pending_garbage = []        # 내가 맞아서 대기 중인 공격 리스트 [{'lines': n, 'trigger_time': t}, ...]
+        # (콤보/방어/방해 줄 대기열은 GameState가 서버 틱 기준으로 관리 -> 서버 시뮬레이션과 같은 코드)
+        self.snapshot_base = {}          # slot -> 마지막 raw 스냅샷 (델타 기준)
+        self.peers = {}                  # slot -> 상대 보드 롤백 복제본 (늦은 입력/공격은 되감아서 적용)
+        self.pending_moves = []          # 아직 보내지 않은 내 입력 [(키 코드, 틱), ...] (MOVE_BATCHING)
+        self.pending_frame = 0           # 첫 입력을 모은 틱 구간 (monotonic 시각 * TICK_RATE)
 
         self.logger = setup_file_logger("GameScene")
     
@@ -30,23 +37,22 @@ class GameScene(BaseScene):
         seed = self.context.game_seed
         players = self.context.game_players
         
-        # State 생성
+        # State 생성 (모든 슬롯이 같은 시드 -> 같은 블록 순서 / 같은 방해 줄 구멍)
         for slot in players:
-            random.seed(seed)
-            self.games[slot] = GameState()
+            self.games[slot] = GameState(seed)
+        self.snapshot_base = {}
+        self.peers = {slot: RollbackBoard(game) for slot, game in self.games.items() if slot != self.context.my_slot}
             
-        self.last_tick = time.time()
+        self.pending_moves = []
+        self.pending_frame = 0
+        self.server_tick = 0
         self.sent_gameover = False
         self.game_finished = False
         self.result_msg = ""
         self.renderer.clear_screen()
         self.my_final_score = 0
-        self.pending_garbage = {slot: [] for slot in players}
-        self.accumulated_lines = 0
-        self.last_clear_time = 0
 
     def update(self):
-        current_time = time.time()
         # 1. 입력 처리
         action = self.input_handler.get_action()
         if action:
@@ -63,98 +69,68 @@ class GameScene(BaseScene):
                     self.network.send_packet(Packet(CMD_REQ_SEARCH_ROOM, b''))
                     return
                 
-                if self.context.my_slot in self.games:
-                    cleared = self.games[self.context.my_slot].process_input(action)
+                my_game = self.games.get(self.context.my_slot)
+                if my_game:
+                    cleared = my_game.process_input(action)
                     if cleared > 0:
-                        self._handle_line_clear(cleared)
-                    self.network.send_packet(Packet(CMD_REQ_MOVE, bytes([action.value])))
+                        self.logger.debug(f"[Clear] Cleared {cleared} lines (acc: {my_game.accumulated_lines})")
+                    self._send_move(action.value, my_game.tick)
 
         if self.game_finished:
             self._draw()
             time.sleep(0.01)
             return
-# 2. 0.5초 콤보 타이머 체크 (공격 전송)
-        if self.accumulated_lines > 0:
-            if current_time - self.last_clear_time > 0.5:
-                # 콤보 종료 -> 서버로 공격 전송
-                self.logger.info(f"[Attack] Sending {self.accumulated_lines} lines attack!")
-                payload = struct.pack('>B', self.accumulated_lines)
-                self.network.send_packet(Packet(CMD_REQ_ATTACK, payload))
-                
-                self.accumulated_lines = 0 # 초기화
-
-        for slot, garbage_list in self.pending_garbage.items():
-            if not garbage_list: continue
-            
-            if slot not in self.games: continue
-            game = self.games[slot]
-            if game.game_over: continue
-
-            while garbage_list:
-                attack = garbage_list[0]
-                if current_time >= attack['trigger_time']:
-                    lines = attack['lines']
-                    game.board.add_garbage_lines(lines)
-                    garbage_list.pop(0)
-                    
-                    if slot == self.context.my_slot:
-                        self.logger.info(f"[Defense] Garbage applied: {lines} lines")
-                else:
-                    break
-
-        # 4. 게임 상태 체크 (내 게임 오버)
+        self._flush_moves()
+        # 2. 게임 상태 체크 (내 게임 오버)
         if not self.sent_gameover:
             my_game = self.games.get(self.context.my_slot)
             if my_game and my_game.game_over:
                 self.logger.info("My Game Over detected.")
-                score = my_game.score
-                payload = struct.pack('>I', score)
-                self.network.send_packet(Packet(CMD_REQ_GAMEOVER, payload))
+                self._flush_moves(force=True)
+                self.network.send_packet(ReqGameover.packet(my_game.score, my_game.tick))
                 self.sent_gameover = True
 
-        # 5. 주기적 업데이트 (중력)
-        if time.time() - self.last_tick > 0.5:
-            for slot, game in self.games.items():
-                cleared = game.update()
-                if slot == self.context.my_slot and cleared > 0:
-                    self._handle_line_clear(cleared) # 중력으로 지워진 줄도 처리
-            self.last_tick = time.time()
-
+        # (중력 / 방해 줄 적용 / 콤보 타이머는 서버 틱(CMD_NOTI_TICK)을 받을 때 처리)
         self._draw()
         time.sleep(0.01)
 
-    def _handle_line_clear(self, cleared):
-        """라인 삭제 시 방어 및 공격 장전 로직"""
-        self.logger.debug(f"[Clear] Cleared {cleared} lines")
-        self.last_clear_time = time.time()
-        my_slot = self.context.my_slot
-        my_garbage = self.pending_garbage.get(my_slot, [])
-        # 1. 방어 (Pending Garbage 상쇄)
-        while cleared > 0 and my_garbage:
-            attack = my_garbage[0]
-            if attack['lines'] <= cleared:
-                cleared -= attack['lines']
-                my_garbage.pop(0)
-                self.logger.info("[Defense] Blocked completely!")
-            else:
-                attack['lines'] -= cleared
-                cleared = 0
-                self.logger.info(f"[Defense] Reduced attack. Rem: {attack['lines']}")
+    def _advance_tick(self, tick):
+        """서버 틱 tick까지 모든 보드 진행 (공격 도착 -> 콤보 타이머 -> 방해 줄 적용 -> 중력)"""
+        for peer in self.peers.values():
+            peer.advance(tick)
+        game = self.games.get(self.context.my_slot)
+        if game:
+            game.advance_to(tick)
+            if game.attacks:
+                # 공격을 만든 입력이 먼저 도착해야 서버 시뮬레이션이 같은 공격으로 대조함
+                self._flush_moves(force=True)
+            # 콤보가 끝난 내 공격 전송: [Lines(1B)] [Tick(4B)]
+            for attack_tick, lines in game.attacks:
+                self.logger.info(f"[Attack] Sending {lines} lines attack! (tick {attack_tick})")
+                self.network.send_packet(ReqAttack.packet(lines, attack_tick))
+            game.attacks.clear()
 
-        # 2. 공격 장전 (남은 클리어 라인)
-        if cleared > 0:
-            self.accumulated_lines += cleared
-            self.logger.info(f"[Combo] Accumulated: {self.accumulated_lines}")
+    def _send_move(self, keycode, tick):
+        """내 입력 전송 (MOVE_BATCHING이면 모았다가 _flush_moves에서 한 패킷으로)"""
+        if MOVE_BATCHING:
+            if not self.pending_moves:
+                self.pending_frame = int(time.monotonic() * TICK_RATE)
+            self.pending_moves.append((keycode, tick))
+            return
+        # [KeyCode(1B)] [Tick(4B)]: 입력을 적용한 서버 틱 (서버 시뮬레이션이 같은 틱에 재현)
+        self.network.send_packet(ReqMove.packet(keycode, tick))
 
-    def _draw(self):
+    def _flush_moves(self, force=False):
+        """모은 입력을 CMD_REQ_MOVE_BATCH로 전송 (첫 입력을 모은 틱 구간(1/TICK_RATE초)이 지나면, force면 바로)"""
+        if not self.pending_moves:
+            return
+        if not force and int(time.monotonic() * TICK_RATE) == self.pending_frame:
+            return
+        for body in encode_moves(self.pending_moves):
+            self.network.send_packet(Packet(CMD_REQ_MOVE_BATCH, body))
+        self.pending_moves.clear()
 
-        for slot, game in self.games.items():
-            if slot in self.pending_garbage:
-                total_pending = sum(a['lines'] for a in self.pending_garbage[slot])
-                game.pending_garbage = total_pending
-            else:
-                game.pending_garbage = 0
-            
+    def _draw(self):
         self.renderer.draw_battle(
             self.context.my_slot, 
             self.games, 
@@ -164,66 +140,100 @@ class GameScene(BaseScene):
 
     @route(CMD_NOTI_MOVE)
     def on_peer_move(self, pkt):
-        slot, keycode = struct.unpack('>B B', pkt.body)
+        slot, keycode, stamp = NotiMove.unpack(pkt.body)
         # 내 슬롯이 아니고, 해당 슬롯에 게임 상태가 존재할 때만 처리
-        if slot != self.context.my_slot and slot in self.games:
-            try:
-                self.games[slot].process_input(Action(keycode))
-            except:
-                pass
+        peer = self.peers.get(slot)
+        if peer is None:
+            return
+        # 모르는 키 코드만 버림 (롤백/적용 중 나는 예외는 숨기지 않음 -> 상대 보드가 조용히 어긋나지 않도록)
+        try:
+            Action(keycode)
+        except ValueError:
+            self.logger.warning(f"Unknown keycode {keycode} from slot {slot}")
+            return
+        # [Tick(4B)]: 상대가 입력한 서버 틱 (아직 그 틱 전이면 맞춰서 진행, 이미 지났으면 롤백 후 적용)
+        peer.move(keycode, peer.game.tick if stamp is None else stamp)
+
+    @route(CMD_NOTI_MOVE_BATCH)
+    def on_peer_moves(self, pkt):
+        """상대 입력 묶음: [Slot(1B)] + [BaseTick(4B)] + ([KeyCode:4bit][TickDelta:4bit]) * N"""
+        slot, base_tick, entries = NotiMoveBatch.unpack(pkt.body)
+        peer = self.peers.get(slot)
+        if peer is not None:
+            peer.moves(decode_entries(base_tick, entries))
+
+    @route(CMD_NOTI_TICK)
+    def on_server_tick(self, pkt):
+        """서버 틱 동기화: 지난번 이후의 틱들을 차례로 진행"""
+        if self.game_finished:
+            return
+        tick, = NotiTick.unpack(pkt.body)
+        if tick > self.server_tick:
+            self._advance_tick(tick)
+            self.server_tick = tick
 
     @route(CMD_NOTI_GARBAGE)
     def on_garbage(self, pkt):
         """서버로부터 공격 알림 받음 (Broadcast)"""
-        # [수정] 3바이트 파싱 (Attacker, Target, Lines)
-        if len(pkt.body) < 3: 
-            self.logger.error("Invalid garbage packet")
-            return
+        # [Attacker(1B)] [Target(1B)] [Lines(1B)] [ApplyTick(4B, 선택)]
+        attacker_slot, target_slot, lines, apply_tick = NotiGarbage.unpack(pkt.body)
         if self.game_finished:
             return
 
-        attacker_slot, target_slot, lines = struct.unpack('>B B B', pkt.body)
-        if target_slot not in self.pending_garbage:
+        # ApplyTick: 서버가 정한 적용 틱 (없으면 지금부터 GARBAGE_DELAY_TICKS 뒤)
+        if apply_tick is None:
+            apply_tick = self.server_tick + GARBAGE_DELAY_TICKS
+        if target_slot not in self.games:
             return
         self.logger.info(f"[Net] Attack: {attacker_slot} -> {target_slot} ({lines} lines)")
 
-        # 1. 내가 타겟인 경우: 방어(Counter) 로직 수행
-        if target_slot == self.context.my_slot:
-            # 크로스 카운터 (내 장전된 공격으로 상쇄)
-            if self.accumulated_lines > 0:
-                if self.accumulated_lines >= lines:
-                    self.accumulated_lines -= lines
-                    self.logger.info(f"[Counter] Blocked attack! (Rem acc: {self.accumulated_lines})")
-                    lines = 0
-                else:
-                    lines -= self.accumulated_lines
-                    self.accumulated_lines = 0
-                    self.logger.info(f"[Counter] Reduced attack. (Inc: {lines})")
-
-        # 2. 대기열 추가 (나 & 상대방 모두 해당)
-        # 상대방이 공격받은 것도 시각적으로 보여주기 위해 pending에 추가함
-        if lines > 0:
-            trigger_time = time.time() + 2.0
-            
-            # 해당 슬롯의 대기열에 추가
-            if target_slot in self.pending_garbage:
-                self.pending_garbage[target_slot].append({
-                    'lines': lines,
-                    'trigger_time': trigger_time,
-                    'attacker': attacker_slot
-                })
-                
-            if target_slot == self.context.my_slot:
-                self.logger.info(f"[Danger] {lines} lines incoming in 2s!")
+        # 모든 복제본에 같은 방식으로 등록 (크로스 카운터 / 대기열은 GameState가 도착 틱에 처리)
+        peer = self.peers.get(target_slot)
+        if peer is not None:
+            peer.garbage(lines, apply_tick)
+        else:
+            self.games[target_slot].queue_garbage(lines, apply_tick)
+            self.logger.info(f"[Danger] {lines} lines incoming (apply tick {apply_tick})")
+
+    @route(CMD_NOTI_SNAPSHOT)
+    def on_snapshot(self, pkt):
+        """서버 시뮬레이션의 전체 스냅샷: [Slot(1B)][Snapshot]"""
+        if self.game_finished:
+            return
+        slot, data = NotiSnapshot.unpack(pkt.body)
+        self._resync(slot, decompress(data))
+
+    @route(CMD_NOTI_SNAPSHOT_DELTA)
+    def on_snapshot_delta(self, pkt):
+        """직전 스냅샷 대비 XOR 델타: [Slot(1B)][Delta]"""
+        if self.game_finished:
+            return
+        slot, delta = NotiSnapshotDelta.unpack(pkt.body)
+        try:
+            raw = decode_delta(delta, self.snapshot_base.get(slot))
+        except ProtocolError as e:
+            # 기준 스냅샷이 없거나 다름 -> 다음 전체 스냅샷까지 기다림
+            self.logger.warning(f"Snapshot delta dropped (slot {slot}): {e}")
+            return
+        self._resync(slot, raw)
+
+    def _resync(self, slot, raw):
+        """
+        상대 보드를 스냅샷으로 덮어쓴 뒤, 스냅샷 이후에 받은 입력/공격을 순서대로 다시 적용
+        (입력이 유실/중복되어 어긋났던 복제본도 서버 상태로 돌아옴)
+        복원에 실패하면 ProtocolError가 그대로 올라가고, 다음 델타의 기준도 바꾸지 않음
+        """
+        peer = self.peers.get(slot)
+        if peer is not None:
+            peer.resync(raw, max(peer.game.tick, self.server_tick))
+        self.snapshot_base[slot] = raw
 
     @route(CMD_NOTI_RESULT)
     def on_game_result(self, pkt):
         # [Modified] 승리 사유 추가 (1B)
         # 구조: [WinnerSlot(1B)] [Reason(1B)] (Reason은 선택적일 수 있음 - 하위호환)
-        winner_slot = pkt.body[0]
-        reason = 0
-        if len(pkt.body) >= 2:
-            reason = pkt.body[1]
+        winner_slot, reason = NotiResult.unpack(pkt.body)
+        reason = reason or 0
         self.logger.info(f"Game Finished. Winner: {winner_slot}, Reason: {reason}") # [로그]
         self.game_finished = True
         
@@ -239,6 +249,8 @@ class GameScene(BaseScene):
             
         if self.context.my_slot in self.games:
             self.my_final_score = self.games[self.context.my_slot].score
+        for slot, peer in self.peers.items():
+            self.logger.info(f"[Rollback] P{slot + 1}: {peer.summary()}")
             
         for g in self.games.values():
             g.game_over = True
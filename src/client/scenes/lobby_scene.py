@@ -1,11 +1,12 @@
 # src/client/scenes/lobby_scene.py
 import sys
 import os
-import struct
 import time
 from src.client.scenes.base_scene import BaseScene
 from src.common.protocol import Packet
 from src.common.constants import *
+from src.common.messages import (ReqCreateRoom, ReqJoinRoom, ReqSpectate, RoomList, ROOM_ENTRY,
+                                 ResCreateRoom, ResJoinRoom, ResSpectate)
 from src.client.network.router import route
 from src.common.utils import get_local_ip
 
@@ -60,7 +61,7 @@ class LobbyScene(BaseScene):
             title = sys.stdin.readline().strip()
             self.renderer.hide_cursor()
             if title:
-                self.network.send_packet(Packet(CMD_REQ_CREATE_ROOM, title))
+                self.network.send_packet(ReqCreateRoom.packet(title))
             else:
                 self._refresh_ui()
 
@@ -70,8 +71,17 @@ class LobbyScene(BaseScene):
             rid = sys.stdin.readline().strip()
             self.renderer.hide_cursor()
             if rid.isdigit():
-                payload = struct.pack('>H', int(rid))
-                self.network.send_packet(Packet(CMD_REQ_JOIN_ROOM, payload))
+                self.network.send_packet(ReqJoinRoom.packet(int(rid)))
+            else:
+                self._refresh_ui()
+
+        elif cmd == 'W':
+            print("[Watch] Enter Room ID: ", end='', flush=True)
+            self.renderer.show_cursor()
+            rid = sys.stdin.readline().strip()
+            self.renderer.hide_cursor()
+            if rid.isdigit():
+                self.network.send_packet(ReqSpectate.packet(int(rid)))
             else:
                 self._refresh_ui()
 
@@ -89,21 +99,16 @@ class LobbyScene(BaseScene):
     @route(CMD_REQ_SEARCH_ROOM)
     def on_room_list_update(self, pkt):
         """방 목록 갱신 패킷 처리 (서버가 REQ CMD를 그대로 응답으로 사용 중)"""
-        count = pkt.body[0]
+        count, entries = RoomList.unpack(pkt.body)
         self.room_list = []
-        offset = 1
+        offset = 0
         for _ in range(count):
-            if offset + 2 > len(pkt.body): break
-            rid = struct.unpack('>H', pkt.body[offset:offset+2])[0]
-            offset += 2
-            
-            status = pkt.body[offset]
-            offset += 1
+            # 항목: [ID(2B)] [Status(1B)] [TitleLen(1B)] [Title(Str)]
+            if offset + ROOM_ENTRY.size > len(entries): break
+            rid, status, tlen = ROOM_ENTRY.unpack_from(entries, offset)
+            offset += ROOM_ENTRY.size
             
-            tlen = pkt.body[offset]
-            offset += 1
-            
-            title = pkt.body[offset:offset+tlen].decode('utf-8')
+            title = entries[offset:offset+tlen].decode('utf-8')
             offset += tlen
             self.room_list.append({'id': rid, 'title': title, 'status': status})
         
@@ -111,7 +116,7 @@ class LobbyScene(BaseScene):
 
     @route(CMD_RES_CREATE_ROOM)
     def on_create_room_response(self, pkt):
-        res, room_id = struct.unpack('>B H', pkt.body)
+        res, room_id = ResCreateRoom.unpack(pkt.body)
         if res == 0:
             self.context.room_id = room_id
             self.context.my_slot = 0 # 방장은 0번
@@ -119,7 +124,7 @@ class LobbyScene(BaseScene):
 
     @route(CMD_RES_JOIN_ROOM)
     def on_join_room_response(self, pkt):
-        res, my_slot = struct.unpack('>B B', pkt.body)
+        res, my_slot = ResJoinRoom.unpack(pkt.body)
         if res == 0:
             self.context.my_slot = my_slot
             # 입장 성공 시 즉시 ROOM_INFO 요청
@@ -130,6 +135,21 @@ class LobbyScene(BaseScene):
             time.sleep(1)
             self._refresh_ui()
 
+    @route(CMD_RES_SPECTATE)
+    def on_spectate_response(self, pkt):
+        """관전 응답: [Result(1B)] [RoomID(2B)] [Seed(4B)] [PlayerMask(1B)]"""
+        res, room_id, seed, mask = ResSpectate.unpack(pkt.body)
+        if res == 0:
+            self.context.room_id = room_id
+            self.context.my_slot = -1
+            self.context.game_seed = seed
+            self.context.game_players = [i for i in range(8) if mask & (1 << i)]
+            self.manager.change_scene("SPECTATE")
+        else:
+            print(f"\nWatch Failed (Error {res})")
+            time.sleep(1)
+            self._refresh_ui()
+
     def _refresh_ui(self):
         display_ip = self.context.server_ip
         if display_ip in ["127.0.0.1", "localhost", "0.0.0.0"]:
@@ -4,6 +4,7 @@ import time
 from src.client.scenes.base_scene import BaseScene
 from src.common.protocol import Packet
 from src.common.constants import CMD_RES_LOGIN, CMD_REQ_SEARCH_ROOM
+from src.common.messages import ResLogin
 from src.client.network.router import route
 
 try:
@@ -151,7 +152,8 @@ class LoginScene(BaseScene):
     @route(CMD_RES_LOGIN)
     def on_login_response(self, pkt):
         """서버로부터 로그인 응답이 왔을 때 (라우터에 의해 자동 호출)"""
-        if pkt.body[0] == 0: # 성공
+        result, = ResLogin.unpack(pkt.body)
+        if result == 0: # 성공
             print("Login Success!")
             # 로비 데이터 요청 후 씬 전환
             self.context.server_ip = self.target_ip
@@ -1,9 +1,9 @@
 # src/client/scenes/room_scene.py
-import struct
 import time
 from src.client.scenes.base_scene import BaseScene
 from src.common.protocol import Packet
 from src.common.constants import *
+from src.common.messages import NotiEnterRoom, NotiLeaveRoom, NotiReadyState, NotiGameStart
 from src.common.config import MAX_ROOM_SLOTS
 from src.client.network.router import route
 
@@ -43,28 +43,27 @@ class RoomScene(BaseScene):
 
     @route(CMD_NOTI_ENTER_ROOM)
     def on_user_enter(self, pkt):
-        slot = pkt.body[0]
-        nick = pkt.body[1:].decode('utf-8')
+        slot, nick = NotiEnterRoom.unpack(pkt.body)
         if slot < MAX_ROOM_SLOTS:
             self.room_slots[slot] = nick
             self.room_ready[slot] = False
 
     @route(CMD_NOTI_LEAVE_ROOM)
     def on_user_leave(self, pkt):
-        slot = pkt.body[0]
+        slot, = NotiLeaveRoom.unpack(pkt.body)
         if slot < MAX_ROOM_SLOTS:
             self.room_slots[slot] = None
             self.room_ready[slot] = False
 
     @route(CMD_NOTI_READY_STATE)
     def on_ready_change(self, pkt):
-        slot, state = struct.unpack('>B B', pkt.body)
+        slot, state = NotiReadyState.unpack(pkt.body)
         if slot < MAX_ROOM_SLOTS:
             self.room_ready[slot] = bool(state)
 
     @route(CMD_NOTI_GAME_START)
     def on_game_start(self, pkt):
-        seed = struct.unpack('>I', pkt.body)[0]
+        seed, = NotiGameStart.unpack(pkt.body)
         players = [i for i, u in enumerate(self.room_slots) if u is not None]
         
         self.context.game_seed = seed
@@ -0,0 +1,85 @@
+# src/client/scenes/spectate_scene.py
+import time
+from src.client.scenes.base_scene import BaseScene
+from src.common.protocol import Packet
+from src.common.constants import *
+from src.common.messages import NotiResult
+from src.core.game_state import GameState
+from src.core.snapshot import decode_frame, decompress, decode_delta, restore_state, FRAME_KEY
+from src.client.network.router import route
+from src.common.utils import setup_file_logger
+
+class SpectateScene(BaseScene):
+    """
+    진행 중인 게임 관전 화면 (입력 없음)
+    서버가 보내는 관전 프레임(CMD_NOTI_SPECTATE_FRAME)으로 모든 보드를 덮어써서 표시
+    (보드를 직접 진행하지 않으므로 서버 시뮬레이션 기준으로 약간 늦게 보임)
+    """
+    def __init__(self, manager):
+        super().__init__(manager)
+        self.games = {}
+        self.frame_base = {}   # slot -> 마지막 raw 스냅샷 (델타 기준)
+        self.frame_tick = 0
+        self.game_finished = False
+        self.result_msg = ""
+        self.winner_score = 0
+        self.logger = setup_file_logger("SpectateScene")
+
+    def on_enter(self):
+        seed = self.context.game_seed
+        self.games = {slot: GameState(seed) for slot in self.context.game_players}
+        self.frame_base = {}
+        self.frame_tick = 0
+        self.game_finished = False
+        self.result_msg = ""
+        self.winner_score = 0
+        self.renderer.clear_screen()
+
+    def update(self):
+        action = self.input_handler.get_action()
+        if action == Action.QUIT:
+            if not self.game_finished:
+                self.network.send_packet(Packet(CMD_REQ_LEAVE_SPECTATE, b''))
+            self.context.reset_game_data()
+            self.manager.change_scene("LOBBY")
+            self.network.send_packet(Packet(CMD_REQ_SEARCH_ROOM, b''))
+            return
+
+        self.renderer.draw_battle(
+            -1,
+            self.games,
+            self.result_msg if self.game_finished else None,
+            self.winner_score
+        )
+        time.sleep(0.01)
+
+    @route(CMD_NOTI_SPECTATE_FRAME)
+    def on_frame(self, pkt):
+        """관전 프레임: 전체 프레임이면 스냅샷, 아니면 직전 프레임 대비 델타 (바뀐 슬롯만)"""
+        if self.game_finished:
+            return
+        flags, tick, parts = decode_frame(pkt.body)
+        for slot, data in parts:
+            game = self.games.get(slot)
+            if game is None:
+                continue
+            if flags & FRAME_KEY:
+                raw = decompress(data)
+            else:
+                raw = decode_delta(data, self.frame_base.get(slot))
+            restore_state(game, raw)
+            self.frame_base[slot] = raw
+        self.frame_tick = tick
+
+    @route(CMD_NOTI_RESULT)
+    def on_game_result(self, pkt):
+        """게임 종료: [WinnerSlot(1B)] [Reason(1B)] (서버는 이후 관전을 종료함)"""
+        winner_slot, _ = NotiResult.unpack(pkt.body)
+        self.game_finished = True
+        if winner_slot == 255:
+            self.result_msg = "DRAW"
+        else:
+            self.result_msg = f"WINNER: P{winner_slot + 1}"
+            if winner_slot in self.games:
+                self.winner_score = self.games[winner_slot].score
+        self.logger.info(f"Spectated game finished. Winner: {winner_slot}")
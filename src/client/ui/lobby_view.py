@@ -56,7 +56,7 @@ class LobbyView:
                 lines.append(f"{self.BORDER_V}".ljust(41) + f"{self.BORDER_V}")
              
         lines.append(f"{self.TEE_L}{self.BORDER_H * width}{self.TEE_R}")
-        menu = " [C]reate   [J]oin   [R]efresh   [Q]uit "
+        menu = "[C]reate [J]oin [W]atch [R]efresh [Q]uit"
         lines.append(f"{self.BORDER_V}{menu}".ljust(41) + f"{self.BORDER_V}")
         lines.append(f"{self.CORNER_BL}{self.BORDER_H * width}{self.CORNER_BR}")
         
@@ -1,4 +1,7 @@
 # src/common/config.py
+import os
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
 
 # 네트워크 설정
 HOST = '0.0.0.0'       # 모든 인터페이스에서 접속 허용
@@ -12,6 +15,41 @@ encoding = 'utf-8'     # 문자열 인코딩 방식
 
 # 게임 설정
 TICK_RATE = 30         # 서버/클라이언트 로직 갱신 주기 (FPS)
+TICK_SYNC_INTERVAL = 5   # 몇 틱마다 CMD_NOTI_TICK을 보낼지 (5틱 = 약 0.17초)
+GRAVITY_TICKS = 15       # 중력 주기 (15틱 = 0.5초)
+GARBAGE_DELAY_TICKS = 60 # 공격받은 방해 줄이 실제로 올라오기까지 (60틱 = 2초)
+COMBO_WINDOW_TICKS = 15  # 마지막 줄 삭제 후 이 시간 동안 추가 삭제가 없으면 공격 전송 (0.5초)
+SIMULATION_MODE = 'off'  # 서버 게임 시뮬레이션 ('off': 중계만, 'shadow': 검증만, 'authoritative': 서버 판정)
+SIM_MAX_LAG_TICKS = 30   # 입력이 없어도 서버 시뮬레이션을 (현재 틱 - 이 값)까지는 진행
+SNAPSHOT_INTERVAL_TICKS = 30  # 서버 시뮬레이션 스냅샷으로 상대 보드를 재동기화하는 주기 (1초)
+SNAPSHOT_KEYFRAME_EVERY = 10  # 스냅샷 몇 번마다 델타 대신 전체 스냅샷을 보낼지
+ROLLBACK_WINDOW_TICKS = 30    # 상대 보드 롤백 스냅샷을 보관하는 틱 수 (이보다 늦은 입력은 도착 시점에 적용)
+ROLLBACK_BUDGET_MS = 4.0      # 롤백 재시뮬레이션 한 번의 목표 시간 (넘은 횟수를 통계로 남김)
+MOVE_BATCHING = True          # 클라이언트가 입력을 틱마다 모아서 CMD_REQ_MOVE_BATCH로 전송 (False면 입력마다 CMD_REQ_MOVE)
+MOVE_BATCH_MAX = 32           # 입력 묶음 한 패킷의 최대 입력 수
+SPECTATOR_INTERVAL_TICKS = 3  # 관전 프레임 주기 (3틱 = 초당 10프레임)
+SPECTATOR_LIMIT = 1000        # 게임 한 판의 최대 관전자 수
+SPECTATOR_FANOUT_BATCH = 16   # 서버 루프 1회에 관전 프레임을 넣어 줄 관전자 수 (나머지는 다음 루프)
+SPECTATOR_SKIP_BYTES = 16 * 1024  # 송신 큐가 이 이상 밀린 관전자는 프레임을 건너뜀 (이후 전체 프레임)
+SIM_WORKERS = 0          # 시뮬레이션 워커 프로세스 수 (0이면 서버 루프 안에서 실행)
+SIM_POOL_MAX_INFLIGHT = 2    # 워커별로 응답을 기다릴 수 있는 명령 묶음 수
+SIM_POOL_HIGH_WATER = 4096   # 워커에 못 보내고 쌓인 명령이 이 이상이면 해당 방들의 수신 중지
+SIM_POOL_LOW_WATER = 1024    # 이 이하로 줄면 수신 재개
+SIM_POOL_BATCH_MAX = 512     # 명령 묶음 하나의 최대 명령 수
+SIM_POOL_BATCH_BYTES = 16 * 1024  # 명령 묶음 하나의 최대 크기 (x MAX_INFLIGHT가 Pipe 버퍼보다 작아야 전송이 막히지 않음)
+REPLAY_DIR = os.path.join(PROJECT_ROOT, 'replays')  # 경기 리플레이 저장 디렉터리 (실행 위치와 무관, main_server --replay-dir, 빈 값이면 기록 안 함)
+REPLAY_CHUNK_SIZE = 4096      # 경기별 메모리 버퍼가 이만큼 차면 writer 스레드로 넘김
+REPLAY_MAX_PENDING = 8 * 1024 * 1024  # writer 스레드가 아직 쓰지 못한 바이트 한도 (넘으면 기록 중단)
+REPLAY_INDEX_TICKS = 30       # 리플레이 인덱스 간격 (1초)
 RANDOM_SEED_SIZE = 4   # 시드값 크기 (4바이트 정수)
 
-MAX_ROOM_SLOTS = 4  # 최대 방 인원수
\ No newline at end of file
+MAX_ROOM_SLOTS = 4  # 최대 방 인원수
+
+BOARD_WIDTH = 10       # 보드 가로 칸 수
+BOARD_HEIGHT = 20      # 보드 세로 칸 수
+PIECE_RANDOMIZER = 'random'  # 블록 순서 생성 방식 ('random': 균등 추첨, 'bag7': 7-bag)
+
+# 송신 큐 설정 (서버 ClientPeer 출력 버퍼)
+SEND_HIGH_WATER = 64 * 1024    # 이 이상 쌓이면 해당 클라이언트 수신(읽기) 일시 중지
+SEND_LOW_WATER = 16 * 1024     # 이 이하로 비워지면 수신 재개
+SEND_HARD_LIMIT = 1024 * 1024  # 이 이상 쌓이면 느린 클라이언트로 보고 연결 종료
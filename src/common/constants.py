@@ -16,15 +16,24 @@ CMD_NOTI_ENTER_ROOM = 0x15
 CMD_REQ_LEAVE_ROOM  = 0x16
 CMD_NOTI_LEAVE_ROOM = 0x17
 CMD_REQ_ROOM_INFO   = 0x18
+CMD_REQ_SPECTATE       = 0x19  # 진행 중인 게임 관전 [RoomID(2B)]
+CMD_RES_SPECTATE       = 0x1A  # [Result(1B)] [RoomID(2B)] [Seed(4B)] [PlayerMask(1B)]
+CMD_REQ_LEAVE_SPECTATE = 0x1B  # 관전 종료
 
 # 게임 상태 (0x20 ~ 0x2F)
 CMD_REQ_TOGGLE_READY = 0x20
 CMD_NOTI_READY_STATE = 0x21
 CMD_NOTI_GAME_START  = 0x22  # 시드 포함
+CMD_NOTI_TICK        = 0x23  # 서버 게임 틱 동기화 [Tick(4B)]
+CMD_NOTI_SNAPSHOT       = 0x24  # 보드 전체 스냅샷 [Slot(1B)][Snapshot] (src/core/snapshot.py)
+CMD_NOTI_SNAPSHOT_DELTA = 0x25  # 이전 스냅샷 대비 XOR 델타 [Slot(1B)][Delta]
+CMD_NOTI_SPECTATE_FRAME = 0x26  # 관전 프레임 (모든 슬롯) [Flags(1B)][Tick(4B)][Count(1B)] + ([Slot][Len(2B)][Data]) * Count
 
 # 조작 (0x30 ~ 0x3F)
 CMD_REQ_MOVE = 0x30
 CMD_NOTI_MOVE = 0x31
+CMD_REQ_MOVE_BATCH  = 0x32  # 한 틱 동안 모은 입력 [BaseTick(4B)] + ([KeyCode:4bit][TickDelta:4bit]) * N (src/common/move_batch.py)
+CMD_NOTI_MOVE_BATCH = 0x33  # [Slot(1B)] + REQ 본문
 
 # 상호작용 (0x40 ~ 0x4F)
 CMD_REQ_ATTACK   = 0x40
@@ -34,6 +43,10 @@ CMD_NOTI_GARBAGE = 0x41
 CMD_REQ_GAMEOVER = 0x90
 CMD_NOTI_RESULT  = 0x91
 
+# 워커 프로세스 간 내부 통신 (0xE0 ~ 0xEF, 클라이언트에게는 전송되지 않음)
+CMD_IPC_ROOM_LIST = 0xE0  # 워커가 가진 방 목록 공유
+CMD_IPC_HANDOFF   = 0xE1  # 다른 워커의 방으로 입장하는 클라이언트 연결 이관 (fd 전달)
+
 # --- Input Actions (추상화된 입력) ---
 class Action(Enum):
     MOVE_LEFT  = 1
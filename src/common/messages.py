@@ -0,0 +1,217 @@
+# src/common/messages.py
+"""
+패킷 본문 스키마 (src/common/constants.py의 모든 명령)
+
+명령마다 필드를 'name:code' 나열로 선언하면 import 시점에 struct.Struct와 __slots__ 메시지 클래스로 컴파일됨
+(호출할 때마다 형식 문자열을 다시 해석하지 않고, 길이 검사도 한 곳에서 함)
+- code   : struct 형식 문자 (모두 Big-Endian)
+- 'x:I?' : 선택 필드 (하위호환용으로 뒤에 붙은 필드, 없으면 None / 앞의 선택 필드가 있어야 뒤 것도 있음)
+- 'x:str', 'x:bytes': 나머지 본문 전체 (마지막 필드만, 선택 필드와 함께 쓰지 않음)
+  방 목록 / 관전 프레임 / 입력 묶음처럼 개수가 바뀌는 부분은 bytes로 받아서 각 모듈이 해석
+
+메시지 클래스 사용법
+- Cls.pack(*values) -> bytes      : 필드 값 -> 본문 (객체를 만들지 않는 빠른 경로)
+- Cls.unpack(body) -> tuple       : 본문 -> 필드 값 튜플 (짧거나 잘못된 본문은 ProtocolError)
+- Cls.packet(*values) -> Packet   : pack + Packet
+- Cls.decode(body) -> 인스턴스    / msg.encode() -> bytes
+핸들러에서 난 ProtocolError는 잘못된 패킷으로 처리: 서버 라우터는 rejected에 세고, 클라이언트 씬(BaseScene)은 로그를 남기고 버림
+"""
+import struct
+from operator import attrgetter
+from src.common.constants import *
+from src.common.errors import ProtocolError
+from src.common.protocol import Packet
+
+MESSAGES = {}  # CMD -> 메시지 클래스
+
+class Message:
+    """스키마로 만든 메시지 클래스의 공통 부분 (필드는 클래스마다 __slots__)"""
+    __slots__ = ()
+    cmd = None
+    fields = ()
+
+    @classmethod
+    def decode(cls, body):
+        return cls(*cls.unpack(body))
+
+    @classmethod
+    def packet(cls, *values):
+        return Packet(cls.cmd, cls.pack(*values))
+
+    def encode(self):
+        return self.pack(*self._values(self))
+
+    def to_packet(self):
+        return Packet(self.cmd, self.encode())
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self._values(self) == other._values(other)
+
+    def __repr__(self):
+        args = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.fields)
+        return f"{type(self).__name__}({args})"
+
+def _parse(spec):
+    """'a:B b:I? c:str' -> 필수 [(이름, 코드)], 선택 [(이름, 코드)], 나머지 필드 (이름, 'str'/'bytes') 또는 None"""
+    required, optional, tail = [], [], None
+    for token in spec.split():
+        name, code = token.split(':')
+        if hasattr(Message, name):
+            raise ValueError(f"field name '{name}' is reserved")
+        if tail is not None:
+            raise ValueError(f"'{tail[0]}' must be the last field")
+        if code in ('str', 'bytes'):
+            tail = (name, code)
+        elif code.endswith('?'):
+            optional.append((name, code[:-1]))
+        elif optional:
+            raise ValueError(f"required field '{name}' after optional fields")
+        else:
+            required.append((name, code))
+    if tail and optional:
+        raise ValueError("tail field cannot follow optional fields")
+    return required, optional, tail
+
+def _define(src, namespace):
+    """소스 문자열 -> 함수 (namedtuple처럼 필드 이름을 매개변수로 박아서 *args 처리를 없앰)"""
+    exec(src, namespace)
+    return namespace.pop('_f')
+
+def _compile_pack(required, optional, tail):
+    names = [n for n, _ in required]
+    codes = [c for _, c in required]
+    if not optional and tail is None:
+        return struct.Struct('>' + ''.join(codes)).pack
+    namespace = {}
+    if tail is not None:
+        namespace['p'] = struct.Struct('>' + ''.join(codes)).pack
+        rest = tail[0]
+        if tail[1] == 'str':
+            rest = f"({rest}.encode('utf-8') if {rest}.__class__ is str else {rest})"
+        head = f"p({', '.join(names)}) + " if names else ""
+        return _define(f"def _f({', '.join(names + [tail[0]])}):\n    return {head}{rest}", namespace)
+    # 선택 필드는 None이 나온 곳부터 생략
+    lines = []
+    for k in range(len(optional) + 1):
+        namespace[f'p{k}'] = struct.Struct('>' + ''.join(codes + [c for _, c in optional[:k]])).pack
+        args = ', '.join(names + [n for n, _ in optional[:k]])
+        if k < len(optional):
+            lines.append(f"    if {optional[k][0]} is None: return p{k}({args})")
+        else:
+            lines.append(f"    return p{k}({args})")
+    params = names + [f"{n}=None" for n, _ in optional]
+    return _define(f"def _f({', '.join(params)}):\n" + "\n".join(lines), namespace)
+
+def _compile_unpack(name, required, optional, tail):
+    codes = [c for _, c in required]
+    base = struct.Struct('>' + ''.join(codes))
+    size = base.size
+    namespace = {'u': base.unpack_from, 'error': struct.error}
+
+    def short(body):
+        return ProtocolError(f"{name}: body too short ({len(body)} < {size} bytes)")
+    namespace['short'] = short
+
+    if not optional:
+        # 짧은 본문은 unpack_from이 struct.error를 냄 (길이를 따로 재지 않음)
+        rest = ""
+        if tail is not None:
+            rest = f" + (body[{size}:],)" if tail[1] == 'bytes' else f" + (str(body[{size}:], 'utf-8'),)"
+
+        def invalid(e):
+            return ProtocolError(f"{name}: invalid utf-8 ({e})")
+        namespace['invalid'] = invalid
+        return _define(
+            "def _f(body):\n"
+            "    try:\n"
+            f"        return u(body){rest}\n"
+            "    except error:\n"
+            "        raise short(body) from None\n"
+            "    except UnicodeDecodeError as e:\n"
+            "        raise invalid(e) from None", namespace)
+    # 긴 형식부터 확인 (선택 필드가 모두 붙은 경우가 보통)
+    lines = ["def _f(body):", "    n = len(body)"]
+    for k in range(len(optional), -1, -1):
+        s = struct.Struct('>' + ''.join(codes + [c for _, c in optional[:k]]))
+        namespace[f'u{k}'] = s.unpack_from
+        missing = f" + {(None,) * (len(optional) - k)!r}" if k < len(optional) else ""
+        lines.append(f"    if n >= {s.size}: return u{k}(body){missing}")
+    lines.append("    raise short(body)")
+    return _define("\n".join(lines), namespace)
+
+def _compile_init(names, defaults):
+    """필드를 바로 대입하는 __init__"""
+    params = [f"{n}=None" if n in defaults else n for n in names]
+    body = "".join(f"\n    self.{n} = {n}" for n in names) or "\n    pass"
+    return _define(f"def _f(self{''.join(', ' + p for p in params)}):{body}", {})
+
+def message(cmd, name, spec=''):
+    """스키마 한 줄 -> 메시지 클래스 (MESSAGES에 등록)"""
+    required, optional, tail = _parse(spec)
+    fields = tuple(n for n, _ in required + optional) + ((tail[0],) if tail else ())
+    if len(fields) > 1:
+        values = attrgetter(*fields)
+    elif fields:
+        getter = attrgetter(fields[0])
+        values = lambda obj: (getter(obj),)
+    else:
+        values = lambda obj: ()
+    cls = type(name, (Message,), {
+        '__slots__': fields,
+        '__init__': _compile_init(fields, {n for n, _ in optional}),
+        'cmd': cmd,
+        'fields': fields,
+        'pack': staticmethod(_compile_pack(required, optional, tail)),
+        'unpack': staticmethod(_compile_unpack(name, required, optional, tail)),
+        '_values': staticmethod(values),
+    })
+    MESSAGES[cmd] = cls
+    return cls
+
+# --- 접속 ---
+ReqLogin = message(CMD_REQ_LOGIN, 'ReqLogin', 'nickname:str')
+ResLogin = message(CMD_RES_LOGIN, 'ResLogin', 'result:B')                        # 0=성공
+
+# --- 방 관리 ---
+# 방 목록: 요청은 빈 본문, 응답도 같은 CMD [Count(1B)] + ([ID(2B)][Status(1B)][TitleLen(1B)][Title]) * Count
+RoomList = message(CMD_REQ_SEARCH_ROOM, 'RoomList', 'count:B entries:bytes')
+ROOM_ENTRY = struct.Struct('>H B B')  # 방 목록 항목 앞부분 [ID][Status][TitleLen] (+ Title)
+ReqCreateRoom = message(CMD_REQ_CREATE_ROOM, 'ReqCreateRoom', 'title:str')
+ResCreateRoom = message(CMD_RES_CREATE_ROOM, 'ResCreateRoom', 'result:B room_id:H')
+ReqJoinRoom = message(CMD_REQ_JOIN_ROOM, 'ReqJoinRoom', 'room_id:H')
+ResJoinRoom = message(CMD_RES_JOIN_ROOM, 'ResJoinRoom', 'result:B slot:B')       # 1=방 없음, 2=가득 참, 3=게임 중
+NotiEnterRoom = message(CMD_NOTI_ENTER_ROOM, 'NotiEnterRoom', 'slot:B nickname:str')
+ReqLeaveRoom = message(CMD_REQ_LEAVE_ROOM, 'ReqLeaveRoom')
+NotiLeaveRoom = message(CMD_NOTI_LEAVE_ROOM, 'NotiLeaveRoom', 'slot:B')
+ReqRoomInfo = message(CMD_REQ_ROOM_INFO, 'ReqRoomInfo')
+ReqSpectate = message(CMD_REQ_SPECTATE, 'ReqSpectate', 'room_id:H')
+ResSpectate = message(CMD_RES_SPECTATE, 'ResSpectate', 'result:B room_id:H seed:I player_mask:B')
+ReqLeaveSpectate = message(CMD_REQ_LEAVE_SPECTATE, 'ReqLeaveSpectate')
+
+# --- 게임 상태 ---
+ReqToggleReady = message(CMD_REQ_TOGGLE_READY, 'ReqToggleReady')
+NotiReadyState = message(CMD_NOTI_READY_STATE, 'NotiReadyState', 'slot:B ready:B')
+NotiGameStart = message(CMD_NOTI_GAME_START, 'NotiGameStart', 'seed:I')
+NotiTick = message(CMD_NOTI_TICK, 'NotiTick', 'tick:I')
+NotiSnapshot = message(CMD_NOTI_SNAPSHOT, 'NotiSnapshot', 'slot:B data:bytes')              # src/core/snapshot.py
+NotiSnapshotDelta = message(CMD_NOTI_SNAPSHOT_DELTA, 'NotiSnapshotDelta', 'slot:B delta:bytes')
+NotiSpectateFrame = message(CMD_NOTI_SPECTATE_FRAME, 'NotiSpectateFrame', 'flags:B tick:I count:B parts:bytes')
+
+# --- 조작 ---
+ReqMove = message(CMD_REQ_MOVE, 'ReqMove', 'keycode:B tick:I?')
+NotiMove = message(CMD_NOTI_MOVE, 'NotiMove', 'slot:B keycode:B tick:I?')
+ReqMoveBatch = message(CMD_REQ_MOVE_BATCH, 'ReqMoveBatch', 'base_tick:I entries:bytes')       # src/common/move_batch.py
+NotiMoveBatch = message(CMD_NOTI_MOVE_BATCH, 'NotiMoveBatch', 'slot:B base_tick:I entries:bytes')
+
+# --- 상호작용 ---
+ReqAttack = message(CMD_REQ_ATTACK, 'ReqAttack', 'lines:B tick:I?')
+NotiGarbage = message(CMD_NOTI_GARBAGE, 'NotiGarbage', 'attacker:B target:B lines:B apply_tick:I?')
+
+# --- 종료 ---
+ReqGameover = message(CMD_REQ_GAMEOVER, 'ReqGameover', 'score:I? tick:I?')
+NotiResult = message(CMD_NOTI_RESULT, 'NotiResult', 'winner:B reason:B?')        # winner 255=무승부, reason 1=기권승
+
+# --- 워커 간 내부 통신 ---
+IpcRoomList = message(CMD_IPC_ROOM_LIST, 'IpcRoomList', 'count:H entries:bytes')
+# [Authenticated][NickLen][PendingInLen][PendingOutLen][CMD] + 닉네임 + 받은 미처리 bytes + 보낼 bytes + 이관을 일으킨 패킷 본문
+IpcHandoff = message(CMD_IPC_HANDOFF, 'IpcHandoff', 'authenticated:B nick_len:H in_len:I out_len:I packet_cmd:B rest:bytes')
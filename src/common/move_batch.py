@@ -0,0 +1,57 @@
+# src/common/move_batch.py
+"""
+입력 묶음 패킷 (CMD_REQ_MOVE_BATCH / CMD_NOTI_MOVE_BATCH) 본문 형식
+
+빠르게 조작하면 한 틱에 입력이 여러 개 나오는데, 입력마다 CMD_REQ_MOVE(8B)를 보내면 서버도
+그만큼 CMD_NOTI_MOVE(9B)를 상대 수만큼 중계함 -> 클라이언트가 한 틱 동안 모은 입력을 한 패킷으로 보냄
+
+  REQ  : [BaseTick(4B)] + [Entry(1B)] * N
+  NOTI : [Slot(1B)] + REQ 본문 그대로 (서버는 해석한 뒤 본문을 그대로 중계)
+  Entry: 상위 4비트 = 키 코드(Action.value), 하위 4비트 = 이전 입력과의 틱 차이 (0~15, 첫 입력은 BaseTick 기준)
+  N은 패킷 길이로 정해짐 (별도 개수 필드 없음, 앞부분은 src/common/messages.py의 ReqMoveBatch / NotiMoveBatch)
+"""
+from src.common.constants import Action
+from src.common.config import MOVE_BATCH_MAX
+from src.common.messages import ReqMoveBatch
+
+MAX_DELTA = 0x0F
+
+# 받은 쪽에서 적용할 키 코드 (모르는 코드는 틱 차이만 반영하고 건너뜀 -> 모든 수신자가 같은 입력을 적용)
+VALID_KEYS = frozenset(a.value for a in Action if a.value <= 0x0F)
+
+def encode_moves(moves, limit=MOVE_BATCH_MAX):
+    """
+    [(키 코드, 틱), ...] (틱 오름차순) -> 본문 목록
+    틱 차이가 15를 넘거나 limit개가 차면 다음 본문으로 나눔 (보통은 본문 하나)
+    """
+    bodies = []
+    entries = None
+    base = last = 0
+    for keycode, tick in moves:
+        delta = tick - last
+        if entries is None or not 0 <= delta <= MAX_DELTA or len(entries) >= limit:
+            if entries is not None:
+                bodies.append(ReqMoveBatch.pack(base, bytes(entries)))
+            entries = bytearray()
+            base = tick
+            delta = 0
+        entries.append((keycode & 0x0F) << 4 | delta)
+        last = tick
+    if entries is not None:
+        bodies.append(ReqMoveBatch.pack(base, bytes(entries)))
+    return bodies
+
+def decode_entries(base_tick, entries):
+    """[BaseTick] + 입력 바이트들 -> [(키 코드, 틱), ...]"""
+    tick = base_tick
+    moves = []
+    for entry in entries:
+        tick += entry & 0x0F
+        keycode = entry >> 4
+        if keycode in VALID_KEYS:
+            moves.append((keycode, tick))
+    return moves
+
+def decode_moves(body):
+    """REQ 본문 -> [(키 코드, 틱), ...] (짧은 본문은 ProtocolError)"""
+    return decode_entries(*ReqMoveBatch.unpack(body))
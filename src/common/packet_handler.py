@@ -1,48 +1,136 @@
 # src/common/packet_handler.py
-from .protocol import Packet
-from .config import HEADER_SIZE
+from .protocol import Packet, Frame
+from .config import HEADER_SIZE, BUFFER_SIZE
+from .errors import ProtocolError
+
+_new_frame = tuple.__new__  # Frame(...) 대신 tuple.__new__(Frame, (cmd, body)) -> Python 수준 __new__ 호출 없음
 
 class Packetizer:
     """
     TCP 스트림 데이터를 받아서 완성된 패킷 단위로 잘라주는 클래스
+
+    미리 할당한 bytearray 하나를 [start:end] 구간으로 관리하는 압축(Compacting) 버퍼.
+    - 수신: recv_into()로 버퍼 끝에 바로 받아씀 (중간 bytes 객체 생성 없음)
+    - 분리: get_frames()가 Frame(cmd, memoryview body)을 복사 없이 반환 (서버는 이것을 그대로 라우터로 전달)
+    - 정리: 공간이 모자랄 때만 남은 데이터를 앞으로 당김 (매 프레임 재슬라이싱 X)
+
+    주의: get_frames()가 돌려준 memoryview는 다음 put_data()/recv_into() 호출 전까지만 유효함
     """
-    def __init__(self):
-        self.buffer = b''
+    def __init__(self, capacity=BUFFER_SIZE * 2):
+        self._buf = bytearray(capacity)
+        self._view = memoryview(self._buf)
+        self._start = 0  # 아직 처리하지 않은 데이터 시작 위치
+        self._end = 0    # 수신된 데이터의 끝 위치
+
+    def _reserve(self, nbytes):
+        """버퍼 끝에 최소 nbytes 만큼의 빈 공간 확보"""
+        if len(self._buf) - self._end >= nbytes:
+            return
+
+        size = self._end - self._start
+        if self._start > 0:
+            # 1. 남은 데이터를 앞으로 당김 (같은 길이 대입이라 재할당 없음)
+            self._buf[:size] = self._buf[self._start:self._end]
+            self._start = 0
+            self._end = size
+            if len(self._buf) - self._end >= nbytes:
+                return
+
+        # 2. 그래도 모자라면 더 큰 버퍼로 교체
+        # (이미 내보낸 memoryview가 있을 수 있으므로 resize 대신 새 객체 생성)
+        new_buf = bytearray(max(len(self._buf) * 2, size + nbytes))
+        new_buf[:size] = self._buf[:size]
+        self._buf = new_buf
+        self._view = memoryview(new_buf)
 
     def put_data(self, data):
         """수신된 데이터를 버퍼에 추가"""
         if data:
-            self.buffer += data
+            n = len(data)
+            end = self._end
+            if len(self._buf) - end < n:
+                self._reserve(n)
+                end = self._end
+            self._buf[end:end + n] = data
+            self._end = end + n
+
+    def recv_into(self, sock, nbytes=BUFFER_SIZE):
+        """
+        소켓에서 버퍼로 직접 수신 (sock.recv_into 사용)
+        반환값: 수신한 바이트 수 (0이면 연결 종료)
+        BlockingIOError 등 소켓 예외는 호출자에게 그대로 전달됨
+        """
+        n = sock.recv_into(self.reserve_view(nbytes), nbytes)
+        self._end += n
+        return n
+
+    def reserve_view(self, nbytes=BUFFER_SIZE):
+        """
+        버퍼 끝의 빈 공간(최소 nbytes)을 memoryview로 반환
+        외부에서 직접 채운 뒤 commit(n)으로 확정 (asyncio BufferedProtocol 용)
+        """
+        self._reserve(nbytes)
+        return self._view[self._end:]
+
+    def commit(self, nbytes):
+        """reserve_view()로 받은 공간 중 실제로 채워진 바이트 수 확정"""
+        self._end += nbytes
+
+    def get_frames(self):
+        """
+        버퍼에서 완성된 프레임을 Frame(cmd, body)로 하나씩 반환 (for로 순회)
+        body는 내부 버퍼를 가리키는 memoryview (복사 없음)
+        """
+        start = self._start
+        avail = self._end - start
+        # 완성된 프레임이 없으면 제너레이터를 만들지 않음 (잘게 쪼개져 도착할 때 대부분의 수신)
+        if avail < HEADER_SIZE or avail < HEADER_SIZE + ((self._buf[start] << 8) | self._buf[start + 1]):
+            return ()
+        return self._frames(False)
 
     def get_packets(self):
-        """버퍼에서 완성된 패킷들을 하나씩 꺼내서 반환 (Generator)"""
-        while True:
-            # 1. 헤더(LEN)를 읽을 수 있는지 확인
-            if len(self.buffer) < HEADER_SIZE:
-                break # 데이터가 부족함
+        """
+        get_frames()와 같지만 body를 bytes로 복사해 Packet으로 반환
+        받은 패킷을 다음 수신 이후까지 보관하는 쪽용 (클라이언트 수신 스레드 -> 씬 큐)
+        """
+        start = self._start
+        avail = self._end - start
+        if avail < HEADER_SIZE or avail < HEADER_SIZE + ((self._buf[start] << 8) | self._buf[start + 1]):
+            return ()
+        return self._frames(True)
 
-            # 2. 패킷 길이 파악 (Peek)
-            # Packet.parse_header는 CMD+BODY 길이를 반환함
-            payload_len = Packet.parse_header(self.buffer[:HEADER_SIZE])
-            total_packet_len = HEADER_SIZE + payload_len
+    def _frames(self, copy):
+        buf = self._buf
+        view = self._view
+        start = self._start
+        end = self._end
+        # 1. 헤더(LEN)를 읽을 수 있는 동안
+        while end - start >= HEADER_SIZE:
+            # 2. 패킷 길이 파악 (Big-Endian, CMD+BODY 길이)
+            payload_len = (buf[start] << 8) | buf[start + 1]
+            if payload_len < 1:
+                raise ProtocolError("Empty payload (missing CMD byte)")
 
             # 3. 전체 패킷이 도착했는지 확인
-            if len(self.buffer) < total_packet_len:
-                break # 아직 바디가 다 안 옴
+            frame_end = start + HEADER_SIZE + payload_len
+            if end < frame_end:
+                break
 
-            # 4. 패킷 분리 (Slicing)
-            # [LEN(2)] [CMD(1)] [BODY(...)]
-            # packet_data는 CMD부터 끝까지
-            raw_payload = self.buffer[HEADER_SIZE : total_packet_len]
-            
-            # 버퍼에서 잘라낸 부분 삭제
-            self.buffer = self.buffer[total_packet_len:]
+            # 4. 읽기 위치를 먼저 옮긴 뒤 반환 (소비자가 중간에 멈춰도 상태 일관, 예: 다른 워커로 이관)
+            self._start = frame_end
+            if frame_end == end:
+                # 버퍼가 비었으면 위치 초기화 (압축 비용 제거)
+                self._start = self._end = 0
 
-            # 5. CMD와 BODY 분리
-            cmd = raw_payload[0]
-            body = raw_payload[1:]
+            if copy:
+                yield Packet(buf[start + HEADER_SIZE], bytes(view[start + HEADER_SIZE + 1:frame_end]))
+            else:
+                yield _new_frame(Frame, (buf[start + HEADER_SIZE], view[start + HEADER_SIZE + 1:frame_end]))
+            start = frame_end
 
-            yield Packet(cmd, body)
+    def pending_bytes(self):
+        """아직 패킷으로 완성되지 않은 잔여 데이터 반환 (복사본)"""
+        return bytes(self._buf[self._start:self._end])
 
     def has_data(self):
-        return len(self.buffer) > 0
\ No newline at end of file
+        return self._end > self._start
@@ -1,5 +1,6 @@
 # src/common/protocol.py
 import struct
+from collections import namedtuple
 from .config import HEADER_SIZE
 
 class Packet:
@@ -7,6 +8,8 @@ class Packet:
     네트워크 패킷 객체
     구조: [LEN(2)] + [CMD(1)] + [BODY(N)]
     """
+    __slots__ = ('cmd', 'body')
+
     def __init__(self, cmd, body=b''):
         self.cmd = cmd
         self.body = body
@@ -31,4 +34,15 @@ class Packet:
         return struct.unpack('>H', header_bytes)[0]
 
     def __repr__(self):
-        return f"<Packet CMD={hex(self.cmd)} LEN={len(self.body)}>"
\ No newline at end of file
+        return f"<Packet CMD={hex(self.cmd)} LEN={len(self.body)}>"
+
+class Frame(namedtuple('Frame', 'cmd body')):
+    """
+    수신 프레임 (cmd, body): Packetizer.get_frames()가 만들어 서버 라우터/핸들러로 전달
+    body는 수신 버퍼를 가리키는 memoryview라서 다음 수신 전까지만 유효함 (보관하려면 bytes()로 복사)
+    튜플이라 Packet보다 만드는 비용이 작고, 핸들러는 Packet과 같이 .cmd / .body로 읽음
+    """
+    __slots__ = ()
+
+    def __repr__(self):
+        return f"<Frame CMD={hex(self[0])} LEN={len(self[1])}>"
@@ -0,0 +1,135 @@
+# src/common/replay.py
+"""
+경기 리플레이 파일 형식 (서버가 기록: src/server/infra/replay_writer.py)
+
+파일 구조 - 모두 Big-Endian, 앞에서부터 덧붙이기만 함
+  [헤더] [로스터: ([Slot(1B)][NameLen(1B)][Name]) * N] [레코드 12B * M] [인덱스] [푸터 16B]
+  헤더: 매직 'TTRP', 버전, 시뮬레이션 모드, 방 번호, 시드, 시작 시각(UNIX 초), 틱 속도, 로스터 수
+  레코드: [Kind(1B)][Slot(1B)][A(1B)][B(1B)][Tick(4B)][Value(4B)]  (Tick = 기록 시점의 서버 틱)
+    REC_MOVE    : 중계된 입력   A=KeyCode, Value=입력을 적용한 틱 (시뮬레이션과 같은 값)
+    REC_GARBAGE : 방해 줄 전송  Slot=공격자, A=대상, B=줄 수, Value=적용 틱
+    REC_DEATH   : 사망          Value=점수
+    REC_RESULT  : 게임 종료     Slot=승자(255=없음), A=사유
+    REC_REPORT_ATTACK   : 클라이언트 공격 보고    A=줄 수, Value=보고한 틱
+    REC_REPORT_GAMEOVER : 클라이언트 게임오버 보고 Value=보고한 틱
+    (보고도 서버 시뮬레이션을 그 틱까지 진행시키므로 재시뮬레이션 순서를 맞추려고 기록)
+  인덱스: ([Tick(4B)][Offset(8B)]) * K  (약 REPLAY_INDEX_TICKS마다 그 틱 이후 첫 레코드 위치)
+  푸터: [인덱스 수(4B)][레코드 수(4B)][마지막 틱(4B)][매직 'TTRI']
+
+서버가 비정상 종료되어 푸터가 없으면 레코드를 처음부터 훑어서 읽음 (레코드가 고정 길이)
+"""
+import os
+import struct
+from bisect import bisect_right
+from src.common.errors import ProtocolError
+
+MAGIC = b'TTRP'
+FOOTER_MAGIC = b'TTRI'
+VERSION = 1
+
+HEADER = struct.Struct('>4s B B H I d B B')
+ROSTER_ENTRY = struct.Struct('>B B')
+RECORD = struct.Struct('>B B B B I I')
+INDEX_ENTRY = struct.Struct('>I Q')
+FOOTER = struct.Struct('>I I I 4s')
+
+REC_MOVE = 1
+REC_GARBAGE = 2
+REC_DEATH = 3
+REC_RESULT = 4
+REC_REPORT_ATTACK = 5
+REC_REPORT_GAMEOVER = 6
+
+SIM_MODES = ('off', 'shadow', 'authoritative')
+
+def encode_header(room_id, seed, start_time, tick_rate, mode, roster):
+    """헤더 + 로스터 bytes (roster: [(slot, 닉네임)])"""
+    out = [HEADER.pack(MAGIC, VERSION, SIM_MODES.index(mode), room_id, seed, start_time, tick_rate, len(roster))]
+    for slot, name in roster:
+        name_bytes = name.encode('utf-8')[:255]
+        out.append(ROSTER_ENTRY.pack(slot, len(name_bytes)))
+        out.append(name_bytes)
+    return b''.join(out)
+
+def encode_footer(index, records, end_tick):
+    return b''.join(INDEX_ENTRY.pack(t, o) for t, o in index) + FOOTER.pack(len(index), records, end_tick, FOOTER_MAGIC)
+
+class ReplayReader:
+    """
+    리플레이 파일 읽기
+    - records(start_tick): 레코드 튜플 (kind, slot, a, b, tick, value) 순회 (인덱스로 시작 위치 탐색)
+    - seek_time(seconds): 경기 시작 후 seconds초 지점부터 순회
+    """
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            data = f.read()
+        if len(data) < HEADER.size:
+            raise ProtocolError("Truncated replay header")
+        (magic, version, mode, self.room_id, self.seed, self.start_time,
+         self.tick_rate, count) = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ProtocolError(f"Not a replay file: {path}")
+        self.mode = SIM_MODES[mode] if mode < len(SIM_MODES) else 'off'
+
+        offset = HEADER.size
+        self.roster = []
+        for _ in range(count):
+            if offset + ROSTER_ENTRY.size > len(data):
+                raise ProtocolError("Truncated replay roster")
+            slot, length = ROSTER_ENTRY.unpack_from(data, offset)
+            offset += ROSTER_ENTRY.size
+            self.roster.append((slot, data[offset:offset + length].decode('utf-8', 'replace')))
+            offset += length
+        self.records_offset = offset
+        self._data = data
+        self._load_footer()
+
+    def _load_footer(self):
+        data = self._data
+        self.complete = False
+        if len(data) >= self.records_offset + FOOTER.size:
+            n_index, n_records, end_tick, magic = FOOTER.unpack_from(data, len(data) - FOOTER.size)
+            index_start = len(data) - FOOTER.size - n_index * INDEX_ENTRY.size
+            if magic == FOOTER_MAGIC and index_start == self.records_offset + n_records * RECORD.size:
+                self.complete = True
+                self.record_count = n_records
+                self.end_tick = end_tick
+                self.index = [INDEX_ENTRY.unpack_from(data, index_start + i * INDEX_ENTRY.size)
+                              for i in range(n_index)]
+                return
+
+        # 푸터 없음 (기록 중이거나 비정상 종료): 남은 온전한 레코드만 사용, 인덱스 없이 처음부터
+        self.record_count = (len(data) - self.records_offset) // RECORD.size
+        self.index = []
+        self.end_tick = 0
+        if self.record_count:
+            last = self.records_offset + (self.record_count - 1) * RECORD.size
+            self.end_tick = RECORD.unpack_from(data, last)[4]
+
+    @property
+    def duration(self):
+        """경기 길이 (초)"""
+        return self.end_tick / self.tick_rate if self.tick_rate else 0.0
+
+    def offset_for(self, tick):
+        """tick 이상의 레코드를 찾기 시작할 파일 위치 (인덱스 이진 탐색)"""
+        i = bisect_right(self.index, (tick, 1 << 64)) - 1
+        return self.index[i][1] if i >= 0 else self.records_offset
+
+    def records(self, start_tick=0):
+        data = self._data
+        end = self.records_offset + self.record_count * RECORD.size
+        offset = self.offset_for(start_tick) if start_tick else self.records_offset
+        for record in RECORD.iter_unpack(data[offset:end]):
+            if record[4] >= start_tick:
+                yield record
+
+    def seek_time(self, seconds):
+        return self.records(int(seconds * self.tick_rate))
+
+def list_replays(directory):
+    """디렉터리의 리플레이 파일 경로 목록 (이름순 = 시작 시각순)"""
+    if not os.path.isdir(directory):
+        return []
+    return sorted(os.path.join(directory, name) for name in os.listdir(directory) if name.endswith('.ttr'))
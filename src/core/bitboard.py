@@ -0,0 +1,251 @@
+# src/core/bitboard.py
+import random
+from src.common.config import BOARD_WIDTH, BOARD_HEIGHT
+
+class BitBoard:
+    """
+    Board와 같은 API를 가진 비트보드 엔진
+    - rows[y]: 한 줄을 정수 비트마스크로 저장 (비트 x = x열이 채워져 있음)
+    - grid[y]: 렌더링용 색상 평면 (bytearray 한 줄, 값은 Board.grid와 같음)
+    - heights[x]: 열마다 표면 높이 (바닥부터 가장 위 블록까지 칸 수, 빈 열은 0)
+    충돌 검사는 블록의 줄 단위 마스크를 시프트해서 AND, 꽉 찬 줄은 FULL_ROW와 비교
+
+    주의: grid를 직접 수정하면 rows와 어긋나므로 반드시 메서드를 통해 변경할 것
+    """
+    WIDTH = BOARD_WIDTH
+    HEIGHT = BOARD_HEIGHT
+    FULL_ROW = (1 << WIDTH) - 1
+
+    def __init__(self, holes=None):
+        # 방해 줄 구멍 위치 생성기 (GarbageHoles, 없으면 전역 random 사용)
+        self.holes = holes
+        # 0: 빈 칸, 1~7: 고정된 블록 색상, 8: 방해 줄(Garbage)
+        self.grid = [bytearray(self.WIDTH) for _ in range(self.HEIGHT)]
+        self.rows = [0] * self.HEIGHT
+        self.heights = [0] * self.WIDTH
+
+    def is_valid_position(self, tetromino, adj_x=0, adj_y=0):
+        """해당 블록이 보드 내부에 있고, 다른 블록과 겹치지 않는지 확인"""
+        shape = tetromino.shapes[tetromino.rotation % tetromino.max_rotation]
+        x = tetromino.x + adj_x + shape.min_x
+        # 1. 좌우 벽 (블록의 가로 범위로 한 번에 검사)
+        if x < 0 or x + shape.max_x - shape.min_x >= self.WIDTH:
+            return False
+
+        y = tetromino.y + adj_y
+        rows = self.rows
+        for ly, mask in shape.row_masks_at[x]:
+            target_y = y + ly
+            # 2. 위/아래 경계
+            if not 0 <= target_y < self.HEIGHT:
+                return False
+            # 3. 충돌 (미리 시프트된 줄 마스크와 AND)
+            if rows[target_y] & mask:
+                return False
+        return True
+
+    def place_tetromino(self, tetromino):
+        """블록을 보드에 고정"""
+        color = tetromino.color_id
+        px, py = tetromino.x, tetromino.y
+        for lx, ly in tetromino.shapes[tetromino.rotation % tetromino.max_rotation].cells:
+            x = px + lx
+            y = py + ly
+            if 0 <= y < self.HEIGHT and 0 <= x < self.WIDTH:
+                self.grid[y][x] = color
+                self.rows[y] |= 1 << x
+                if self.HEIGHT - y > self.heights[x]:
+                    self.heights[x] = self.HEIGHT - y
+
+    def clear_lines(self):
+        """꽉 찬 줄을 지우고, 지운 줄 수를 반환"""
+        full = self.FULL_ROW
+        rows = self.rows
+        if full not in rows:
+            return 0
+
+        keep = [y for y in range(self.HEIGHT) if rows[y] != full]
+        lines_cleared = self.HEIGHT - len(keep)
+
+        # 지운 만큼 위쪽에 빈 줄 추가
+        self.rows = [0] * lines_cleared + [rows[y] for y in keep]
+        grid = self.grid
+        self.grid = [bytearray(self.WIDTH) for _ in range(lines_cleared)] + [grid[y] for y in keep]
+        self._rebuild_heights()
+        return lines_cleared
+
+    def add_garbage_lines(self, count):
+        """방해 줄(Garbage) 추가 (아래에서 솟아오름)"""
+        # 위쪽 줄 삭제 (게임 오버 유발 가능) 후 아래쪽에 새 줄을 이어 붙임 (리스트 회전)
+        if count >= self.HEIGHT:
+            count = self.HEIGHT
+        del self.rows[:count]
+        del self.grid[:count]
+        # 열 높이는 count만큼 올라감 (밀려 나간 칸이 있으면 아래에서 다시 계산)
+        heights = self.heights
+        overflow = False
+        for x in range(self.WIDTH):
+            if heights[x]:
+                heights[x] += count
+                if heights[x] > self.HEIGHT:
+                    overflow = True
+
+        # 회색 줄(8) 추가 (한 칸은 비워둠)
+        for _ in range(count):
+            # 구멍 하나 뚫기
+            hole = self.holes.next_hole(self.WIDTH) if self.holes else random.randint(0, self.WIDTH - 1)
+            row = bytearray(b'\x08' * self.WIDTH)
+            row[hole] = 0
+            self.grid.append(row)
+            self.rows.append(self.FULL_ROW & ~(1 << hole))
+
+        if overflow:
+            self._rebuild_heights()
+        else:
+            # 원래 비어 있던 열: 방해 줄 중 가장 위에서 채워진 줄까지의 높이
+            for i, y in enumerate(range(self.HEIGHT - count, self.HEIGHT)):
+                row = self.rows[y]
+                for x in range(self.WIDTH):
+                    if not heights[x] and row >> x & 1:
+                        heights[x] = count - i
+
+    def drill_path(self, tetromino):
+        """블록 아래의 모든 장애물 제거 (무게추 효과)"""
+        px, py = tetromino.x, tetromino.y
+        for lx, ly in tetromino.shapes[tetromino.rotation % tetromino.max_rotation].cells:
+            x = px + lx
+            y = py + ly
+            if not 0 <= x < self.WIDTH:
+                continue
+            # 현재 블록 위치보다 아래(y+1)부터 바닥까지 0으로 만듦
+            keep = ~(1 << x)
+            for dy in range(max(y + 1, 0), self.HEIGHT):
+                self.grid[dy][x] = 0
+                self.rows[dy] &= keep
+            self._refresh_height(x)
+
+    def is_in_bounds(self, tetromino, adj_x=0, adj_y=0):
+        """블록이 보드 경계(벽, 바닥) 안에 있는지 확인"""
+        shape = tetromino.shapes[tetromino.rotation % tetromino.max_rotation]
+        x = tetromino.x + adj_x
+        if x + shape.min_x < 0 or x + shape.max_x >= self.WIDTH:
+            return False
+        y = tetromino.y + adj_y
+        return 0 <= y + shape.min_y and y + shape.max_y < self.HEIGHT
+
+    def drill_position(self, tetromino, adj_x=0, adj_y=0):
+        """블록이 위치할 좌표의 기존 블록들을 제거"""
+        for lx, ly in tetromino.shapes[tetromino.rotation % tetromino.max_rotation].cells:
+            target_x = tetromino.x + lx + adj_x
+            target_y = tetromino.y + ly + adj_y
+
+            # 범위 안이라면 해당 칸을 0(빈 공간)으로 만듦
+            if 0 <= target_x < self.WIDTH and 0 <= target_y < self.HEIGHT:
+                self.grid[target_y][target_x] = 0
+                self.rows[target_y] &= ~(1 << target_x)
+                if self.HEIGHT - target_y == self.heights[target_x]:
+                    self._refresh_height(target_x)
+
+    # --- 열 높이 기반 드롭 계산 ---
+    def drop_distance(self, tetromino):
+        """
+        현재 위치에서 하드 드롭으로 내려갈 수 있는 칸 수
+        착지 위치 = max(열 높이 + 그 열의 블록 바닥 오프셋) 한 번으로 계산
+        (블록이 이미 어떤 열의 표면 아래에 있으면 한 칸씩 내려보는 방식으로 계산)
+        """
+        if not self.is_valid_position(tetromino, adj_y=1):
+            return 0
+        shape = tetromino.shapes[tetromino.rotation % tetromino.max_rotation]
+        px, py = tetromino.x, tetromino.y
+        heights = self.heights
+        surface = 0
+        for lx, bottom in shape.col_bottoms:
+            h = heights[px + lx]
+            if py + bottom >= self.HEIGHT - h:
+                # 오버행 아래로 들어간 블록: 표면 높이로는 알 수 없음
+                distance = 1
+                while self.is_valid_position(tetromino, adj_y=distance + 1):
+                    distance += 1
+                return distance
+            if h + bottom > surface:
+                surface = h + bottom
+        return self.HEIGHT - 1 - surface - py
+
+    def floor_distance(self, tetromino):
+        """
+        바닥(보드 경계)까지 내려갈 수 있는 칸 수 (무게추용, 쌓인 블록 무시)
+        is_in_bounds(adj_y=1)가 참인 동안 한 칸씩 내리는 것과 같은 결과
+        """
+        if not self.is_in_bounds(tetromino, adj_y=1):
+            return 0
+        shape = tetromino.shapes[tetromino.rotation % tetromino.max_rotation]
+        return self.HEIGHT - 1 - (tetromino.y + shape.max_y)
+
+    def drill_down(self, tetromino):
+        """
+        무게추 하드 드롭: 바닥까지 지나가는 칸들을 한 번에 제거하고 내려간 칸 수 반환
+        (drill_position(adj_y=1) + 한 칸 이동을 바닥까지 반복한 것과 같은 결과)
+        """
+        distance = self.floor_distance(tetromino)
+        if not distance:
+            return 0
+        shape = tetromino.shapes[tetromino.rotation % tetromino.max_rotation]
+        px, py = tetromino.x, tetromino.y
+        # 열마다 (시작 위치 + 1 + 가장 위 칸) ~ (도착 위치 + 가장 아래 칸) 구간이 지나간 칸
+        tops = {}
+        for lx, ly in shape.cells:
+            if ly < tops.get(lx, ly + 1):
+                tops[lx] = ly
+        for lx, bottom in shape.col_bottoms:
+            x = px + lx
+            keep = ~(1 << x)
+            for y in range(max(py + 1 + tops[lx], 0), min(py + distance + bottom + 1, self.HEIGHT)):
+                self.grid[y][x] = 0
+                self.rows[y] &= keep
+            self._refresh_height(x)
+        return distance
+
+    def load_cells(self, cells):
+        """색상 값 목록(WIDTH * HEIGHT, 위쪽 줄부터)으로 보드 전체를 교체 (스냅샷 복원용)"""
+        width = self.WIDTH
+        self.grid = [bytearray(cells[y * width:(y + 1) * width]) for y in range(self.HEIGHT)]
+        self.rows = [sum(1 << x for x, c in enumerate(row) if c) for row in self.grid]
+        self._rebuild_heights()
+
+    def snapshot(self):
+        """보드 상태를 불변 값으로 (색상 평면 bytes, rows, heights) - 복원 시 다시 계산할 것이 없음"""
+        return (b''.join(self.grid), tuple(self.rows), tuple(self.heights))
+
+    def restore(self, state):
+        """snapshot() 값으로 보드 전체를 되돌림"""
+        cells, rows, heights = state
+        width = self.WIDTH
+        flat = bytearray(cells)  # bytearray를 잘라야 줄마다 복사가 한 번
+        self.grid = [flat[y:y + width] for y in range(0, width * self.HEIGHT, width)]
+        self.rows = list(rows)
+        self.heights = list(heights)
+
+    def _refresh_height(self, x):
+        """x열의 높이를 현재 표면부터 아래로 훑어 다시 계산 (제거만 일어난 열용)"""
+        bit = 1 << x
+        rows = self.rows
+        for y in range(self.HEIGHT - self.heights[x], self.HEIGHT):
+            if rows[y] & bit:
+                self.heights[x] = self.HEIGHT - y
+                return
+        self.heights[x] = 0
+
+    def _rebuild_heights(self):
+        """모든 열 높이 재계산 (위에서부터 처음 나타나는 비트 = 그 열의 표면)"""
+        heights = [0] * self.WIDTH
+        seen = 0
+        for y, row in enumerate(self.rows):
+            new = row & ~seen
+            while new:
+                low = new & -new
+                heights[low.bit_length() - 1] = self.HEIGHT - y
+                new ^= low
+            seen |= row
+            if seen == self.FULL_ROW:
+                break
+        self.heights = heights
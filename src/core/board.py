@@ -1,16 +1,19 @@
 # src/core/board.py
+import random
 
 class Board:
     WIDTH = 10
     HEIGHT = 20
 
-    def __init__(self):
+    def __init__(self, holes=None):
+        # 방해 줄 구멍 위치 생성기 (GarbageHoles, 없으면 전역 random 사용)
+        self.holes = holes
         # 0: 빈 칸, 1: 고정된 블록, 8: 방해 줄(Garbage)
         self.grid = [[0] * self.WIDTH for _ in range(self.HEIGHT)]
 
     def is_valid_position(self, tetromino, adj_x=0, adj_y=0):
         """해당 블록이 보드 내부에 있고, 다른 블록과 겹치지 않는지 확인"""
-        for lx, ly in tetromino.SHAPES[tetromino.type][tetromino.rotation % tetromino.max_rotation]:
+        for lx, ly in tetromino.shape.cells:
             target_x = tetromino.x + lx + adj_x
             target_y = tetromino.y + ly + adj_y
 
@@ -49,10 +52,10 @@ class Board:
         self.grid = self.grid[count:]
         
         # 아래쪽에 회색 줄(8) 추가 (한 칸은 비워둠)
-        import random
         for _ in range(count):
             row = [8] * self.WIDTH
-            row[random.randint(0, self.WIDTH-1)] = 0 # 구멍 하나 뚫기
+            hole = self.holes.next_hole(self.WIDTH) if self.holes else random.randint(0, self.WIDTH-1)
+            row[hole] = 0 # 구멍 하나 뚫기
             self.grid.append(row)
 
     def drill_path(self, tetromino):
@@ -65,7 +68,7 @@ class Board:
     
     def is_in_bounds(self, tetromino, adj_x=0, adj_y=0):
         """블록이 보드 경계(벽, 바닥) 안에 있는지 확인"""
-        for lx, ly in tetromino.SHAPES[tetromino.type][tetromino.rotation % tetromino.max_rotation]:
+        for lx, ly in tetromino.shape.cells:
             target_x = tetromino.x + lx + adj_x
             target_y = tetromino.y + ly + adj_y
             
@@ -76,10 +79,32 @@ class Board:
 
     def drill_position(self, tetromino, adj_x=0, adj_y=0):
         """블록이 위치할 좌표의 기존 블록들을 제거"""
-        for lx, ly in tetromino.SHAPES[tetromino.type][tetromino.rotation % tetromino.max_rotation]:
+        for lx, ly in tetromino.shape.cells:
             target_x = tetromino.x + lx + adj_x
             target_y = tetromino.y + ly + adj_y
             
             # 범위 안이라면 해당 칸을 0(빈 공간)으로 만듦
             if 0 <= target_x < self.WIDTH and 0 <= target_y < self.HEIGHT:
-                self.grid[target_y][target_x] = 0
\ No newline at end of file
+                self.grid[target_y][target_x] = 0
+
+    def drop_distance(self, tetromino):
+        """현재 위치에서 하드 드롭으로 내려갈 수 있는 칸 수 (한 칸씩 검사)"""
+        distance = 0
+        while self.is_valid_position(tetromino, adj_y=distance + 1):
+            distance += 1
+        return distance
+
+    def floor_distance(self, tetromino):
+        """바닥(보드 경계)까지 내려갈 수 있는 칸 수 (무게추용, 쌓인 블록 무시)"""
+        distance = 0
+        while self.is_in_bounds(tetromino, adj_y=distance + 1):
+            distance += 1
+        return distance
+
+    def drill_down(self, tetromino):
+        """무게추 하드 드롭: 아래 칸을 부수면서 바닥까지 이동할 거리 반환 (칸 제거 포함)"""
+        distance = 0
+        while self.is_in_bounds(tetromino, adj_y=distance + 1):
+            self.drill_position(tetromino, adj_y=distance + 1)
+            distance += 1
+        return distance
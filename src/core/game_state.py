@@ -1,62 +1,122 @@
 # src/core/game_state.py
 from src.common.constants import Action
-from .board import Board
+from src.common.config import PIECE_RANDOMIZER, GRAVITY_TICKS, GARBAGE_DELAY_TICKS, COMBO_WINDOW_TICKS
+from .bitboard import BitBoard
+from .rng import PieceStream, GarbageHoles, new_seed
 from .tetromino import Tetromino
 
+# process_batch 이벤트 (종류, 틱, 값)
+EV_LOCK = 'lock'          # 블록 고정 (값: 블록 종류)
+EV_LINES = 'lines'        # 줄 삭제 (값: 지운 줄 수)
+EV_ITEM = 'item'          # 아이템 획득 (값: 보유 수)
+EV_GARBAGE = 'garbage'    # 방해 줄이 올라옴 (값: 줄 수)
+EV_TOPOUT = 'topout'      # 블록이 쌓여 게임오버 (값: 점수)
+
 class GameState:
-    def __init__(self):
-        self.board = Board()
-        self.current_piece = Tetromino.create_random()
-        self.next_piece = Tetromino.create_random()
+    def __init__(self, seed=None, randomizer=PIECE_RANDOMIZER):
+        # 게임마다 독립된 난수원 (CMD_NOTI_GAME_START의 시드 -> 같은 시드면 같은 게임)
+        self.seed = new_seed() if seed is None else seed
+        self.pieces = PieceStream(self.seed, randomizer)
+        self.board = BitBoard(GarbageHoles(self.seed))
+        self.current_piece = self.pieces.next_piece()
+        self.next_piece = self.pieces.next_piece()
         self.score = 0
         self.game_over = False
         self.item_count = 0        # 보유 아이템 수 (최대 3)
         self.item_target = 4       # 다음 아이템 획득 목표 (4 -> 8 -> 16)
         self.item_progress = 0
+        self._ghost = None         # get_ghost_piece()가 매 프레임 재사용하는 블록 객체
+
+        # 서버 틱 기준 진행 상태 (클라이언트와 서버 시뮬레이션이 같은 순서로 처리)
+        self.tick = 0              # 마지막으로 처리한 서버 틱
+        self.incoming = []         # 도착 전 공격 [(도착 틱, 줄 수, 적용 틱), ...]
+        self.garbage_queue = []    # 적용 대기 방해 줄 [[줄 수, 적용 틱], ...] (줄 삭제로 상쇄 가능)
+        self.accumulated_lines = 0 # 콤보로 모으고 있는 공격 줄 수
+        self.last_clear_tick = 0   # 마지막으로 줄을 지운 틱 (콤보 타이머)
+        self.attacks = []          # 콤보가 끝나 내보낼 공격 [(틱, 줄 수), ...] (호출자가 꺼내 감)
+        self.inputs = 0            # 지금까지 받은 입력 수 (스냅샷 이후 입력을 다시 적용할 때 기준)
+        self.garbage_seq = 0       # 지금까지 등록된 공격 수 (queue_garbage 호출 수)
+        self.events = None         # process_batch 중에만 이벤트를 모으는 리스트 (평소엔 None -> 기록 비용 없음)
         
     def process_input(self, action):
-        """유저 입력을 처리하고 상태 업데이트"""
+        """유저 입력을 처리하고 상태 업데이트 (지운 줄 수 반환)"""
+        self.inputs += 1
         if self.game_over:
             return 0
 
-        lines_cleared = 0
-
         if action == Action.MOVE_LEFT:
-            if self.board.is_valid_position(self.current_piece, adj_x=-1):
-                self.current_piece.x -= 1
-                
+            return self._move_left()
         elif action == Action.MOVE_RIGHT:
-            if self.board.is_valid_position(self.current_piece, adj_x=1):
-                self.current_piece.x += 1
-                
+            return self._move_right()
         elif action == Action.DOWN:
-            if self.board.is_valid_position(self.current_piece, adj_y=1):
-                lines_cleared = self._move_down()
-                
+            return self._soft_drop()
         elif action == Action.ROTATE:
-            self.current_piece.rotate()
-            if not self.board.is_valid_position(self.current_piece):
-                # 회전 불가능하면 원상복구 (벽 차기 생략)
-                self.current_piece.rotate_counter()
-                
+            return self._rotate()
         elif action == Action.DROP:
-            #  스페이스바(하드 드롭) 처리
-            if self.current_piece.is_heavy:
-                # 무게추: 바닥에 닿을 때까지 부수면서 내려감
-                while self.board.is_in_bounds(self.current_piece, adj_y=1):
-                    self.board.drill_position(self.current_piece, adj_y=1)
-                    self.current_piece.y += 1
-                lines_cleared = self.lock_piece()
-            else:
-                # 일반: 그냥 내려감
-                while self.board.is_valid_position(self.current_piece, adj_y=1):
-                    self.current_piece.y += 1
-                lines_cleared = self.lock_piece()
-            
-        elif action == Action.USE_ITEM: 
+            return self._hard_drop()
+        elif action == Action.USE_ITEM:
             self.use_item()
+        return 0
 
-        return lines_cleared
+    def process_batch(self, keys, ticks=None):
+        """
+        입력 묶음을 한 번에 처리하고 그동안 생긴 이벤트 목록 [(종류, 틱, 값), ...] 반환 (EV_*)
+        - keys : 키 코드(Action.value) 나열 (패킷 body의 bytes를 그대로 넘겨도 됨, 모르는 코드는 무시)
+        - ticks: 입력별 서버 틱 (주면 입력마다 그 틱까지 진행 후 적용 -> 중력 / 방해 줄도 이벤트로 나옴)
+        호출자는 매 입력 뒤 game_over / score / item_count를 확인하지 않고 이벤트만 보면 됨
+        """
+        events = self.events = []
+        handlers = _KEY_HANDLERS
+        try:
+            if ticks is None:
+                for key in keys:
+                    self.inputs += 1
+                    handler = handlers.get(key)
+                    if handler is not None and not self.game_over:
+                        handler(self)
+            else:
+                for key, tick in zip(keys, ticks):
+                    if tick > self.tick:
+                        self.advance_to(tick)
+                    self.inputs += 1
+                    handler = handlers.get(key)
+                    if handler is not None and not self.game_over:
+                        handler(self)
+        finally:
+            self.events = None
+        return events
+
+    def _move_left(self):
+        if self.board.is_valid_position(self.current_piece, adj_x=-1):
+            self.current_piece.x -= 1
+        return 0
+
+    def _move_right(self):
+        if self.board.is_valid_position(self.current_piece, adj_x=1):
+            self.current_piece.x += 1
+        return 0
+
+    def _soft_drop(self):
+        if self.board.is_valid_position(self.current_piece, adj_y=1):
+            return self._move_down()
+        return 0
+
+    def _rotate(self):
+        self.current_piece.rotate()
+        if not self.board.is_valid_position(self.current_piece):
+            # 회전 불가능하면 원상복구 (벽 차기 생략)
+            self.current_piece.rotate_counter()
+        return 0
+
+    def _hard_drop(self):
+        #  스페이스바(하드 드롭) 처리
+        if self.current_piece.is_heavy:
+            # 무게추: 바닥에 닿을 때까지 부수면서 내려감
+            self.current_piece.y += self.board.drill_down(self.current_piece)
+        else:
+            # 일반: 열 높이로 계산한 착지 위치까지 한 번에 내려감
+            self.current_piece.y += self.board.drop_distance(self.current_piece)
+        return self.lock_piece()
 
     def update(self):
         """일정 시간마다 호출되는 게임 루프 (중력 작용)"""
@@ -85,33 +145,20 @@ class GameState:
                 
         return lines_cleared
 
-    def lock_piece(self):
-        """블록을 보드에 고정하고 새 블록 생성"""
-        self.board.place_tetromino(self.current_piece)
-        lines = self.board.clear_lines()
-        self.score += lines * 100
-        
-        # 새 블록 가져오기
-        self.current_piece = self.next_piece
-        self.next_piece = Tetromino.create_random()
-        
-        # 새 블록을 놓을 자리가 없으면 게임 오버
-        if not self.board.is_valid_position(self.current_piece):
-            self.game_over = True
-        
-        return lines
-        
     def get_ghost_piece(self):
         if not self.current_piece: return None
-        ghost = self.current_piece.clone()
+        # 매 프레임 새로 clone하지 않고 같은 객체에 현재 블록 상태만 복사
+        ghost = self._ghost
+        if ghost is None:
+            ghost = self._ghost = self.current_piece.clone()
+        else:
+            ghost.copy_from(self.current_piece)
         
         # 고스트 표시: 무게추 상태면 바닥까지 뚫는 위치 보여주기
         if ghost.is_heavy:
-            while self.board.is_in_bounds(ghost, adj_y=1):
-                ghost.y += 1
+            ghost.y += self.board.floor_distance(ghost)
         else:
-            while self.board.is_valid_position(ghost, adj_y=1):
-                ghost.y += 1
+            ghost.y += self.board.drop_distance(ghost)
         return ghost
 
     def use_item(self):
@@ -124,12 +171,18 @@ class GameState:
         return False
 
     def lock_piece(self):
+        events = self.events
+        if events is not None:
+            events.append((EV_LOCK, self.tick, self.current_piece.type))
         self.board.place_tetromino(self.current_piece)
         lines = self.board.clear_lines()
         self.score += lines * 100
         
         # 아이템 획득 로직
         if lines > 0:
+            if events is not None:
+                events.append((EV_LINES, self.tick, lines))
+            self._on_lines_cleared(lines)
             self.item_progress += lines
             # 목표 달성 시
             if self.item_progress >= self.item_target:
@@ -137,14 +190,150 @@ class GameState:
                     self.item_count += 1
                     self.item_progress = 0 # 0으로 초기화 (요청사항)
                     self.item_target *= 2  # 목표 2배 증가 (4->8->16)
+                    if events is not None:
+                        events.append((EV_ITEM, self.tick, self.item_count))
                 else:
                     # 아이템 꽉 차면 게이지 유지하거나 초기화 (여기선 유지)
                     pass
 
         self.current_piece = self.next_piece
-        self.next_piece = Tetromino.create_random()
+        self.next_piece = self.pieces.next_piece()
         
         if not self.board.is_valid_position(self.current_piece):
             self.game_over = True
+            if events is not None:
+                events.append((EV_TOPOUT, self.tick, self.score))
         
-        return lines
\ No newline at end of file
+        return lines
+
+    # --- 스냅샷 / 복원 (같은 프로세스 안에서 되감기용, 전송용은 src/core/snapshot.py) ---
+    def snapshot(self):
+        """
+        현재 상태 전체를 불변 튜플 하나로 (보드, 현재/다음 블록, 블록 순서 위치, 방해 줄 구멍 위치,
+        점수/아이템, 틱/콤보, 방해 줄 대기열, 내보낼 공격, 입력/공격 수)
+        나중에 상태가 바뀌어도 영향이 없으므로 그대로 보관했다가 restore()에 넘기면 됨
+        """
+        cur, nxt = self.current_piece, self.next_piece
+        return (
+            self.board.snapshot(),
+            (cur.type, cur.rotation, cur.x, cur.y, cur.is_heavy),
+            (nxt.type, nxt.rotation, nxt.x, nxt.y, nxt.is_heavy),
+            self.pieces.position(), self.board.holes.counter,
+            self.score, self.game_over, self.item_count, self.item_target, self.item_progress,
+            self.tick, self.accumulated_lines, self.last_clear_tick,
+            tuple(self.incoming), tuple(tuple(entry) for entry in self.garbage_queue), tuple(self.attacks),
+            self.inputs, self.garbage_seq,
+        )
+
+    def restore(self, state):
+        """snapshot() 시점으로 되돌림 (같은 시드로 만든 GameState여야 함)"""
+        (board, cur, nxt, position, holes,
+         self.score, self.game_over, self.item_count, self.item_target, self.item_progress,
+         self.tick, self.accumulated_lines, self.last_clear_tick,
+         incoming, garbage_queue, attacks, self.inputs, self.garbage_seq) = state
+        self.board.restore(board)
+        self.board.holes.counter = holes
+        self.pieces.rewind(position)
+        self.current_piece = _make_piece(cur)
+        self.next_piece = _make_piece(nxt)
+        self.incoming = list(incoming)
+        self.garbage_queue = [list(entry) for entry in garbage_queue]
+        self.attacks = list(attacks)
+
+    # --- 서버 틱 / 공격 / 방어 ---
+    @property
+    def pending_garbage(self):
+        """적용 대기 중인 방해 줄 총합 (화면 표시용)"""
+        return sum(entry[0] for entry in self.garbage_queue)
+
+    def queue_garbage(self, lines, apply_tick):
+        """
+        이 보드를 향한 공격 등록 (CMD_NOTI_GARBAGE)
+        서버는 틱 T 처리 후 공격을 보내고 적용 틱을 T + GARBAGE_DELAY_TICKS로 정하므로,
+        모든 복제본이 같은 순서로 처리하도록 틱 T+1을 시작할 때 도착한 것으로 처리함
+        """
+        self.garbage_seq += 1
+        arrive_tick = apply_tick - GARBAGE_DELAY_TICKS + 1
+        if arrive_tick <= self.tick:
+            self._receive_garbage(lines, apply_tick)
+        else:
+            self.incoming.append((arrive_tick, lines, apply_tick))
+
+    def advance_to(self, tick):
+        """서버 틱 tick까지 차례로 진행"""
+        while self.tick < tick:
+            if self.game_over and not self.incoming:
+                self.tick = tick
+                return
+            self._run_tick(self.tick + 1)
+
+    def _run_tick(self, tick):
+        """틱 하나 진행: 공격 도착 -> 콤보 타이머 -> 방해 줄 적용 -> 중력 순서"""
+        self.tick = tick
+
+        # 1. 도착한 공격 (모은 공격 줄로 상쇄 후 대기열에 추가)
+        while self.incoming and self.incoming[0][0] <= tick:
+            _, lines, apply_tick = self.incoming.pop(0)
+            self._receive_garbage(lines, apply_tick)
+        if self.game_over:
+            return
+
+        # 2. 콤보 타이머: 마지막 삭제 후 COMBO_WINDOW_TICKS 동안 추가 삭제가 없으면 공격 확정
+        if self.accumulated_lines > 0 and tick - self.last_clear_tick >= COMBO_WINDOW_TICKS:
+            self.attacks.append((tick, self.accumulated_lines))
+            self.accumulated_lines = 0
+
+        # 3. 적용 시점이 된 방해 줄 올리기
+        queue = self.garbage_queue
+        while queue and queue[0][1] <= tick:
+            lines = queue.pop(0)[0]
+            self.board.add_garbage_lines(lines)
+            if self.events is not None:
+                self.events.append((EV_GARBAGE, tick, lines))
+
+        # 4. 중력
+        if tick % GRAVITY_TICKS == 0:
+            self.update()
+
+    def _receive_garbage(self, lines, apply_tick):
+        """크로스 카운터: 모아 둔 공격 줄로 들어온 공격을 먼저 상쇄"""
+        if self.accumulated_lines > 0:
+            blocked = min(self.accumulated_lines, lines)
+            self.accumulated_lines -= blocked
+            lines -= blocked
+        if lines > 0:
+            self.garbage_queue.append([lines, apply_tick])
+
+    def _on_lines_cleared(self, cleared):
+        """줄 삭제: 대기 중인 방해 줄을 먼저 상쇄(방어)하고 남은 줄은 공격으로 모음"""
+        self.last_clear_tick = self.tick
+        queue = self.garbage_queue
+        while cleared > 0 and queue:
+            head = queue[0]
+            if head[0] <= cleared:
+                cleared -= head[0]
+                queue.pop(0)
+            else:
+                head[0] -= cleared
+                cleared = 0
+        if cleared > 0:
+            self.accumulated_lines += cleared
+
+def _make_piece(state):
+    shape_type, rotation, x, y, is_heavy = state
+    piece = Tetromino(shape_type)
+    piece.rotation = rotation
+    piece.x = x
+    piece.y = y
+    piece.is_heavy = is_heavy
+    return piece
+
+# 키 코드 -> 입력 처리 함수 (process_batch용: Action 객체를 만들지 않고 바로 분기)
+_KEY_HANDLERS = {
+    Action.MOVE_LEFT.value: GameState._move_left,
+    Action.MOVE_RIGHT.value: GameState._move_right,
+    Action.DOWN.value: GameState._soft_drop,
+    Action.ROTATE.value: GameState._rotate,
+    Action.DROP.value: GameState._hard_drop,
+    Action.USE_ITEM.value: GameState.use_item,
+}
@@ -0,0 +1,104 @@
+# src/core/rng.py
+import random
+from .tetromino import Tetromino
+
+_MASK64 = (1 << 64) - 1
+
+def splitmix64(x):
+    """64비트 정수 하나를 섞어서 반환 (SplitMix64, 카운터 기반 난수용)"""
+    x = (x + 0x9E3779B97F4A7C15) & _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+def new_seed():
+    """시드가 주어지지 않았을 때 쓸 32비트 시드"""
+    return random.getrandbits(32)
+
+class PieceStream:
+    """
+    게임 하나가 사용하는 블록 순서 생성기 (게임마다 독립된 random.Random 사용)
+    블록 종류를 청크 단위로 미리 만들어 두고 하나씩 꺼냄
+
+    mode
+    - 'random': 매번 7종 중 균등 추첨 (기존 방식)
+    - 'bag7'  : 7종을 한 묶음(bag)으로 섞어서 차례로 배출 (같은 블록이 오래 안 나오는 현상 방지)
+    """
+    CHUNK_BAGS = 16                          # bag7 모드: 한 번에 미리 만드는 bag 수
+    CHUNK_SIZE = CHUNK_BAGS * len(Tetromino.TYPES)
+
+    def __init__(self, seed, mode='random'):
+        if mode not in ('random', 'bag7'):
+            raise ValueError(f"Unknown piece randomizer: {mode}")
+        self.seed = seed
+        self.mode = mode
+        self._rng = random.Random(seed)
+        self._chunk = ()
+        self._pos = 0
+        self.drawn = 0                       # 지금까지 꺼낸 블록 수 (스냅샷 복원용 위치)
+
+    def next_type(self):
+        """다음 블록 종류 ('I', 'O', ...)"""
+        if self._pos >= len(self._chunk):
+            self._refill()
+        shape_type = self._chunk[self._pos]
+        self._pos += 1
+        self.drawn += 1
+        return shape_type
+
+    def seek(self, drawn):
+        """처음부터 drawn개를 꺼낸 직후 상태로 되돌림 (같은 시드의 청크를 다시 생성)"""
+        self._rng = random.Random(self.seed)
+        self._chunk = ()
+        self._pos = 0
+        self.drawn = drawn
+        while drawn > self.CHUNK_SIZE:
+            self._refill()
+            drawn -= self.CHUNK_SIZE
+        if drawn:
+            self._refill()
+            self._pos = drawn
+
+    def position(self):
+        """현재 위치 (청크, 청크 안 위치, 꺼낸 수) - 청크는 불변 튜플이라 그대로 보관해도 됨"""
+        return (self._chunk, self._pos, self.drawn)
+
+    def rewind(self, position):
+        """position() 시점으로 되돌림 (같은 청크 안이면 즉시, 청크가 다르면 seek로 다시 생성)"""
+        chunk, pos, drawn = position
+        if chunk is self._chunk:
+            self._pos = pos
+            self.drawn = drawn
+        else:
+            self.seek(drawn)
+
+    def next_piece(self):
+        return Tetromino(self.next_type())
+
+    def _refill(self):
+        types = Tetromino.TYPES
+        if self.mode == 'bag7':
+            chunk = []
+            bag = list(types)
+            for _ in range(self.CHUNK_BAGS):
+                self._rng.shuffle(bag)
+                chunk.extend(bag)
+        else:
+            chunk = self._rng.choices(types, k=self.CHUNK_SIZE)
+        self._chunk = tuple(chunk)
+        self._pos = 0
+
+class GarbageHoles:
+    """
+    방해 줄 구멍 위치 생성기 (카운터 기반)
+    n번째 방해 줄의 구멍 = splitmix64(시드, n) 이므로 블록 생성 순서나
+    다른 보드의 진행 상황과 관계없이 '몇 번째 줄인가'만으로 결정됨
+    """
+    def __init__(self, seed):
+        self.key = splitmix64(seed & _MASK64)
+        self.counter = 0
+
+    def next_hole(self, width):
+        hole = splitmix64(self.key + self.counter) % width
+        self.counter += 1
+        return hole
@@ -0,0 +1,242 @@
+# src/core/snapshot.py
+"""
+GameState 스냅샷 코덱 (상대 보드 재동기화용, CMD_NOTI_SNAPSHOT / CMD_NOTI_SNAPSHOT_DELTA)
+
+raw 스냅샷 (pack_state) 구조 - 모두 Big-Endian
+  [헤더 42B] [보드 100B: 칸당 4비트, 두 칸씩 한 바이트] [방해 줄 목록: (줄 수 1B, 적용 틱 4B) * N]
+  헤더: 플래그, 틱, 입력 수, 공격 수, 점수, 아이템(수/진행/목표), 블록 순서 위치, 방해 줄 구멍 위치,
+        현재 블록(종류/회전/x/y), 다음 블록 종류, 모은 공격 줄 수, 마지막 삭제 틱, 목록 길이 2개
+  보드를 목록보다 앞에 두어 방해 줄 수가 바뀌어도 델타에서 보드 위치가 밀리지 않음
+
+전송 형태
+- 전체 스냅샷 (compress): 보드 부분을 런 길이 부호화(RLE)한 쪽이 짧으면 RLE 사용 (FLAG_RLE)
+  RLE 한 바이트 = (칸 값 << 4) | (길이 - 1), 길이 1~16
+- 델타 (encode_delta): 이전 raw와 XOR한 결과를 [0 개수(1B)][리터럴 개수(1B)][리터럴...] 반복으로 부호화
+  [기준 틱(4B)][새 raw 길이(2B)] + 부호화 데이터 (바뀐 바이트가 적으면 몇 바이트로 끝남)
+- 관전 프레임 (encode_frame): 여러 슬롯의 전체 스냅샷(FRAME_KEY) 또는 델타를 한 패킷으로 묶음
+"""
+import struct
+from src.common.config import BOARD_WIDTH, BOARD_HEIGHT, GARBAGE_DELAY_TICKS
+from src.common.errors import ProtocolError
+from .tetromino import Tetromino
+
+CELLS = BOARD_WIDTH * BOARD_HEIGHT
+PACKED_SIZE = CELLS // 2
+
+FLAG_RLE = 0x01        # 보드가 RLE로 부호화됨 (전송 형태에서만 사용, raw에는 없음)
+FLAG_GAME_OVER = 0x02
+
+HEADER = struct.Struct('>B I I I I B H H I I B B b b B B I B B')
+ENTRY = struct.Struct('>B I')
+DELTA_HEADER = struct.Struct('>I H')
+FRAME_HEADER = struct.Struct('>B I B')
+FRAME_PART = struct.Struct('>B H')
+
+FRAME_KEY = 0x01       # 관전 프레임: 각 슬롯 데이터가 전체 스냅샷 (아니면 직전 프레임 대비 델타)
+
+# 블록 종류 번호 (TYPES 순서, 무게추는 마지막)
+TYPE_CODES = {t: i for i, t in enumerate(Tetromino.TYPES)}
+TYPE_CODES['WEIGHT'] = len(Tetromino.TYPES)
+
+def _pack_cells(grid):
+    """grid(행 목록) -> 칸당 4비트 패킹 (PACKED_SIZE 바이트)"""
+    flat = b''.join(grid)
+    return bytes((flat[i] << 4) | flat[i + 1] for i in range(0, CELLS, 2))
+
+def _unpack_cells(packed):
+    cells = bytearray(CELLS)
+    for i, byte in enumerate(packed):
+        cells[2 * i] = byte >> 4
+        cells[2 * i + 1] = byte & 0x0F
+    return cells
+
+def _rle_encode(cells):
+    out = bytearray()
+    i = 0
+    while i < CELLS:
+        value = cells[i]
+        run = 1
+        while run < 16 and i + run < CELLS and cells[i + run] == value:
+            run += 1
+        out.append((value << 4) | (run - 1))
+        i += run
+    return bytes(out)
+
+def _rle_decode(data, offset):
+    """RLE 보드 해독 -> (칸 목록, 다음 오프셋)"""
+    cells = bytearray()
+    while len(cells) < CELLS:
+        if offset >= len(data):
+            raise ProtocolError("Truncated snapshot board")
+        byte = data[offset]
+        cells.extend(bytes([byte >> 4]) * ((byte & 0x0F) + 1))
+        offset += 1
+    if len(cells) != CELLS:
+        raise ProtocolError("Snapshot board overflow")
+    return cells, offset
+
+def pack_state(game):
+    """GameState -> raw 스냅샷 bytes"""
+    piece = game.current_piece
+    flags = FLAG_GAME_OVER if game.game_over else 0
+    entries = game.garbage_queue + [[lines, apply_tick] for _, lines, apply_tick in game.incoming]
+    header = HEADER.pack(
+        flags, game.tick, game.inputs, game.garbage_seq, game.score,
+        game.item_count, game.item_progress, game.item_target,
+        game.pieces.drawn, game.board.holes.counter,
+        TYPE_CODES[piece.type], piece.rotation, piece.x, piece.y,
+        TYPE_CODES[game.next_piece.type],
+        game.accumulated_lines, game.last_clear_tick,
+        len(game.garbage_queue), len(game.incoming),
+    )
+    return header + _pack_cells(game.board.grid) + b''.join(ENTRY.pack(l, t) for l, t in entries)
+
+def snapshot_tick(raw):
+    return struct.unpack_from('>I', raw, 1)[0]
+
+def restore_state(game, raw):
+    """
+    raw 스냅샷으로 GameState 전체를 덮어씀 (같은 시드로 만든 GameState여야 함)
+    잘못된 스냅샷이면 game을 건드리기 전에 ProtocolError (검증/해독을 모두 끝낸 뒤에 대입)
+    """
+    if len(raw) < HEADER.size + PACKED_SIZE:
+        raise ProtocolError("Truncated snapshot")
+    (flags, tick, inputs, garbage_seq, score, item_count, item_progress, item_target,
+     drawn, holes, cur_type, cur_rot, cur_x, cur_y, next_type,
+     accumulated, last_clear_tick, n_queue, n_incoming) = HEADER.unpack_from(raw)
+    offset = HEADER.size + PACKED_SIZE
+    if len(raw) != offset + ENTRY.size * (n_queue + n_incoming):
+        raise ProtocolError("Snapshot length mismatch")
+    current_piece = _make_piece(cur_type, cur_rot, cur_x, cur_y)
+    next_piece = _make_piece(next_type, 0, 3, 0)
+    cells = _unpack_cells(raw[HEADER.size:offset])
+    entries = [ENTRY.unpack_from(raw, offset + i * ENTRY.size) for i in range(n_queue + n_incoming)]
+
+    game.board.load_cells(cells)
+    game.game_over = bool(flags & FLAG_GAME_OVER)
+    game.tick = tick
+    game.inputs = inputs
+    game.garbage_seq = garbage_seq
+    game.score = score
+    game.item_count = item_count
+    game.item_progress = item_progress
+    game.item_target = item_target
+    game.accumulated_lines = accumulated
+    game.last_clear_tick = last_clear_tick
+    game.garbage_queue = [[lines, apply_tick] for lines, apply_tick in entries[:n_queue]]
+    game.incoming = [(apply_tick - GARBAGE_DELAY_TICKS + 1, lines, apply_tick)
+                     for lines, apply_tick in entries[n_queue:]]
+    game.attacks = []
+
+    # 블록 순서 / 방해 줄 구멍 생성기 위치 (현재/다음 블록은 이미 꺼낸 상태)
+    game.pieces.seek(drawn)
+    game.board.holes.counter = holes
+    game.current_piece = current_piece
+    game.next_piece = next_piece
+
+def _make_piece(code, rotation, x, y):
+    if code == TYPE_CODES['WEIGHT']:
+        piece = Tetromino(Tetromino.TYPES[0])
+        piece.make_heavy()
+    elif code < len(Tetromino.TYPES):
+        piece = Tetromino(Tetromino.TYPES[code])
+    else:
+        raise ProtocolError(f"Unknown piece type in snapshot: {code}")
+    piece.rotation = rotation % piece.max_rotation
+    piece.x = x
+    piece.y = y
+    return piece
+
+def compress(raw):
+    """raw -> 전송용 전체 스냅샷 (RLE가 짧으면 보드를 RLE로)"""
+    board_end = HEADER.size + PACKED_SIZE
+    rle = _rle_encode(_unpack_cells(raw[HEADER.size:board_end]))
+    if len(rle) >= PACKED_SIZE:
+        return raw
+    return bytes([raw[0] | FLAG_RLE]) + raw[1:HEADER.size] + rle + raw[board_end:]
+
+def decompress(data):
+    """전송용 전체 스냅샷 -> raw"""
+    data = bytes(data)
+    if len(data) < HEADER.size:
+        raise ProtocolError("Truncated snapshot")
+    if not data[0] & FLAG_RLE:
+        return data
+    cells, offset = _rle_decode(data, HEADER.size)
+    packed = bytes((cells[i] << 4) | cells[i + 1] for i in range(0, CELLS, 2))
+    return bytes([data[0] & ~FLAG_RLE]) + data[1:HEADER.size] + packed + data[offset:]
+
+def encode_delta(raw, base):
+    """base(이전 raw) 대비 XOR 델타"""
+    out = bytearray(DELTA_HEADER.pack(snapshot_tick(base), len(raw)))
+    base_len = len(base)
+    n = len(raw)
+    i = 0
+    while i < n:
+        # 바뀌지 않은 바이트(XOR 0) 건너뛰기
+        zeros = 0
+        while i < n and zeros < 255 and (raw[i] == (base[i] if i < base_len else 0)):
+            zeros += 1
+            i += 1
+        if i >= n:
+            break
+        start = i
+        while i < n and i - start < 255 and raw[i] != (base[i] if i < base_len else 0):
+            i += 1
+        out.append(zeros)
+        out.append(i - start)
+        out.extend(raw[j] ^ (base[j] if j < base_len else 0) for j in range(start, i))
+    return bytes(out)
+
+def decode_delta(data, base):
+    """XOR 델타 + base -> 새 raw (기준 틱이 다르면 ProtocolError)"""
+    data = bytes(data)
+    if len(data) < DELTA_HEADER.size:
+        raise ProtocolError("Truncated snapshot delta")
+    base_tick, n = DELTA_HEADER.unpack_from(data)
+    if base is None or snapshot_tick(base) != base_tick:
+        raise ProtocolError("Snapshot delta base mismatch")
+    out = bytearray(base[:n])
+    out.extend(bytes(n - len(out)))
+    pos = 0
+    i = DELTA_HEADER.size
+    while i < len(data):
+        if i + 2 > len(data):
+            raise ProtocolError("Truncated snapshot delta")
+        pos += data[i]
+        count = data[i + 1]
+        i += 2
+        if pos + count > n or i + count > len(data):
+            raise ProtocolError("Snapshot delta out of range")
+        for j in range(count):
+            out[pos + j] ^= data[i + j]
+        pos += count
+        i += count
+    return bytes(out)
+
+def encode_frame(flags, tick, parts):
+    """관전 프레임 본문: parts = [(slot, 스냅샷 또는 델타)]"""
+    out = [FRAME_HEADER.pack(flags, tick, len(parts))]
+    for slot, data in parts:
+        out.append(FRAME_PART.pack(slot, len(data)))
+        out.append(data)
+    return b''.join(out)
+
+def decode_frame(data):
+    """관전 프레임 본문 -> (flags, tick, [(slot, 데이터)])"""
+    data = bytes(data)
+    if len(data) < FRAME_HEADER.size:
+        raise ProtocolError("Truncated spectator frame")
+    flags, tick, count = FRAME_HEADER.unpack_from(data)
+    offset = FRAME_HEADER.size
+    parts = []
+    for _ in range(count):
+        if offset + FRAME_PART.size > len(data):
+            raise ProtocolError("Truncated spectator frame")
+        slot, length = FRAME_PART.unpack_from(data, offset)
+        offset += FRAME_PART.size
+        if offset + length > len(data):
+            raise ProtocolError("Truncated spectator frame")
+        parts.append((slot, data[offset:offset + length]))
+        offset += length
+    return flags, tick, parts
@@ -1,6 +1,36 @@
 # src/core/tetromino.py
 import random
 from src.common.constants import Action
+from src.common.config import BOARD_WIDTH
+
+class PieceShape:
+    """
+    (블록 종류, 회전) 하나에 대해 미리 계산해 둔 정보 (모듈 로드 시 한 번만 생성)
+    - cells      : 로컬 좌표 ((lx, ly), ...)
+    - row_masks  : 줄 단위 가로 비트마스크 ((ly, mask), ...) / 비트 i = lx == i
+    - min_x ~ max_x, min_y ~ max_y : 경계 상자 (로컬 좌표)
+    - col_bottoms: 열마다 가장 아래 칸 ((lx, 최대 ly), ...)
+    - row_masks_at[x + min_x]: 블록을 x열에 놓았을 때의 보드 기준 마스크 ((ly, mask << x), ...)
+      (보드 안에 들어가는 모든 x에 대해 미리 시프트해 둠)
+    """
+    __slots__ = ('cells', 'row_masks', 'min_x', 'max_x', 'min_y', 'max_y', 'col_bottoms', 'row_masks_at')
+
+    def __init__(self, coords):
+        self.cells = tuple(coords)
+        masks = {}
+        bottoms = {}
+        for lx, ly in coords:
+            masks[ly] = masks.get(ly, 0) | (1 << lx)
+            bottoms[lx] = max(bottoms.get(lx, ly), ly)
+        self.row_masks = tuple(sorted(masks.items()))
+        xs = [lx for lx, _ in coords]
+        ys = [ly for _, ly in coords]
+        self.min_x, self.max_x = min(xs), max(xs)
+        self.min_y, self.max_y = min(ys), max(ys)
+        self.col_bottoms = tuple(sorted(bottoms.items()))
+        self.row_masks_at = tuple(
+            tuple((ly, mask << x if x >= 0 else mask >> -x) for ly, mask in self.row_masks)
+            for x in range(-self.min_x, BOARD_WIDTH - self.max_x))
 
 class Tetromino:
     """
@@ -55,6 +85,14 @@ class Tetromino:
     
     TYPES = ['I', 'O', 'T', 'S', 'Z', 'J', 'L']
 
+    # 블록 종류별 색상 번호 (TYPES 순서 + 1, 그 외는 8)
+    COLOR_IDS = {t: i + 1 for i, t in enumerate(TYPES)}
+
+    # 블록 종류 -> 회전별 PieceShape 목록 (모듈 로드 시 아래에서 채움)
+    TABLE = {}
+
+    __slots__ = ('type', 'rotation', 'x', 'y', 'max_rotation', 'color_id', 'is_heavy', 'shapes')
+
     def __init__(self, shape_type):
         self.type = shape_type
         self.rotation = 0 # 0 ~ 3
@@ -62,22 +100,25 @@ class Tetromino:
         self.y = 0        # 초기 시작 위치 (맨 위)
         
         # O형은 회전이 없음
-        self.max_rotation = len(self.SHAPES[shape_type])
-        if shape_type in self.TYPES:
-            self.color_id = self.TYPES.index(shape_type) + 1
-        else:
-            self.color_id = 8 
+        self.shapes = self.TABLE[shape_type]
+        self.max_rotation = len(self.shapes)
+        self.color_id = self.COLOR_IDS.get(shape_type, 8)
         self.is_heavy = False
 
+    @property
+    def shape(self):
+        """현재 회전 상태의 PieceShape (미리 계산된 좌표/마스크)"""
+        return self.shapes[self.rotation % self.max_rotation]
+
     @classmethod
-    def create_random(cls):
-        """무작위 블록 생성"""
-        return cls(random.choice(cls.TYPES))
+    def create_random(cls, rng=random):
+        """무작위 블록 생성 (rng: random.Random 객체, 기본은 전역 random)"""
+        return cls(rng.choice(cls.TYPES))
 
     def get_blocks(self):
         """현재 회전 상태에 따른 블록들의 절대 좌표(board 상의 x, y) 반환"""
-        local_coords = self.SHAPES[self.type][self.rotation % self.max_rotation]
-        return [(self.x + lx, self.y + ly) for lx, ly in local_coords]
+        x, y = self.x, self.y
+        return [(x + lx, y + ly) for lx, ly in self.shapes[self.rotation % self.max_rotation].cells]
 
     def rotate(self):
         self.rotation = (self.rotation + 1) % self.max_rotation
@@ -88,19 +129,30 @@ class Tetromino:
     def clone(self):
         """현재 블록의 상태를 복제한 새 객체 반환"""
         new_piece = Tetromino(self.type)
-        new_piece.rotation = self.rotation
-        new_piece.x = self.x
-        new_piece.y = self.y
-        new_piece.color_id = self.color_id
-        new_piece.is_heavy = self.is_heavy
+        new_piece.copy_from(self)
         return new_piece
 
+    def copy_from(self, other):
+        """다른 블록의 상태를 그대로 복사 (객체 재사용용, 할당 없음)"""
+        self.type = other.type
+        self.shapes = other.shapes
+        self.max_rotation = other.max_rotation
+        self.rotation = other.rotation
+        self.x = other.x
+        self.y = other.y
+        self.color_id = other.color_id
+        self.is_heavy = other.is_heavy
+
     def make_heavy(self):
         """블록을 무게추 모드로 변경 (모양 변경 포함)"""
         self.is_heavy = True
         self.type = 'WEIGHT'     # [수정] 모양을 무게추 모양으로 변경
+        self.shapes = self.TABLE['WEIGHT']
         self.rotation = 0        # 회전 초기화 (무게추는 회전 안 함)
         self.max_rotation = 1    # 회전 불가 설정
         self.color_id = 8        # 색상: 흰색/회색
         if self.x > 6: 
-            self.x = 6
\ No newline at end of file
+            self.x = 6
+
+# 회전별 PieceShape 테이블 생성 (import 시 한 번)
+Tetromino.TABLE.update({t: tuple(PieceShape(c) for c in rotations) for t, rotations in Tetromino.SHAPES.items()})
@@ -32,11 +32,10 @@ def main():
                 game.update()
                 last_tick = current_time
                 
-            renderer.draw(game)
+            renderer.draw_battle(0, {0: game})
             time.sleep(0.01)
             
-        renderer.draw(game)
-        renderer.draw_game_over()
+        renderer.draw_battle(0, {0: game}, "GAME OVER", game.score)
         time.sleep(2) # 게임 오버 메시지 2초간 보여줌
         
     except KeyboardInterrupt:
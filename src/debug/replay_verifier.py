@@ -0,0 +1,254 @@
+# src/debug/replay_verifier.py
+"""
+헤드리스 리플레이 재생 / 검증기
+
+리플레이 파일(src/common/replay.py)의 시드와 기록된 입력/방해 줄/보고만으로 모든 보드를
+GameState로 다시 시뮬레이션하고 (화면/대기 없이 CPU 속도로), 기록된 점수와 승자가 재현되는지 확인
+엔진 변경 후 회귀 확인이나 이의 제기된 결과를 한꺼번에 검증할 때 사용
+파일이 여러 개면 프로세스 풀로 나눠서 처리
+
+- 서버 시뮬레이션이 켜진 경기(shadow/authoritative): 서버와 같은 명령 순서로 재현되므로 결과가 정확히 같아야 함
+  (서버 틱 TICK_SYNC_INTERVAL마다 하던 catch_up도 기록된 서버 틱으로 재현)
+- 'off' 경기: 클라이언트가 방해 줄을 받은 시점이 기록되지 않아 근사 재현 (불일치가 곧 조작은 아님)
+
+실행: python -m src.debug.replay_verifier [파일 또는 디렉터리 ...] [--workers N] [--verbose]
+"""
+import sys
+import os
+import time
+import argparse
+import multiprocessing
+from collections import deque
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.common.constants import Action
+from src.common.config import TICK_RATE, TICK_SYNC_INTERVAL, SIM_MAX_LAG_TICKS, REPLAY_DIR
+from src.common.errors import ProtocolError
+from src.common.replay import (ReplayReader, list_replays, REC_MOVE, REC_GARBAGE, REC_DEATH,
+                               REC_RESULT, REC_REPORT_ATTACK, REC_REPORT_GAMEOVER)
+from src.core.game_state import GameState
+
+NO_WINNER = 255
+
+class ReplayPlayer:
+    """
+    리플레이 한 개를 처음부터 재생 (슬롯마다 GameState 하나, RoomSimulation과 같은 처리 순서)
+    run(until_tick) 후 sims에서 그 시점의 보드를 볼 수 있음
+    """
+    def __init__(self, reader):
+        self.reader = reader
+        self.sims = {slot: GameState(reader.seed) for slot, _ in reader.roster}
+        self.emulate_catch_up = reader.mode != 'off'
+        self.server_tick = 0
+        self.attacks = {slot: deque() for slot in self.sims}  # 재시뮬레이션이 낸 공격 줄 수 (기록과 대조 전)
+        self.deaths = {}        # slot -> 기록된 점수 (사망 순서대로)
+        self.forfeits = set()   # 보드가 살아 있는데 사망 처리된 슬롯 (나감 / 스스로 게임오버 보고)
+        self.result = None      # (승자, 사유, 틱)
+        self.mismatches = []
+        self.records = 0
+        self._ops = {
+            REC_MOVE: self._move,
+            REC_GARBAGE: self._garbage,
+            REC_DEATH: self._death,
+            REC_RESULT: self._result,
+            REC_REPORT_ATTACK: self._report,
+            REC_REPORT_GAMEOVER: self._report,
+        }
+
+    def run(self, until_tick=None):
+        for record in self.reader.records():
+            if until_tick is not None and record[4] > until_tick:
+                break
+            self.apply(record)
+        return self
+
+    def apply(self, record):
+        kind, slot, a, b, tick, value = record
+        self._sync(tick)
+        op = self._ops.get(kind)
+        if op is not None:
+            op(slot, a, b, tick, value)
+        self.records += 1
+
+    def _sync(self, tick):
+        """서버 on_tick의 catch_up을 재현 (기록 시점 서버 틱 tick까지 지나간 동기화 틱)"""
+        if self.emulate_catch_up and tick > self.server_tick:
+            first = (self.server_tick // TICK_SYNC_INTERVAL + 1) * TICK_SYNC_INTERVAL
+            for sync_tick in range(first, tick + 1, TICK_SYNC_INTERVAL):
+                target = sync_tick - SIM_MAX_LAG_TICKS
+                if target <= 0:
+                    continue
+                for slot, sim in self.sims.items():
+                    if sim.tick < target and not sim.game_over:
+                        sim.advance_to(target)
+                        self._collect(slot)
+        if tick > self.server_tick:
+            self.server_tick = tick
+
+    def _collect(self, slot):
+        sim = self.sims[slot]
+        if sim.attacks:
+            self.attacks[slot].extend(lines for _, lines in sim.attacks)
+            sim.attacks.clear()
+
+    def _move(self, slot, keycode, _, tick, stamp):
+        sim = self.sims.get(slot)
+        if sim is None:
+            return
+        try:
+            action = Action(keycode)
+        except ValueError:
+            return
+        sim.advance_to(stamp)
+        sim.process_input(action)
+        self._collect(slot)
+
+    def _report(self, slot, _a, _b, tick, stamp):
+        # 클라이언트 보고는 서버 시뮬레이션을 보고한 틱까지 진행시킴
+        sim = self.sims.get(slot)
+        if sim is not None:
+            sim.advance_to(stamp)
+            self._collect(slot)
+
+    def _garbage(self, attacker, target, lines, tick, apply_tick):
+        if self.emulate_catch_up and attacker in self.attacks:
+            pending = self.attacks[attacker]
+            expected = pending.popleft() if pending else 0
+            if expected != lines:
+                self.mismatches.append(f"tick {tick}: slot {attacker} attack recorded {lines}, replayed {expected}")
+        sim = self.sims.get(target)
+        if sim is not None:
+            sim.queue_garbage(lines, apply_tick)
+
+    def _death(self, slot, _a, _b, tick, score):
+        sim = self.sims.get(slot)
+        if sim is None:
+            return
+        self.deaths[slot] = score
+        if not sim.game_over:
+            self.forfeits.add(slot)
+        elif sim.score != score:
+            self.mismatches.append(f"tick {tick}: slot {slot} score recorded {score}, replayed {sim.score}")
+
+    def _result(self, winner, reason, _b, tick, _value):
+        self.result = (winner, reason, tick)
+
+    def final_score(self, slot):
+        """승자 판정에 쓸 점수 (나간 슬롯은 기록된 점수, 나머지는 재시뮬레이션 점수)"""
+        if slot in self.forfeits:
+            return self.deaths[slot]
+        return self.sims[slot].score
+
+    def expected_winner(self):
+        """GameSession.handle_death와 같은 규칙으로 재시뮬레이션 결과의 승자 계산"""
+        winner, reason, _ = self.result
+        if reason == 1:
+            # 기권승: 마지막 생존자 (사망 기록이 없어야 함)
+            return winner if winner not in self.deaths else NO_WINNER
+        if len(self.deaths) < len(self.sims):
+            return NO_WINNER  # 모두 나가서 강제 종료
+        scores = {slot: self.final_score(slot) for slot in self.deaths}
+        best = max(scores.values())
+        top = [slot for slot, score in scores.items() if score == best]
+        return top[0] if len(top) == 1 else NO_WINNER
+
+def verify_replay(path):
+    """
+    리플레이 파일 하나 검증 -> 결과 dict (프로세스 풀에서 돌려받도록 기본 타입만 사용)
+    status: 'ok' | 'mismatch' | 'incomplete'(결과 기록 없음) | 'error'(읽기 실패)
+    """
+    start = time.perf_counter()
+    try:
+        reader = ReplayReader(path)
+    except (OSError, ProtocolError) as e:
+        return {'path': path, 'status': 'error', 'error': str(e), 'mismatches': [], 'records': 0, 'ticks': 0,
+                'seconds': time.perf_counter() - start}
+
+    player = ReplayPlayer(reader).run()
+    mismatches = list(player.mismatches)
+    recorded_winner = expected = None
+    if player.result is None:
+        status = 'incomplete'
+    else:
+        recorded_winner = player.result[0]
+        expected = player.expected_winner()
+        if expected != recorded_winner:
+            mismatches.append(f"winner recorded {recorded_winner}, replayed {expected}")
+        status = 'mismatch' if mismatches else 'ok'
+
+    return {
+        'path': path,
+        'status': status,
+        'mode': reader.mode,
+        'seed': reader.seed,
+        'records': player.records,
+        'ticks': player.server_tick,
+        'scores': {slot: (player.deaths.get(slot), sim.score) for slot, sim in player.sims.items()},
+        'winner': (recorded_winner, expected),
+        'forfeits': sorted(player.forfeits),
+        'mismatches': mismatches,
+        'seconds': time.perf_counter() - start,
+    }
+
+def collect_paths(targets):
+    """파일/디렉터리 인자 -> 리플레이 파일 경로 목록"""
+    paths = []
+    for target in targets:
+        if os.path.isdir(target):
+            paths.extend(list_replays(target))
+        else:
+            paths.append(target)
+    return paths
+
+def verify_all(paths, workers):
+    """여러 파일을 워커 프로세스로 나눠 검증 (완료 순서대로 결과를 내보냄)"""
+    if workers <= 1 or len(paths) <= 1:
+        for path in paths:
+            yield verify_replay(path)
+        return
+    chunksize = max(1, len(paths) // (workers * 4))
+    with multiprocessing.Pool(workers) as pool:
+        yield from pool.imap_unordered(verify_replay, paths, chunksize)
+
+def format_result(result):
+    name = os.path.basename(result['path'])
+    if result['status'] == 'error':
+        return f"[ERROR] {name}: {result['error']}"
+    scores = ' '.join(f"{slot}:{rec if rec is not None else '-'}/{sim}" for slot, (rec, sim) in result['scores'].items())
+    line = (f"[{result['status'].upper()}] {name} ({result['mode']}, {result['records']} records, "
+            f"{result['ticks']} ticks) scores(recorded/replayed) {scores} winner {result['winner'][0]}/{result['winner'][1]}")
+    for mismatch in result['mismatches']:
+        line += f"\n    - {mismatch}"
+    return line
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless replay verifier")
+    parser.add_argument('targets', nargs='*', default=[REPLAY_DIR], help="replay files or directories")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--verbose', action='store_true', help="print every replay, not only failures")
+    args = parser.parse_args()
+
+    paths = collect_paths(args.targets)
+    if not paths:
+        print("No replay files found.")
+        return 0
+
+    counts = {'ok': 0, 'mismatch': 0, 'incomplete': 0, 'error': 0}
+    records = ticks = 0
+    start = time.perf_counter()
+    for result in verify_all(paths, args.workers):
+        counts[result['status']] += 1
+        records += result['records']
+        ticks += result['ticks']
+        if args.verbose or result['status'] != 'ok':
+            print(format_result(result))
+    elapsed = time.perf_counter() - start
+
+    print(f"{len(paths)} replays: " + ', '.join(f"{k} {v}" for k, v in counts.items()))
+    print(f"{records} records, {ticks / TICK_RATE:.0f}s of game time in {elapsed:.2f}s "
+          f"({ticks / TICK_RATE / max(elapsed, 1e-9):.0f}x realtime, {args.workers} workers)")
+    return 1 if counts['mismatch'] or counts['error'] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
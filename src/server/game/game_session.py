@@ -1,29 +1,203 @@
 # src/server/game_session.py
 import random
-import struct
-from src.common.protocol import Packet
-from src.common.constants import *
+from src.common.messages import NotiGameStart, NotiTick, NotiSnapshot, NotiSnapshotDelta, NotiResult, NotiGarbage
+from src.common.config import (TICK_RATE, TICK_SYNC_INTERVAL, GARBAGE_DELAY_TICKS,
+                               SIMULATION_MODE, SIM_MAX_LAG_TICKS,
+                               SNAPSHOT_INTERVAL_TICKS, SNAPSHOT_KEYFRAME_EVERY,
+                               SPECTATOR_INTERVAL_TICKS)
 from src.common.utils import setup_file_logger
+from src.core.snapshot import compress, encode_delta
+from src.server.game.room_simulation import (EV_ATTACK, EV_TOPOUT, EV_DEATH, EV_MISMATCH,
+                                             EV_SNAPSHOT, EV_STATS, EV_LOST, SNAP_PLAYERS, SNAP_SPECTATORS)
+from src.server.game.spectator_feed import SpectatorFeed
+from src.server.infra.scheduler import scheduler
+from src.server.infra.sim_pool import sim_pool
+from src.server.infra.replay_writer import replay_writer
 
 class GameSession:
+    """
+    게임 한 판의 진행 (틱 / 공격 / 사망 / 승자 판정)
+
+    simulation_mode (서버 실행 시 --sim 으로 지정)
+    - 'off'          : 클라이언트가 보고한 공격/점수/게임오버를 그대로 중계 (기존 방식)
+    - 'shadow'       : 슬롯마다 GameState를 돌려 클라이언트 보고와 비교만 함 (불일치 통계/로그)
+    - 'authoritative': 서버 GameState 결과로 공격과 게임오버를 판정 (클라이언트 보고는 참고만)
+    입력은 [KeyCode][Tick]으로 들어오며, 시뮬레이션을 그 틱까지 진행한 뒤 적용하므로
+    클라이언트와 같은 순서(공격 도착 -> 콤보 -> 방해 줄 -> 중력 -> 입력)로 재현됨
+
+    시뮬레이션(RoomSimulation)은 sim_pool이 만들어 줌: 풀이 켜져 있으면(--sim-workers)
+    워커 프로세스에서 돌고 결과 이벤트는 비동기로 on_sim_events()에 도착함
+
+    관전자(spectators)는 서버 시뮬레이션 스냅샷으로 보드를 받으므로 simulation_mode != 'off'일 때만 가능
+    (SPECTATOR_INTERVAL_TICKS마다, 관전자가 있을 때만 스냅샷 요청)
+
+    리플레이 기록이 켜져 있으면(replay_writer) 시드/로스터와 중계한 입력, 방해 줄, 사망, 결과를
+    서버 틱과 함께 리플레이 파일로 남김 (src/common/replay.py)
+    시뮬레이션이 켜져 있으면 시뮬레이션을 진행시키는 클라이언트 보고(공격/게임오버)도 기록하여
+    리플레이만으로 서버 시뮬레이션과 같은 순서로 재현 가능 (src/debug/replay_verifier.py)
+    """
+    simulation_mode = SIMULATION_MODE
+
     def __init__(self, room):
         self.room = room  # 패킷 전송을 위해 Room 참조
         self.alive_slots = set()
         self.final_scores = {}
         self.is_active = True
+        self.seed = None
+        self.tick = 0              # 서버 게임 틱 (게임 시간의 기준)
+        self.tick_timer = None
+        self.sim = None            # 서버 측 시뮬레이션 핸들 (simulation_mode != 'off')
+        self.sim_stats = None      # 게임 종료 후 시뮬레이션 통계
+        self.snapshot_base = {}    # slot -> 마지막으로 보낸 raw 스냅샷 (델타 기준)
+        self.snapshot_sent = {}    # slot -> 보낸 스냅샷 수 (SNAPSHOT_KEYFRAME_EVERY마다 전체 스냅샷)
+        self.spectators = SpectatorFeed()
+        self.recorder = None       # 리플레이 기록기 (replay_writer가 켜져 있을 때)
         self.logger = setup_file_logger(f"Server_Session_{self.room.room_id}")
         # 게임 시작 시 현재 방에 있는 유저들로 생존자 목록 초기화
         for i, user in enumerate(self.room.slots):
             if user:
                 self.alive_slots.add(i)
+        self.players = sorted(self.alive_slots)  # 시작 시점의 슬롯 (관전자에게 알림)
                 
     def start(self):
         """게임 시작: 시드 생성 및 브로드캐스트"""
         seed = random.randint(0, 0xFFFFFFFF)
+        self.seed = seed
         print(f"[Room #{self.room.room_id}] Game Start! Seed: {seed}")
         
-        payload = struct.pack('>I', seed)
-        self.room.broadcast(Packet(CMD_NOTI_GAME_START, payload))
+        self.room.broadcast(NotiGameStart.packet(seed))
+
+        roster = [(slot, getattr(self.room.slots[slot], 'nickname', '')) for slot in self.players]
+        self.recorder = replay_writer.open_match(self.room.room_id, seed, roster, self.simulation_mode, TICK_RATE)
+
+        if self.simulation_mode != 'off':
+            self.sim = sim_pool.create(self.room.room_id, seed, self.players,
+                                       self.simulation_mode, self.on_sim_events)
+
+        # 고정 주기 틱 시작 (중력/방해 줄/콤보 시간은 모두 이 틱 기준)
+        self.tick_timer = scheduler.call_every(1.0 / TICK_RATE, self.on_tick)
+
+    def on_tick(self):
+        """서버 틱: TICK_SYNC_INTERVAL마다 현재 틱을 방 전체에 알림"""
+        self.tick += 1
+        if self.tick % TICK_SYNC_INTERVAL == 0:
+            self.room.broadcast(NotiTick.packet(self.tick))
+
+        # 입력이 없는 슬롯도 중력/방해 줄이 진행되도록 일정 지연까지는 따라잡음
+        # (입력이 늦게 도착할 수 있으므로 현재 틱까지 바로 진행하지 않음)
+        if self.sim and self.tick % TICK_SYNC_INTERVAL == 0 and self.tick > SIM_MAX_LAG_TICKS:
+            self.sim.submit(('catch_up', self.tick - SIM_MAX_LAG_TICKS))
+        # 주기적으로 서버 시뮬레이션 상태를 보내 상대 보드 복제본을 재동기화 / 관전 프레임 생성
+        if self.sim:
+            audience = 0
+            if self.tick % SNAPSHOT_INTERVAL_TICKS == 0:
+                audience |= SNAP_PLAYERS
+            if self.spectators.viewers and self.tick % SPECTATOR_INTERVAL_TICKS == 0:
+                audience |= SNAP_SPECTATORS
+            if audience:
+                self.sim.submit(('snapshot', audience))
+
+    # --- 관전 ---
+    @property
+    def can_spectate(self):
+        return self.is_active and self.sim is not None
+
+    def add_spectator(self, client):
+        """관전자 추가 (아직 내보낸 프레임이 없으면 스냅샷을 바로 요청해 입장 시점 프레임 전송)"""
+        if not self.can_spectate or not self.spectators.add(client):
+            return False
+        if not self.spectators.states:
+            self.sim.submit(('snapshot', SNAP_SPECTATORS))
+        return True
+
+    # --- 서버 시뮬레이션 ---
+    def _stamp(self, stamp):
+        """클라이언트가 보고한 틱 (없거나 서버 틱보다 앞서면 현재 서버 틱)"""
+        if stamp is None or stamp > self.tick:
+            return self.tick
+        return stamp
+
+    def handle_move(self, slot_id, keycode, stamp=None):
+        """입력 [KeyCode] 을 stamp 틱에 시뮬레이션에 적용 (중계한 입력은 리플레이에도 기록)"""
+        if not self.is_active:
+            return
+        stamp = self._stamp(stamp)
+        if self.recorder:
+            self.recorder.move(slot_id, keycode, self.tick, stamp)
+        if self.sim:
+            self.sim.submit(('move', slot_id, keycode, stamp))
+
+    def handle_moves(self, slot_id, moves):
+        """입력 묶음 [(키 코드, 틱), ...] (입력마다 handle_move와 같은 틱 보정, 시뮬레이션에는 명령 하나로)"""
+        if not self.is_active:
+            return
+        stamps = [self._stamp(tick) for _, tick in moves]
+        if self.recorder:
+            for (keycode, _), stamp in zip(moves, stamps):
+                self.recorder.move(slot_id, keycode, self.tick, stamp)
+        if self.sim:
+            self.sim.submit(('moves', slot_id, bytes(keycode for keycode, _ in moves), stamps))
+
+    def report_gameover(self, slot_id, score, stamp=None):
+        """클라이언트의 게임오버 보고 (시뮬레이션이 있으면 대조 후 사망 처리)"""
+        if self.sim and self.is_active:
+            stamp = self._stamp(stamp)
+            if self.recorder:
+                self.recorder.report_gameover(slot_id, self.tick, stamp)
+            self.sim.submit(('gameover', slot_id, score, stamp))
+            if self.simulation_mode == 'authoritative':
+                return  # 시뮬레이션의 EV_DEATH(서버 점수)로 사망 처리
+        self.handle_death(slot_id, score)
+
+    def on_sim_events(self, events):
+        """시뮬레이션 결과 처리 (인라인이면 즉시, 워커 풀이면 응답이 도착했을 때)"""
+        frame = None  # 관전 프레임에 넣을 스냅샷 (slot -> raw)
+        for kind, slot_id, value, tick in events:
+            if kind == EV_STATS:
+                self.sim_stats = value
+                self.logger.info(f"[Room #{self.room.room_id}] Simulation ({self.simulation_mode}) stats: {value}")
+                continue
+            if kind == EV_LOST:
+                # 워커가 죽어 시뮬레이션을 잃음 -> 이후로는 시뮬레이션 없이(off처럼) 클라이언트 보고로 진행
+                self.logger.warning(f"[Room #{self.room.room_id}] Simulation lost ({value}), continuing without it")
+                self.sim = None
+                continue
+            if not self.is_active:
+                continue
+            if kind == EV_ATTACK:
+                self._send_attack(slot_id, value)
+            elif kind == EV_TOPOUT:
+                self.logger.info(f"[Sim] Slot {slot_id} topped out at tick {tick} (Score: {value})")
+                self.handle_death(slot_id, value)
+            elif kind == EV_DEATH:
+                self.handle_death(slot_id, value)
+            elif kind == EV_SNAPSHOT:
+                audience = tick
+                if audience & SNAP_PLAYERS:
+                    self._send_snapshot(slot_id, value)
+                if audience & SNAP_SPECTATORS:
+                    if frame is None:
+                        frame = {}
+                    frame[slot_id] = value
+            elif kind == EV_MISMATCH:
+                self.logger.warning(f"[Sim] Slot {slot_id} {value}")
+        # 한 번의 스냅샷 요청에서 나온 모든 슬롯을 프레임 하나로 (방 단위로 한 번만 부호화)
+        if frame and self.is_active:
+            self.spectators.publish(self.tick, frame)
+
+    def _send_snapshot(self, slot_id, raw):
+        """스냅샷 전송: 처음과 SNAPSHOT_KEYFRAME_EVERY번마다 전체, 그 사이는 직전 대비 XOR 델타"""
+        base = self.snapshot_base.get(slot_id)
+        if raw == base:
+            return
+        count = self.snapshot_sent.get(slot_id, 0)
+        if base is None or count % SNAPSHOT_KEYFRAME_EVERY == 0:
+            packet = NotiSnapshot.packet(slot_id, compress(raw))
+        else:
+            packet = NotiSnapshotDelta.packet(slot_id, encode_delta(raw, base))
+        self.snapshot_base[slot_id] = raw
+        self.snapshot_sent[slot_id] = count + 1
+        self.room.broadcast(packet)
 
     def handle_death(self, slot_id, score):
         """플레이어 사망 처리 및 승자 판정 로직"""
@@ -33,6 +207,8 @@ class GameSession:
         if slot_id in self.alive_slots:
             self.alive_slots.remove(slot_id)
             self.final_scores[slot_id] = score
+            if self.recorder:
+                self.recorder.death(slot_id, self.tick, score)
             
             self.logger.info(f"[Room #{self.room.room_id}] Slot {slot_id} Died. Score: {score}. Survivors: {self.alive_slots}")
             
@@ -52,18 +228,15 @@ class GameSession:
             elif active_users_count == 1:
                 last_user = active_users[0]
                 # last_user 객체가 어느 슬롯인지 찾음
-                try:
-                    last_user_slot = self.room.slots.index(last_user)
-                    # 그 유저가 살아있는 상태라면 승리
-                    if last_user_slot in self.alive_slots:
-                        should_end = True
-                        winner_slot = last_user_slot
-                        # [Modified] 승리 사유 추가 (1=기권승/Walkover)
-                        self.finish_game(winner_slot, reason=1)
-                        self.logger.info(f"[Room #{self.room.room_id}] Auto-Win: Slot {winner_slot} is the last survivor.")
-                        return # finish_game에서 처리하므로 여기서 리턴
-                except ValueError:
-                    pass # 혹시 모를 에러 방지       
+                last_user_slot = self.room.slot_of.get(last_user, -1)
+                # 그 유저가 살아있는 상태라면 승리
+                if last_user_slot in self.alive_slots:
+                    should_end = True
+                    winner_slot = last_user_slot
+                    # [Modified] 승리 사유 추가 (1=기권승/Walkover)
+                    self.finish_game(winner_slot, reason=1)
+                    self.logger.info(f"[Room #{self.room.room_id}] Auto-Win: Slot {winner_slot} is the last survivor.")
+                    return # finish_game에서 처리하므로 여기서 리턴
             # (예외 처리) 방에 접속자가 아무도 없게 된 경우 강제 종료
             if active_users_count == 0:
                 should_end = True
@@ -92,24 +265,49 @@ class GameSession:
         """
         if not self.is_active: return
         self.is_active = False
+        if self.tick_timer:
+            self.tick_timer.cancel()
+        if self.sim:
+            self.sim.close()
+        if self.recorder:
+            self.recorder.result(winner_slot if winner_slot != -1 else 255, reason, self.tick)
+            self.recorder.close()
         
         self.logger.info(f"[Room #{self.room.room_id}] Game Finished. Winner: Slot {winner_slot}, Reason: {reason}")
         
         # 결과 전송: [WinnerSlot(1B)] [Reason(1B)]
         # (WinnerSlot: 255 = 무승부/없음)
         w = winner_slot if winner_slot != -1 else 255
-        payload = struct.pack('>B B', w, reason)
-        self.room.broadcast(Packet(CMD_NOTI_RESULT, payload))
+        result = NotiResult.packet(w, reason)
+        self.room.broadcast(result)
+        if self.spectators.viewers:
+            self.logger.info(f"[Room #{self.room.room_id}] Spectators: {self.spectators.get_stats()}")
+        self.spectators.close(result)
         
         # Room에 게임 종료 알림 (상태 정리)
         self.room.on_game_end()
 
-    def handle_attack(self, attacker_slot, lines):
+    def handle_attack(self, attacker_slot, lines, stamp=None):
         """
-        공격 요청 처리: 공격자 -> 타겟(오른쪽 생존자)에게 방해 줄 전송
+        클라이언트의 공격 보고 처리
+        - off/shadow: 보고된 공격을 그대로 전송 (shadow는 시뮬레이션 결과와 대조)
+        - authoritative: 공격은 시뮬레이션이 이미 전송하므로 대조만 함
         """
         if not self.is_active: return
 
+        if self.sim:
+            # 시뮬레이션 결과와 대조 (authoritative면 공격은 시뮬레이션이 이미 보냄)
+            stamp = self._stamp(stamp)
+            if self.recorder:
+                self.recorder.report_attack(attacker_slot, lines, self.tick, stamp)
+            self.sim.submit(('attack', attacker_slot, lines, stamp))
+            if self.simulation_mode == 'authoritative':
+                return
+
+        self._send_attack(attacker_slot, lines)
+
+    def _send_attack(self, attacker_slot, lines):
+        """공격자 -> 타겟(오른쪽 생존자)에게 방해 줄 전송"""
         # 1. 타겟 선정 (나를 제외한 생존자 중 오른쪽)
         target_slot = self.get_next_alive_target(attacker_slot)
         
@@ -119,10 +317,16 @@ class GameSession:
 
         self.logger.info(f"[Attack] Slot {attacker_slot} -> Slot {target_slot} ({lines} lines)")
 
-        # 2. 타겟에게 공격 패킷 전송
-        # 패킷 구조: [AttackerSlot(1B)] [TargetSlot(1B)] [Lines(1B)]
-        payload = struct.pack('>B B B', attacker_slot, target_slot, lines)
-        self.room.broadcast(Packet(CMD_NOTI_GARBAGE, payload))
+        # 2. 타겟에게 공격 패킷 전송 (방해 줄은 서버 틱 기준 GARBAGE_DELAY_TICKS 뒤에 적용)
+        # 패킷 구조: [AttackerSlot(1B)] [TargetSlot(1B)] [Lines(1B)] [ApplyTick(4B)]
+        apply_tick = self.tick + GARBAGE_DELAY_TICKS
+        self.room.broadcast(NotiGarbage.packet(attacker_slot, target_slot, lines, apply_tick))
+        if self.recorder:
+            self.recorder.garbage(attacker_slot, target_slot, lines, self.tick, apply_tick)
+
+        # 타겟 시뮬레이션에도 클라이언트와 같은 적용 틱으로 등록
+        if self.sim:
+            self.sim.submit(('garbage', target_slot, lines, apply_tick))
         
 
     def get_next_alive_target(self, attacker_slot):
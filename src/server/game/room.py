@@ -1,7 +1,5 @@
 # src/server/room.py
-import struct
-from src.common.protocol import Packet
-from src.common.constants import CMD_NOTI_LEAVE_ROOM, CMD_NOTI_ENTER_ROOM
+from src.common.messages import NotiLeaveRoom, NotiEnterRoom
 from src.server.infra.client_peer import ClientPeer
 from src.server.game.game_session import GameSession
 from src.common.config import MAX_ROOM_SLOTS
@@ -13,10 +11,14 @@ class Room:
         self.max_slots = MAX_ROOM_SLOTS
         self.slots = [None] * self.max_slots
         self.ready_states = [False] * self.max_slots
+        self.slot_of = {}  # ClientPeer -> 슬롯 번호 (slots와 항상 함께 갱신)
         
         # 게임 세션 객체 (게임 중일 때만 존재)
         self.game_session = None
 
+        # 방 상태(대기/게임 중)가 바뀔 때 호출 (RoomManager가 설정)
+        self.on_change = None
+
     @property
     def is_playing(self):
         """현재 게임 진행 중인지 여부"""
@@ -26,23 +28,34 @@ class Room:
         """유저 입장"""
         for i in range(self.max_slots):
             if self.slots[i] is None:
-                self.slots[i] = client
+                self._assign_slot(client, i)
                 self.ready_states[i] = False
                 return i
         return -1
 
+    def _assign_slot(self, client, slot_id):
+        """슬롯 배정: slots / slot_of / 클라이언트 캐시(room, slot_id)를 한 번에 갱신"""
+        self.slots[slot_id] = client
+        self.slot_of[client] = slot_id
+        client.room = self
+        client.room_id = self.room_id
+        client.slot_id = slot_id
+
+    def _release_slot(self, client, slot_id):
+        """슬롯 해제: 배정의 역순"""
+        self.slots[slot_id] = None
+        del self.slot_of[client]
+        client.room = None
+        client.room_id = None
+        client.slot_id = -1
+
     def leave_user(self, client: ClientPeer):
         """유저 퇴장 처리 및 방장 이양 로직"""
-        slot_id = -1
-        
         # 1. 나가는 유저 슬롯 찾기
-        for i in range(self.max_slots):
-            if self.slots[i] == client:
-                slot_id = i
-                break
+        slot_id = self.slot_of.get(client, -1)
         
         if slot_id != -1:
-            self.slots[slot_id] = None
+            self._release_slot(client, slot_id)
             self.ready_states[slot_id] = False
 
             if self.is_playing:
@@ -56,8 +69,7 @@ class Room:
                 else:
                     # 대기 중이면 즉시 이양
                     # 우선 방장이 나갔음을 모두에게 알림
-                    leave_pkt = Packet(CMD_NOTI_LEAVE_ROOM, struct.pack('>B', 0))
-                    self.broadcast(leave_pkt)
+                    self.broadcast(NotiLeaveRoom.packet(0))
 
                     self._attempt_host_migration()
 
@@ -75,15 +87,12 @@ class Room:
         
         if new_host_idx != -1:
             new_host_client = self.slots[new_host_idx]
-            self.slots[0] = new_host_client
             self.slots[new_host_idx] = None
+            self._assign_slot(new_host_client, 0)
             self.ready_states[0] = False
             
-            self.broadcast(Packet(CMD_NOTI_LEAVE_ROOM, struct.pack('>B', new_host_idx)))
-            
-            nick_bytes = new_host_client.nickname.encode('utf-8')
-            enter_body = struct.pack('>B', 0) + nick_bytes
-            self.broadcast(Packet(CMD_NOTI_ENTER_ROOM, enter_body))
+            self.broadcast(NotiLeaveRoom.packet(new_host_idx))
+            self.broadcast(NotiEnterRoom.packet(0, new_host_client.nickname))
             
             print(f"[Room #{self.room_id}] Host migrated to {new_host_client.nickname}")
 
@@ -93,9 +102,11 @@ class Room:
         return [u for u in self.slots if u is not None]
 
     def broadcast(self, packet, exclude_client=None):
-        for user in self.get_users():
-            if user != exclude_client:
-                user.send_packet(packet)
+        """패킷을 한 번만 직렬화해서 같은 bytes를 각 유저의 송신 큐에 넣음"""
+        data = packet.to_bytes()
+        for user in self.slots:
+            if user is not None and user is not exclude_client:
+                user.send_bytes(data)
 
     def is_empty(self):
         return all(s is None for s in self.slots)
@@ -126,6 +137,8 @@ class Room:
         # 세션 생성 후 시작
         self.game_session = GameSession(self)
         self.game_session.start()
+        if self.on_change:
+            self.on_change()
 
     def handle_player_death(self, slot_id, score):
         """핸들러에서 오는 사망 요청을 세션으로 위임"""
@@ -135,6 +148,8 @@ class Room:
     def on_game_end(self):
         """게임이 끝났을 때 세션에서 호출하는 콜백"""
         self.game_session = None
+        if self.on_change:
+            self.on_change()
         # 모든 유저 레디 해제
         # 모든 유저 레디 해제
         for i in range(self.max_slots):
@@ -3,17 +3,29 @@ from typing import Dict
 from .room import Room
 
 class RoomManager:
-    def __init__(self):
+    def __init__(self, id_start=1, id_step=1):
         self._rooms: Dict[int, Room] = {}
-        self._next_room_id = 1
+        self._next_room_id = id_start
+        self._id_step = id_step
+        self.version = 0  # 방 목록/상태가 바뀔 때마다 증가 (멀티 워커 목록 공유용)
+
+    def configure_ids(self, id_start, id_step):
+        """
+        방 번호 할당 규칙 설정 (멀티 워커 모드)
+        워커 k는 k+1, k+1+N, k+1+2N ... 번호만 사용하므로 번호만 보고 소유 워커를 알 수 있음
+        """
+        self._next_room_id = id_start
+        self._id_step = id_step
 
     def create_room(self, title: str) -> Room:
         """새로운 방 생성"""
         room_id = self._next_room_id
-        self._next_room_id += 1
+        self._next_room_id += self._id_step
         
         new_room = Room(room_id, title)
+        new_room.on_change = self.touch
         self._rooms[room_id] = new_room
+        self.touch()
         return new_room
 
     def get_room(self, room_id: int) -> Room:
@@ -22,9 +34,14 @@ class RoomManager:
     def remove_room(self, room_id: int):
         if room_id in self._rooms:
             del self._rooms[room_id]
+            self.touch()
 
     def get_all_rooms(self):
         return list(self._rooms.values())
 
+    def touch(self):
+        """방 목록 변경 표시"""
+        self.version += 1
+
 # 전역 관리자 객체 생성
-room_manager = RoomManager()
\ No newline at end of file
+room_manager = RoomManager()
@@ -0,0 +1,159 @@
+# src/server/game/room_simulation.py
+from collections import deque
+from src.common.constants import Action
+from src.core.game_state import GameState
+from src.core.snapshot import pack_state
+
+# 시뮬레이션 -> 세션 이벤트 (kind, slot, a, b)
+EV_ATTACK = 'attack'      # (slot, lines, tick)  authoritative: 콤보가 끝난 공격 -> 방해 줄 전송
+EV_TOPOUT = 'topout'      # (slot, score, tick)  authoritative: 블록이 쌓여 게임오버
+EV_DEATH = 'death'        # (slot, score, None)  게임오버 보고 처리 결과 (사망 처리에 쓸 점수)
+EV_MISMATCH = 'mismatch'  # (slot, 설명, None)   클라이언트 보고와 시뮬레이션 결과 불일치
+EV_SNAPSHOT = 'snapshot'  # (slot, raw 스냅샷, 받을 대상) 상대 보드 재동기화 / 관전 프레임용
+EV_STATS = 'stats'        # (-1, 통계 dict, None) close 처리 후 마지막 통계
+EV_LOST = 'lost'          # (-1, 사유, None)      시뮬레이션 워커가 죽음 (sim_pool이 보냄, 이후 이벤트 없음)
+
+# 스냅샷 받을 대상 (비트 조합)
+SNAP_PLAYERS = 0x01       # 플레이어 재동기화 (NOTI_SNAPSHOT / DELTA)
+SNAP_SPECTATORS = 0x02    # 관전 프레임 (NOTI_SPECTATE_FRAME)
+
+class RoomSimulation:
+    """
+    방 하나의 서버 측 게임 시뮬레이션 (슬롯마다 GameState 하나)
+
+    네트워크/세션과 분리된 순수 로직이라 I/O 프로세스 안에서 바로 돌리거나(SIM_WORKERS=0)
+    시뮬레이션 워커 프로세스로 보내서 돌릴 수 있음 (sim_pool)
+    명령은 튜플 (op, ...)로 받아 apply()에서 처리하고, 결과는 events에 쌓아 호출자가 꺼내 감
+
+    명령
+    - ('move', slot, keycode, tick)      : tick까지 진행 후 입력 적용
+    - ('moves', slot, keys, ticks)        : 입력 묶음 (keys: 키 코드 bytes, ticks: 입력별 틱 오름차순)
+    - ('garbage', slot, lines, apply_tick): 방해 줄 등록
+    - ('catch_up', tick)                  : 입력이 없는 슬롯도 tick까지 진행
+    - ('attack', slot, lines, tick)       : 클라이언트 공격 보고 대조
+    - ('gameover', slot, score, tick)     : 클라이언트 게임오버 보고 대조 -> EV_DEATH
+    - ('snapshot', audience)              : 슬롯별 현재 상태 -> EV_SNAPSHOT (audience: SNAP_* 조합)
+    - ('close',)                          : 게임 종료 -> EV_STATS
+    """
+    def __init__(self, seed, slots, mode='authoritative'):
+        self.mode = mode
+        self.authoritative = mode == 'authoritative'
+        # 클라이언트와 같은 시드 -> 같은 블록 순서 / 같은 방해 줄 구멍
+        self.sims = {slot: GameState(seed) for slot in slots}
+        self.unverified = {slot: deque() for slot in slots}  # 클라이언트 보고와 아직 대조하지 않은 공격
+        self.topped_out = set()
+        self.events = []
+        self.stats = {'inputs': 0, 'late_inputs': 0, 'attack_mismatch': 0,
+                      'score_mismatch': 0, 'topout_mismatch': 0}
+        self._ops = {
+            'move': self.move,
+            'moves': self.moves,
+            'garbage': self.garbage,
+            'catch_up': self.catch_up,
+            'attack': self.report_attack,
+            'gameover': self.report_gameover,
+            'snapshot': self.snapshot,
+            'close': self.close,
+        }
+
+    def apply(self, cmd):
+        self._ops[cmd[0]](*cmd[1:])
+
+    def drain(self):
+        """쌓인 이벤트를 꺼내서 반환"""
+        events = self.events
+        self.events = []
+        return events
+
+    def _advance(self, slot, tick):
+        sim = self.sims[slot]
+        if tick < sim.tick:
+            # 지연 허용치를 넘겨 도착한 입력: 현재 시뮬레이션 틱에 적용
+            self.stats['late_inputs'] += 1
+        sim.advance_to(tick)
+        return sim
+
+    def _collect(self, slot):
+        """콤보가 끝난 공격 / 게임오버를 이벤트로 변환"""
+        sim = self.sims[slot]
+        if sim.attacks:
+            pending = self.unverified[slot]
+            for tick, lines in sim.attacks:
+                pending.append(lines)
+                if self.authoritative:
+                    self.events.append((EV_ATTACK, slot, lines, tick))
+            sim.attacks.clear()
+        if sim.game_over and slot not in self.topped_out:
+            self.topped_out.add(slot)
+            if self.authoritative:
+                self.events.append((EV_TOPOUT, slot, sim.score, sim.tick))
+
+    def move(self, slot, keycode, tick):
+        if slot not in self.sims:
+            return
+        try:
+            action = Action(keycode)
+        except ValueError:
+            return
+        sim = self._advance(slot, tick)
+        sim.process_input(action)
+        self.stats['inputs'] += 1
+        self._collect(slot)
+
+    def moves(self, slot, keys, ticks):
+        sim = self.sims.get(slot)
+        if sim is None or not keys:
+            return
+        # 틱이 오름차순이라 시뮬레이션보다 늦은 입력은 앞쪽에만 있음
+        late = 0
+        while late < len(ticks) and ticks[late] < sim.tick:
+            late += 1
+        self.stats['late_inputs'] += late
+        sim.process_batch(keys, ticks)
+        self.stats['inputs'] += len(keys)
+        self._collect(slot)
+
+    def garbage(self, slot, lines, apply_tick):
+        sim = self.sims.get(slot)
+        if sim is not None:
+            sim.queue_garbage(lines, apply_tick)
+
+    def catch_up(self, tick):
+        for slot, sim in self.sims.items():
+            if sim.tick < tick and not sim.game_over:
+                sim.advance_to(tick)
+                self._collect(slot)
+
+    def report_attack(self, slot, lines, tick):
+        if slot not in self.sims:
+            return
+        self._advance(slot, tick)
+        self._collect(slot)
+        pending = self.unverified[slot]
+        expected = pending.popleft() if pending else 0
+        if expected != lines:
+            self.stats['attack_mismatch'] += 1
+            self.events.append((EV_MISMATCH, slot, f"attack: client {lines}, server {expected}", None))
+
+    def report_gameover(self, slot, score, tick):
+        sim = self.sims.get(slot)
+        if sim is None:
+            self.events.append((EV_DEATH, slot, score, None))
+            return
+        self._advance(slot, tick)
+        self._collect(slot)
+        if not sim.game_over:
+            self.stats['topout_mismatch'] += 1
+            self.events.append((EV_MISMATCH, slot, f"gameover reported but simulation is alive (tick {sim.tick})", None))
+        if sim.score != score:
+            self.stats['score_mismatch'] += 1
+            self.events.append((EV_MISMATCH, slot, f"score: client {score}, server {sim.score}", None))
+        # authoritative: 스스로 게임오버를 보고하면 기권으로 받아들이되 점수는 서버 값 사용
+        self.events.append((EV_DEATH, slot, sim.score if self.authoritative else score, None))
+
+    def snapshot(self, audience=SNAP_PLAYERS):
+        for slot, sim in self.sims.items():
+            self.events.append((EV_SNAPSHOT, slot, pack_state(sim), audience))
+
+    def close(self):
+        self.events.append((EV_STATS, -1, dict(self.stats), None))
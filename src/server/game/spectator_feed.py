@@ -0,0 +1,131 @@
+# src/server/game/spectator_feed.py
+from src.common.protocol import Packet
+from src.common.constants import CMD_NOTI_SPECTATE_FRAME
+from src.common.config import SPECTATOR_LIMIT, SPECTATOR_FANOUT_BATCH, SPECTATOR_SKIP_BYTES
+from src.core.snapshot import compress, encode_delta, encode_frame, FRAME_KEY
+from src.server.infra.scheduler import scheduler
+
+class SpectatorFeed:
+    """
+    게임 한 판의 관전자 목록과 관전 프레임 스트림
+
+    - 관전자는 Room.slots에 들어가지 않으므로 플레이어 브로드캐스트(NOTI_MOVE 중계 등)와 무관함
+    - 서버 시뮬레이션 스냅샷이 도착하면(publish) 프레임을 방 단위로 한 번만 부호화하고
+      같은 bytes를 모든 관전자 송신 큐에 넣음 (관전자가 늘어도 부호화 비용은 그대로)
+      델타 프레임 1개 + 필요할 때만 전체 프레임(FRAME_KEY) 1개
+    - 전송은 서버 루프가 플레이어 수신/송신을 끝낸 뒤(scheduler.call_idle)에 SPECTATOR_FANOUT_BATCH명씩만 하고
+      나머지는 다음 루프로 넘김 (관전자가 많아도 플레이어 패킷 처리가 관전 프레임 뒤로 밀리지 않음)
+    - 보내지 못한 데이터(ClientPeer.pending_bytes)가 SPECTATOR_SKIP_BYTES 이상 밀린 관전자는 프레임을 건너뛰고 다음에 전체 프레임을 받음
+      (느린 관전자 때문에 큐가 쌓이거나 연결이 끊기지 않음)
+    """
+    def __init__(self, limit=SPECTATOR_LIMIT):
+        self.limit = limit
+        self.viewers = {}      # ClientPeer -> 직전 프레임까지 받았는지 (False면 다음에 전체 프레임)
+        self.states = {}       # slot -> 마지막으로 내보낸 raw 스냅샷
+        self.tick = 0          # states의 서버 틱
+        self._keyframe = None  # states를 전체 스냅샷으로 부호화한 프레임 (처음 필요할 때 생성)
+        self._delta = None     # 진행 중인 전송의 델타 프레임 (전체 프레임만 보낼 때는 None)
+        self._targets = []     # 아직 이번 프레임을 넣지 못한 관전자
+        self._timer = None
+
+        # 통계
+        self.published = 0
+        self.encoded_bytes = 0
+        self.frames_sent = 0
+        self.frames_skipped = 0
+
+    def is_full(self):
+        return len(self.viewers) >= self.limit
+
+    def add(self, client):
+        """관전자 추가 (이미 내보낸 상태가 있으면 입장 시점의 전체 프레임을 바로 전송)"""
+        if client in self.viewers:
+            return True
+        if self.is_full():
+            return False
+        client.spectating = self
+        self.viewers[client] = False
+        if self.states:
+            client.send_bytes(self.keyframe())
+            self.viewers[client] = True
+            self.frames_sent += 1
+        return True
+
+    def remove(self, client):
+        self.viewers.pop(client, None)
+        if client.spectating is self:
+            client.spectating = None
+
+    def keyframe(self):
+        if self._keyframe is None:
+            parts = [(slot, compress(raw)) for slot, raw in sorted(self.states.items())]
+            self._keyframe = Packet(CMD_NOTI_SPECTATE_FRAME, encode_frame(FRAME_KEY, self.tick, parts)).to_bytes()
+            self.encoded_bytes += len(self._keyframe)
+        return self._keyframe
+
+    def publish(self, tick, states):
+        """새 스냅샷(slot -> raw)으로 프레임을 만들어 관전자에게 전송 시작"""
+        changed = {slot: raw for slot, raw in states.items() if self.states.get(slot) != raw}
+        if not changed:
+            return
+        previous = self.states
+        if all(slot in previous for slot in changed):
+            parts = [(slot, encode_delta(raw, previous[slot])) for slot, raw in sorted(changed.items())]
+            self._delta = Packet(CMD_NOTI_SPECTATE_FRAME, encode_frame(0, tick, parts)).to_bytes()
+            self.encoded_bytes += len(self._delta)
+        else:
+            self._delta = None
+        self.states = {**previous, **changed}
+        self.tick = tick
+        self._keyframe = None
+        self.published += 1
+
+        # 이전 프레임을 아직 받지 못한 관전자는 델타 기준이 없으므로 전체 프레임 대상
+        for client in self._targets:
+            if client in self.viewers:
+                self.viewers[client] = False
+        self._targets = list(self.viewers)
+        if self._timer is None:
+            self._timer = scheduler.call_idle(self._fanout)
+
+    def _fanout(self):
+        """관전자 SPECTATOR_FANOUT_BATCH명에게 프레임을 넣고, 남으면 다음 서버 루프에 이어서"""
+        self._timer = None
+        targets = self._targets
+        batch = targets[-SPECTATOR_FANOUT_BATCH:]
+        del targets[-SPECTATOR_FANOUT_BATCH:]
+        viewers = self.viewers
+        for client in batch:
+            synced = viewers.get(client)
+            if synced is None:
+                continue  # 그 사이 관전 종료
+            if client.pending_bytes() >= SPECTATOR_SKIP_BYTES:
+                viewers[client] = False
+                self.frames_skipped += 1
+                continue
+            client.send_bytes(self._delta if synced and self._delta is not None else self.keyframe())
+            viewers[client] = True
+            self.frames_sent += 1
+        if targets:
+            self._timer = scheduler.call_idle(self._fanout)
+
+    def close(self, packet=None):
+        """게임 종료: 관전자에게 마지막 패킷(결과)을 보내고 모두 내보냄"""
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        self._targets = []
+        data = packet.to_bytes() if packet is not None else None
+        for client in list(self.viewers):
+            if data is not None:
+                client.send_bytes(data)
+            self.remove(client)
+
+    def get_stats(self):
+        return {
+            'viewers': len(self.viewers),
+            'published': self.published,
+            'encoded_bytes': self.encoded_bytes,
+            'frames_sent': self.frames_sent,
+            'frames_skipped': self.frames_skipped,
+        }
@@ -1,7 +1,8 @@
 # src/server/handlers/connection.py
 from src.server.infra.router import router
-from src.common.constants import CMD_REQ_LOGIN, CMD_RES_LOGIN
-from src.common.protocol import Packet
+from src.common.constants import CMD_REQ_LOGIN
+from src.common.errors import ProtocolError
+from src.common.messages import ReqLogin, ResLogin
 
 @router.route(CMD_REQ_LOGIN)
 def handle_login(client, packet):
@@ -10,7 +11,7 @@ def handle_login(client, packet):
     [BODY]: Nickname (String)
     """
     try:
-        nickname = packet.body.decode('utf-8')
+        nickname, = ReqLogin.unpack(packet.body)
         client.nickname = nickname
         client.is_authenticated = True
         
@@ -18,8 +19,7 @@ def handle_login(client, packet):
         
         # 로그인 성공 응답 전송 (Result: 0=성공)
         # 구조: [LEN][CMD][Result(1B)]
-        response = Packet(CMD_RES_LOGIN, bytes([0]))
-        client.send_packet(response)
+        client.send_packet(ResLogin.packet(0))
         
-    except UnicodeDecodeError:
+    except ProtocolError:
         print(f"[Error] Invalid nickname encoding from {client.addr}")
\ No newline at end of file
@@ -1,30 +1,20 @@
 # src/server/handlers/game.py
-import struct
-from src.server.infra.router import router
-from src.server.game.room_manager import room_manager
-from src.common.protocol import Packet
+from src.server.infra.router import router, require_room, require_playing
 from src.common.constants import *
+from src.common.messages import (NotiReadyState, ReqMove, NotiMove, ReqMoveBatch, NotiMoveBatch,
+                                 ReqGameover, ReqAttack)
+from src.common.move_batch import decode_entries
 from src.common.utils import setup_file_logger
 
 logger = setup_file_logger("Server_GameHandler")
 
-@router.route(CMD_REQ_TOGGLE_READY)
+@router.route(CMD_REQ_TOGGLE_READY, require_room)
 def handle_toggle_ready(client, packet):
     """준비 상태 변경 요청"""
-    if not hasattr(client, 'room_id') or client.room_id is None:
-        return
-
-    room = room_manager.get_room(client.room_id)
-    if not room: return
-
-    # 1. 내 슬롯 찾기
-    my_slot = -1
-    for i, user in enumerate(room.slots):
-        if user == client:
-            my_slot = i
-            break
-    
-    if my_slot == -1: return
+    room = client.room
+
+    # 1. 내 슬롯 (입장 시 Room이 기록해 둔 값)
+    my_slot = client.slot_id
 
     if my_slot == 0:
         if room.can_start_game():
@@ -40,82 +30,74 @@ def handle_toggle_ready(client, packet):
         state_val = 1 if is_ready else 0
         logger.info(f"[Room #{room.room_id}] Slot {my_slot} Ready: {is_ready}")
         # 변경 사실 알림 (NOTI_READY_STATE)
-        noti_payload = struct.pack('>B B', my_slot, state_val)
-        room.broadcast(Packet(CMD_NOTI_READY_STATE, noti_payload))
+        room.broadcast(NotiReadyState.packet(my_slot, state_val))
 
 
-@router.route(CMD_REQ_MOVE)
+@router.route(CMD_REQ_MOVE, require_playing)
 def handle_move(client, packet):
     """
     이동 패킷 중계 (Relay)
     받은 키 입력을 같은 방의 다른 사람에게 그대로 전달
     """
-    if not hasattr(client, 'room_id') or client.room_id is None:
-        return
-    
-    room = room_manager.get_room(client.room_id)
-    if not room or not room.is_playing: return
-
-    # 패킷 구조: [KeyCode(1B)]
-    if len(packet.body) < 1: return
-    keycode = packet.body[0]
-
-    # 내 슬롯 번호 찾기
-    my_slot = -1
-    for i, user in enumerate(room.slots):
-        if user == client:
-            my_slot = i
-            break
-    
-    if my_slot == -1: return
+    room = client.room
+
+    # 패킷 구조: [KeyCode(1B)] [Tick(4B, 선택)]
+    keycode, stamp = ReqMove.unpack(packet.body)
+
+    my_slot = client.slot_id
 
     # 상대방에게 알림 (NOTI_MOVE)
-    # 구조: [SlotID(1B)] [KeyCode(1B)]
+    # 구조: [SlotID(1B)] [KeyCode(1B)] [Tick(4B, 받은 경우)]
     # 나를 제외한(exclude_client=client) 모두에게 전송
-    relay_payload = struct.pack('>B B', my_slot, keycode)
-    room.broadcast(Packet(CMD_NOTI_MOVE, relay_payload), exclude_client=client)
+    room.broadcast(NotiMove.packet(my_slot, keycode, stamp), exclude_client=client)
+
+    # 서버 시뮬레이션에도 같은 틱에 입력 적용
+    if room.game_session:
+        room.game_session.handle_move(my_slot, keycode, stamp)
+
+@router.route(CMD_REQ_MOVE_BATCH, require_playing)
+def handle_move_batch(client, packet):
+    """
+    입력 묶음 중계 (한 틱 동안 모은 입력)
+    상대에게는 본문 앞에 슬롯만 붙여 패킷 하나로 전달
+    """
+    room = client.room
 
-@router.route(CMD_REQ_GAMEOVER)
+    # 패킷 구조: [BaseTick(4B)] + ([KeyCode:4bit][TickDelta:4bit]) * N
+    base_tick, entries = ReqMoveBatch.unpack(packet.body)
+    moves = decode_entries(base_tick, entries)
+
+    my_slot = client.slot_id
+    room.broadcast(NotiMoveBatch.packet(my_slot, base_tick, entries), exclude_client=client)
+
+    if room.game_session and moves:
+        room.game_session.handle_moves(my_slot, moves)
+
+@router.route(CMD_REQ_GAMEOVER, require_playing)
 def handle_gameover(client, packet):
     """클라이언트가 자신이 게임오버되었음을 알림"""
-    if not hasattr(client, 'room_id') or client.room_id is None: return
-    room = room_manager.get_room(client.room_id)
-    if not room or not room.is_playing: return
-   
-    score = 0
-    if len(packet.body) >= 4:
-        score = struct.unpack('>I', packet.body[:4])[0]
-
-    # 내 슬롯 찾기
-    my_slot = -1
-    for i, user in enumerate(room.slots):
-        if user == client:
-            my_slot = i
-            break
-    
+    room = client.room
+    # 패킷 구조: [Score(4B)] [Tick(4B, 선택)] (점수가 없으면 0)
+    score, stamp = ReqGameover.unpack(packet.body)
+    score = score or 0
+
+    my_slot = client.slot_id
     if my_slot != -1:
-        # 방 로직에 위임 (생존자 체크 및 게임 종료 판단)
         logger.info(f"[Room #{room.room_id}] Slot {my_slot} requested GAMEOVER (Score: {score})")
-        room.handle_player_death(my_slot, score)
+        if room.game_session:
+            # 세션에 위임 (시뮬레이션 검증 후 생존자 체크 및 게임 종료 판단)
+            room.game_session.report_gameover(my_slot, score, stamp)
+        else:
+            room.handle_player_death(my_slot, score)
 
-@router.route(CMD_REQ_ATTACK)
+@router.route(CMD_REQ_ATTACK, require_playing)
 def handle_attack(client, packet):
-    """공격 요청: [Lines(1B)]"""
-    if not hasattr(client, 'room_id') or client.room_id is None: return
-    room = room_manager.get_room(client.room_id)
-    if not room or not room.is_playing: return
-
-    if len(packet.body) < 1: return
-    lines = packet.body[0]
-
-    my_slot = -1
-    for i, user in enumerate(room.slots):
-        if user == client:
-            my_slot = i
-            break
-    
+    """공격 요청: [Lines(1B)] [Tick(4B, 선택)]"""
+    room = client.room
+    lines, stamp = ReqAttack.unpack(packet.body)
+
+    my_slot = client.slot_id
     if my_slot != -1:
         logger.info(f"[Room #{room.room_id}] Slot {my_slot} ATTACK request: {lines} lines")
-        # GameSession으로 전달 (아직 room.game_session에 handle_attack이 없으므로 주석 처리하거나 2단계에서 구현)
         if room.game_session:
-             room.game_session.handle_attack(my_slot, lines)
\ No newline at end of file
+             room.game_session.handle_attack(my_slot, lines, stamp)
\ No newline at end of file
@@ -1,15 +1,17 @@
 # src/server/handlers/room.py
-import struct
-from src.server.infra.router import router
+from src.server.infra.router import router, require_room, require_spectating
 from src.server.game.room_manager import room_manager
-from src.common.protocol import Packet
+from src.server.infra.cluster import cluster, encode_room_entries
 from src.common.constants import *
+from src.common.messages import (RoomList, ReqCreateRoom, ResCreateRoom, ReqJoinRoom, ResJoinRoom,
+                                 NotiEnterRoom, NotiLeaveRoom, NotiReadyState, ReqSpectate, ResSpectate)
 
 @router.route(CMD_REQ_CREATE_ROOM)
 def handle_create_room(client, packet):
     """방 생성 요청: [Title(Str)]"""
     try:
-        title = packet.body.decode('utf-8')
+        title, = ReqCreateRoom.unpack(packet.body)
+        stop_spectating(client)
         room = room_manager.create_room(title)
         
         print(f"[Room] Created Room #{room.room_id} '{title}' by {client.nickname}")
@@ -17,12 +19,10 @@ def handle_create_room(client, packet):
         # 1. 생성 결과 전송 (RES_CREATE_ROOM)
         # 구조: [Result(1B)] [RoomID(2B)]
         # Result: 0=성공
-        payload = struct.pack('>B H', 0, room.room_id)
-        client.send_packet(Packet(CMD_RES_CREATE_ROOM, payload))
+        client.send_packet(ResCreateRoom.packet(0, room.room_id))
         
         # 2. 자동으로 방 입장 처리
-        slot_id = room.enter_user(client)
-        client.room_id = room.room_id # 클라이언트에 현재 방 번호 기록
+        slot_id = room.enter_user(client) # 클라이언트의 room / room_id / slot_id는 Room이 기록
         
         # 방장이므로 입장 결과(RES_JOIN_ROOM)나 NOTI는 생략하거나 필요 시 전송
         # (PPT 흐름상 RES_CREATE_ROOM 받은 클라가 자동으로 입장 UI로 전환한다고 가정)
@@ -33,63 +33,107 @@ def handle_create_room(client, packet):
 @router.route(CMD_REQ_JOIN_ROOM)
 def handle_join_room(client, packet):
     """방 입장 요청: [RoomID(2B)]"""
-    if len(packet.body) < 2:
-        return
-        
-    room_id = struct.unpack('>H', packet.body[:2])[0]
+    room_id, = ReqJoinRoom.unpack(packet.body)
     room = room_manager.get_room(room_id)
+    stop_spectating(client)
+
+    # [멀티 워커] 다른 워커 소유의 방이면 연결을 그 워커로 이관 (입장 처리는 이관받은 워커가 수행)
+    if not room and not cluster.is_local(room_id) and client.room is None:
+        if cluster.handoff(client, packet, cluster.owner_of(room_id)):
+            return
     
     if not room:
         # 실패 응답 (Result=1)
-        client.send_packet(Packet(CMD_RES_JOIN_ROOM, b'\x01\x00'))
+        client.send_packet(ResJoinRoom.packet(1, 0))
         return
-    # [Check] 게임 중이면 입장 불가 (혹은 관전)
+    # [Check] 게임 중이면 입장 불가 (CMD_REQ_SPECTATE로 관전)
     if room.is_playing:
-        client.send_packet(Packet(CMD_RES_JOIN_ROOM, b'\x03\x00')) # Error 3: Playing
+        client.send_packet(ResJoinRoom.packet(3, 0)) # Error 3: Playing
         return
     slot_id = room.enter_user(client)
     if slot_id == -1:
         # 방 꽉 참 (Result=2)
-        client.send_packet(Packet(CMD_RES_JOIN_ROOM, b'\x02\x00'))
+        client.send_packet(ResJoinRoom.packet(2, 0))
         return
 
-    client.room_id = room.room_id
     print(f"[Room] {client.nickname} joined Room #{room_id} (Slot {slot_id})")
 
     # 1. 나에게: 입장 성공 응답 (RES_JOIN_ROOM)
     # 구조: [Result(1B)] [MySlotID(1B)]
-    resp = struct.pack('>B B', 0, slot_id)
-    client.send_packet(Packet(CMD_RES_JOIN_ROOM, resp))
+    client.send_packet(ResJoinRoom.packet(0, slot_id))
     
     # 2. 다른 사람들에게: 입장 알림 (NOTI_ENTER_ROOM)
     # 구조: [SlotID(1B)] [NickName(Str)]
-    noti_body = struct.pack('>B', slot_id) + client.nickname.encode('utf-8')
-    room.broadcast(Packet(CMD_NOTI_ENTER_ROOM, noti_body), exclude_client=client)
+    room.broadcast(NotiEnterRoom.packet(slot_id, client.nickname), exclude_client=client)
 
     # [Refactor] 기존 유저 목록 전송 로직 삭제 (CMD_REQ_ROOM_INFO로 대체)
 
-@router.route(CMD_REQ_LEAVE_ROOM)
-def handle_leave_room(client, packet):
-    """방 퇴장 요청"""
-    if not hasattr(client, 'room_id') or client.room_id is None:
+@router.route(CMD_REQ_SPECTATE)
+def handle_spectate(client, packet):
+    """
+    관전 요청: [RoomID(2B)]
+    응답: [Result(1B)] [RoomID(2B)] [Seed(4B)] [PlayerMask(1B)]
+    Result: 0=성공, 1=방 없음, 2=관전자 가득 참, 3=게임 중이 아님, 4=관전 불가 (서버 시뮬레이션 off)
+    성공하면 이어서 CMD_NOTI_SPECTATE_FRAME (처음은 전체 프레임)과 게임 종료 시 CMD_NOTI_RESULT를 받음
+    """
+    room_id, = ReqSpectate.unpack(packet.body)
+    if client.room is not None:
+        return  # 방에 입장한 플레이어는 관전 불가
+    room = room_manager.get_room(room_id)
+    stop_spectating(client)
+
+    # [멀티 워커] 다른 워커의 방이면 연결 이관 (관전 처리는 이관받은 워커가 수행)
+    if not room and not cluster.is_local(room_id):
+        if cluster.handoff(client, packet, cluster.owner_of(room_id)):
+            return
+
+    def reply(result, seed=0, mask=0):
+        client.send_packet(ResSpectate.packet(result, room_id, seed, mask))
+
+    if not room:
+        reply(1)
+        return
+    session = room.game_session
+    if not room.is_playing:
+        reply(3)
+        return
+    if not session.can_spectate:
+        reply(4)
+        return
+    if session.spectators.is_full():
+        reply(2)
         return
 
-    room = room_manager.get_room(client.room_id)
-    if room:
-        slot_id = room.leave_user(client)
-        print(f"[Room] {client.nickname} left Room #{room.room_id}")
+    # 응답을 먼저 보내야 클라이언트가 이어지는 프레임을 관전 화면에서 받음
+    reply(0, session.seed, sum(1 << slot for slot in session.players))
+    session.add_spectator(client)
+    print(f"[Room] {client.nickname} is spectating Room #{room_id} ({len(session.spectators.viewers)} spectators)")
+
+@router.route(CMD_REQ_LEAVE_SPECTATE, require_spectating)
+def handle_leave_spectate(client, packet):
+    """관전 종료"""
+    stop_spectating(client)
+
+def stop_spectating(client):
+    if client.spectating is not None:
+        client.spectating.remove(client)
+
+@router.route(CMD_REQ_LEAVE_ROOM, require_room)
+def handle_leave_room(client, packet):
+    """방 퇴장 요청"""
+    room = client.room
+    slot_id = room.leave_user(client)
+    print(f"[Room] {client.nickname} left Room #{room.room_id}")
+    
+    # 다른 사람들에게: 퇴장 알림 (NOTI_LEAVE_ROOM)
+    # 구조: [SlotID(1B)]
+    if slot_id != -1:
+        room.broadcast(NotiLeaveRoom.packet(slot_id))
         
-        # 다른 사람들에게: 퇴장 알림 (NOTI_LEAVE_ROOM)
-        # 구조: [SlotID(1B)]
-        if slot_id != -1:
-            room.broadcast(Packet(CMD_NOTI_LEAVE_ROOM, struct.pack('>B', slot_id)))
-            
-        # 방이 비었으면 삭제
-        if room.is_empty():
-            room_manager.remove_room(room.room_id)
-            print(f"[Room] Room #{room.room_id} deleted (Empty)")
-            
-    client.room_id = None
+    # 방이 비었으면 삭제
+    if room.is_empty():
+        room_manager.remove_room(room.room_id)
+        print(f"[Room] Room #{room.room_id} deleted (Empty)")
 
 @router.route(CMD_REQ_SEARCH_ROOM)
 def handle_search_room(client, packet):
@@ -97,40 +141,51 @@ def handle_search_room(client, packet):
     방 목록 요청 처리
     응답 구조: [Count(1B)] + 반복([ID(2B)] + [TitleLen(1B)] + [Title(Str)])
     """
-    rooms = room_manager.get_all_rooms()
-    
-    # 패킷 조립
+    # 로컬 방 목록 + [멀티 워커] 다른 워커들이 공유한 방 목록
+    sections = [encode_room_entries(room_manager.get_all_rooms())]
+    sections.extend(cluster.get_remote_room_entries())
+
+    # 패킷 조립 (방 개수 필드가 1바이트이므로 최대 255개까지만 전송)
     payload = bytearray()
-    payload.append(len(rooms)) # 방 개수
-    
-    for room in rooms:
-        # 방 ID (2Bytes)
-        payload.extend(struct.pack('>H', room.room_id))
-        status = 1 if room.is_playing else 0
-        payload.append(status)
-        # 방 제목 (가변 길이)
-        title_bytes = room.title.encode('utf-8')
-        payload.append(len(title_bytes)) # 제목 길이
-        payload.extend(title_bytes)      # 제목 내용
+    count = 0
+    for section_count, entries in sections:
+        if count + section_count > 255:
+            break
+        count += section_count
+        payload.extend(entries)
         
-        # (선택) 현재 인원 수 추가 가능 (여기선 생략)
+    # (선택) 현재 인원 수 추가 가능 (여기선 생략)
 
     # 목록 전송 (CMD_REQ_SEARCH_ROOM에 대한 응답용 별도 CMD가 없으므로 동일 CMD 사용하거나 0x10 사용)
     # PPT 명세상 Server->Client의 0x10은 없으나, 목록 응답용으로 0x10을 재사용한다고 가정
-    client.send_packet(Packet(CMD_REQ_SEARCH_ROOM, payload))
+    client.send_packet(RoomList.packet(count, bytes(payload)))
 
 
-@router.route(CMD_REQ_ROOM_INFO)
+@router.route(CMD_REQ_ROOM_INFO, require_room)
 def handle_room_info(client, packet):
-    if not client.room_id: return
-    room = room_manager.get_room(client.room_id)
-    if not room: return
+    room = client.room
     # 1. 유저 목록 전송
     for user in room.get_users():
-        slot = room.slots.index(user)
-        body = struct.pack('>B', slot) + user.nickname.encode('utf-8')
-        client.send_packet(Packet(CMD_NOTI_ENTER_ROOM, body))
+        slot = user.slot_id
+        client.send_packet(NotiEnterRoom.packet(slot, user.nickname))
         # 2. 레디 정보 전송 (레디한 경우만)
         if room.ready_states[slot]:
-            r_body = struct.pack('>B B', slot, 1)
-            client.send_packet(Packet(CMD_NOTI_READY_STATE, r_body))
\ No newline at end of file
+            client.send_packet(NotiReadyState.packet(slot, 1))
+
+def handle_disconnect(client):
+    """
+    연결이 끊긴 클라이언트의 방 퇴장 처리 (패킷이 아닌 서버 백엔드에서 직접 호출)
+    selectors / asyncio 서버가 공통으로 사용
+    """
+    stop_spectating(client)
+    room = client.room
+    if room:
+        slot_id = room.leave_user(client)
+        if slot_id != -1:
+            print(f"[Room] {client.nickname} forced leave Room #{room.room_id}")
+            # 남은 사람들에게 알림
+            room.broadcast(NotiLeaveRoom.packet(slot_id))
+
+        if room.is_empty():
+            room_manager.remove_room(room.room_id)
+            print(f"[Room] Room #{room.room_id} deleted (Empty)")
@@ -0,0 +1,172 @@
+# src/server/infra/async_server.py
+import asyncio
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from src.common.config import HOST, PORT, BUFFER_SIZE, SEND_HIGH_WATER, SEND_LOW_WATER, SEND_HARD_LIMIT
+from src.common.errors import ProtocolError
+from src.server.infra.client_peer import ClientPeer
+from src.server.infra.router import router
+from src.server.infra.scheduler import scheduler
+# server_core 임포트 시 핸들러 모듈들이 함께 임포트되어 라우터에 등록됨
+from src.server.infra.server_core import print_banner, install_stats_dump
+from src.server.handlers.room import handle_disconnect
+
+class TransportSocket:
+    """
+    asyncio Transport를 ClientPeer가 사용하는 소켓 인터페이스(send/close)로 감싸는 어댑터
+    Transport.write()는 블로킹 없이 내부 버퍼에 쌓으므로 항상 전부 전송된 것으로 처리
+    """
+    def __init__(self, transport):
+        self.transport = transport
+
+    def send(self, data):
+        self.transport.write(data)
+        return len(data)
+
+    def sendmsg(self, buffers):
+        self.transport.writelines(buffers)
+        return sum(len(b) for b in buffers)
+
+    def close(self):
+        self.transport.close()
+
+class PeerProtocol(asyncio.BufferedProtocol):
+    """
+    클라이언트 연결 1개를 담당하는 프로토콜
+    BufferedProtocol을 사용해 Packetizer 버퍼에 직접 수신 (recv_into와 같은 방식)
+    """
+    def __init__(self, server):
+        self.server = server
+        self.transport = None
+        self.client = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+        transport.set_write_buffer_limits(high=SEND_HIGH_WATER, low=SEND_LOW_WATER)
+        addr = transport.get_extra_info('peername')
+        print(f"[Connect] New connection from {addr}")
+
+        self.client = ClientPeer(TransportSocket(transport), addr)
+        self.client.on_output = self.server.schedule_flush
+        self.server.clients[self.client.conn] = self.client
+
+    def get_buffer(self, sizehint):
+        return self.client.packetizer.reserve_view(BUFFER_SIZE)
+
+    def buffer_updated(self, nbytes):
+        client = self.client
+        client.packetizer.commit(nbytes)
+        try:
+            for frame in client.packetizer.get_frames():
+                router.handle(client, frame)
+        except ProtocolError:
+            self.transport.close()
+
+    def pause_writing(self):
+        # 송신 버퍼 High Water 초과: 이 클라이언트의 요청 수신도 잠시 멈춤
+        self.client.read_paused = True
+        self.transport.pause_reading()
+
+    def resume_writing(self):
+        self.client.read_paused = False
+        self.transport.resume_reading()
+
+    def connection_lost(self, exc):
+        client = self.client
+        print(f"[Disconnect] Closed connection from {client.addr}")
+        client.closing = True
+        handle_disconnect(client)
+        self.server.clients.pop(client.conn, None)
+
+class AsyncTetrisServer:
+    """
+    asyncio 기반 서버 백엔드 (selectors 루프의 대안)
+    PacketRouter / ClientPeer / RoomManager / 핸들러는 그대로 재사용함
+    """
+    def __init__(self, host=HOST, port=PORT, loop_impl='asyncio'):
+        self.host = host
+        self.port = port
+        self.loop_impl = loop_impl
+        self.loop = None
+        self.clients = {}     # TransportSocket -> ClientPeer
+        self._pending = set() # 송신 큐에 데이터가 쌓인 클라이언트
+        self._flush_scheduled = False
+        self._idle_scheduled = False
+        self._timer_handle = None
+
+    def _arm_timers(self):
+        """스케줄러의 가장 가까운 마감에 맞춰 이벤트 루프 타이머 재설정"""
+        if self._timer_handle:
+            self._timer_handle.cancel()
+            self._timer_handle = None
+        timeout = scheduler.timeout()
+        if timeout is not None:
+            self._timer_handle = self.loop.call_later(timeout, self._run_timers)
+
+    def _run_timers(self):
+        self._timer_handle = None
+        scheduler.run_due()
+        self._arm_timers()
+
+    def _schedule_idle(self):
+        """미룬 작업 실행 예약 (이미 쌓인 수신/송신 콜백 뒤에 실행됨)"""
+        if not self._idle_scheduled:
+            self._idle_scheduled = True
+            self.loop.call_soon(self._run_idle)
+
+    def _run_idle(self):
+        self._idle_scheduled = False
+        scheduler.run_idle()
+        if scheduler.has_idle():
+            self._schedule_idle()
+
+    def schedule_flush(self, client):
+        """송신할 데이터가 생긴 클라이언트 등록 (현재 콜백들이 끝난 뒤 한 번에 flush)"""
+        self._pending.add(client)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.loop.call_soon(self._flush_pending)
+
+    def _flush_pending(self):
+        self._flush_scheduled = False
+        while self._pending:
+            client = self._pending.pop()
+            if client.conn not in self.clients:
+                continue
+            client.flush()
+            transport = client.conn.transport
+            if client.closing or transport.get_write_buffer_size() > SEND_HARD_LIMIT:
+                # 너무 느린 클라이언트 -> 연결 종료 (connection_lost에서 방 정리)
+                transport.abort()
+
+    async def serve(self):
+        self.loop = asyncio.get_running_loop()
+        install_stats_dump()
+        # 타이머가 새로 등록되어 가장 빠른 마감이 바뀌면 루프 타이머 재설정
+        scheduler.on_schedule = self._arm_timers
+        scheduler.on_idle = self._schedule_idle
+        server = await self.loop.create_server(
+            lambda: PeerProtocol(self), self.host, self.port, reuse_address=True)
+        print_banner(self.port)
+        print(f" [Info] Backend: asyncio ({self.loop_impl})")
+        async with server:
+            await server.serve_forever()
+
+    def start(self):
+        """서버 시작 (uvloop 선택 시 설치되어 있으면 사용, 없으면 기본 루프)"""
+        if self.loop_impl == 'uvloop':
+            try:
+                import uvloop
+                asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            except ImportError:
+                print("[Server] uvloop is not installed. Falling back to asyncio loop.")
+                self.loop_impl = 'asyncio'
+        try:
+            asyncio.run(self.serve())
+        except KeyboardInterrupt:
+            print("\n[Server] Shutting down...")
+
+if __name__ == "__main__":
+    AsyncTetrisServer().start()
@@ -1,11 +1,24 @@
 # src/server/client_peer.py
+import os
 import socket
+from collections import deque
+from itertools import islice
 from src.common.packet_handler import Packetizer
+from src.common.config import SEND_HIGH_WATER, SEND_LOW_WATER, SEND_HARD_LIMIT
+
+# sendmsg 한 번에 넘길 수 있는 최대 버퍼 수
+try:
+    IOV_MAX = min(os.sysconf('SC_IOV_MAX'), 1024)
+except (AttributeError, ValueError, OSError):
+    IOV_MAX = 1024
 
 class ClientPeer:
     """
     서버에 접속한 클라이언트 객체 래퍼
-    소켓, 주소, 닉네임, 수신 버퍼 등을 관리함
+    소켓, 주소, 닉네임, 수신 버퍼, 송신 큐 등을 관리함
+
+    송신은 바로 sendall() 하지 않고 out_queue에 쌓아 두었다가
+    서버 루프가 flush()로 내보냄 (논블로킹 소켓에서 프레임 유실/부분 전송 방지)
     """
     def __init__(self, conn: socket.socket, addr):
         self.conn = conn
@@ -14,12 +27,132 @@ class ClientPeer:
         self.packetizer = Packetizer() # 패킷 조립기 (TCP 스트림 처리용)
         self.is_authenticated = False  # 로그인 여부
 
+        # 현재 방 정보 캐시 (Room.enter_user / leave_user / 방장 이양 때 Room이 갱신)
+        self.room = None               # 입장한 Room 객체
+        self.room_id = None
+        self.slot_id = -1
+        self.spectating = None         # 관전 중인 게임의 SpectatorFeed (관전자는 room이 None)
+
+        # 송신 큐 (bytes 또는 부분 전송 후 남은 memoryview)
+        self.out_queue = deque()
+        self.out_bytes = 0             # 큐에 남은 총 바이트 수
+        self.read_paused = False       # High Water 초과로 수신 중지 상태인지
+        self.closing = False           # 전송 오류/한도 초과 -> 서버 루프에서 연결 정리
+        self.on_output = None          # 큐가 비어 있다가 데이터가 생기면 호출 (서버가 설정)
+
+        # 송신 통계
+        self.bytes_queued = 0
+        self.bytes_sent = 0
+        self.send_calls = 0
+        self.partial_writes = 0
+        self.would_block = 0
+        self.high_water_hits = 0
+
     def send_packet(self, packet):
-        """패킷 객체를 바이트로 변환하여 전송"""
-        try:
-            self.conn.sendall(packet.to_bytes())
-        except OSError:
-            pass # 연결이 끊긴 경우 처리는 server_core에서 담당
+        """패킷 객체를 바이트로 변환하여 송신 큐에 추가"""
+        self.send_bytes(packet.to_bytes())
+
+    def send_bytes(self, data):
+        """이미 직렬화된 프레임을 송신 큐에 추가"""
+        if self.closing:
+            return
+        was_empty = not self.out_queue
+        self.out_queue.append(data)
+        self.out_bytes += len(data)
+        self.bytes_queued += len(data)
+
+        if self.out_bytes > SEND_HARD_LIMIT:
+            # 너무 느린 클라이언트: 더 쌓지 않고 연결 정리 대상으로 표시
+            self._abort()
+            if self.on_output:
+                self.on_output(self)
+            return
+        if self.out_bytes >= SEND_HIGH_WATER and not self.read_paused:
+            self.read_paused = True
+            self.high_water_hits += 1
+
+        if was_empty and self.on_output:
+            self.on_output(self)
+
+    def flush(self):
+        """
+        송신 큐를 가능한 만큼 소켓으로 내보냄
+        큐에 쌓인 여러 프레임을 sendmsg (scatter/gather) 한 번으로 전송 (미지원 OS는 합쳐서 send)
+        반환값: 큐를 모두 비웠으면 True (EVENT_WRITE 감시 불필요)
+        """
+        queue = self.out_queue
+        sendmsg = getattr(self.conn, 'sendmsg', None)
+        while queue:
+            try:
+                if len(queue) == 1:
+                    sent = self.conn.send(queue[0])
+                elif sendmsg is not None:
+                    buffers = list(islice(queue, IOV_MAX)) if len(queue) > IOV_MAX else list(queue)
+                    sent = sendmsg(buffers)
+                else:
+                    data = b''.join(queue)
+                    queue.clear()
+                    queue.append(data)
+                    sent = self.conn.send(data)
+            except BlockingIOError:
+                # 커널 송신 버퍼가 가득 참 -> EVENT_WRITE 때 다시 시도
+                self.would_block += 1
+                return False
+            except OSError:
+                self._abort()
+                return True
+
+            self.send_calls += 1
+            self.bytes_sent += sent
+            self.out_bytes -= sent
+
+            # 전송된 만큼 큐 앞쪽에서 제거
+            while sent:
+                head_len = len(queue[0])
+                if sent < head_len:
+                    # 부분 전송: 남은 부분만 큐 맨 앞에 다시 둠 (복사 없이 memoryview)
+                    queue[0] = memoryview(queue[0])[sent:]
+                    break
+                queue.popleft()
+                sent -= head_len
+            else:
+                continue
+            self.partial_writes += 1
+            break
+
+        if self.read_paused and self.out_bytes <= SEND_LOW_WATER:
+            self.read_paused = False
+        return not queue
+
+    def has_pending_output(self):
+        return bool(self.out_queue)
+
+    def pending_bytes(self):
+        """
+        아직 상대에게 보내지 못한 바이트 수 (백엔드 공용)
+        asyncio 백엔드는 send가 항상 전부 보낸 것으로 처리하므로 Transport 쓰기 버퍼에 남은 양까지 더함
+        """
+        transport = getattr(self.conn, 'transport', None)
+        if transport is None:
+            return self.out_bytes
+        return self.out_bytes + transport.get_write_buffer_size()
+
+    def _abort(self):
+        """송신 불가 상태로 전환 (큐 폐기)"""
+        self.closing = True
+        self.out_queue.clear()
+        self.out_bytes = 0
+
+    def get_stats(self):
+        return {
+            'bytes_queued': self.bytes_queued,
+            'bytes_sent': self.bytes_sent,
+            'send_calls': self.send_calls,
+            'partial_writes': self.partial_writes,
+            'would_block': self.would_block,
+            'high_water_hits': self.high_water_hits,
+            'pending_bytes': self.pending_bytes(),
+        }
 
     def __repr__(self):
-        return f"<Client {self.nickname}@{self.addr[0]}>"
\ No newline at end of file
+        return f"<Client {self.nickname}@{self.addr[0]}>"
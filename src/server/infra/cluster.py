@@ -0,0 +1,148 @@
+# src/server/infra/cluster.py
+import socket
+from src.common.protocol import Packet
+from src.common.constants import CMD_IPC_ROOM_LIST, CMD_IPC_HANDOFF
+from src.common.messages import IpcRoomList, IpcHandoff, ROOM_ENTRY
+
+# 워커 간 메시지 최대 크기 (SOCK_SEQPACKET 한 메시지)
+IPC_MAX_MESSAGE = 256 * 1024
+
+def encode_room_entries(rooms):
+    """
+    방 목록 항목 인코딩 (CMD_REQ_SEARCH_ROOM 응답과 같은 형식)
+    항목: [ID(2B)] [Status(1B)] [TitleLen(1B)] [Title(Str)]
+    반환: (항목 수, bytes)
+    """
+    payload = bytearray()
+    for room in rooms:
+        title_bytes = room.title.encode('utf-8')[:255]
+        payload.extend(ROOM_ENTRY.pack(room.room_id, 1 if room.is_playing else 0, len(title_bytes)))
+        payload.extend(title_bytes)
+    return len(rooms), bytes(payload)
+
+class ClusterLink:
+    """
+    멀티 워커(Pre-fork) 모드에서 다른 워커들과의 연결을 관리하는 객체
+    - 방 소유권: 방 번호로 소유 워커를 계산 ((room_id - 1) % 워커 수)
+    - 방 목록: 로컬 방 목록이 바뀌면 다른 워커들에게 전송, 받은 목록은 캐시
+    - 연결 이관: 다른 워커 소유 방에 입장하려는 클라이언트의 소켓(fd)을 소유 워커로 넘김
+
+    단일 프로세스 모드에서는 enabled=False 상태로 아무 일도 하지 않음
+    """
+    def __init__(self):
+        self.enabled = False
+        self.worker_id = 0
+        self.num_workers = 1
+        self.channels = {}         # worker_id -> AF_UNIX SOCK_SEQPACKET 소켓
+        self.remote_rooms = {}     # worker_id -> (항목 수, 인코딩된 항목 bytes)
+        self.server = None         # 이관받은 연결을 등록할 서버 (TetrisServer)
+        self._published_version = -1
+
+    def setup(self, worker_id, num_workers, channels):
+        self.enabled = True
+        self.worker_id = worker_id
+        self.num_workers = num_workers
+        self.channels = channels
+        for sock in channels.values():
+            sock.setblocking(False)
+
+    def owner_of(self, room_id):
+        return (room_id - 1) % self.num_workers
+
+    def is_local(self, room_id):
+        return not self.enabled or self.owner_of(room_id) == self.worker_id
+
+    # --- 방 목록 공유 ---
+    def publish_rooms(self, room_manager):
+        """로컬 방 목록이 바뀌었으면 다른 워커들에게 전송"""
+        if room_manager.version == self._published_version:
+            return
+        self._published_version = room_manager.version
+        count, entries = encode_room_entries(room_manager.get_all_rooms())
+        self._broadcast(CMD_IPC_ROOM_LIST, IpcRoomList.pack(count, entries))
+
+    def get_remote_room_entries(self):
+        """다른 워커들의 방 목록 (항목 수, bytes) 리스트"""
+        return list(self.remote_rooms.values())
+
+    # --- 연결 이관 ---
+    def handoff(self, client, packet, owner):
+        """
+        클라이언트 연결을 owner 워커로 이관하고, packet(입장 요청)은 그 워커가 처리하게 함
+        아직 처리하지 않은 수신 데이터와 보내지 못한 송신 데이터도 함께 넘김
+        """
+        client.flush()
+        nick_bytes = client.nickname.encode('utf-8')
+        pending_in = client.packetizer.pending_bytes()
+        pending_out = b''.join(bytes(chunk) for chunk in client.out_queue)
+        # 이관 메시지: [Authenticated][NickLen][PendingInLen][PendingOutLen][CMD] + 닉네임 + 수신/송신 데이터 + 패킷 본문
+        body = IpcHandoff.pack(1 if client.is_authenticated else 0, len(nick_bytes),
+                               len(pending_in), len(pending_out), packet.cmd,
+                               nick_bytes + pending_in + pending_out + packet.body)
+        message = bytes([CMD_IPC_HANDOFF]) + body
+
+        try:
+            socket.send_fds(self.channels[owner], [message], [client.conn.fileno()])
+        except OSError as e:
+            print(f"[Cluster] Handoff to worker {owner} failed: {e}")
+            return False
+
+        # 이 워커에서는 연결을 내려놓음 (fd는 owner 워커가 복제본을 가지고 있음)
+        self.server.detach_client(client)
+        return True
+
+    # --- 수신 처리 ---
+    def on_readable(self, sock):
+        """워커 채널에서 메시지 수신 (서버 루프에서 호출)"""
+        while True:
+            try:
+                data, fds, _flags, _addr = socket.recv_fds(sock, IPC_MAX_MESSAGE, 1)
+            except BlockingIOError:
+                return
+            except OSError:
+                return
+            if not data:
+                return
+            self._dispatch(sock, data, fds)
+
+    def _dispatch(self, sock, data, fds):
+        cmd = data[0]
+        body = data[1:]
+        if cmd == CMD_IPC_ROOM_LIST:
+            sender = self._sender_of(sock)
+            self.remote_rooms[sender] = IpcRoomList.unpack(body)
+        elif cmd == CMD_IPC_HANDOFF and fds:
+            self._adopt(body, fds[0])
+        else:
+            for fd in fds:
+                socket.close(fd)
+
+    def _adopt(self, body, fd):
+        authenticated, nick_len, in_len, out_len, cmd, rest = IpcHandoff.unpack(body)
+        nickname = rest[:nick_len].decode('utf-8')
+        offset = nick_len
+        pending_in = rest[offset:offset + in_len]
+        offset += in_len
+        pending_out = rest[offset:offset + out_len]
+        offset += out_len
+        packet = Packet(cmd, rest[offset:])
+
+        conn = socket.socket(fileno=fd)
+        self.server.adopt_client(conn, nickname, bool(authenticated), pending_out, packet, pending_in)
+
+    def _broadcast(self, cmd, body):
+        message = bytes([cmd]) + body
+        for worker_id, sock in self.channels.items():
+            try:
+                sock.send(message)
+            except OSError as e:
+                print(f"[Cluster] Send to worker {worker_id} failed: {e}")
+
+    def _sender_of(self, sock):
+        for worker_id, s in self.channels.items():
+            if s is sock:
+                return worker_id
+        return -1
+
+# 전역 클러스터 객체 (단일 프로세스 모드에서는 비활성)
+cluster = ClusterLink()
@@ -0,0 +1,96 @@
+# src/server/infra/prefork.py
+import os
+import socket
+import signal
+import threading
+import multiprocessing
+from src.common.config import HOST, PORT
+from src.server.infra.server_core import TetrisServer, print_banner
+from src.server.infra.cluster import cluster
+from src.server.game.room_manager import room_manager
+
+def _create_channels(num_workers):
+    """
+    워커 쌍마다 AF_UNIX SOCK_SEQPACKET 채널 생성 (메시지 경계 보존 + fd 전달 가능)
+    반환: channels[i][j] = 워커 i가 워커 j와 통신할 때 쓰는 소켓
+    """
+    channels = [{} for _ in range(num_workers)]
+    for i in range(num_workers):
+        for j in range(i + 1, num_workers):
+            a, b = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+            channels[i][j] = a
+            channels[j][i] = b
+    return channels
+
+def _on_sigterm(signum, frame):
+    """SIGTERM도 KeyboardInterrupt와 같은 종료 경로로 처리 (부모: 워커 정리, 워커: 서버 루프 종료)"""
+    raise KeyboardInterrupt
+
+def _watch_parent(fd):
+    """부모 생존 파이프 감시: 부모가 어떻게 죽든 쓰기 끝이 닫혀 EOF가 오면 워커 자신에게 SIGTERM"""
+    while os.read(fd, 1):
+        pass
+    os.kill(os.getpid(), signal.SIGTERM)
+
+def _worker_main(worker_id, num_workers, host, port, channels, alive_fds):
+    """워커 프로세스 진입점: 자기 채널만 남기고 방 번호 규칙을 설정한 뒤 서버 루프 실행"""
+    # 쓰기 끝은 부모만 가지고 있어야 부모가 죽었을 때 EOF가 옴
+    alive_r, alive_w = alive_fds
+    os.close(alive_w)
+    threading.Thread(target=_watch_parent, args=(alive_r,), name="ParentWatch", daemon=True).start()
+
+    for other, per_worker in enumerate(channels):
+        if other != worker_id:
+            for sock in per_worker.values():
+                sock.close()
+
+    cluster.setup(worker_id, num_workers, channels[worker_id])
+    room_manager.configure_ids(worker_id + 1, num_workers)
+
+    server = TetrisServer(host, port, reuse_port=True)
+    try:
+        server.start()
+    except KeyboardInterrupt:
+        pass
+
+def run_prefork(num_workers, host=HOST, port=PORT):
+    """
+    N개의 워커 프로세스가 SO_REUSEPORT로 같은 포트를 공유하는 멀티 워커 서버 실행
+    (POSIX 전용: fork, SO_REUSEPORT, SCM_RIGHTS fd 전달 필요)
+    """
+    if not hasattr(socket, 'SO_REUSEPORT') or not hasattr(socket, 'send_fds'):
+        raise RuntimeError("Multi-worker mode requires SO_REUSEPORT and fd passing (POSIX only)")
+
+    ctx = multiprocessing.get_context('fork')
+    channels = _create_channels(num_workers)
+    # 워커가 고아로 남아 SO_REUSEPORT 포트를 계속 잡고 있지 않도록
+    # - SIGTERM 처리기는 fork 전에 설치 (워커 시작 도중 SIGTERM이 와도 정리 경로를 탐, 워커도 상속)
+    # - 부모가 SIGKILL 등으로 죽으면 생존 파이프의 EOF로 워커가 스스로 종료
+    signal.signal(signal.SIGTERM, _on_sigterm)
+    alive_fds = os.pipe()
+    workers = [ctx.Process(target=_worker_main, args=(i, num_workers, host, port, channels, alive_fds),
+                           name=f"TetrisWorker-{i}", daemon=True)
+               for i in range(num_workers)]
+    try:
+        for w in workers:
+            w.start()
+
+        # 부모 프로세스는 채널과 생존 파이프의 읽기 끝을 쓰지 않음
+        for per_worker in channels:
+            for sock in per_worker.values():
+                sock.close()
+        os.close(alive_fds[0])
+
+        print_banner(port)
+        print(f" [Info] Multi-worker mode: {num_workers} workers")
+        for w in workers:
+            w.join()
+    except KeyboardInterrupt:
+        print("\n[Server] Shutting down workers...")
+    finally:
+        for w in workers:
+            if w.is_alive():
+                w.terminate()
+            if w.pid is not None:
+                w.join()
+        os.close(alive_fds[1])
@@ -0,0 +1,208 @@
+# src/server/infra/replay_writer.py
+import os
+import time
+import atexit
+import threading
+from collections import deque
+from src.common.config import REPLAY_CHUNK_SIZE, REPLAY_MAX_PENDING, REPLAY_INDEX_TICKS
+from src.common.replay import (RECORD, REC_MOVE, REC_GARBAGE, REC_DEATH, REC_RESULT,
+                               REC_REPORT_ATTACK, REC_REPORT_GAMEOVER, encode_header, encode_footer)
+from src.common.utils import setup_file_logger
+
+logger = setup_file_logger("Server_Replay")
+
+class MatchRecorder:
+    """
+    경기 하나의 리플레이 기록기 (GameSession이 소유, 서버 루프 스레드에서만 호출)
+    레코드는 메모리 버퍼에 쌓다가 REPLAY_CHUNK_SIZE마다 writer 스레드로 넘김 (파일 I/O는 writer 스레드)
+    """
+    __slots__ = ('writer', 'path', '_buf', '_offset', '_next_index_tick', 'index', 'records',
+                 'last_tick', 'closed', 'failed')
+
+    def __init__(self, writer, path, header):
+        self.writer = writer
+        self.path = path
+        self._buf = bytearray()
+        self._offset = len(header)      # 다음 레코드의 파일 위치 - 버퍼 길이
+        self._next_index_tick = 0
+        self.index = []                 # (tick, offset)
+        self.records = 0
+        self.last_tick = 0
+        self.closed = False
+        self.failed = False             # writer가 밀려서 기록을 포기함
+
+    def record(self, kind, slot, a, b, tick, value):
+        if self.closed:
+            return
+        buf = self._buf
+        if tick >= self._next_index_tick:
+            self.index.append((tick, self._offset + len(buf)))
+            self._next_index_tick = tick + REPLAY_INDEX_TICKS
+        buf += RECORD.pack(kind, slot, a, b, tick, value)
+        self.records += 1
+        self.last_tick = tick
+        if len(buf) >= REPLAY_CHUNK_SIZE:
+            self._handoff()
+
+    def move(self, slot, keycode, tick, stamp):
+        self.record(REC_MOVE, slot, keycode, 0, tick, stamp)
+
+    def garbage(self, attacker, target, lines, tick, apply_tick):
+        self.record(REC_GARBAGE, attacker, target, lines, tick, apply_tick)
+
+    def death(self, slot, tick, score):
+        self.record(REC_DEATH, slot, 0, 0, tick, score)
+
+    def result(self, winner, reason, tick):
+        self.record(REC_RESULT, winner, reason, 0, tick, 0)
+
+    def report_attack(self, slot, lines, tick, stamp):
+        self.record(REC_REPORT_ATTACK, slot, lines, 0, tick, stamp)
+
+    def report_gameover(self, slot, tick, stamp):
+        self.record(REC_REPORT_GAMEOVER, slot, 0, 0, tick, stamp)
+
+    def _handoff(self):
+        data = bytes(self._buf)
+        self._buf.clear()
+        self._offset += len(data)
+        if not self.writer._submit(self, 'write', data):
+            # writer가 밀림: 이 경기는 여기까지만 기록 (푸터 없이 닫음 -> 읽을 때 온전한 레코드까지만 사용)
+            self.failed = True
+            self.closed = True
+            self.writer._submit(self, 'close', b'', force=True)
+
+    def close(self):
+        """남은 버퍼 + 인덱스/푸터를 넘기고 파일 닫기 요청"""
+        if self.closed:
+            return
+        if self._buf:
+            self._handoff()
+            if self.failed:
+                return
+        self.closed = True
+        self.writer._submit(self, 'close', encode_footer(self.index, self.records, self.last_tick), force=True)
+
+class ReplayWriter:
+    """
+    리플레이 파일 writer 스레드 (프로세스당 하나, 첫 경기 기록 때 시작)
+
+    - 서버 루프는 청크(bytes)를 deque에 넣기만 하고, 파일 열기/쓰기/닫기는 writer 스레드가 처리
+    - 아직 쓰지 못한 바이트가 REPLAY_MAX_PENDING을 넘으면 새 청크를 받지 않음
+      (디스크가 느려도 서버 메모리가 무한히 늘지 않음, 해당 경기 리플레이는 거기서 끊김)
+    directory가 None이면 비활성 (open_match()가 None 반환)
+    """
+    def __init__(self):
+        self.directory = None
+        self._queue = deque()
+        self._cond = threading.Condition()
+        self._thread = None
+        self._pending_bytes = 0
+        self._busy = False
+
+        # 통계
+        self.matches = 0
+        self.chunks = 0
+        self.bytes_written = 0
+        self.dropped = 0
+        self.errors = 0
+
+    @property
+    def enabled(self):
+        return self.directory is not None
+
+    def configure(self, directory):
+        """기록 디렉터리 설정 (None 또는 빈 문자열이면 기록 안 함)"""
+        self.directory = directory or None
+
+    def open_match(self, room_id, seed, roster, mode, tick_rate):
+        """경기 기록 시작 -> MatchRecorder (비활성이면 None)"""
+        if not self.enabled:
+            return None
+        start = time.time()
+        name = f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(start))}_room{room_id}_{seed:08x}.ttr"
+        path = os.path.join(self.directory, name)
+        header = encode_header(room_id, seed, start, tick_rate, mode, roster)
+        recorder = MatchRecorder(self, path, header)
+        self._submit(recorder, 'open', header, force=True)
+        self.matches += 1
+        return recorder
+
+    def _start(self):
+        self._thread = threading.Thread(target=self._run, name="ReplayWriter", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def _submit(self, recorder, op, data, force=False):
+        """청크 전달 (한도를 넘으면 False, 열기/닫기는 항상 받음)"""
+        with self._cond:
+            if not force and self._pending_bytes + len(data) > REPLAY_MAX_PENDING:
+                self.dropped += 1
+                return False
+            self._queue.append((recorder, op, data))
+            self._pending_bytes += len(data)
+            if self._thread is None:
+                self._start()
+            self._cond.notify()
+        return True
+
+    def _run(self):
+        files = {}  # MatchRecorder -> 파일 객체
+        while True:
+            with self._cond:
+                while not self._queue:
+                    self._busy = False
+                    self._cond.notify_all()
+                    self._cond.wait()
+                recorder, op, data = self._queue.popleft()
+                self._busy = True
+            if recorder is None:
+                break
+            try:
+                if op == 'open':
+                    os.makedirs(os.path.dirname(recorder.path) or '.', exist_ok=True)
+                    files[recorder] = open(recorder.path, 'ab', buffering=0)
+                f = files.get(recorder)
+                if f is not None:
+                    f.write(data)
+                    if op == 'close':
+                        del files[recorder]
+                        f.close()
+                    self.bytes_written += len(data)
+                    self.chunks += 1
+            except OSError as e:
+                self.errors += 1
+                files.pop(recorder, None)
+                logger.error(f"[Replay] {recorder.path}: {e}")
+            with self._cond:
+                self._pending_bytes -= len(data)
+        for f in files.values():
+            f.close()
+
+    def flush(self, timeout=5.0):
+        """넘겨 둔 청크를 모두 쓸 때까지 대기 (테스트/종료용)"""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._queue and not self._busy, timeout)
+
+    def stop(self):
+        thread = self._thread
+        if thread is None:
+            return
+        with self._cond:
+            self._queue.append((None, None, b''))
+            self._cond.notify()
+        thread.join(timeout=5.0)
+        self._thread = None
+
+    def get_stats(self):
+        return {
+            'matches': self.matches,
+            'chunks': self.chunks,
+            'bytes_written': self.bytes_written,
+            'pending_bytes': self._pending_bytes,
+            'dropped': self.dropped,
+            'errors': self.errors,
+        }
+
+# 전역 리플레이 writer (main_server --replay-dir 로 설정, 설정 전에는 기록 안 함)
+replay_writer = ReplayWriter()
@@ -1,26 +1,174 @@
 # src/server/router.py
-from typing import Callable, Dict
+from time import perf_counter_ns
+from typing import Callable, Dict, List, Tuple
+from src.common.errors import ProtocolError
+
+# 지연 시간 히스토그램 구간 수: 구간 i = [2^(i-1), 2^i) 마이크로초 (마지막 구간은 그 이상 전부)
+LATENCY_BUCKETS = 20
+
+# --- 미들웨어 (Guard) ---
+# guard(client, packet) -> bool : False를 반환하면 핸들러를 실행하지 않고 패킷을 버림
+
+def require_auth(client, packet):
+    """로그인한 클라이언트만 통과"""
+    return client.is_authenticated
+
+def require_room(client, packet):
+    """방에 입장한 클라이언트만 통과"""
+    return client.room is not None
+
+def require_playing(client, packet):
+    """게임 진행 중인 방의 클라이언트만 통과"""
+    room = client.room
+    return room is not None and room.is_playing
+
+def require_spectating(client, packet):
+    """관전 중인 클라이언트만 통과"""
+    return client.spectating is not None
 
 class PacketRouter:
+    """
+    CMD(1바이트) -> 핸들러 라우터
+
+    등록된 라우트와 미들웨어를 CMD 값으로 바로 인덱싱하는 256칸 테이블로 컴파일해 둠
+    (패킷마다 dict 조회/미들웨어 목록 순회 대신 리스트 인덱싱 한 번)
+    명령별 호출 수 / 거부 수 / 지연 시간 히스토그램을 기록하고 dump_stats()로 출력
+    핸들러가 본문을 스키마로 읽다가 ProtocolError가 나면(src/common/messages.py) 거부로 집계하고 버림
+    """
     def __init__(self):
-        # CMD(int) -> Handler Function 매핑
-        self.routes: Dict[int, Callable] = {}
+        # CMD(int) -> (Handler Function, 라우트별 Guard 목록)
+        self.routes: Dict[int, Tuple[Callable, Tuple[Callable, ...]]] = {}
+        self.middlewares: List[Callable] = []  # 모든 라우트에 적용되는 Guard
+        self.table: List = [None] * 256       # 컴파일된 디스패치 테이블
+
+        # 통계 (CMD 값으로 인덱싱)
+        self.stats_enabled = True
+        self.calls = [0] * 256
+        self.rejected = [0] * 256
+        self.unknown = [0] * 256
+        self.total_ns = [0] * 256
+        self.histograms = [None] * 256        # 처음 호출될 때 생성
 
-    def route(self, cmd: int):
-        """데코레이터: 특정 CMD를 처리할 핸들러 등록"""
+    def route(self, cmd: int, *guards: Callable):
+        """
+        데코레이터: 특정 CMD를 처리할 핸들러 등록
+        guards: 이 라우트에만 적용할 Guard (예: require_auth, require_room)
+        """
         def decorator(func):
-            self.routes[cmd] = func
+            self.routes[cmd] = (func, guards)
+            self._compile(cmd)
             return func
         return decorator
 
+    def use(self, guard: Callable, exclude=()):
+        """
+        모든 라우트에 적용할 Guard 추가 (exclude에 있는 CMD는 제외)
+        이미 등록된 라우트와 이후에 등록되는 라우트 모두에 적용됨
+        """
+        self.middlewares.append((guard, frozenset(exclude)))
+        for cmd in self.routes:
+            self._compile(cmd)
+
+    def _compile(self, cmd):
+        """라우트 하나를 Guard 체인이 합쳐진 호출 가능 객체로 만들어 테이블에 배치"""
+        func, route_guards = self.routes[cmd]
+        guards = tuple(g for g, exclude in self.middlewares if cmd not in exclude) + route_guards
+        self.table[cmd] = func if not guards else self._chain(cmd, func, guards)
+
+    def _chain(self, cmd, func, guards):
+        rejected = self.rejected
+        def guarded(client, packet):
+            for guard in guards:
+                if not guard(client, packet):
+                    rejected[cmd] += 1
+                    return
+            func(client, packet)
+        guarded.__name__ = func.__name__
+        return guarded
+
     def handle(self, client, packet):
         """패킷을 받아서 적절한 핸들러 실행"""
-        handler = self.routes.get(packet.cmd)
-        if handler:
-            # 핸들러 함수 호출 (client 객체와 패킷 본문 전달)
+        cmd = packet.cmd
+        handler = self.table[cmd]
+        if handler is None:
+            # 알 수 없는 명령은 출력 없이 집계만 함 (잘못된 패킷 폭주 시 print 비용 방지)
+            self.unknown[cmd] += 1
+            return
+        if not self.stats_enabled:
+            try:
+                handler(client, packet)
+            except ProtocolError:
+                self.rejected[cmd] += 1
+            return
+
+        start = perf_counter_ns()
+        try:
             handler(client, packet)
-        else:
-            print(f"[Warn] No handler for CMD: {hex(packet.cmd)}")
+        except ProtocolError:
+            self.rejected[cmd] += 1
+        finally:
+            elapsed = perf_counter_ns() - start
+            self.calls[cmd] += 1
+            self.total_ns[cmd] += elapsed
+            hist = self.histograms[cmd]
+            if hist is None:
+                hist = self.histograms[cmd] = [0] * LATENCY_BUCKETS
+            bucket = (elapsed // 1000).bit_length()
+            hist[bucket if bucket < LATENCY_BUCKETS else LATENCY_BUCKETS - 1] += 1
+
+    # --- 통계 ---
+    def reset_stats(self):
+        for arr in (self.calls, self.rejected, self.unknown, self.total_ns):
+            arr[:] = [0] * 256
+        self.histograms = [None] * 256
+
+    def get_stats(self):
+        """
+        명령별 통계 dict 반환 (호출/거부/미등록 기록이 있는 CMD만)
+        { cmd: {'handler', 'calls', 'rejected', 'unknown', 'total_us', 'p50_us', 'p99_us', 'histogram'} }
+        """
+        stats = {}
+        for cmd in range(256):
+            if not (self.calls[cmd] or self.rejected[cmd] or self.unknown[cmd]):
+                continue
+            hist = self.histograms[cmd] or [0] * LATENCY_BUCKETS
+            entry = self.routes.get(cmd)
+            stats[cmd] = {
+                'handler': entry[0].__name__ if entry else None,
+                'calls': self.calls[cmd],
+                'rejected': self.rejected[cmd],
+                'unknown': self.unknown[cmd],
+                'total_us': self.total_ns[cmd] / 1000,
+                'p50_us': _percentile_us(hist, 0.50),
+                'p99_us': _percentile_us(hist, 0.99),
+                'histogram': list(hist),
+            }
+        return stats
+
+    def dump_stats(self):
+        """명령별 통계를 총 소요 시간 순으로 정리한 문자열 반환"""
+        stats = self.get_stats()
+        lines = [f"{'CMD':>4} {'Handler':<22} {'Calls':>9} {'Reject':>7} {'Unknown':>7} "
+                 f"{'Total(ms)':>10} {'Avg(us)':>8} {'p50<':>7} {'p99<':>7}"]
+        for cmd, s in sorted(stats.items(), key=lambda kv: kv[1]['total_us'], reverse=True):
+            avg = s['total_us'] / s['calls'] if s['calls'] else 0.0
+            lines.append(f"0x{cmd:02X} {s['handler'] or '-':<22} {s['calls']:>9} {s['rejected']:>7} "
+                         f"{s['unknown']:>7} {s['total_us'] / 1000:>10.2f} {avg:>8.1f} "
+                         f"{s['p50_us']:>7} {s['p99_us']:>7}")
+        return "\n".join(lines)
+
+def _percentile_us(hist, q):
+    """히스토그램에서 분위수가 속한 구간의 상한(마이크로초) 반환"""
+    total = sum(hist)
+    if not total:
+        return 0
+    target = q * total
+    acc = 0
+    for i, n in enumerate(hist):
+        acc += n
+        if acc >= target:
+            return 1 << i
+    return 1 << (len(hist) - 1)
 
 # 전역 라우터 객체 생성 (다른 파일에서 import router 해서 사용)
-router = PacketRouter()
\ No newline at end of file
+router = PacketRouter()
@@ -0,0 +1,135 @@
+# src/server/infra/scheduler.py
+import heapq
+import itertools
+from collections import deque
+from time import monotonic
+
+class Timer:
+    """call_later / call_every가 반환하는 타이머 핸들 (cancel()로 취소)"""
+    __slots__ = ('deadline', 'interval', 'callback', 'cancelled')
+
+    def __init__(self, deadline, interval, callback):
+        self.deadline = deadline
+        self.interval = interval   # None이면 1회성
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+class TickScheduler:
+    """
+    서버 루프용 타이머 스케줄러 (마감 시각 min-heap)
+
+    - call_later(delay, cb): 1회성 타이머
+    - call_every(interval, cb): 고정 주기 타이머 (다음 마감 = 이전 마감 + interval, 누적 오차 없음)
+    - timeout(): 가장 가까운 마감까지 남은 시간 -> select()의 timeout으로 사용
+    - run_due(): 마감이 지난 타이머 실행
+    - call_idle(cb) / run_idle(): 서버 루프가 플레이어 수신/송신을 끝낸 뒤에 실행할 작업
+      (관전 프레임 전송처럼 지연에 민감하지 않고 양이 많은 일을 플레이어 처리 뒤로 미룸)
+
+    통계: 주기 타이머의 지연(jitter = 실제 실행 시각 - 예정 시각)과
+    한 주기 이상 밀려서 건너뛴 틱 수(overrun)를 기록
+    """
+    def __init__(self, clock=monotonic):
+        self.clock = clock
+        self._heap = []
+        self._seq = itertools.count()  # 같은 마감 시각이면 등록 순서대로
+        self._idle = deque()
+        self.on_schedule = None        # 가장 빠른 마감이 바뀌면 호출 (asyncio 백엔드가 설정)
+        self.on_idle = None            # 미룬 작업이 처음 생기면 호출 (asyncio 백엔드가 설정)
+
+        # 통계
+        self.fired = 0
+        self.overruns = 0              # 건너뛴 주기 수
+        self.jitter_count = 0
+        self.jitter_total = 0.0
+        self.jitter_max = 0.0
+
+    def call_later(self, delay, callback):
+        return self._push(Timer(self.clock() + delay, None, callback))
+
+    def call_every(self, interval, callback, first_delay=None):
+        delay = interval if first_delay is None else first_delay
+        return self._push(Timer(self.clock() + delay, interval, callback))
+
+    def call_idle(self, callback):
+        """이번 루프의 입출력이 끝난 뒤 한 번 실행 (timeout()과 무관, 서버 루프가 run_idle()로 실행)"""
+        timer = Timer(None, None, callback)
+        self._idle.append(timer)
+        if len(self._idle) == 1 and self.on_idle:
+            self.on_idle()
+        return timer
+
+    def has_idle(self):
+        return bool(self._idle)
+
+    def run_idle(self):
+        """미뤄 둔 작업을 실행하고 실행한 수를 반환 (실행 중에 새로 등록된 작업은 다음 루프에서)"""
+        idle = self._idle
+        count = 0
+        for _ in range(len(idle)):
+            timer = idle.popleft()
+            if not timer.cancelled:
+                count += 1
+                timer.callback()
+        return count
+
+    def _push(self, timer):
+        earliest = not self._heap or timer.deadline < self._heap[0][0]
+        heapq.heappush(self._heap, (timer.deadline, next(self._seq), timer))
+        if earliest and self.on_schedule:
+            self.on_schedule()
+        return timer
+
+    def timeout(self):
+        """다음 마감까지 남은 초 (타이머가 없으면 None = 무한 대기)"""
+        heap = self._heap
+        while heap and heap[0][2].cancelled:
+            heapq.heappop(heap)
+        if not heap:
+            return None
+        return max(0.0, heap[0][0] - self.clock())
+
+    def run_due(self):
+        """마감이 지난 타이머들을 실행하고 실행한 수를 반환"""
+        heap = self._heap
+        now = self.clock()
+        count = 0
+        while heap and heap[0][0] <= now:
+            deadline, _, timer = heapq.heappop(heap)
+            if timer.cancelled:
+                continue
+            count += 1
+
+            if timer.interval is not None:
+                # 주기 타이머: 지연 기록 후 다음 마감 예약 (밀린 주기는 몰아서 실행하지 않고 건너뜀)
+                late = now - deadline
+                self.jitter_count += 1
+                self.jitter_total += late
+                if late > self.jitter_max:
+                    self.jitter_max = late
+                skipped = int(late // timer.interval)
+                self.overruns += skipped
+                timer.deadline = deadline + (skipped + 1) * timer.interval
+                heapq.heappush(heap, (timer.deadline, next(self._seq), timer))
+
+            timer.callback()
+        self.fired += count
+        return count
+
+    def get_stats(self):
+        return {
+            'timers': sum(1 for _, _, t in self._heap if not t.cancelled),
+            'fired': self.fired,
+            'overruns': self.overruns,
+            'jitter_avg_ms': (self.jitter_total / self.jitter_count * 1000) if self.jitter_count else 0.0,
+            'jitter_max_ms': self.jitter_max * 1000,
+        }
+
+    def reset_stats(self):
+        self.fired = self.overruns = self.jitter_count = 0
+        self.jitter_total = self.jitter_max = 0.0
+
+# 전역 스케줄러 객체 (서버 루프가 구동, 방/게임 세션이 타이머 등록)
+scheduler = TickScheduler()
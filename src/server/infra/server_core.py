@@ -1,58 +1,130 @@
 # src/server/server_core.py
 import socket
 import selectors
+import signal
 import sys
 import os
-import struct
 # 프로젝트 루트 경로 추가
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
-from src.server.game.room_manager import room_manager
-from src.common.config import HOST, PORT, BUFFER_SIZE
+from src.common.config import HOST, PORT
 from src.server.infra.client_peer import ClientPeer
 from src.server.infra.router import router
+from src.server.infra.cluster import cluster
+from src.server.infra.scheduler import scheduler
+from src.server.infra.sim_pool import sim_pool
+from src.server.infra.replay_writer import replay_writer
+from src.server.game.room_manager import room_manager
 from src.common.utils import get_local_ip
-from src.common.protocol import Packet
+from src.common.errors import ProtocolError
 from src.common.constants import *
 
 # 핸들러 모듈을 임포트해야 데코레이터가 실행되어 라우터에 등록됨
 import src.server.handlers.connection 
 import src.server.handlers.room
 import src.server.handlers.game
+from src.server.handlers.room import handle_disconnect
+from src.server.infra.router import require_auth
+
+# 인증 게이트: 로그인 전에는 로그인 요청 외의 모든 명령을 무시
+router.use(require_auth, exclude=(CMD_REQ_LOGIN,))
+
+def print_banner(port):
+    """서버 시작 안내 문구 출력 (백엔드 공용)"""
+    local_ip = get_local_ip()
+    print(f"========================================")
+    print(f" [Server] Started on {local_ip}:{port}")
+    print(f" [Info] Tell your friend to connect to: {local_ip}")
+    print(f"========================================")
+
+def install_stats_dump():
+    """SIGUSR1을 받으면 라우터의 명령별 처리 통계를 출력 (POSIX 전용, 백엔드 공용)"""
+    if not hasattr(signal, 'SIGUSR1'):
+        return
+    def _on_sigusr1(signum, frame):
+        print(f"[Stats] Router (pid {os.getpid()})\n{router.dump_stats()}")
+        print(f"[Stats] Scheduler {scheduler.get_stats()}")
+        if sim_pool.enabled:
+            print(f"[Stats] SimPool {sim_pool.get_stats()}")
+        if replay_writer.enabled:
+            print(f"[Stats] Replay {replay_writer.get_stats()}")
+    signal.signal(signal.SIGUSR1, _on_sigusr1)
 
 class TetrisServer:
-    def __init__(self):
+    def __init__(self, host=HOST, port=PORT, reuse_port=False):
+        self.host = host
+        self.port = port
+        self.reuse_port = reuse_port # 멀티 워커 모드: 여러 프로세스가 같은 포트에서 accept
         self.sel = selectors.DefaultSelector()
         self.clients = {} # socket -> ClientPeer
+        self._pending = set() # 송신 큐에 데이터가 쌓인 클라이언트 (루프 끝에서 flush)
 
     def start(self):
         """서버 시작"""
         server_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         server_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        server_sock.bind((HOST, PORT))
+        if self.reuse_port:
+            server_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        server_sock.bind((self.host, self.port))
         server_sock.listen()
         server_sock.setblocking(False)
 
+        install_stats_dump()
+
         # 서버 소켓을 감시 대상에 등록 (새로운 연결이 오면 accept 호출)
         self.sel.register(server_sock, selectors.EVENT_READ, data=None)
-        
-        local_ip = get_local_ip()
-        print(f"========================================")
-        print(f" [Server] Started on {local_ip}:{PORT}")
-        print(f" [Info] Tell your friend to connect to: {local_ip}")
-        print(f"========================================")
+
+        # 멀티 워커 모드: 다른 워커와의 채널도 감시
+        if cluster.enabled:
+            cluster.server = self
+            for sock in cluster.channels.values():
+                self.sel.register(sock, selectors.EVENT_READ, data=cluster)
+            print(f"[Worker {cluster.worker_id}] Listening on port {self.port}")
+        else:
+            print_banner(self.port)
+
+        # 시뮬레이션 워커 풀: 워커 응답 감시 + 밀리면 해당 방 클라이언트 수신 중지
+        if sim_pool.enabled:
+            sim_pool.on_backpressure = self._on_sim_backpressure
+            sim_pool.on_worker_exit = self.sel.unregister
+            for conn in sim_pool.connections:
+                self.sel.register(conn, selectors.EVENT_READ, data=sim_pool)
 
         try:
             while True:
-                # 이벤트 대기 (블로킹)
-                events = self.sel.select(timeout=None)
+                # 이벤트 대기 (가장 가까운 타이머 마감까지만 블로킹, 미룬 작업이 있으면 블로킹하지 않음)
+                events = self.sel.select(timeout=0 if scheduler.has_idle() else scheduler.timeout())
                 for key, mask in events:
                     if key.data is None:
                         # 1. 새로운 연결 요청 (ServerSocket)
                         self._accept_wrapper(key.fileobj)
+                    elif key.data is cluster:
+                        # 다른 워커로부터의 메시지 (방 목록, 연결 이관)
+                        cluster.on_readable(key.fileobj)
+                    elif key.data is sim_pool:
+                        # 시뮬레이션 워커의 결과 이벤트 (공격, 게임오버)
+                        sim_pool.on_readable(key.fileobj)
                     else:
-                        # 2. 기존 클라이언트의 데이터 수신
+                        # 2. 기존 클라이언트의 데이터 송수신
                         client = key.data
                         self._service_connection(key, mask, client)
+
+                # 3. 마감이 지난 타이머 실행 (게임 틱 등)
+                scheduler.run_due()
+
+                # 이번 루프에서 쌓인 시뮬레이션 명령을 워커별로 한 번에 전송
+                if sim_pool.enabled:
+                    sim_pool.flush()
+
+                # 4. 이번 루프에서 쌓인 송신 큐 내보내기
+                self._flush_pending()
+
+                # 5. 플레이어 입출력이 끝난 뒤 미뤄 둔 작업 (관전 프레임 전송) 실행 후 바로 내보냄
+                if scheduler.run_idle():
+                    self._flush_pending()
+
+                # 6. 방 목록이 바뀌었으면 다른 워커들에게 공유
+                if cluster.enabled:
+                    cluster.publish_rooms(room_manager)
         except KeyboardInterrupt:
             print("\n[Server] Shutting down...")
         finally:
@@ -63,60 +135,126 @@ class TetrisServer:
         conn, addr = sock.accept()  # 연결 수락
         print(f"[Connect] New connection from {addr}")
         conn.setblocking(False)
+        # 작은 프레임(키 입력 중계)이 Nagle 알고리즘에 묶여 지연되지 않도록 설정
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         
-        # 클라이언트 객체 생성 및 등록
-        client = ClientPeer(conn, addr)
-        self.clients[conn] = client
+        self._register_client(ClientPeer(conn, addr))
+
+    def _register_client(self, client):
+        """클라이언트 객체 등록"""
+        client.on_output = self._pending.add
+        self.clients[client.conn] = client
         
-        # 셀렉터에 등록 (데이터 수신 감시)
-        self.sel.register(conn, selectors.EVENT_READ, data=client)
+        # 셀렉터에 등록 (데이터 수신 감시, 송신은 큐가 밀릴 때만 EVENT_WRITE 추가)
+        self.sel.register(client.conn, selectors.EVENT_READ, data=client)
+        if client.has_pending_output():
+            self._pending.add(client)
+
+    def adopt_client(self, conn, nickname, authenticated, pending_out, packet, pending_in):
+        """
+        [멀티 워커] 다른 워커에서 이관된 연결 등록
+        이관 사유가 된 패킷(입장 요청)을 먼저 처리하고, 남은 수신 데이터를 이어서 처리
+        """
+        conn.setblocking(False)
+        client = ClientPeer(conn, conn.getpeername())
+        client.nickname = nickname
+        client.is_authenticated = authenticated
+        if pending_out:
+            client.send_bytes(pending_out)
+        self._register_client(client)
+        print(f"[Worker {cluster.worker_id}] Adopted {client.nickname} from another worker")
+
+        router.handle(client, packet)
+        if pending_in and conn in self.clients:
+            client.packetizer.put_data(pending_in)
+            try:
+                self._dispatch_packets(client)
+            except ProtocolError:
+                self._close_connection(client)
+
+    def detach_client(self, client):
+        """
+        [멀티 워커] 다른 워커로 이관된 연결을 이 워커에서 제거
+        (방 퇴장 처리 없이 fd만 닫음 -> 상대 워커의 복제 fd로 연결은 유지됨)
+        """
+        self._pending.discard(client)
+        self.sel.unregister(client.conn)
+        del self.clients[client.conn]
+        client.conn.close()
 
     def _service_connection(self, key, mask, client):
         sock = key.fileobj
-        if mask & selectors.EVENT_READ:
+        if sock not in self.clients:
+            return # 같은 select 결과 안에서 이미 종료된 연결
+        if mask & selectors.EVENT_WRITE:
+            # 커널 송신 버퍼에 여유가 생김 -> 밀린 큐 전송
+            self._pending.add(client)
+
+        if mask & selectors.EVENT_READ and not self._read_blocked(client):
             try:
-                data = sock.recv(BUFFER_SIZE)
-                if data:
-                    # 1. 받은 데이터를 패킷 조립기에 넣음
-                    client.packetizer.put_data(data)
-                    
-                    # 2. 완성된 패킷이 있으면 하나씩 꺼내서 처리
-                    while True:
-                        try:
-                            # generator에서 패킷 하나 꺼내기 (next)
-                            packet = next(client.packetizer.get_packets())
-                            # 라우터에게 패킷 전달
-                            router.handle(client, packet)
-                        except StopIteration:
-                            break # 더 이상 완성된 패킷 없음
+                # 1. 패킷 조립기 버퍼로 직접 수신 (recv_into)
+                n = client.packetizer.recv_into(sock)
+                if n:
+                    # 2. 완성된 패킷이 있으면 하나씩 꺼내서 라우터에게 전달
+                    self._dispatch_packets(client)
                 else:
                     # 데이터가 없으면 연결 종료 신호
-                    self._close_connection(key, client)
-            except ConnectionResetError:
-                self._close_connection(key, client)
+                    self._close_connection(client)
+            except BlockingIOError:
+                pass # 아직 읽을 데이터 없음 (다음 이벤트에서 처리)
+            except (OSError, ProtocolError):
+                self._close_connection(client)
 
-    def _close_connection(self, key, client):
+    def _dispatch_packets(self, client):
+        """조립된 프레임을 복사 없이 라우터로 전달 (도중에 다른 워커로 이관되면 중단)"""
+        conn = client.conn
+        for frame in client.packetizer.get_frames():
+            router.handle(client, frame)
+            if conn not in self.clients:
+                break
+
+    def _flush_pending(self):
+        """송신 큐가 쌓인 클라이언트들을 flush 하고 셀렉터 감시 이벤트 갱신"""
+        while self._pending:
+            client = self._pending.pop()
+            if client.conn not in self.clients:
+                continue # 이미 종료된 연결
+            client.flush()
+            if client.closing:
+                self._close_connection(client)
+            else:
+                self._update_interest(client)
+
+    def _read_blocked(self, client):
+        """송신 큐가 밀렸거나 방 시뮬레이션 워커가 밀려서 수신을 멈춰야 하는지"""
+        return client.read_paused or sim_pool.is_congested(client.room_id)
+
+    def _on_sim_backpressure(self, worker, congested):
+        """시뮬레이션 워커가 밀리거나 회복됨 -> 그 워커 방의 클라이언트 감시 이벤트 갱신"""
+        for client in self.clients.values():
+            if client.room_id is not None and sim_pool.worker_of(client.room_id) == worker:
+                self._pending.add(client)
+
+    def _update_interest(self, client):
+        """송신 대기/수신 중지 상태에 맞춰 EVENT_READ/EVENT_WRITE 감시 설정"""
+        events = 0 if self._read_blocked(client) else selectors.EVENT_READ
+        if client.has_pending_output():
+            events |= selectors.EVENT_WRITE
+        if not events:
+            events = selectors.EVENT_READ
+        if self.sel.get_key(client.conn).events != events:
+            self.sel.modify(client.conn, events, data=client)
+
+    def _close_connection(self, client):
         print(f"[Disconnect] Closed connection from {client.addr}")
         
-        # [NEW] 강제 종료 시 방에서 퇴장 처리 로직 추가 =====================
-        if hasattr(client, 'room_id') and client.room_id is not None:
-            room = room_manager.get_room(client.room_id)
-            if room:
-                slot_id = room.leave_user(client)
-                if slot_id != -1:
-                    print(f"[Room] {client.nickname} forced leave Room #{room.room_id}")
-                    # 남은 사람들에게 알림
-                    noti = Packet(CMD_NOTI_LEAVE_ROOM, struct.pack('>B', slot_id))
-                    room.broadcast(noti)
-                    
-                if room.is_empty():
-                    room_manager.remove_room(room.room_id)
-                    print(f"[Room] Room #{room.room_id} deleted (Empty)")
-        # =================================================================
-        
-        self.sel.unregister(key.fileobj)
-        key.fileobj.close()
-        del self.clients[key.fileobj]
+        # 강제 종료 시 방에서 퇴장 처리 (백엔드 공용 로직)
+        handle_disconnect(client)
+
+        self._pending.discard(client)
+        self.sel.unregister(client.conn)
+        client.conn.close()
+        del self.clients[client.conn]
 
 if __name__ == "__main__":
     server = TetrisServer()
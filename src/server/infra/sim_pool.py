@@ -0,0 +1,293 @@
+# src/server/infra/sim_pool.py
+import itertools
+import signal
+import multiprocessing
+from multiprocessing.reduction import ForkingPickler
+from src.common.config import (SIM_POOL_MAX_INFLIGHT, SIM_POOL_HIGH_WATER, SIM_POOL_LOW_WATER,
+                               SIM_POOL_BATCH_MAX, SIM_POOL_BATCH_BYTES)
+from src.server.game.room_simulation import RoomSimulation, EV_STATS, EV_LOST
+
+def _worker_main(conn, inherited=()):
+    """
+    시뮬레이션 워커 프로세스: 명령 묶음을 받아 방별 RoomSimulation에 적용하고
+    발생한 이벤트를 묶어서 돌려줌 (묶음 하나당 응답 하나 = 처리 완료 확인)
+    I/O 프로세스가 종료되면 Pipe가 닫혀(EOF) 함께 종료됨
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl+C는 I/O 프로세스가 처리
+    # fork로 복사된 I/O 프로세스 쪽 Pipe 끝을 닫아야 I/O 프로세스 종료 시 EOF를 받음
+    for other in inherited:
+        other.close()
+    sims = {}
+    while True:
+        try:
+            batch = conn.recv()
+        except (EOFError, OSError):
+            break
+        if batch is None:
+            break
+        out = []
+        for sim_id, cmd in batch:
+            if cmd[0] == 'open':
+                sims[sim_id] = RoomSimulation(*cmd[1:])
+                continue
+            sim = sims.get(sim_id)
+            if sim is None:
+                continue
+            sim.apply(cmd)
+            if cmd[0] == 'close':
+                del sims[sim_id]
+            if sim.events:
+                out.append((sim_id, sim.drain()))
+        conn.send(out)
+
+class InlineSimulation:
+    """SIM_WORKERS=0: I/O 프로세스 안에서 바로 실행 (이벤트도 즉시 전달)"""
+    def __init__(self, seed, slots, mode, on_events):
+        self.local = RoomSimulation(seed, slots, mode)
+        self.on_events = on_events
+
+    def submit(self, cmd):
+        local = self.local
+        local.apply(cmd)
+        if local.events:
+            self.on_events(local.drain())
+
+    def close(self):
+        self.submit(('close',))
+
+class PooledSimulation:
+    """워커 프로세스에서 실행되는 방 시뮬레이션 핸들 (명령은 다음 flush 때 묶어서 전송)"""
+    __slots__ = ('pool', 'sim_id', 'worker')
+
+    def __init__(self, pool, sim_id, worker):
+        self.pool = pool
+        self.sim_id = sim_id
+        self.worker = worker
+
+    def submit(self, cmd):
+        self.pool._submit(self.worker, self.sim_id, cmd)
+
+    def close(self):
+        self.submit(('close',))
+
+class SimPool:
+    """
+    방 시뮬레이션 워커 프로세스 풀
+
+    - 방 번호로 워커를 고정 (room_id % workers) -> 한 방의 명령은 항상 같은 워커에서 순서대로 처리
+    - 명령은 워커별 outbox에 쌓았다가 서버 루프 끝에서 flush()로 Pipe에 한 번에 전송
+    - 워커는 묶음마다 이벤트 목록으로 응답 (I/O 프로세스가 브로드캐스트/사망 처리)
+    - 백프레셔: 응답을 기다리는 묶음이 SIM_POOL_MAX_INFLIGHT개면 더 보내지 않고 outbox에 모음
+      outbox가 SIM_POOL_HIGH_WATER를 넘으면 그 워커를 congested로 표시하고 on_backpressure 호출
+      (서버는 해당 워커 방의 클라이언트 수신을 멈춤), SIM_POOL_LOW_WATER 이하로 줄면 해제
+    - 묶음 하나는 SIM_POOL_BATCH_MAX개 / SIM_POOL_BATCH_BYTES 이하로 나눠 보냄: 워커가 읽지 않은 데이터가 MAX_INFLIGHT개 묶음을 넘지 않으므로
+      블로킹 Pipe.send가 막히지 않음 (워커가 응답 send에서 막혀 있어도 서로 기다리며 멈추지 않음)
+    - 워커가 죽으면 그 워커의 방 시뮬레이션에만 EV_LOST를 보내고 (세션은 시뮬레이션 없이 계속)
+      on_worker_exit로 서버에 알림, 이후 그 워커 번호의 새 방은 InlineSimulation
+    workers == 0 이면 비활성 (create()가 InlineSimulation 반환)
+    """
+    def __init__(self):
+        self.workers = 0
+        self.connections = []
+        self._procs = []
+        self._outbox = []
+        self._inflight = []
+        self._worker_of_conn = {}
+        self._handlers = {}          # sim_id -> 이벤트 콜백
+        self._worker_of_sim = {}     # sim_id -> 워커 번호
+        self._ids = itertools.count(1)
+        self.congested = set()       # 밀린 워커 번호
+        self.dead = set()            # 종료된 워커 번호
+        self.on_backpressure = None  # (worker, congested) -> None (서버가 설정)
+        self.on_worker_exit = None   # (conn) -> None: 죽은 워커의 Pipe를 감시 대상에서 제거 (서버가 설정)
+        self.max_inflight = SIM_POOL_MAX_INFLIGHT
+        self.high_water = SIM_POOL_HIGH_WATER
+        self.low_water = SIM_POOL_LOW_WATER
+        self.batch_max = SIM_POOL_BATCH_MAX
+        self.batch_bytes = SIM_POOL_BATCH_BYTES
+
+        # 통계
+        self.batches_sent = 0
+        self.commands_sent = 0
+        self.congestion_hits = 0
+        self.max_backlog = 0
+        self.max_batch_bytes = 0
+        self.workers_lost = 0
+
+    @property
+    def enabled(self):
+        return self.workers > 0
+
+    def start(self, workers):
+        """워커 프로세스 시작 (서버 소켓을 만들기 전에 호출)"""
+        if workers <= 0 or self.enabled:
+            return
+        methods = multiprocessing.get_all_start_methods()
+        ctx = multiprocessing.get_context('fork' if 'fork' in methods else 'spawn')
+        for i in range(workers):
+            parent, child = ctx.Pipe()
+            inherited = [parent] + self.connections if ctx.get_start_method() == 'fork' else []
+            proc = ctx.Process(target=_worker_main, args=(child, inherited), name=f"TetrisSim-{i}", daemon=True)
+            proc.start()
+            child.close()
+            self.connections.append(parent)
+            self._worker_of_conn[parent] = i
+            self._procs.append(proc)
+            self._outbox.append([])
+            self._inflight.append(0)
+        self.workers = workers
+
+    def stop(self):
+        for conn in self.connections:
+            try:
+                conn.send(None)
+            except OSError:
+                pass
+        for proc in self._procs:
+            proc.join(timeout=1.0)
+            if proc.is_alive():
+                proc.terminate()
+        for conn in self.connections:
+            conn.close()
+        self.connections = []
+        self._procs = []
+        self._outbox = []
+        self._inflight = []
+        self._worker_of_conn = {}
+        self._worker_of_sim = {}
+        self.congested.clear()
+        self.dead.clear()
+        self.workers = 0
+
+    def worker_of(self, room_id):
+        return room_id % self.workers
+
+    def is_congested(self, room_id):
+        return bool(self.congested) and room_id is not None and room_id % self.workers in self.congested
+
+    def create(self, room_id, seed, slots, mode, on_events):
+        """방 시뮬레이션 생성 (풀이 비활성이면 I/O 프로세스 안에서 실행)"""
+        if not self.enabled or self.worker_of(room_id) in self.dead:
+            return InlineSimulation(seed, slots, mode, on_events)
+        sim_id = next(self._ids)
+        worker = self.worker_of(room_id)
+        self._handlers[sim_id] = on_events
+        self._worker_of_sim[sim_id] = worker
+        self._submit(worker, sim_id, ('open', seed, tuple(slots), mode))
+        return PooledSimulation(self, sim_id, worker)
+
+    def _submit(self, worker, sim_id, cmd):
+        if worker in self.dead:
+            return
+        outbox = self._outbox[worker]
+        outbox.append((sim_id, cmd))
+        if len(outbox) > self.high_water and worker not in self.congested:
+            self.congested.add(worker)
+            self.congestion_hits += 1
+            if self.on_backpressure:
+                self.on_backpressure(worker, True)
+
+    def flush(self):
+        """워커별로 쌓인 명령을 한 묶음씩 전송 (서버 루프마다 호출)"""
+        for worker in range(self.workers):
+            self._send(worker)
+
+    def _send(self, worker):
+        """응답 대기 묶음이 max_inflight개가 될 때까지 outbox 앞쪽부터 batch_max개 / batch_bytes 이하로 잘라 전송"""
+        outbox = self._outbox[worker]
+        if len(outbox) > self.max_backlog:
+            self.max_backlog = len(outbox)
+        conn = self.connections[worker]
+        while outbox and self._inflight[worker] < self.max_inflight and worker not in self.dead:
+            count = min(len(outbox), self.batch_max)
+            data = ForkingPickler.dumps(outbox[:count])
+            while len(data) > self.batch_bytes and count > 1:
+                count //= 2
+                data = ForkingPickler.dumps(outbox[:count])
+            try:
+                conn.send_bytes(data)  # 워커는 conn.recv()로 그대로 받음
+            except OSError:
+                self._lose_worker(worker)
+                return
+            del outbox[:count]
+            self._inflight[worker] += 1
+            self.batches_sent += 1
+            self.commands_sent += count
+            if len(data) > self.max_batch_bytes:
+                self.max_batch_bytes = len(data)
+
+    def on_readable(self, conn):
+        """워커 응답 처리: 이벤트를 세션 콜백으로 전달하고 밀린 명령을 이어서 전송"""
+        worker = self._worker_of_conn[conn]
+        if worker in self.dead:
+            return
+        handlers = self._handlers
+        while conn.poll():
+            try:
+                results = conn.recv()
+            except (EOFError, OSError):
+                self._lose_worker(worker)
+                return
+            self._inflight[worker] -= 1
+            for sim_id, events in results:
+                handler = handlers.get(sim_id)
+                if handler is None:
+                    continue
+                if events[-1][0] == EV_STATS:
+                    del handlers[sim_id]
+                    del self._worker_of_sim[sim_id]
+                handler(events)
+
+        self._send(worker)
+        self._check_low_water(worker)
+
+    def _check_low_water(self, worker):
+        if worker in self.congested and len(self._outbox[worker]) <= self.low_water:
+            self.congested.discard(worker)
+            if self.on_backpressure:
+                self.on_backpressure(worker, False)
+
+    def _lose_worker(self, worker):
+        """
+        워커 프로세스 종료: 그 워커의 Pipe/명령만 정리하고 방 시뮬레이션에 EV_LOST 전달
+        (다른 워커의 방과 서버 루프는 그대로 계속)
+        """
+        if worker in self.dead:
+            return
+        self.dead.add(worker)
+        self.workers_lost += 1
+        conn = self.connections[worker]
+        if self.on_worker_exit:
+            self.on_worker_exit(conn)
+        conn.close()
+        self._outbox[worker] = []
+        self._inflight[worker] = 0
+        self._check_low_water(worker)
+
+        lost = [sim_id for sim_id, w in self._worker_of_sim.items() if w == worker]
+        reason = f"simulation worker {worker} exited"
+        for sim_id in lost:
+            del self._worker_of_sim[sim_id]
+            handler = self._handlers.pop(sim_id)
+            handler([(EV_LOST, -1, reason, None)])
+
+    def pending(self):
+        """응답을 기다리거나 전송 대기 중인 명령이 있는지"""
+        return any(self._inflight) or any(self._outbox)
+
+    def get_stats(self):
+        return {
+            'workers': self.workers,
+            'rooms': len(self._handlers),
+            'batches_sent': self.batches_sent,
+            'commands_sent': self.commands_sent,
+            'inflight': list(self._inflight),
+            'backlog': [len(o) for o in self._outbox],
+            'max_backlog': self.max_backlog,
+            'congestion_hits': self.congestion_hits,
+            'max_batch_bytes': self.max_batch_bytes,
+            'workers_lost': self.workers_lost,
+        }
+
+# 전역 시뮬레이션 풀 (main_server --sim-workers 로 시작, 시작 전에는 인라인 실행)
+sim_pool = SimPool()
@@ -0,0 +1,53 @@
+# src/tests/helpers.py
+"""
+테스트/벤치마크 공용 대역: 소켓 없이 GameSession을 돌리기 위한 Room 대역과 게임 시작 함수
+"""
+import io
+import contextlib
+
+from src.server.game.game_session import GameSession
+
+class StubPlayer:
+    """Room.slots에 들어가는 유저 대역 (리플레이 명단에 쓰이는 닉네임만 있음)"""
+    def __init__(self, nickname):
+        self.nickname = nickname
+
+class StubRoom:
+    """
+    GameSession이 사용하는 Room 인터페이스만 흉내
+    브로드캐스트된 패킷은 packets에 모아 둠 (keep_packets=False면 개수만 셈, 오래 도는 벤치마크용)
+    """
+    def __init__(self, players=2, room_id=0, names=None, keep_packets=True):
+        names = names or [f"P{i}" for i in range(players)]
+        self.room_id = room_id
+        self.slots = [StubPlayer(name) for name in names]
+        self.slot_of = {user: i for i, user in enumerate(self.slots)}
+        self.keep_packets = keep_packets
+        self.packets = []
+        self.sent = 0
+        self.ended = False
+
+    def broadcast(self, packet, exclude_client=None):
+        self.sent += 1
+        if self.keep_packets:
+            self.packets.append(packet)
+
+    def on_game_end(self):
+        self.ended = True
+
+def start_session(mode=None, room=None, players=2):
+    """
+    room(없으면 StubRoom(players))에서 게임 시작 -> (room, session)
+    mode를 주면 GameSession.simulation_mode를 바꿈 (호출자가 되돌릴 것)
+    틱 타이머는 끄므로 호출자가 on_tick()을 직접 호출
+    """
+    if mode is not None:
+        GameSession.simulation_mode = mode
+    if room is None:
+        room = StubRoom(players)
+    room.ended = False
+    session = GameSession(room)
+    with contextlib.redirect_stdout(io.StringIO()):
+        session.start()
+    session.tick_timer.cancel()
+    return room, session
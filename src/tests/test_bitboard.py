@@ -0,0 +1,118 @@
+# src/tests/test_bitboard.py
+import sys
+import os
+import random
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.core.board import Board
+from src.core.bitboard import BitBoard
+from src.core.tetromino import Tetromino
+
+# 기본은 빠르게 끝나는 횟수, 긴 검증은 환경 변수로 지정
+# 예) TETRIS_DIFF_STEPS=1000000 python -m pytest src/tests/test_bitboard.py
+DIFF_STEPS = int(os.environ.get('TETRIS_DIFF_STEPS', '30000'))
+
+def run_differential(steps, seed):
+    """
+    기존 Board(참조 구현)와 BitBoard에 같은 무작위 동작을 적용하며 모든 결과를 비교
+    불일치가 생기면 (단계, 설명) 반환, 모두 같으면 None
+    """
+    rng = random.Random(seed)
+    ref, bit = Board(), BitBoard()
+
+    def new_piece():
+        piece = Tetromino(rng.choice(Tetromino.TYPES))
+        if rng.random() < 0.05:
+            piece.make_heavy()
+        return piece
+
+    piece = new_piece()
+    for step in range(steps):
+        op = rng.random()
+        if op < 0.55:
+            # 위치 질의 (블록 범위 밖 좌표 포함)
+            adj_x = rng.randint(-2, 2)
+            adj_y = rng.randint(-1, 2)
+            a = ref.is_valid_position(piece, adj_x, adj_y)
+            b = bit.is_valid_position(piece, adj_x, adj_y)
+            if a != b:
+                return step, f"is_valid_position {piece.type}/{piece.rotation} ({piece.x},{piece.y})+({adj_x},{adj_y})"
+            if ref.is_in_bounds(piece, adj_x, adj_y) != bit.is_in_bounds(piece, adj_x, adj_y):
+                return step, "is_in_bounds"
+            if a:
+                piece.x += adj_x
+                piece.y += adj_y
+            continue
+
+        if op < 0.62:
+            piece.rotate()
+            continue
+
+        if op < 0.85:
+            # 하드 드롭 후 고정 + 줄 삭제 (열 높이 계산 vs 한 칸씩 검사)
+            if ref.floor_distance(piece) != bit.floor_distance(piece):
+                return step, "floor_distance"
+            if piece.is_heavy:
+                distance = ref.drill_down(piece)
+                if bit.drill_down(piece) != distance:
+                    return step, "drill_down"
+            else:
+                distance = ref.drop_distance(piece)
+                if bit.drop_distance(piece) != distance:
+                    return step, f"drop_distance {piece.type}/{piece.rotation} ({piece.x},{piece.y})"
+            piece.y += distance
+            ref.place_tetromino(piece)
+            bit.place_tetromino(piece)
+            if ref.clear_lines() != bit.clear_lines():
+                return step, "clear_lines count"
+        elif op < 0.93:
+            # 방해 줄: 두 보드가 같은 구멍 위치를 뽑도록 같은 시드로 맞춤
+            count = rng.randint(1, 4)
+            hole_seed = rng.random()
+            random.seed(hole_seed)
+            ref.add_garbage_lines(count)
+            random.seed(hole_seed)
+            bit.add_garbage_lines(count)
+        else:
+            ref.drill_path(piece)
+            bit.drill_path(piece)
+
+        piece = new_piece()
+        if [list(r) for r in bit.grid] != ref.grid:
+            return step, "grid mismatch"
+        if any(bit.rows[y] != sum(1 << x for x in range(Board.WIDTH) if ref.grid[y][x]) for y in range(Board.HEIGHT)):
+            return step, "row bitmask mismatch"
+        expected = [next((Board.HEIGHT - y for y in range(Board.HEIGHT) if ref.grid[y][x]), 0) for x in range(Board.WIDTH)]
+        if bit.heights != expected:
+            return step, f"heights {bit.heights} != {expected}"
+        if not ref.is_valid_position(piece):
+            # 가득 찬 보드는 초기화하고 계속 (게임 오버에 해당)
+            ref, bit = Board(), BitBoard()
+    return None
+
+class TestBitBoard(unittest.TestCase):
+    def test_differential_against_list_board(self):
+        """무작위 동작 시퀀스에서 BitBoard가 Board와 완전히 같은 결과를 내는지"""
+        for seed in range(4):
+            self.assertIsNone(run_differential(DIFF_STEPS // 4, seed))
+
+    def test_line_clear_and_garbage(self):
+        board = BitBoard()
+        board.rows[19] = BitBoard.FULL_ROW
+        board.grid[19][:] = b'\x01' * BitBoard.WIDTH
+        board.rows[18] = 0b1
+        board.grid[18][0] = 2
+        self.assertEqual(board.clear_lines(), 1)
+        self.assertEqual(board.rows[19], 0b1)
+        self.assertEqual(board.grid[19][0], 2)
+
+        board.add_garbage_lines(2)
+        self.assertEqual(len(board.rows), BitBoard.HEIGHT)
+        for y in (18, 19):
+            self.assertEqual(bin(board.rows[y]).count('1'), BitBoard.WIDTH - 1)
+        self.assertEqual(board.rows[17], 0b1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+# src/tests/test_client_peer.py
+import sys
+import os
+import socket
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.server.infra.client_peer import ClientPeer
+from src.common.protocol import Packet
+from src.common.constants import CMD_NOTI_MOVE
+from src.common.config import SEND_HIGH_WATER, SEND_LOW_WATER, SEND_HARD_LIMIT
+
+class TestClientPeerOutbound(unittest.TestCase):
+    def setUp(self):
+        self.server_side, self.remote = socket.socketpair()
+        self.server_side.setblocking(False)
+        self.peer = ClientPeer(self.server_side, ('127.0.0.1', 0))
+        self.notified = []
+        self.peer.on_output = self.notified.append
+
+    def tearDown(self):
+        self.server_side.close()
+        self.remote.close()
+
+    def _drain(self, limit):
+        """원격 소켓에서 limit 바이트를 모두 읽을 때까지 flush/recv 반복"""
+        self.remote.settimeout(1.0)
+        data = bytearray()
+        while len(data) < limit:
+            self.peer.flush()
+            data += self.remote.recv(65536)
+        return bytes(data)
+
+    def test_queue_and_flush(self):
+        """send_packet은 큐에만 쌓고, flush 때 순서대로 전송"""
+        frames = [Packet(CMD_NOTI_MOVE, bytes([0, i])).to_bytes() for i in range(10)]
+        for f in frames:
+            self.peer.send_bytes(f)
+
+        # 비어 있던 큐에 처음 쌓일 때 한 번만 알림
+        self.assertEqual(self.notified, [self.peer])
+        self.assertEqual(self.peer.out_bytes, sum(len(f) for f in frames))
+
+        self.assertTrue(self.peer.flush())
+        self.assertEqual(self._drain(self.peer.bytes_sent), b''.join(frames))
+        self.assertFalse(self.peer.has_pending_output())
+
+    def test_partial_write_and_water_marks(self):
+        """커널 버퍼가 가득 차면 남은 부분을 큐에 보존하고 수신을 일시 중지"""
+        chunk = b'x' * 4096
+        total = 0
+        while total < SEND_HIGH_WATER * 4 and total + len(chunk) <= SEND_HARD_LIMIT:
+            self.peer.send_bytes(chunk)
+            total += len(chunk)
+            self.peer.flush()
+            if self.peer.out_bytes >= SEND_HIGH_WATER:
+                break
+
+        self.assertTrue(self.peer.read_paused)
+        self.assertGreater(self.peer.would_block, 0)
+
+        received = self._drain(total)
+        self.assertEqual(len(received), total)
+        self.assertTrue(self.peer.flush())
+        self.assertLessEqual(self.peer.out_bytes, SEND_LOW_WATER)
+        self.assertFalse(self.peer.read_paused)
+
+    def test_hard_limit_closes(self):
+        """Hard Limit 초과 시 큐를 버리고 종료 대상으로 표시"""
+        self.peer.send_bytes(b'x' * (SEND_HARD_LIMIT + 1))
+        self.assertTrue(self.peer.closing)
+        self.assertEqual(self.peer.out_bytes, 0)
+        self.peer.send_bytes(b'ignored')
+        self.assertFalse(self.peer.has_pending_output())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+# src/tests/test_cluster.py
+import sys
+import os
+import socket
+import struct
+import time
+import unittest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.append(ROOT)
+
+from src.server.game.room_manager import RoomManager
+from src.server.infra.cluster import ClusterLink
+from src.benchmarks.bench_server_backends import BenchClient, start_server
+from src.common.constants import *
+
+class TestRoomAffinity(unittest.TestCase):
+    def test_room_ids_map_to_owner(self):
+        """워커 k가 만든 방 번호는 항상 워커 k로 계산되어야 함"""
+        link = ClusterLink()
+        link.setup(1, 3, {})
+        manager = RoomManager()
+        manager.configure_ids(2, 3)
+        ids = [manager.create_room(f"r{i}").room_id for i in range(5)]
+        self.assertEqual(ids, [2, 5, 8, 11, 14])
+        self.assertTrue(all(link.is_local(i) for i in ids))
+        self.assertEqual(link.owner_of(1), 0)
+        self.assertEqual(link.owner_of(3), 2)
+
+@unittest.skipUnless(hasattr(socket, 'SO_REUSEPORT') and hasattr(socket, 'send_fds'), "POSIX only")
+class TestMultiWorkerServer(unittest.TestCase):
+    def setUp(self):
+        # 고정 포트를 쓰면 남아 있는 다른 서버가 SO_REUSEPORT로 같은 리스너 그룹에 끼어들 수 있음 -> 빈 포트 사용
+        with socket.socket() as s:
+            s.bind(('127.0.0.1', 0))
+            self.PORT = s.getsockname()[1]
+        self.proc = start_server('selectors', self.PORT, extra_args=['--workers', '3'])
+        self.clients = []
+
+    def tearDown(self):
+        for c in self.clients:
+            c.close()
+        self.proc.terminate()
+        self.proc.wait()
+
+    def _login(self, name):
+        c = BenchClient(self.PORT)
+        self.clients.append(c)
+        c.send(CMD_REQ_LOGIN, name.encode())
+        c.wait_for(CMD_RES_LOGIN)
+        return c
+
+    def test_join_and_search_across_workers(self):
+        room_ids = []
+        for i in range(3):
+            host = self._login(f"host{i}")
+            host.send(CMD_REQ_CREATE_ROOM, f"room{i}".encode())
+            res, room_id = struct.unpack('>B H', host.wait_for(CMD_RES_CREATE_ROOM).body)
+            self.assertEqual(res, 0)
+            room_ids.append(room_id)
+        time.sleep(0.2) # 방 목록이 워커들 사이에 공유될 시간
+
+        for i in range(6):
+            guest = self._login(f"guest{i}")
+            guest.send(CMD_REQ_SEARCH_ROOM)
+            # 어느 워커에 접속하든 전체 방 목록이 보여야 함
+            self.assertEqual(guest.wait_for(CMD_REQ_SEARCH_ROOM).body[0], 3)
+
+            room_id = room_ids[i % 3]
+            guest.send(CMD_REQ_JOIN_ROOM, struct.pack('>H', room_id))
+            res = guest.wait_for(CMD_RES_JOIN_ROOM).body
+            self.assertEqual(res[0], 0)
+
+            # 이관 후에도 같은 연결로 방 정보 요청이 동작해야 함
+            guest.send(CMD_REQ_ROOM_INFO)
+            enter = guest.wait_for(CMD_NOTI_ENTER_ROOM).body
+            self.assertEqual(enter[1:], f"host{i % 3}".encode())
+
+    def _worker_pids(self):
+        with open(f"/proc/{self.proc.pid}/task/{self.proc.pid}/children") as f:
+            return [int(pid) for pid in f.read().split()]
+
+    @unittest.skipUnless(os.path.exists('/proc/self/task'), "needs /proc")
+    def test_workers_exit_with_parent(self):
+        """부모가 SIGKILL로 죽어도 워커가 고아로 남아 포트를 잡고 있지 않아야 함"""
+        pids = self._worker_pids()
+        self.assertEqual(len(pids), 3)
+        self.proc.kill()
+        self.proc.wait()
+        deadline = time.time() + 5
+        while time.time() < deadline and any(os.path.exists(f"/proc/{pid}") for pid in pids):
+            time.sleep(0.05)
+        self.assertFalse([pid for pid in pids if os.path.exists(f"/proc/{pid}")])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+# src/tests/test_game_state.py
+import sys
+import os
+import random
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.common.constants import Action
+from src.common.config import GARBAGE_DELAY_TICKS
+from src.core.game_state import GameState, EV_LOCK, EV_LINES, EV_ITEM, EV_GARBAGE, EV_TOPOUT
+from src.tests.test_simulation import bot_action
+
+KEYS = [a.value for a in (Action.MOVE_LEFT, Action.MOVE_RIGHT, Action.ROTATE, Action.DOWN, Action.DROP, Action.USE_ITEM)]
+
+def record_inputs(seed, count):
+    """봇 입력 (키 코드, 틱) 기록: 줄 삭제/아이템이 나오도록 봇 위주, 가끔 무작위 키"""
+    rng = random.Random(seed)
+    game = GameState(seed)
+    keys, ticks = [], []
+    for _ in range(count):
+        if game.game_over:
+            break
+        game.advance_to(game.tick + rng.randrange(3))
+        key = rng.choice(KEYS) if rng.random() < 0.1 else bot_action(game, rng).value
+        game.process_input(Action(key))
+        keys.append(key)
+        ticks.append(game.tick)
+    return keys, ticks
+
+class TestProcessBatch(unittest.TestCase):
+    def assertSameState(self, a, b):
+        self.assertEqual(a.board.grid, b.board.grid)
+        self.assertEqual((a.score, a.item_count, a.game_over, a.tick, a.inputs),
+                         (b.score, b.item_count, b.game_over, b.tick, b.inputs))
+        self.assertEqual((a.current_piece.type, a.current_piece.x, a.current_piece.y),
+                         (b.current_piece.type, b.current_piece.x, b.current_piece.y))
+
+    def test_batch_matches_per_call(self):
+        for seed in range(3):
+            keys, ticks = record_inputs(seed, 3000)
+            one, batch = GameState(seed), GameState(seed)
+            for key, tick in zip(keys, ticks):
+                one.advance_to(tick)
+                one.process_input(Action(key))
+            batch.process_batch(bytes(keys), ticks)
+            self.assertSameState(one, batch)
+
+            # 틱 없이 입력만 (bytes / 모르는 키 코드 포함)
+            one, batch = GameState(seed), GameState(seed)
+            for key in keys[:500] + [99]:
+                one.process_input(Action(key))
+            batch.process_batch(keys[:500] + [200])
+            self.assertSameState(one, batch)
+            self.assertIsNone(batch.events)
+
+    def test_events_describe_changes(self):
+        seed = 0
+        keys, ticks = record_inputs(seed, 5000)
+        game = GameState(seed)
+        game.queue_garbage(2, GARBAGE_DELAY_TICKS + 10)
+        events = game.process_batch(keys, ticks)
+        kinds = [kind for kind, _, _ in events]
+
+        self.assertEqual(sum(v for k, _, v in events if k == EV_LINES) * 100, game.score)
+        self.assertEqual(kinds.count(EV_GARBAGE), 1)
+        _, tick, lines = events[kinds.index(EV_GARBAGE)]
+        self.assertEqual(tick, GARBAGE_DELAY_TICKS + 10)
+        self.assertIn(lines, (1, 2))  # 그 전에 지운 줄만큼은 상쇄됨
+        self.assertEqual(events[kinds.index(EV_ITEM)][2], 1)  # 4줄 삭제 -> 첫 아이템
+        # 줄 삭제는 항상 블록 고정 직후
+        for i, kind in enumerate(kinds):
+            if kind == EV_LINES:
+                self.assertEqual(kinds[i - 1], EV_LOCK)
+        if game.game_over:
+            self.assertEqual((events[-1][0], events[-1][2]), (EV_TOPOUT, game.score))
+        ticks_seen = [tick for _, tick, _ in events]
+        self.assertEqual(ticks_seen, sorted(ticks_seen))
+
+        # 배치 밖에서는 이벤트를 모으지 않음
+        self.assertIsNone(game.events)
+
+    def test_topout_event(self):
+        game = GameState(5)
+        events = game.process_batch([Action.DROP.value] * 200)
+        self.assertTrue(game.game_over)
+        self.assertEqual(events[-1], (EV_TOPOUT, 0, game.score))
+        self.assertEqual([k for k, _, _ in events].count(EV_TOPOUT), 1)
+        # 게임오버 뒤 입력은 세기만 함
+        self.assertEqual(game.inputs, 200)
+        self.assertEqual(game.process_batch([Action.DROP.value]), [])
+
+class TestSnapshot(unittest.TestCase):
+    def play(self, game, keys, ticks):
+        for key, tick in zip(keys, ticks):
+            game.advance_to(tick)
+            game.process_input(Action(key))
+
+    def test_restore_then_replay_matches(self):
+        """중간 스냅샷으로 되돌린 뒤 같은 입력을 다시 적용하면 끝 상태가 같아야 함 (방해 줄 / 아이템 포함)"""
+        seed = 0
+        keys, ticks = record_inputs(seed, 5000)
+        game = GameState(seed)
+        game.queue_garbage(2, 40)
+        half = len(keys) // 2
+        self.play(game, keys[:half], ticks[:half])
+        game.queue_garbage(1, game.tick + GARBAGE_DELAY_TICKS)
+        state = game.snapshot()
+        self.play(game, keys[half:], ticks[half:])
+        final = game.snapshot()
+
+        for _ in range(2):
+            game.restore(state)
+            self.assertEqual(game.snapshot(), state)
+            self.play(game, keys[half:], ticks[half:])
+            self.assertEqual(game.snapshot(), final)
+
+        # 새 GameState에 복원해도 같음 (블록 순서는 seek로 다시 생성)
+        other = GameState(seed)
+        other.restore(state)
+        self.play(other, keys[half:], ticks[half:])
+        self.assertEqual(other.snapshot(), final)
+
+    def test_snapshot_is_immutable_and_crosses_chunks(self):
+        game, fresh = GameState(9), GameState(9)
+        for g in (game, fresh):
+            g.item_count = 1
+            g.use_item()
+        state = game.snapshot()
+
+        # 청크 경계를 넘을 만큼 블록을 꺼내고 보드/대기열을 바꾼 뒤 복원
+        for _ in range(game.pieces.CHUNK_SIZE * 2):
+            game.pieces.next_type()
+        game.board.add_garbage_lines(3)
+        game.garbage_queue.append([1, 99])
+        game.restore(state)
+        self.assertEqual(game.snapshot(), state)
+        self.assertTrue(game.current_piece.is_heavy)
+
+        for _ in range(30):
+            game.process_input(Action.DROP)
+            fresh.process_input(Action.DROP)
+        self.assertEqual(game.board.grid, fresh.board.grid)
+        self.assertEqual(game.board.rows, fresh.board.rows)
+        self.assertEqual(game.board.heights, fresh.board.heights)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+# src/tests/test_messages.py
+import sys
+import os
+import struct
+import unittest
+from types import SimpleNamespace
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.common import constants
+from src.common.errors import ProtocolError
+from src.common.messages import (
+    MESSAGES, message, ReqLogin, NotiEnterRoom, ReqMove, NotiMove, NotiGarbage, ReqGameover,
+    ResSpectate, IpcHandoff,
+)
+from src.common.protocol import Packet
+from src.client.network.router import route
+from src.client.scenes.base_scene import BaseScene
+
+def sample(cls):
+    """필드 형식에 맞는 임의 값 (정수는 1, 2, 3 ...)"""
+    values = []
+    for i, name in enumerate(cls.fields, 1):
+        if name in ('nickname', 'title'):
+            values.append('닉네임')
+        elif name in ('entries', 'data', 'delta', 'parts', 'rest'):
+            values.append(b'\x01\x02\x03')
+        else:
+            values.append(i)
+    return values
+
+class TestMessages(unittest.TestCase):
+    def test_every_command_has_schema(self):
+        cmds = {v for k, v in vars(constants).items() if k.startswith('CMD_')}
+        self.assertEqual(cmds, set(MESSAGES))
+
+    def test_round_trip(self):
+        for cmd, cls in MESSAGES.items():
+            with self.subTest(cls=cls.__name__):
+                values = sample(cls)
+                body = cls.pack(*values)
+                self.assertEqual(list(cls.unpack(body)), values)
+                self.assertEqual(list(cls.unpack(memoryview(body))), values)
+                msg = cls.decode(body)
+                self.assertEqual(msg, cls(*values))
+                self.assertEqual(msg.encode(), body)
+                self.assertEqual(msg.to_packet().cmd, cmd)
+
+    def test_wire_format(self):
+        """기존 struct 형식과 같은 bytes"""
+        self.assertEqual(NotiMove.pack(1, 2, 300), struct.pack('>B B I', 1, 2, 300))
+        self.assertEqual(ResSpectate.pack(0, 7, 99, 5), struct.pack('>B H I B', 0, 7, 99, 5))
+        self.assertEqual(NotiEnterRoom.pack(2, 'abc'), b'\x02abc')
+        self.assertEqual(IpcHandoff.pack(1, 2, 3, 4, 5, b'xy'), struct.pack('>B H I I B', 1, 2, 3, 4, 5) + b'xy')
+
+    def test_optional_fields(self):
+        """뒤에 붙은 선택 필드는 없으면 None, None이면 생략"""
+        self.assertEqual(ReqMove.unpack(b'\x03'), (3, None))
+        self.assertEqual(ReqMove.pack(3, None), b'\x03')
+        self.assertEqual(ReqMove.pack(3), b'\x03')
+        self.assertEqual(NotiGarbage.unpack(b'\x00\x01\x02'), (0, 1, 2, None))
+        self.assertEqual(ReqGameover.unpack(b''), (None, None))
+        self.assertEqual(ReqGameover.unpack(struct.pack('>I', 10)), (10, None))
+        self.assertEqual(ReqGameover.pack(10, 20), struct.pack('>I I', 10, 20))
+        self.assertIsNone(ReqMove(3).tick)
+
+    def test_malformed_body(self):
+        for cls, body in ((ReqMove, b''), (NotiMove, b'\x01'), (ResSpectate, b'\x00\x00\x01'), (NotiEnterRoom, b'')):
+            with self.subTest(cls=cls.__name__), self.assertRaises(ProtocolError):
+                cls.unpack(body)
+        with self.assertRaises(ProtocolError):
+            ReqLogin.unpack(b'\xff\xfe')
+
+    def test_client_scene_drops_malformed(self):
+        """클라이언트 씬: 핸들러에서 난 ProtocolError는 CMD와 함께 로그를 남기고 패킷만 버림"""
+        class StubScene(BaseScene):
+            @route(constants.CMD_NOTI_GARBAGE)
+            def on_garbage(self, pkt):
+                self.garbage = NotiGarbage.unpack(pkt.body)
+
+        scene = StubScene(SimpleNamespace(network=None, renderer=None, input_handler=None, context=None))
+        with self.assertLogs('StubScene', 'WARNING') as logs:
+            scene.handle_packet(Packet(constants.CMD_NOTI_GARBAGE, b'\x01'))
+        self.assertIn(hex(constants.CMD_NOTI_GARBAGE), logs.output[0])
+        self.assertFalse(hasattr(scene, 'garbage'))
+
+        scene.handle_packet(Packet(constants.CMD_NOTI_GARBAGE, NotiGarbage.pack(0, 1, 2, 30)))
+        self.assertEqual(scene.garbage, (0, 1, 2, 30))
+
+    def test_invalid_spec(self):
+        for spec in ('a:B? b:B', 'a:str b:B', 'a:B? b:bytes', 'cmd:B'):
+            with self.subTest(spec=spec), self.assertRaises(ValueError):
+                message(0xFF, 'Bad', spec)
+        self.assertNotIn(0xFF, MESSAGES)
+
+if __name__ == '__main__':
+    unittest.main()
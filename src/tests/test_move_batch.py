@@ -0,0 +1,111 @@
+# src/tests/test_move_batch.py
+import sys
+import os
+import random
+import logging
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.common.errors import ProtocolError
+from src.common.move_batch import encode_moves, decode_moves, decode_entries
+from src.common.messages import NotiMoveBatch
+from src.core.game_state import GameState
+from src.core.snapshot import pack_state
+from src.client.core.rollback import RollbackBoard
+from src.server.game.game_session import GameSession
+from src.tests.test_simulation import bot_action, start_session
+
+def bot_moves(seed, ticks):
+    """봇이 한 틱에 입력을 0~3개씩 낸 기록 [(키 코드, 틱), ...]"""
+    rng = random.Random(seed)
+    game = GameState(seed)
+    moves = []
+    for tick in range(1, ticks + 1):
+        game.advance_to(tick)
+        for _ in range(rng.choice((0, 0, 1, 2, 3))):
+            if game.game_over:
+                return moves
+            action = bot_action(game, rng)
+            game.process_input(action)
+            moves.append((action.value, tick))
+    return moves
+
+class TestMoveBatchCodec(unittest.TestCase):
+    def test_round_trip(self):
+        moves = [(1, 100), (2, 100), (3, 101), (5, 116)]
+        bodies = encode_moves(moves)
+        self.assertEqual(len(bodies), 1)
+        self.assertEqual(len(bodies[0]), 4 + len(moves))  # 입력당 1바이트
+        self.assertEqual(decode_moves(bodies[0]), moves)
+        slot, base_tick, entries = NotiMoveBatch.unpack(b'\x02' + bodies[0])
+        self.assertEqual((slot, decode_entries(base_tick, entries)), (2, moves))
+
+    def test_split(self):
+        """틱 차이가 4비트를 넘거나 최대 개수가 차면 본문을 나눔"""
+        moves = [(1, 10), (2, 26), (3, 26), (4, 27)]
+        bodies = encode_moves(moves, limit=2)
+        self.assertEqual(len(bodies), 3)
+        self.assertEqual([m for body in bodies for m in decode_moves(body)], moves)
+
+    def test_unknown_keys_and_short_body(self):
+        body = bytes([0, 0, 0, 10, 0x11, 0x03, 0xF1, 0x21])  # 0, 15: Action에 없는 코드
+        self.assertEqual(decode_moves(body), [(1, 11), (2, 16)])
+        with self.assertRaises(ProtocolError):
+            decode_moves(b'\x00\x01')
+
+class TestMoveBatchApply(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.WARNING)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        GameSession.simulation_mode = 'off'
+
+    def test_session_batch_matches_single(self):
+        """서버 시뮬레이션: 틱마다 묶어 보낸 입력과 입력마다 보낸 결과가 같음"""
+        sessions = []
+        for _ in range(2):
+            random.seed(3)  # 두 세션이 같은 시드로 시작
+            sessions.append(start_session('shadow')[1])
+        single, batched = sessions
+        moves = bot_moves(single.seed, 600)
+        i = 0
+        for tick in range(1, 601):
+            single.on_tick()
+            batched.on_tick()
+            batch = []
+            while i < len(moves) and moves[i][1] == tick:
+                single.handle_move(0, *moves[i])
+                batch.append(moves[i])
+                i += 1
+            for body in encode_moves(batch):
+                batched.handle_moves(0, decode_moves(body))
+        a, b = single.sim.local, batched.sim.local
+        self.assertEqual(pack_state(a.sims[0]), pack_state(b.sims[0]))
+        self.assertEqual(a.stats, b.stats)
+        self.assertEqual(b.stats['inputs'], len(moves))
+
+    def test_rollback_once_per_batch(self):
+        """늦게 도착한 묶음은 한 번만 되감아도 입력마다 적용한 복제본과 같아짐"""
+        moves = bot_moves(1, 300)
+        each = RollbackBoard(GameState(1))
+        batched = RollbackBoard(GameState(1))
+        i = 0
+        for now in range(10, 301, 10):
+            batch = []
+            while i < len(moves) and moves[i][1] <= now - 8:
+                batch.append(moves[i])
+                i += 1
+            for board in (each, batched):
+                board.advance(now)
+            for keycode, tick in batch:
+                each.move(keycode, tick)
+            batched.moves(batch)
+        for board in (each, batched):
+            board.advance(300)
+        self.assertEqual(pack_state(batched.game), pack_state(each.game))
+        self.assertLess(batched.stats['rollbacks'], each.stats['rollbacks'])
+
+if __name__ == '__main__':
+    unittest.main()
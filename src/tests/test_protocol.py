@@ -11,7 +11,9 @@ sys.path.append(project_root)
 
 from src.common.protocol import Packet
 from src.common.packet_handler import Packetizer
-from src.common.constants import CMD_REQ_LOGIN
+from src.common.errors import ProtocolError
+from src.common.constants import CMD_REQ_LOGIN, CMD_REQ_MOVE
+import socket
 
 class TestProtocol(unittest.TestCase):
     def test_packet_encoding(self):
@@ -53,5 +55,48 @@ class TestProtocol(unittest.TestCase):
         self.assertEqual(received_pkt.body, b'TESTUSER')
         print(f"[Pass] Fragmentation Test Success")
 
+    def test_packet_coalescing(self):
+        """여러 패킷이 한 번에 뭉쳐서 들어왔을 때 모두 분리하는지 테스트"""
+        packetizer = Packetizer(capacity=16)
+        moves = [Packet(CMD_REQ_MOVE, bytes([i % 7 + 1])).to_bytes() for i in range(40)]
+        packetizer.put_data(b''.join(moves) + moves[0][:2])
+
+        frames = [(cmd, bytes(body)) for cmd, body in packetizer.get_frames()]
+        self.assertEqual(len(frames), 40)
+        self.assertEqual(frames[3], (CMD_REQ_MOVE, bytes([4])))
+        # 잘린 헤더 2바이트는 버퍼에 남아 있어야 함
+        self.assertTrue(packetizer.has_data())
+        self.assertEqual(packetizer.pending_bytes(), moves[0][:2])
+
+        packetizer.put_data(moves[0][2:])
+        packets = list(packetizer.get_packets())
+        self.assertEqual(len(packets), 1)
+        self.assertEqual(packets[0].body, bytes([1]))
+        self.assertFalse(packetizer.has_data())
+
+    def test_recv_into(self):
+        """소켓에서 recv_into로 직접 받아 조립하는지 테스트"""
+        a, b = socket.socketpair()
+        try:
+            packetizer = Packetizer(capacity=8)
+            big = Packet(CMD_REQ_LOGIN, b'X' * 100).to_bytes()
+            a.sendall(big)
+            received = 0
+            while received < len(big):
+                received += packetizer.recv_into(b, 32)
+            packets = list(packetizer.get_packets())
+            self.assertEqual(len(packets), 1)
+            self.assertEqual(packets[0].body, b'X' * 100)
+        finally:
+            a.close()
+            b.close()
+
+    def test_empty_payload(self):
+        """CMD가 없는 잘못된 프레임은 ProtocolError"""
+        packetizer = Packetizer()
+        packetizer.put_data(b'\x00\x00')
+        with self.assertRaises(ProtocolError):
+            list(packetizer.get_frames())
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
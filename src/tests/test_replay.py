@@ -0,0 +1,102 @@
+# src/tests/test_replay.py
+import sys
+import os
+import logging
+import tempfile
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.common.config import REPLAY_CHUNK_SIZE, REPLAY_INDEX_TICKS
+from src.common.replay import (ReplayReader, list_replays, RECORD, FOOTER,
+                               REC_MOVE, REC_GARBAGE, REC_DEATH, REC_RESULT)
+from src.server.infra.replay_writer import ReplayWriter, replay_writer
+from src.tests.helpers import StubRoom, start_session
+
+class TestReplay(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.writer = ReplayWriter()
+        self.writer.configure(self.tmp.name)
+
+    def tearDown(self):
+        self.writer.stop()
+        self.tmp.cleanup()
+
+    def record_match(self, moves):
+        rec = self.writer.open_match(3, 0xABCD, [(0, "alice"), (2, "bob")], 'shadow', 30)
+        for i in range(moves):
+            rec.move(i % 2 * 2, 1 + i % 5, i // 4, i // 4)
+        rec.garbage(0, 2, 3, moves // 4, moves // 4 + 60)
+        rec.death(2, moves // 4, 1200)
+        rec.result(0, 0, moves // 4)
+        rec.close()
+        self.assertTrue(self.writer.flush())
+        return rec.path
+
+    def test_roundtrip_and_seek(self):
+        moves = REPLAY_CHUNK_SIZE // RECORD.size * 3 + 17  # 여러 청크에 걸치도록
+        path = self.record_match(moves)
+        self.assertEqual(list_replays(self.tmp.name), [path])
+
+        reader = ReplayReader(path)
+        self.assertTrue(reader.complete)
+        self.assertEqual((reader.room_id, reader.seed, reader.mode, reader.tick_rate), (3, 0xABCD, 'shadow', 30))
+        self.assertEqual(reader.roster, [(0, "alice"), (2, "bob")])
+        records = list(reader.records())
+        self.assertEqual(len(records), moves + 3)
+        self.assertEqual([r[0] for r in records[-3:]], [REC_GARBAGE, REC_DEATH, REC_RESULT])
+        self.assertEqual(records[0], (REC_MOVE, 0, 1, 0, 0, 0))
+        self.assertEqual(reader.end_tick, moves // 4)
+
+        # 인덱스로 중간부터 읽어도 처음부터 읽어서 거른 것과 같음
+        self.assertGreater(len(reader.index), 5)
+        for tick in (0, 1, REPLAY_INDEX_TICKS + 3, moves // 8, moves // 4):
+            expected = [r for r in records if r[4] >= tick]
+            self.assertEqual(list(reader.records(tick)), expected)
+        self.assertEqual(list(reader.seek_time(2.0)), [r for r in records if r[4] >= 60])
+
+    def test_without_footer(self):
+        """기록 도중 서버가 죽어 푸터가 없어도 온전한 레코드까지 읽음"""
+        path = self.record_match(500)
+        with open(path, 'rb') as f:
+            data = f.read()
+        reader = ReplayReader(path)
+        footer_size = FOOTER.size + len(reader.index) * 12
+        with open(path, 'wb') as f:
+            f.write(data[:-footer_size - 5])
+        broken = ReplayReader(path)
+        self.assertFalse(broken.complete)
+        self.assertEqual(list(broken.records()), list(reader.records())[:-1])
+        self.assertEqual(list(broken.records(50)), [r for r in list(reader.records())[:-1] if r[4] >= 50])
+
+    def test_session_records_match(self):
+        logging.disable(logging.WARNING)
+        replay_writer.configure(self.tmp.name)
+        try:
+            _, session = start_session(room=StubRoom(room_id=7, names=["alice", "bob"]))
+            for _ in range(10):
+                session.on_tick()
+            session.handle_move(0, 3, 9)
+            session.handle_move(1, 5)
+            session.handle_attack(1, 2, 10)
+            session.report_gameover(0, 400, 10)
+            session.finish_game(1, reason=1)
+            self.assertTrue(replay_writer.flush())
+        finally:
+            replay_writer.configure(None)
+            logging.disable(logging.NOTSET)
+
+        reader = ReplayReader(session.recorder.path)
+        self.assertEqual(reader.seed, session.seed)
+        self.assertEqual(reader.roster, [(0, "alice"), (1, "bob")])
+        self.assertEqual(list(reader.records()), [
+            (REC_MOVE, 0, 3, 0, 10, 9),
+            (REC_MOVE, 1, 5, 0, 10, 10),
+            (REC_GARBAGE, 1, 0, 2, 10, 10 + 60),
+            (REC_DEATH, 0, 0, 0, 10, 400),
+            (REC_RESULT, 1, 1, 0, 10, 0),
+        ])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+# src/tests/test_replay_verifier.py
+import sys
+import os
+import random
+import struct
+import shutil
+import logging
+import tempfile
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.common.constants import Action, CMD_NOTI_GARBAGE
+from src.common.replay import ReplayReader, RECORD, REC_DEATH
+from src.core.game_state import GameState
+from src.debug.replay_verifier import ReplayPlayer, verify_replay, verify_all
+from src.server.game.game_session import GameSession
+from src.server.infra.replay_writer import replay_writer
+from src.tests.test_simulation import bot_action, start_session
+
+class TestReplayVerifier(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        self.tmp = tempfile.TemporaryDirectory()
+        replay_writer.configure(self.tmp.name)
+
+    def tearDown(self):
+        replay_writer.configure(None)
+        self.tmp.cleanup()
+        logging.disable(logging.NOTSET)
+        GameSession.simulation_mode = 'off'
+
+    def play(self, seed):
+        """authoritative 2인 게임을 끝날 때까지 진행 (입력/공격/게임오버 보고 모두 틱 포함)"""
+        rng = random.Random(seed)
+        room, session = start_session('authoritative')
+        clients = [GameState(session.seed) for _ in range(2)]
+        reported = set()
+        handled = 0
+        while session.is_active:
+            session.on_tick()
+            for packet in room.packets[handled:]:
+                if packet.cmd == CMD_NOTI_GARBAGE:
+                    _, target, lines, apply_tick = struct.unpack('>B B B I', packet.body)
+                    clients[target].queue_garbage(lines, apply_tick)
+            handled = len(room.packets)
+            for me, game in enumerate(clients):
+                game.advance_to(session.tick)
+                for attack_tick, lines in game.attacks:
+                    session.handle_attack(me, lines, attack_tick)
+                game.attacks.clear()
+                if game.game_over:
+                    if me not in reported:
+                        reported.add(me)
+                        session.report_gameover(me, game.score, game.tick)
+                elif rng.random() < 0.3:
+                    # 한동안은 줄을 지우며 공격을 주고받다가 이후 드롭만 해서 게임오버
+                    action = bot_action(game, rng) if session.tick < 2000 else Action.DROP
+                    game.process_input(action)
+                    session.handle_move(me, action.value, game.tick)
+        self.assertTrue(replay_writer.flush())
+        return session
+
+    def test_replay_matches_live_simulation(self):
+        for seed in range(2):
+            session = self.play(seed)
+            reader = ReplayReader(session.recorder.path)
+            player = ReplayPlayer(reader).run()
+            for slot, sim in session.sim.local.sims.items():
+                self.assertEqual(player.sims[slot].board.grid, sim.board.grid)
+                self.assertEqual(player.sims[slot].score, sim.score)
+
+            result = verify_replay(reader.path)
+            self.assertEqual(result['status'], 'ok', result['mismatches'])
+            self.assertEqual({slot: rec for slot, (rec, _) in result['scores'].items()}, session.final_scores)
+
+    def test_detects_tampered_score(self):
+        path = self.play(3).recorder.path
+        reader = ReplayReader(path)
+        with open(path, 'r+b') as f:
+            for i, record in enumerate(reader.records()):
+                if record[0] == REC_DEATH:
+                    f.seek(reader.records_offset + i * RECORD.size)
+                    f.write(RECORD.pack(*record[:5], record[5] + 100))
+                    break
+
+        result = verify_replay(path)
+        self.assertEqual(result['status'], 'mismatch')
+        self.assertIn('score', result['mismatches'][0])
+
+        # 프로세스 풀로 여러 파일: 파일별 결과는 단독 실행과 같음
+        copies = [path]
+        for i in range(3):
+            copies.append(os.path.join(self.tmp.name, f"copy{i}.ttr"))
+            shutil.copy(path, copies[-1])
+        results = list(verify_all(copies, workers=2))
+        self.assertEqual(sorted(r['path'] for r in results), sorted(copies))
+        self.assertTrue(all(r['mismatches'] == result['mismatches'] for r in results))
+
+if __name__ == '__main__':
+    unittest.main()
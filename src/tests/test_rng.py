@@ -0,0 +1,62 @@
+# src/tests/test_rng.py
+import sys
+import os
+import random
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.core.rng import PieceStream, GarbageHoles
+from src.core.tetromino import Tetromino
+from src.core.game_state import GameState
+from src.common.constants import Action
+
+class TestGameRng(unittest.TestCase):
+    def test_piece_stream_deterministic(self):
+        a = PieceStream(1234)
+        b = PieceStream(1234)
+        seq_a = [a.next_type() for _ in range(500)]
+        # 다른 난수 사용이 끼어들어도 결과가 같아야 함
+        random.random()
+        seq_b = [b.next_type() for _ in range(500)]
+        self.assertEqual(seq_a, seq_b)
+        self.assertNotEqual(seq_a, [PieceStream(4321).next_type() for _ in range(500)])
+
+    def test_bag7(self):
+        stream = PieceStream(7, mode='bag7')
+        for _ in range(PieceStream.CHUNK_BAGS * 3):  # 청크 경계를 넘어서도 유지
+            bag = [stream.next_type() for _ in range(7)]
+            self.assertEqual(sorted(bag), sorted(Tetromino.TYPES))
+        with self.assertRaises(ValueError):
+            PieceStream(7, mode='unknown')
+
+    def test_garbage_holes_counter_based(self):
+        holes = GarbageHoles(99)
+        seq = [holes.next_hole(10) for _ in range(200)]
+        self.assertTrue(all(0 <= h < 10 for h in seq))
+        self.assertGreater(len(set(seq)), 5)
+        again = GarbageHoles(99)
+        self.assertEqual(seq, [again.next_hole(10) for _ in range(200)])
+
+    def test_independent_games(self):
+        """같은 시드의 게임 두 개를 번갈아 진행해도 서로 영향이 없음"""
+        actions = [Action.MOVE_LEFT, Action.ROTATE, Action.MOVE_RIGHT, Action.DROP]
+        solo = GameState(42)
+        for i in range(300):
+            solo.process_input(actions[i % 4])
+            if i % 50 == 0:
+                solo.board.add_garbage_lines(1)
+
+        games = [GameState(42), GameState(42), GameState(7)]
+        for i in range(300):
+            for g in games:
+                g.process_input(actions[i % 4])
+                if i % 50 == 0:
+                    g.board.add_garbage_lines(1)
+        for g in games[:2]:
+            self.assertEqual(g.board.grid, solo.board.grid)
+            self.assertEqual(g.score, solo.score)
+            self.assertEqual(g.current_piece.type, solo.current_piece.type)
+
+if __name__ == '__main__':
+    unittest.main()
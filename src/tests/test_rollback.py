@@ -0,0 +1,118 @@
+# src/tests/test_rollback.py
+import sys
+import os
+import random
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.common.constants import Action
+from src.common.config import GARBAGE_DELAY_TICKS, TICK_SYNC_INTERVAL
+from src.core.game_state import GameState
+from src.core.snapshot import pack_state
+from src.client.core.rollback import RollbackBoard
+from src.tests.test_simulation import bot_action
+
+def peer_game(seed, ticks):
+    """
+    상대 한 명의 게임을 서버 순서대로 진행 -> (서버가 보낸 메시지 목록, 정답 상태)
+    메시지: (보낸 틱, 'move', 키 코드, 입력 틱) / (보낸 틱, 'garbage', 줄 수, 적용 틱)
+    """
+    rng = random.Random(seed)
+    game = GameState(seed)
+    messages = []
+    for tick in range(1, ticks + 1):
+        game.advance_to(tick)
+        if game.game_over:
+            break
+        if rng.random() < 0.5:
+            key = bot_action(game, rng).value
+            game.process_input(Action(key))
+            messages.append((tick, 'move', key, tick))
+        if rng.random() < 0.004:
+            lines = rng.randint(1, 3)
+            game.queue_garbage(lines, tick + GARBAGE_DELAY_TICKS)
+            messages.append((tick, 'garbage', lines, tick + GARBAGE_DELAY_TICKS))
+    game.advance_to(ticks)
+    return messages, game
+
+def deliver(messages, max_delay, seed):
+    """서버 -> 클라이언트 한 연결: 순서는 유지하고 도착 틱만 무작위로 늦춤"""
+    rng = random.Random(seed)
+    arrived = []
+    last = 0
+    for msg in messages:
+        last = max(last, msg[0] + rng.randint(0, max_delay))
+        arrived.append((last,) + msg[1:])
+    return arrived
+
+def play_replica(replica, arrived, ticks, naive=False):
+    """로컬 틱마다 서버 틱(TICK_SYNC_INTERVAL마다)과 그때까지 도착한 메시지를 처리"""
+    game = replica.game
+    i = 0
+    for now in range(1, ticks + 1):
+        if now % TICK_SYNC_INTERVAL == 0:
+            replica.advance(now)
+        while i < len(arrived) and arrived[i][0] <= now:
+            _, kind, a, b = arrived[i]
+            i += 1
+            if naive:
+                # 롤백 없이 도착 시점에 적용 (이전 방식)
+                if kind == 'move':
+                    game.advance_to(b)
+                    game.process_input(Action(a))
+                else:
+                    game.queue_garbage(a, b)
+            elif kind == 'move':
+                replica.move(a, b)
+            else:
+                replica.garbage(a, b)
+    replica.advance(ticks)
+
+class TestRollbackBoard(unittest.TestCase):
+    TICKS = 1500
+
+    def test_late_inputs_converge(self):
+        """입력/공격이 최대 20틱 늦게 와도 롤백하면 서버 순서로 진행한 상대 보드와 같아짐"""
+        for seed in range(3):
+            messages, truth = peer_game(seed, self.TICKS)
+            arrived = deliver(messages, 20, seed)
+
+            replica = RollbackBoard(GameState(seed))
+            play_replica(replica, arrived, self.TICKS)
+            self.assertEqual(pack_state(replica.game), pack_state(truth))
+            self.assertGreater(replica.stats['rollbacks'], 0)
+            self.assertEqual(replica.stats['too_late'], 0)
+            self.assertLessEqual(replica.stats['depth_max'], replica.window + TICK_SYNC_INTERVAL)
+            self.assertIn('rollbacks=', replica.summary())
+
+        # 롤백 없이 도착 시점에 적용하면 어긋남 (이 테스트가 실제로 늦은 입력을 다룬다는 확인)
+        naive = RollbackBoard(GameState(seed))
+        play_replica(naive, arrived, self.TICKS, naive=True)
+        self.assertNotEqual(pack_state(naive.game), pack_state(truth))
+
+    def test_too_late_falls_back_and_resync(self):
+        """창보다 늦은 입력은 도착 시점에 적용하고, 서버 스냅샷으로 재동기화하면 이후 기록과 함께 복구"""
+        seed = 4
+        messages, truth = peer_game(seed, 600)
+        arrived = deliver(messages, 80, seed)
+        replica = RollbackBoard(GameState(seed), window=10)
+        play_replica(replica, arrived, 600)
+        self.assertGreater(replica.stats['too_late'], 0)
+
+        # 서버 시뮬레이션 스냅샷 (300틱까지의 메시지만 반영) + 그 이후 기록
+        server = GameState(seed)
+        for tick, kind, a, b in messages:
+            if tick > 300:
+                break
+            server.advance_to(tick)
+            if kind == 'move':
+                server.process_input(Action(a))
+            else:
+                server.queue_garbage(a, b)
+        server.advance_to(300)
+        replica.resync(pack_state(server), 600)
+        self.assertEqual(pack_state(replica.game), pack_state(truth))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+# src/tests/test_room_slots.py
+import sys
+import os
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.server.infra.client_peer import ClientPeer
+from src.server.game.room import Room
+
+class TestRoomSlotIndex(unittest.TestCase):
+    """slots / slot_of / 클라이언트의 room·slot_id 캐시가 항상 같은 상태인지 검사"""
+    def setUp(self):
+        self.room = Room(1, "test")
+        self.users = [ClientPeer(None, ('127.0.0.1', i)) for i in range(3)]
+        for u in self.users:
+            self.room.enter_user(u)
+
+    def assertConsistent(self):
+        for i, user in enumerate(self.room.slots):
+            if user is not None:
+                self.assertEqual(self.room.slot_of[user], i)
+                self.assertIs(user.room, self.room)
+                self.assertEqual(user.slot_id, i)
+                self.assertEqual(user.room_id, self.room.room_id)
+        self.assertEqual(len(self.room.slot_of), len(self.room.get_users()))
+
+    def test_enter_and_leave(self):
+        self.assertConsistent()
+        leaver = self.users[1]
+        self.assertEqual(self.room.leave_user(leaver), 1)
+        self.assertIsNone(leaver.room)
+        self.assertIsNone(leaver.room_id)
+        self.assertEqual(leaver.slot_id, -1)
+        self.assertConsistent()
+
+        # 빈 슬롯 재사용
+        newcomer = ClientPeer(None, ('127.0.0.1', 9))
+        self.assertEqual(self.room.enter_user(newcomer), 1)
+        self.assertConsistent()
+
+    def test_host_migration_updates_index(self):
+        host, second = self.users[0], self.users[1]
+        self.room.leave_user(host)
+        self.assertIs(self.room.slots[0], second)
+        self.assertEqual(second.slot_id, 0)
+        self.assertIsNone(self.room.slots[1])
+        self.assertConsistent()
+
+    def test_leave_unknown_client(self):
+        stranger = ClientPeer(None, ('127.0.0.1', 99))
+        self.assertEqual(self.room.leave_user(stranger), -1)
+        self.assertConsistent()
+
+if __name__ == '__main__':
+    unittest.main()
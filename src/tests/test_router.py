@@ -0,0 +1,84 @@
+# src/tests/test_router.py
+import sys
+import os
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.server.infra.router import PacketRouter, require_auth, require_room, LATENCY_BUCKETS
+from src.server.infra.client_peer import ClientPeer
+from src.common.protocol import Packet
+from src.common.constants import CMD_REQ_LOGIN, CMD_REQ_MOVE, CMD_REQ_LEAVE_ROOM
+from src.common.messages import ReqMove
+
+class TestPacketRouter(unittest.TestCase):
+    def setUp(self):
+        self.router = PacketRouter()
+        self.client = ClientPeer(None, ('127.0.0.1', 0))
+        self.called = []
+
+        @self.router.route(CMD_REQ_LOGIN)
+        def login(client, packet):
+            client.is_authenticated = True
+            self.called.append('login')
+
+        @self.router.route(CMD_REQ_LEAVE_ROOM, require_room)
+        def leave(client, packet):
+            self.called.append('leave')
+
+        # 라우트 등록 후에 추가한 미들웨어도 기존 라우트에 적용되어야 함
+        self.router.use(require_auth, exclude=(CMD_REQ_LOGIN,))
+
+    def test_auth_gate(self):
+        """로그인 전 명령은 거부 통계만 남기고 핸들러를 실행하지 않음"""
+        self.client.room = object()
+        self.router.handle(self.client, Packet(CMD_REQ_LEAVE_ROOM, b''))
+        self.assertEqual(self.called, [])
+        self.assertEqual(self.router.rejected[CMD_REQ_LEAVE_ROOM], 1)
+
+        self.router.handle(self.client, Packet(CMD_REQ_LOGIN, b'nick'))
+        self.router.handle(self.client, Packet(CMD_REQ_LEAVE_ROOM, b''))
+        self.assertEqual(self.called, ['login', 'leave'])
+
+    def test_route_guard(self):
+        """라우트별 Guard (방 밖에서의 퇴장 요청 무시)"""
+        self.client.is_authenticated = True
+        self.router.handle(self.client, Packet(CMD_REQ_LEAVE_ROOM, b''))
+        self.assertEqual(self.called, [])
+        self.assertEqual(self.router.rejected[CMD_REQ_LEAVE_ROOM], 1)
+
+    def test_malformed_body_rejected(self):
+        """핸들러가 낸 ProtocolError(짧은 본문)는 연결을 끊지 않고 거부 통계로 남김"""
+        @self.router.route(CMD_REQ_MOVE)
+        def move(client, packet):
+            self.called.append(ReqMove.unpack(packet.body))
+
+        self.client.is_authenticated = True
+        self.router.handle(self.client, Packet(CMD_REQ_MOVE, b''))
+        self.router.handle(self.client, Packet(CMD_REQ_MOVE, ReqMove.pack(3, 7)))
+        self.assertEqual(self.called, [(3, 7)])
+        self.assertEqual(self.router.rejected[CMD_REQ_MOVE], 1)
+
+    def test_unknown_command_counted(self):
+        for _ in range(3):
+            self.router.handle(self.client, Packet(0xEE, b''))
+        self.assertEqual(self.router.unknown[0xEE], 3)
+        self.assertIsNone(self.router.get_stats()[0xEE]['handler'])
+
+    def test_stats(self):
+        for _ in range(5):
+            self.router.handle(self.client, Packet(CMD_REQ_LOGIN, b'nick'))
+        stats = self.router.get_stats()[CMD_REQ_LOGIN]
+        self.assertEqual(stats['handler'], 'login')
+        self.assertEqual(stats['calls'], 5)
+        self.assertEqual(sum(stats['histogram']), 5)
+        self.assertEqual(len(stats['histogram']), LATENCY_BUCKETS)
+        self.assertLessEqual(stats['p50_us'], stats['p99_us'])
+        self.assertIn('login', self.router.dump_stats())
+
+        self.router.reset_stats()
+        self.assertEqual(self.router.get_stats(), {})
+        self.assertNotIn(CMD_REQ_MOVE, self.router.get_stats())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+# src/tests/test_scheduler.py
+import sys
+import os
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.server.infra.scheduler import TickScheduler
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+class TestTickScheduler(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.sched = TickScheduler(clock=self.clock)
+        self.log = []
+
+    def test_timeout_follows_earliest_deadline(self):
+        self.assertIsNone(self.sched.timeout())
+        self.sched.call_later(0.5, lambda: self.log.append('a'))
+        t = self.sched.call_later(0.2, lambda: self.log.append('b'))
+        self.assertAlmostEqual(self.sched.timeout(), 0.2)
+        t.cancel()
+        self.assertAlmostEqual(self.sched.timeout(), 0.5)
+
+        self.clock.now += 0.6
+        self.assertEqual(self.sched.run_due(), 1)
+        self.assertEqual(self.log, ['a'])
+        self.assertIsNone(self.sched.timeout())
+
+    def test_fixed_rate_without_drift(self):
+        """주기 타이머는 실행이 늦어져도 원래 격자(0.1초 간격)에 맞춰 다음 마감을 잡음"""
+        self.sched.call_every(0.1, lambda: self.log.append(self.clock.now))
+        for late in (0.01, 0.03, 0.0, 0.02):
+            self.clock.now += self.sched.timeout() + late
+            self.sched.run_due()
+        self.assertEqual(len(self.log), 4)
+        self.assertAlmostEqual(self.sched.timeout() + self.clock.now, 100.5)
+        stats = self.sched.get_stats()
+        self.assertEqual(stats['overruns'], 0)
+        self.assertAlmostEqual(stats['jitter_max_ms'], 30.0)
+
+    def test_overrun_skips_missed_ticks(self):
+        """한 번에 여러 주기가 밀리면 몰아서 실행하지 않고 건너뛴 수를 기록"""
+        self.sched.call_every(0.1, lambda: self.log.append(1))
+        self.clock.now += 0.35
+        self.sched.run_due()
+        self.assertEqual(self.log, [1])
+        self.assertEqual(self.sched.get_stats()['overruns'], 2)
+        self.assertAlmostEqual(self.sched.timeout(), 0.05)
+
+    def test_callback_can_schedule(self):
+        notified = []
+        self.sched.on_schedule = lambda: notified.append(1)
+        self.sched.call_later(0.1, lambda: self.sched.call_later(0.0, lambda: self.log.append('x')))
+        self.clock.now += 0.1
+        self.sched.run_due()
+        self.sched.run_due()
+        self.assertEqual(self.log, ['x'])
+        self.assertEqual(len(notified), 2)
+
+    def test_idle_runs_once_per_call(self):
+        """미룬 작업은 timeout()에 영향이 없고, 실행 중 다시 등록한 작업은 다음 run_idle()에서 실행"""
+        notified = []
+        self.sched.on_idle = lambda: notified.append(1)
+        def again():
+            self.log.append('a')
+            if len(self.log) < 2:
+                self.sched.call_idle(again)
+        self.sched.call_idle(again)
+        self.sched.call_idle(lambda: self.log.append('b')).cancel()
+        self.assertIsNone(self.sched.timeout())
+        self.assertTrue(self.sched.has_idle())
+
+        self.assertEqual(self.sched.run_idle(), 1)
+        self.assertEqual(self.log, ['a'])
+        self.assertEqual(self.sched.run_idle(), 1)
+        self.assertEqual(self.log, ['a', 'a'])
+        self.assertFalse(self.sched.has_idle())
+        self.assertEqual(len(notified), 1)  # 비어 있다가 처음 생길 때만 알림
+
+if __name__ == '__main__':
+    unittest.main()
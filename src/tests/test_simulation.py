@@ -0,0 +1,270 @@
+# src/tests/test_simulation.py
+import sys
+import os
+import random
+import struct
+import logging
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.common.constants import Action, CMD_NOTI_TICK, CMD_NOTI_GARBAGE
+from src.common.config import GARBAGE_DELAY_TICKS, COMBO_WINDOW_TICKS, SIM_MAX_LAG_TICKS
+from src.core.game_state import GameState
+from src.server.game.game_session import GameSession
+from src.server.game.room_simulation import RoomSimulation, EV_STATS, EV_LOST
+from src.server.infra.sim_pool import SimPool, InlineSimulation
+from src.tests.helpers import start_session
+
+def bot_action(game, rng):
+    """가장 깊이 착지하는 열로 이동 후 드롭하는 간단한 봇 (줄 삭제가 자주 일어나도록)"""
+    piece = game.current_piece
+    if rng.random() < 0.15:
+        return Action.ROTATE
+    probe = piece.clone()
+    best_x, best_y = piece.x, -1
+    for x in range(-2, game.board.WIDTH):
+        probe.x = x
+        probe.y = piece.y
+        if game.board.is_valid_position(probe):
+            y = probe.y + game.board.drop_distance(probe)
+            if y > best_y:
+                best_x, best_y = x, y
+    if best_x < piece.x:
+        return Action.MOVE_LEFT
+    if best_x > piece.x:
+        return Action.MOVE_RIGHT
+    return Action.DROP
+
+class TestGameStateTicks(unittest.TestCase):
+    def test_defense_then_combo_attack(self):
+        game = GameState(1)
+        game.advance_to(10)
+        game.queue_garbage(3, 10 + GARBAGE_DELAY_TICKS)
+        self.assertEqual(game.pending_garbage, 0)   # 다음 틱에 도착
+        game.advance_to(11)
+        self.assertEqual(game.pending_garbage, 3)
+
+        # 5줄 삭제: 3줄은 방어, 2줄은 공격으로 모음
+        game._on_lines_cleared(5)
+        self.assertEqual(game.pending_garbage, 0)
+        self.assertEqual(game.accumulated_lines, 2)
+        game.advance_to(11 + COMBO_WINDOW_TICKS - 1)
+        self.assertEqual(game.attacks, [])
+        game.advance_to(11 + COMBO_WINDOW_TICKS)
+        self.assertEqual(game.attacks, [(11 + COMBO_WINDOW_TICKS, 2)])
+
+    def test_counter_and_apply(self):
+        game = GameState(2)
+        game.accumulated_lines = 1
+        game.last_clear_tick = game.tick = 100
+        game.queue_garbage(3, 100 + GARBAGE_DELAY_TICKS)
+        game.advance_to(101)
+        self.assertEqual(game.accumulated_lines, 0)  # 모은 공격으로 1줄 상쇄
+        self.assertEqual(game.pending_garbage, 2)
+        game.advance_to(100 + GARBAGE_DELAY_TICKS)
+        self.assertEqual(game.pending_garbage, 0)
+        self.assertEqual(bin(game.board.rows[-1]).count('1'), game.board.WIDTH - 1)
+
+class TestServerSimulation(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.WARNING)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        GameSession.simulation_mode = 'off'
+
+    def play(self, mode, ticks=1500, seed=5):
+        """
+        클라이언트 두 명(각자 모든 슬롯의 복제본 보유)과 서버 세션을 같은 패킷 흐름으로 진행
+        반환: (세션, 클라이언트 복제본 목록)
+        """
+        rng = random.Random(seed)
+        room, session = start_session(mode)
+        clients = [{slot: GameState(session.seed) for slot in range(2)} for _ in range(2)]
+        handled = 0
+        for tick in range(1, ticks + 1):
+            session.on_tick()
+            if tick % 90 == 0 and session.is_active:
+                session._send_attack(tick // 90 % 2, 1)  # 방해 줄 흐름 만들기
+            # 서버 -> 클라이언트
+            for packet in room.packets[handled:]:
+                for games in clients:
+                    if packet.cmd == CMD_NOTI_TICK:
+                        t = struct.unpack('>I', packet.body)[0]
+                        for game in games.values():
+                            game.advance_to(t)
+                    elif packet.cmd == CMD_NOTI_GARBAGE:
+                        _, target, lines, apply_tick = struct.unpack('>B B B I', packet.body)
+                        games[target].queue_garbage(lines, apply_tick)
+            handled = len(room.packets)
+            # 클라이언트 -> 서버 (각자 자기 슬롯 입력, 상대 복제본에는 NOTI_MOVE로 반영)
+            for me, games in enumerate(clients):
+                mine = games[me]
+                for attack_tick, lines in mine.attacks:
+                    session.handle_attack(me, lines, attack_tick)
+                mine.attacks.clear()
+                if rng.random() < 0.3 and not mine.game_over:
+                    action = bot_action(mine, rng)
+                    mine.process_input(action)
+                    session.handle_move(me, action.value, mine.tick)
+                    other = clients[1 - me][me]
+                    other.advance_to(mine.tick)
+                    other.process_input(action)
+                for game in games.values():
+                    if game is not mine:
+                        game.attacks.clear()
+        return session, clients
+
+    def test_replicas_match_server(self):
+        """틱이 찍힌 입력/공격만으로 서버 시뮬레이션이 모든 클라이언트 복제본과 같은 결과를 냄"""
+        cleared = 0
+        for seed in range(4):
+            session, clients = self.play('shadow', seed=seed)
+            local = session.sim.local
+            for slot, sim in local.sims.items():
+                sim.advance_to(max(c[slot].tick for c in clients))
+                for games in clients:
+                    self.assertEqual(games[slot].board.grid, sim.board.grid)
+                    self.assertEqual(games[slot].score, sim.score)
+                    self.assertEqual(games[slot].game_over, sim.game_over)
+                cleared += sim.score
+            self.assertEqual(local.stats['attack_mismatch'], 0)
+            self.assertGreater(local.stats['inputs'], 200)
+        self.assertGreater(cleared, 0)
+
+    def test_authoritative_ignores_forged_attack(self):
+        room, session = start_session('authoritative')
+        before = len(room.packets)
+        session.handle_attack(0, 4, 0)
+        self.assertEqual(session.sim.local.stats['attack_mismatch'], 1)
+        self.assertFalse(any(p.cmd == CMD_NOTI_GARBAGE for p in room.packets[before:]))
+
+    def test_catch_up_without_inputs(self):
+        room, session = start_session('authoritative')
+        for _ in range(SIM_MAX_LAG_TICKS + 45):
+            session.on_tick()
+        for sim in session.sim.local.sims.values():
+            self.assertEqual(sim.tick, 45)
+
+    def test_continues_without_lost_sim(self):
+        """워커가 죽어 시뮬레이션을 잃은 세션은 off 모드처럼 클라이언트 보고로 진행"""
+        _, session = start_session('authoritative')
+        session.on_sim_events([(EV_LOST, -1, "simulation worker 0 exited", None)])
+        self.assertIsNone(session.sim)
+        self.assertFalse(session.can_spectate)
+        session.report_gameover(0, 100)   # authoritative라도 보고된 점수로 바로 사망 처리
+        self.assertEqual(session.final_scores, {0: 100})
+        self.assertEqual(session.alive_slots, {1})
+
+class TestSimPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = SimPool()
+        self.pool.start(1)
+
+    def tearDown(self):
+        self.pool.stop()
+
+    def pump(self):
+        pool = self.pool
+        pool.flush()
+        while pool.pending():
+            for worker, conn in enumerate(pool.connections):
+                if worker not in pool.dead and conn.poll(1.0):
+                    pool.on_readable(conn)
+
+    def test_worker_matches_inline(self):
+        """같은 명령열이면 워커 프로세스와 인라인 실행의 이벤트가 같음"""
+        rng = random.Random(3)
+        cmds = []
+        for tick in range(1, 1200):
+            if rng.random() < 0.4:
+                cmds.append(('move', rng.randrange(2), rng.choice([1, 2, 3, 4, 5]), tick))
+            if tick % 150 == 0:
+                cmds.append(('garbage', rng.randrange(2), 2, tick + GARBAGE_DELAY_TICKS))
+        cmds.append(('catch_up', 1200))
+        cmds.append(('close',))
+
+        inline = RoomSimulation(77, (0, 1))
+        expected = []
+        for cmd in cmds:
+            inline.apply(cmd)
+            expected.extend(inline.drain())
+
+        received = []
+        handle = self.pool.create(5, 77, (0, 1), 'authoritative', received.extend)
+        for i, cmd in enumerate(cmds):
+            handle.submit(cmd)
+            if i % 100 == 0:
+                self.pump()
+        self.pump()
+        self.assertEqual(received, expected)
+        self.assertEqual(received[-1][0], EV_STATS)
+        self.assertEqual(received[-1][2]['inputs'], sum(1 for c in cmds if c[0] == 'move'))
+        self.assertEqual(self.pool.get_stats()['rooms'], 0)
+
+    def test_backpressure(self):
+        pool = self.pool
+        pool.high_water, pool.low_water = 50, 10
+        changes = []
+        pool.on_backpressure = lambda worker, congested: changes.append((worker, congested))
+        handle = pool.create(3, 1, (0,), 'authoritative', lambda events: None)
+        for tick in range(1, 80):
+            handle.submit(('move', 0, 1, tick))
+        self.assertEqual(changes, [(0, True)])
+        self.assertTrue(pool.is_congested(3))
+        self.assertFalse(pool.is_congested(None))
+        self.pump()
+        self.assertEqual(changes, [(0, True), (0, False)])
+        self.assertFalse(pool.is_congested(3))
+
+    def test_batches_bounded(self):
+        """outbox가 커도 한 번에 보내는 묶음은 batch_bytes 이하 (응답 대기 묶음도 max_inflight개까지)"""
+        pool = self.pool
+        pool.batch_bytes = 1024
+        received = []
+        handle = pool.create(3, 1, (0,), 'shadow', received.extend)
+        for tick in range(1, 2001):
+            handle.submit(('move', 0, 1, tick))
+        pool.flush()
+        self.assertEqual(pool.batches_sent, pool.max_inflight)
+        self.assertLess(pool.commands_sent, 2001)
+        self.assertLessEqual(pool.max_batch_bytes, 1024)
+        handle.close()
+        self.pump()
+        self.assertEqual(received[-1][0], EV_STATS)
+        self.assertEqual(received[-1][2]['inputs'], 2000)
+
+    def test_worker_exit(self):
+        """워커 하나가 죽으면 그 워커의 방만 EV_LOST를 받고, 다른 워커의 방은 계속 동작"""
+        pool = self.pool
+        pool.stop()
+        pool.start(2)
+        exited = []
+        pool.on_worker_exit = exited.append
+        lost, alive = [], []
+        lost_handle = pool.create(2, 1, (0,), 'shadow', lost.extend)     # 워커 0
+        alive_handle = pool.create(3, 1, (0,), 'shadow', alive.extend)   # 워커 1
+        self.pump()
+
+        dead_conn = pool.connections[0]
+        pool._procs[0].kill()
+        pool._procs[0].join()
+        lost_handle.submit(('move', 0, 1, 1))
+        alive_handle.submit(('move', 0, 1, 1))
+        pool.flush()
+        if 0 not in pool.dead:
+            self.assertTrue(dead_conn.poll(1.0))
+            pool.on_readable(dead_conn)
+        self.assertEqual([e[0] for e in lost], [EV_LOST])
+        self.assertEqual(exited, [dead_conn])
+        self.assertEqual(pool.get_stats()['workers_lost'], 1)
+        self.assertIsInstance(pool.create(4, 1, (0,), 'shadow', lambda events: None), InlineSimulation)
+
+        alive_handle.close()
+        self.pump()
+        self.assertEqual(alive[-1][0], EV_STATS)
+        self.assertEqual(alive[-1][2]['inputs'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+# src/tests/test_snapshot.py
+import sys
+import os
+import random
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.common.constants import Action
+from src.common.errors import ProtocolError
+from src.core.game_state import GameState
+from src.core.rng import PieceStream
+from src.core.snapshot import (pack_state, restore_state, compress, decompress,
+                               encode_delta, decode_delta, snapshot_tick, CELLS, HEADER)
+
+ACTIONS = [Action.MOVE_LEFT, Action.MOVE_RIGHT, Action.ROTATE, Action.DOWN, Action.DROP, Action.USE_ITEM]
+
+def step(game, rng, tick):
+    """무작위 입력 + 가끔 방해 줄, 틱 진행"""
+    game.advance_to(tick)
+    game.process_input(rng.choice(ACTIONS))
+    if tick % 40 == 0:
+        game.queue_garbage(rng.randint(1, 3), tick + 60)
+    game.attacks.clear()
+
+class TestSnapshot(unittest.TestCase):
+    def test_piece_stream_seek(self):
+        for mode in ('random', 'bag7'):
+            a = PieceStream(9, mode)
+            seq = [a.next_type() for _ in range(PieceStream.CHUNK_SIZE * 2 + 5)]
+            for n in (0, 1, PieceStream.CHUNK_SIZE, PieceStream.CHUNK_SIZE + 3):
+                b = PieceStream(9, mode)
+                b.seek(n)
+                self.assertEqual(b.drawn, n)
+                self.assertEqual([b.next_type() for _ in range(20)], seq[n:n + 20])
+
+    def test_restore_continues_identically(self):
+        rng = random.Random(1)
+        game = GameState(123)
+        game.item_count = 1
+        for tick in range(1, 400):
+            step(game, rng, tick)
+            if tick % 50 == 0:
+                raw = pack_state(game)
+                copy = GameState(123)
+                restore_state(copy, decompress(compress(raw)))
+                self.assertEqual(pack_state(copy), raw)
+
+                # 같은 입력을 이어서 주면 계속 같은 상태
+                r1, r2 = random.Random(tick), random.Random(tick)
+                for t in range(tick + 1, tick + 120):
+                    step(game, r1, t)
+                    step(copy, r2, t)
+                self.assertEqual(pack_state(copy), pack_state(game))
+                self.assertEqual(copy.board.rows, game.board.rows)
+                self.assertEqual(copy.board.heights, game.board.heights)
+                rng = random.Random(tick + 1)
+
+    def test_delta_roundtrip_and_size(self):
+        rng = random.Random(2)
+        game = GameState(5)
+        base = pack_state(game)
+        for tick in range(1, 600):
+            step(game, rng, tick)
+            if tick % 30 == 0:
+                raw = pack_state(game)
+                delta = encode_delta(raw, base)
+                self.assertEqual(decode_delta(delta, base), raw)
+                self.assertLess(len(delta), len(raw))
+                self.assertLess(len(compress(raw)), CELLS)
+                base = raw
+
+        with self.assertRaises(ProtocolError):
+            decode_delta(encode_delta(base, base), pack_state(GameState(5)))
+        self.assertEqual(snapshot_tick(base), 570)
+
+    def test_malformed(self):
+        raw = pack_state(GameState(1))
+        with self.assertRaises(ProtocolError):
+            restore_state(GameState(1), raw[:-3])
+        with self.assertRaises(ProtocolError):
+            decompress(compress(raw)[:45])
+
+    def test_malformed_leaves_game_untouched(self):
+        rng = random.Random(3)
+        source = GameState(7)
+        for tick in range(1, 200):
+            step(source, rng, tick)
+        raw = pack_state(source)
+        game = GameState(7)
+        before = pack_state(game)
+
+        def patched(index, value):
+            fields = list(HEADER.unpack_from(raw))
+            fields[index] = value
+            return HEADER.pack(*fields) + raw[HEADER.size:]
+
+        # 길이 부족 / 다음 블록 종류 오류 / 방해 줄 목록 길이 불일치
+        for bad in (raw[:-1], patched(14, 0xEE), patched(18, HEADER.unpack_from(raw)[18] + 1)):
+            with self.assertRaises(ProtocolError):
+                restore_state(game, bad)
+            self.assertEqual(pack_state(game), before)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,172 @@
+# src/tests/test_spectators.py
+import sys
+import os
+import random
+import logging
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.common.constants import Action, CMD_NOTI_SPECTATE_FRAME, CMD_NOTI_RESULT
+from src.common.config import SPECTATOR_FANOUT_BATCH, SPECTATOR_SKIP_BYTES
+from src.common.packet_handler import Packetizer
+from src.core.game_state import GameState
+from src.core.snapshot import pack_state, restore_state, decode_frame, decompress, decode_delta, FRAME_KEY
+from src.server.game.game_session import GameSession
+from src.server.game.spectator_feed import SpectatorFeed
+from src.server.infra.scheduler import scheduler
+from src.server.infra.client_peer import ClientPeer
+from src.server.infra.async_server import TransportSocket
+from src.tests.helpers import start_session
+
+class Viewer:
+    """관전자 ClientPeer 대역: 받은 프레임으로 보드 상태를 복원"""
+    def __init__(self):
+        self.spectating = None
+        self.out_bytes = 0
+        self.received = []
+        self.states = {}
+        self.keyframes = 0
+
+    def send_bytes(self, data):
+        self.received.append(data)
+        packetizer = Packetizer()
+        packetizer.put_data(data)
+        for packet in packetizer.get_packets():
+            if packet.cmd != CMD_NOTI_SPECTATE_FRAME:
+                continue
+            flags, _, parts = decode_frame(packet.body)
+            if flags & FRAME_KEY:
+                self.keyframes += 1
+            for slot, part in parts:
+                if flags & FRAME_KEY:
+                    self.states[slot] = decompress(part)
+                else:
+                    self.states[slot] = decode_delta(part, self.states.get(slot))
+
+    def pending_bytes(self):
+        return self.out_bytes
+
+class StubTransport:
+    """asyncio Transport 대역: write는 모두 쓰기 버퍼에 쌓이고, 상대가 읽지 않으면 비워지지 않음"""
+    def __init__(self):
+        self.buffered = 0
+        self.writes = 0
+
+    def write(self, data):
+        self.buffered += len(data)
+        self.writes += 1
+
+    def writelines(self, buffers):
+        for data in buffers:
+            self.write(data)
+
+    def get_write_buffer_size(self):
+        return self.buffered
+
+class TestSpectators(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.WARNING)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        GameSession.simulation_mode = 'off'
+
+    def test_stream_matches_simulation(self):
+        """관전 프레임만으로 서버 시뮬레이션 상태가 복원되고, 프레임은 관전자 모두가 같은 bytes를 받음"""
+        room, session = start_session('authoritative')
+        rng = random.Random(4)
+        viewers = [Viewer() for _ in range(3)]
+        self.assertTrue(session.add_spectator(viewers[0]))
+        for tick in range(1, 400):
+            session.on_tick()
+            scheduler.run_idle()
+            if rng.random() < 0.5:
+                slot = rng.randrange(2)
+                session.handle_move(slot, rng.choice(list(Action)[:4]).value, session.tick)
+            if tick == 100:
+                for v in viewers[1:]:
+                    session.add_spectator(v)  # 진행 중 입장: 입장 시점 전체 프레임
+        states = session.spectators.states
+        for v in viewers:
+            self.assertEqual(v.spectating, session.spectators)
+            self.assertEqual(v.states, states)
+            self.assertEqual(v.keyframes, 1)
+        self.assertTrue(all(a is b for a, b in zip(viewers[1].received[1:], viewers[2].received[1:])))
+        for slot, sim in session.sim.local.sims.items():
+            restored = GameState(session.seed)
+            restore_state(restored, states[slot])
+            self.assertEqual(restored.board.grid, sim.board.grid)
+        # 플레이어 브로드캐스트에는 관전 프레임이 섞이지 않음
+        self.assertFalse(any(p.cmd == CMD_NOTI_SPECTATE_FRAME for p in room.packets))
+
+        session.finish_game(0)
+        self.assertEqual(session.spectators.viewers, {})
+        self.assertIsNone(viewers[0].spectating)
+        self.assertEqual(viewers[0].received[-1][2], CMD_NOTI_RESULT)
+
+    def test_requires_simulation(self):
+        _, session = start_session('off')
+        self.assertFalse(session.add_spectator(Viewer()))
+
+    def test_fanout_batches_and_slow_viewer(self):
+        feed = SpectatorFeed()
+        viewers = [Viewer() for _ in range(SPECTATOR_FANOUT_BATCH * 2 + 10)]
+        for v in viewers:
+            feed.add(v)
+        game = GameState(1)
+        feed.publish(1, {0: pack_state(game)})
+        self.assertFalse(any(v.received for v in viewers))  # 전송은 루프의 입출력 뒤로 미뤄짐
+        scheduler.run_idle()
+        self.assertEqual(sum(1 for v in viewers if v.received), SPECTATOR_FANOUT_BATCH)
+        while feed._targets:
+            scheduler.run_idle()
+        self.assertTrue(all(v.keyframes == 1 for v in viewers))
+
+        slow = viewers[0]
+        slow.out_bytes = SPECTATOR_SKIP_BYTES
+        game.advance_to(40)
+        feed.publish(40, {0: pack_state(game)})
+        while feed._targets:
+            scheduler.run_idle()
+        self.assertEqual(len(slow.received), 1)
+        self.assertEqual(feed.frames_skipped, 1)
+        self.assertEqual(viewers[1].keyframes, 1)   # 나머지는 델타
+
+        slow.out_bytes = 0
+        game.advance_to(80)
+        feed.publish(80, {0: pack_state(game)})
+        while feed._targets:
+            scheduler.run_idle()
+        self.assertEqual(slow.keyframes, 2)          # 건너뛴 뒤에는 전체 프레임
+        self.assertEqual(slow.states, viewers[1].states)
+
+    def test_slow_viewer_on_asyncio_backend(self):
+        """asyncio 백엔드: flush 후 송신 큐는 비지만 Transport 버퍼에 밀린 관전자도 건너뜀"""
+        transport = StubTransport()
+        peer = ClientPeer(TransportSocket(transport), ('127.0.0.1', 0))
+        feed = SpectatorFeed()
+        feed.add(peer)
+        game = GameState(1)
+        for tick in (1, 40, 80):
+            game.advance_to(tick)
+            feed.publish(tick, {0: pack_state(game)})
+            while feed._targets:
+                scheduler.run_idle()
+            peer.flush()
+            self.assertEqual(peer.out_bytes, 0)
+            if tick == 1:
+                transport.buffered = SPECTATOR_SKIP_BYTES  # 상대가 읽지 않아 버퍼가 밀림
+        self.assertEqual(transport.writes, 1)
+        self.assertEqual(feed.frames_skipped, 2)
+        self.assertEqual(peer.pending_bytes(), SPECTATOR_SKIP_BYTES)
+
+        transport.buffered = 0
+        game.advance_to(120)
+        feed.publish(120, {0: pack_state(game)})
+        while feed._targets:
+            scheduler.run_idle()
+        self.assertEqual(feed.frames_sent, 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+# src/tests/test_tetromino.py
+import sys
+import os
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.core.tetromino import Tetromino
+from src.common.config import BOARD_WIDTH
+
+class TestPieceTable(unittest.TestCase):
+    def test_table_matches_shapes(self):
+        """미리 계산한 마스크/경계/열 바닥이 SHAPES 좌표와 일치하는지"""
+        for shape_type, rotations in Tetromino.SHAPES.items():
+            self.assertEqual(len(Tetromino.TABLE[shape_type]), len(rotations))
+            for coords, shape in zip(rotations, Tetromino.TABLE[shape_type]):
+                self.assertEqual(shape.cells, tuple(coords))
+                for ly, mask in shape.row_masks:
+                    self.assertEqual(mask, sum(1 << lx for lx, y in coords if y == ly))
+                for lx, bottom in shape.col_bottoms:
+                    self.assertEqual(bottom, max(y for x, y in coords if x == lx))
+                self.assertEqual(shape.min_y, min(y for _, y in coords))
+                self.assertEqual(shape.max_y, max(y for _, y in coords))
+
+                # x열에 놓았을 때의 마스크 = 절대 좌표 칸들의 비트 합
+                for x in range(-shape.min_x, BOARD_WIDTH - shape.max_x):
+                    shifted = dict(shape.row_masks_at[x + shape.min_x])
+                    for ly in shifted:
+                        self.assertEqual(shifted[ly], sum(1 << (x + lx) for lx, y in coords if y == ly))
+
+    def test_slots_and_color(self):
+        piece = Tetromino('S')
+        self.assertFalse(hasattr(piece, '__dict__'))
+        self.assertEqual(piece.color_id, Tetromino.TYPES.index('S') + 1)
+
+        piece.rotate()
+        clone = piece.clone()
+        self.assertEqual((clone.type, clone.rotation, clone.color_id), ('S', 1, piece.color_id))
+        self.assertEqual(clone.get_blocks(), piece.get_blocks())
+
+        piece.make_heavy()
+        self.assertEqual(piece.color_id, 8)
+        self.assertIs(piece.shape, Tetromino.TABLE['WEIGHT'][0])
+
+if __name__ == '__main__':
+    unittest.main()